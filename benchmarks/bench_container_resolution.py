@@ -0,0 +1,59 @@
+"""
+Container Resolution Benchmark
+
+Compares make() and call() with cached resolution plans against compiling
+every plan again (the cost of inspecting signatures on each resolve).
+Run with: python benchmarks/bench_container_resolution.py
+"""
+
+import timeit
+
+from larapy.container.container import Container
+
+
+class Config:
+    """Shared dependency registered as a singleton."""
+
+
+class Repository:
+    def __init__(self, config: Config, table: str = "users"):
+        self.config = config
+        self.table = table
+
+
+class Service:
+    def __init__(self, config: Config, repository: Repository, retries: int = 3):
+        self.repository = repository
+
+
+def handler(service: Service, request=None):
+    return service
+
+
+def measure(container: Container, label: str, action, number: int) -> None:
+    cached = timeit.timeit(action, number=number)
+
+    def uncached():
+        container.forget_resolution_plans()
+        action()
+
+    rebuilt = timeit.timeit(uncached, number=number)
+
+    cached_us = cached / number * 1e6
+    rebuilt_us = rebuilt / number * 1e6
+    print(
+        f"{label:<14} uncached {rebuilt_us:>8.2f} us"
+        f"   cached {cached_us:>7.2f} us   x{rebuilt_us / cached_us:>5.1f}"
+    )
+
+
+def main(number: int = 20000) -> None:
+    container = Container()
+    container.singleton(Config)
+
+    measure(container, "make(Service)", lambda: container.make(Service), number)
+    measure(container, "call(handler)", lambda: container.call(handler, {"request": None}), number)
+
+
+if __name__ == "__main__":
+    main()
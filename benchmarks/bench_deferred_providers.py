@@ -0,0 +1,79 @@
+"""
+Deferred Provider Benchmark
+
+Boots a fresh interpreter with the framework's deferrable providers listed in
+bootstrap/providers.py, once registering every provider eagerly and once
+through the cached provider manifest, and reports cold-start time, peak RSS
+and the number of imported modules. Run with:
+python benchmarks/bench_deferred_providers.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PROVIDERS = [
+    "larapy.events.event_service_provider.EventServiceProvider",
+    "larapy.hashing.hash_service_provider.HashServiceProvider",
+    "larapy.encryption.encryption_service_provider.EncryptionServiceProvider",
+    "larapy.broadcasting.broadcast_service_provider.BroadcastServiceProvider",
+    "larapy.notifications.notification_service_provider.NotificationServiceProvider",
+]
+
+BOOT = """
+import json, resource, sys, time
+started = time.perf_counter()
+from larapy.foundation import Application
+from larapy.foundation.provider_repository import load_provider_class
+app = Application({base!r})
+if {eager!r}:
+    for name in {providers!r}:
+        app.register(load_provider_class(name))
+else:
+    app.register_configured_providers()
+app.boot()
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def boot(base: str, eager: bool) -> dict:
+    code = BOOT.format(base=base, eager=eager, providers=PROVIDERS)
+    env = dict(os.environ, APP_ENV="local")
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    return json.loads(output.stdout)
+
+
+def best_of(base: str, eager: bool, runs: int) -> dict:
+    results = [boot(base, eager) for _ in range(runs)]
+    return min(results, key=lambda result: result["ms"])
+
+
+def main(runs: int = 5) -> None:
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, "bootstrap"))
+        with open(os.path.join(base, "bootstrap", "providers.py"), "w") as handle:
+            handle.write(f"providers = {PROVIDERS!r}\n")
+
+        # First boot compiles and writes the manifest
+        boot(base, eager=False)
+
+        for label, eager in (("eager", True), ("deferred", False)):
+            result = best_of(base, eager, runs)
+            print(
+                f"{label:<9} cold start {result['ms']:>7.1f} ms"
+                f"   peak RSS {result['rss_kb'] / 1024:>6.1f} MiB"
+                f"   modules {result['modules']:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
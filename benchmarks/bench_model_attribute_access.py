@@ -0,0 +1,134 @@
+"""
+Model Attribute Access Benchmark
+
+Reads 10 attributes, three of them cast, from each of 100,000 models,
+comparing the accessors installed on the model class and the per-model cast
+cache with the previous path: a __getattribute__ override run for every
+attribute lookup, a __getattr__ fallback for every column and a fresh cast
+(datetime.strptime included) on every read.
+Run with: python benchmarks/bench_model_attribute_access.py
+"""
+
+import time
+
+from sqlalchemy import text
+
+from larapy.database.connection import Connection
+from larapy.database.orm import Model
+
+COLUMNS = ["id", "name", "email", "age", "city", "country", "score", "active", "created_at", "updated_at"]
+CASTS = {"age": "int", "active": "bool", "created_at": "datetime"}
+
+
+class User(Model):
+    _table = "users"
+    _casts = CASTS
+
+
+class LegacyUser(Model):
+    """Attribute access as Model implemented it before the class accessors."""
+
+    _table = "users"
+    _casts = CASTS
+
+    def __getattribute__(self, key):
+        if (
+            key.startswith("_")
+            or key.isupper()
+            or key
+            in [
+                "get_attribute",
+                "set_attribute",
+                "get_relation",
+                "set_relation",
+                "relation_loaded",
+                "__dict__",
+                "__class__",
+            ]
+        ):
+            return super().__getattribute__(key)
+
+        _relations = super().__getattribute__("_relations") if hasattr(self, "_relations") else {}
+        if key in _relations:
+            return _relations[key]
+
+        return super().__getattribute__(key)
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+
+        if key in self._relations:
+            return self._relations[key]
+
+        return self.get_attribute(key)
+
+    def get_attribute(self, key):
+        if key in self._attributes:
+            value = self._attributes[key]
+
+            if key in self._casts:
+                return self.cast_attribute(key, value)
+
+            return value
+
+        return None
+
+
+def read_all(models: list) -> int:
+    """Read every benchmarked attribute of every model."""
+    reads = 0
+    for model in models:
+        (model.id, model.name, model.email, model.age, model.city, model.country,
+         model.score, model.active, model.created_at, model.updated_at)
+        reads += len(COLUMNS)
+    return reads
+
+
+def measure(models: list) -> float:
+    """Time the best of three passes over the models."""
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        read_all(models)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(size: int = 100000) -> None:
+    connection = Connection({"driver": "sqlite", "database": ":memory:"}).connect()
+    connection.statement(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50), email VARCHAR(100), age INTEGER,"
+        " city VARCHAR(50), country VARCHAR(50), score REAL, active INTEGER, created_at TEXT, updated_at TEXT)"
+    )
+    connection.get_connection().execute(
+        text(
+            "INSERT INTO users (name, email, age, city, country, score, active, created_at, updated_at)"
+            " VALUES (:name, :email, :age, 'Lisbon', 'PT', :score, :active, :stamp, :stamp)"
+        ),
+        [
+            {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90, "score": i / 7,
+             "active": i % 2, "stamp": "2024-01-01 00:00:00"}
+            for i in range(size)
+        ],
+    )
+    connection.get_connection().commit()
+    User._connection = LegacyUser._connection = connection
+
+    legacy = LegacyUser.query().get().all()
+    models = User.query().get().all()
+
+    before_s = measure(legacy)
+    after_s = measure(models)
+
+    for column in COLUMNS:
+        assert getattr(models[-1], column) == getattr(legacy[-1], column)
+
+    print(
+        f"read {len(COLUMNS)} attributes x {size} models   before {before_s * 1e3:>8.1f} ms"
+        f"   after {after_s * 1e3:>8.1f} ms   x{before_s / after_s:>4.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Model Hydration Benchmark
+
+Hydrates 100,000 rows from an in-memory SQLite table into models, comparing
+Builder.get() (tuple rows with one shared column list, one attributes dict
+per model, original attributes rebuilt from the row only when needed) with
+the previous path: a dict per row from row._mapping, then two copies of it
+per model for the attributes and the original attributes.
+Run with: python benchmarks/bench_model_hydration.py
+"""
+
+import time
+import tracemalloc
+
+from sqlalchemy import text
+
+from larapy.database.connection import Connection
+from larapy.database.orm import Model
+
+
+class User(Model):
+    _table = "users"
+
+
+def legacy_get(connection: Connection) -> list:
+    """The select and hydration the ORM builder used before tuple rows."""
+    result = connection.get_connection().execute(text("SELECT * FROM users"))
+    rows = [dict(row._mapping) for row in result.fetchall()]
+
+    models = []
+    for attributes in rows:
+        model = User(connection=connection)
+        model._attributes = attributes.copy()
+        model._original = attributes.copy()
+        model._exists = True
+        model._was_recently_created = False
+        models.append(model)
+    return models
+
+
+def measure(action) -> tuple:
+    """Time one run, then trace a second run for its peak memory."""
+    started = time.perf_counter()
+    models = action()
+    elapsed = time.perf_counter() - started
+    del models
+
+    tracemalloc.start()
+    models = action()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return models, elapsed, peak
+
+
+def main(size: int = 100000) -> None:
+    connection = Connection({"driver": "sqlite", "database": ":memory:"}).connect()
+    connection.statement(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50), email VARCHAR(100),"
+        " age INTEGER, created_at TEXT, updated_at TEXT)"
+    )
+    connection.get_connection().execute(
+        text(
+            "INSERT INTO users (name, email, age, created_at, updated_at)"
+            " VALUES (:name, :email, :age, :stamp, :stamp)"
+        ),
+        [
+            {"name": f"user{i}", "email": f"user{i}@example.com", "age": i % 90,
+             "stamp": "2024-01-01 00:00:00"}
+            for i in range(size)
+        ],
+    )
+    connection.get_connection().commit()
+    User._connection = connection
+
+    before, before_s, before_peak = measure(lambda: legacy_get(connection))
+    after, after_s, after_peak = measure(lambda: User.query().get().all())
+
+    assert len(before) == len(after) == size
+    assert after[-1].get_attributes() == before[-1].get_attributes()
+    assert not after[-1].is_dirty()
+
+    print(
+        f"hydrate {size} rows   before {before_s * 1e3:>8.1f} ms"
+        f"   after {after_s * 1e3:>8.1f} ms   x{before_s / after_s:>4.1f}"
+    )
+    print(
+        f"peak memory          before {before_peak / 2**20:>8.1f} MB"
+        f"   after {after_peak / 2**20:>8.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
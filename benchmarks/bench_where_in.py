@@ -0,0 +1,68 @@
+"""
+WHERE IN Benchmark
+
+Runs a query builder where_in() over 10,000 ids against an in-memory SQLite
+table, comparing the cached statement with an expanding parameter against
+the previous path: one "?" per id, rewritten one at a time into named
+parameters and wrapped in a fresh text() on every execution.
+Run with: python benchmarks/bench_where_in.py
+"""
+
+import timeit
+
+from sqlalchemy import text
+
+from larapy.database.connection import Connection
+
+
+def legacy_prepare_bindings(query: str, bindings: list) -> tuple:
+    """The placeholder rewrite Connection used before the statement cache."""
+    params = {}
+
+    for i, value in enumerate(bindings):
+        param_name = f"param_{i}"
+        params[param_name] = value
+        query = query.replace("?", f":{param_name}", 1)
+
+    return query, params
+
+
+def legacy_where_in(connection: Connection, ids: list) -> list:
+    placeholders = ", ".join(["?" for _ in ids])
+    query, params = legacy_prepare_bindings(
+        f"SELECT * FROM users WHERE id IN ({placeholders})", ids
+    )
+    result = connection.get_connection().execute(text(query), params)
+    return [dict(row._mapping) for row in result.fetchall()]
+
+
+def main(size: int = 10000, number: int = 20) -> None:
+    connection = Connection({"driver": "sqlite", "database": ":memory:"}).connect()
+    connection.statement("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))")
+    connection.get_connection().execute(
+        text("INSERT INTO users (id, name) VALUES (:id, :name)"),
+        [{"id": i, "name": f"user{i}"} for i in range(1, size + 1)],
+    )
+    connection.get_connection().commit()
+
+    ids = list(range(1, size + 1))
+
+    def current():
+        return connection.table("users").where_in("id", ids).get()
+
+    assert len(current()) == len(legacy_where_in(connection, ids)) == size
+
+    before = timeit.timeit(lambda: legacy_where_in(connection, ids), number=number)
+    after = timeit.timeit(current, number=number)
+
+    before_ms = before / number * 1e3
+    after_ms = after / number * 1e3
+    print(
+        f"where_in({size} ids)   before {before_ms:>8.2f} ms"
+        f"   after {after_ms:>8.2f} ms   x{before_ms / after_ms:>5.1f}"
+    )
+    print(f"statement cache: {connection.statement_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
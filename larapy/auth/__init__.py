@@ -1,13 +1,4 @@
-from larapy.auth.authenticatable import Authenticatable
-from larapy.auth.user_provider import UserProvider, DatabaseUserProvider
-from larapy.auth.guard import Guard, SessionGuard
-from larapy.auth.auth_manager import AuthManager
-from larapy.auth.passwords import Hash
-from larapy.auth.gate import Gate
-from larapy.auth.policy import Policy
-from larapy.auth.exceptions import AuthorizationException
-from larapy.auth.authorizes_requests import AuthorizesRequests
-from larapy.auth.gate_service_provider import GateServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Authenticatable",
@@ -23,3 +14,19 @@ __all__ = [
     "AuthorizesRequests",
     "GateServiceProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.auth.authenticatable": ["Authenticatable"],
+        "larapy.auth.user_provider": ["UserProvider", "DatabaseUserProvider"],
+        "larapy.auth.guard": ["Guard", "SessionGuard"],
+        "larapy.auth.auth_manager": ["AuthManager"],
+        "larapy.auth.passwords": ["Hash"],
+        "larapy.auth.gate": ["Gate"],
+        "larapy.auth.policy": ["Policy"],
+        "larapy.auth.exceptions": ["AuthorizationException"],
+        "larapy.auth.authorizes_requests": ["AuthorizesRequests"],
+        "larapy.auth.gate_service_provider": ["GateServiceProvider"],
+    },
+)
@@ -1,8 +1,4 @@
-from larapy.auth.controllers.login_controller import LoginController
-from larapy.auth.controllers.register_controller import RegisterController
-from larapy.auth.controllers.forgot_password_controller import ForgotPasswordController
-from larapy.auth.controllers.reset_password_controller import ResetPasswordController
-from larapy.auth.controllers.verification_controller import VerificationController
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "LoginController",
@@ -11,3 +7,14 @@ __all__ = [
     "ResetPasswordController",
     "VerificationController",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.auth.controllers.login_controller": ["LoginController"],
+        "larapy.auth.controllers.register_controller": ["RegisterController"],
+        "larapy.auth.controllers.forgot_password_controller": ["ForgotPasswordController"],
+        "larapy.auth.controllers.reset_password_controller": ["ResetPasswordController"],
+        "larapy.auth.controllers.verification_controller": ["VerificationController"],
+    },
+)
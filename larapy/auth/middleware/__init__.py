@@ -1,7 +1,4 @@
-from larapy.auth.middleware.authorize import AuthorizeMiddleware
-from larapy.auth.middleware.authenticate import Authenticate
-from larapy.auth.middleware.redirect_if_authenticated import RedirectIfAuthenticated
-from larapy.auth.middleware.ensure_email_is_verified import EnsureEmailIsVerified
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "AuthorizeMiddleware",
@@ -9,3 +6,13 @@ __all__ = [
     "RedirectIfAuthenticated",
     "EnsureEmailIsVerified",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.auth.middleware.authorize": ["AuthorizeMiddleware"],
+        "larapy.auth.middleware.authenticate": ["Authenticate"],
+        "larapy.auth.middleware.redirect_if_authenticated": ["RedirectIfAuthenticated"],
+        "larapy.auth.middleware.ensure_email_is_verified": ["EnsureEmailIsVerified"],
+    },
+)
@@ -1,5 +1,12 @@
-from larapy.auth.passwords.hash import Hash
-from larapy.auth.passwords.password_broker import PasswordBroker
-from larapy.auth.passwords.token_repository import TokenRepository
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Hash", "PasswordBroker", "TokenRepository"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.auth.passwords.hash": ["Hash"],
+        "larapy.auth.passwords.password_broker": ["PasswordBroker"],
+        "larapy.auth.passwords.token_repository": ["TokenRepository"],
+    },
+)
@@ -1,12 +1,4 @@
-from larapy.broadcasting.broadcast_manager import BroadcastManager
-from larapy.broadcasting.broadcaster import Broadcaster
-from larapy.broadcasting.channel import Channel
-from larapy.broadcasting.channel_authenticator import ChannelAuthenticator
-from larapy.broadcasting.channel_router import ChannelRouter, BroadcastChannelRoute
-from larapy.broadcasting.broadcast_event import BroadcastEvent
-from larapy.broadcasting.should_broadcast import ShouldBroadcast
-from larapy.broadcasting.presence_channel import PresenceChannel
-from larapy.broadcasting.broadcast_service_provider import BroadcastServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "BroadcastManager",
@@ -20,3 +12,18 @@ __all__ = [
     "PresenceChannel",
     "BroadcastServiceProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.broadcasting.broadcast_manager": ["BroadcastManager"],
+        "larapy.broadcasting.broadcaster": ["Broadcaster"],
+        "larapy.broadcasting.channel": ["Channel"],
+        "larapy.broadcasting.channel_authenticator": ["ChannelAuthenticator"],
+        "larapy.broadcasting.channel_router": ["ChannelRouter", "BroadcastChannelRoute"],
+        "larapy.broadcasting.broadcast_event": ["BroadcastEvent"],
+        "larapy.broadcasting.should_broadcast": ["ShouldBroadcast"],
+        "larapy.broadcasting.presence_channel": ["PresenceChannel"],
+        "larapy.broadcasting.broadcast_service_provider": ["BroadcastServiceProvider"],
+    },
+)
@@ -1,7 +1,7 @@
-from larapy.support import ServiceProvider
+from larapy.support import DeferrableProvider, ServiceProvider
 
 
-class BroadcastServiceProvider(ServiceProvider):
+class BroadcastServiceProvider(ServiceProvider, DeferrableProvider):
     def register(self):
         self.app.singleton("broadcast", lambda c: self._create_broadcast_manager(c))
         self.app.singleton("broadcast.channel", lambda c: self._create_channel_router())
@@ -18,3 +18,6 @@ class BroadcastServiceProvider(ServiceProvider):
 
     def boot(self):
         pass
+
+    def provides(self):
+        return ["broadcast", "broadcast.channel"]
@@ -1,7 +1,4 @@
-from larapy.broadcasting.broadcasters.pusher_broadcaster import PusherBroadcaster
-from larapy.broadcasting.broadcasters.redis_broadcaster import RedisBroadcaster
-from larapy.broadcasting.broadcasters.log_broadcaster import LogBroadcaster
-from larapy.broadcasting.broadcasters.null_broadcaster import NullBroadcaster
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "PusherBroadcaster",
@@ -9,3 +6,13 @@ __all__ = [
     "LogBroadcaster",
     "NullBroadcaster",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.broadcasting.broadcasters.pusher_broadcaster": ["PusherBroadcaster"],
+        "larapy.broadcasting.broadcasters.redis_broadcaster": ["RedisBroadcaster"],
+        "larapy.broadcasting.broadcasters.log_broadcaster": ["LogBroadcaster"],
+        "larapy.broadcasting.broadcasters.null_broadcaster": ["NullBroadcaster"],
+    },
+)
@@ -1,4 +1,26 @@
-from larapy.cache.rate_limiter import RateLimiter, Limit
-from larapy.cache.cache_manager import CacheManager, cache, reset_cache
+from larapy.support.lazy_loader import lazy_exports
 
-__all__ = ["RateLimiter", "Limit", "CacheManager", "cache", "reset_cache"]
+__all__ = [
+    "RateLimiter",
+    "Limit",
+    "CacheManager",
+    "cache",
+    "reset_cache",
+    "ArrayStore",
+    "FileStore",
+    "RedisStore",
+    "make_store",
+    "QueryCache",
+    "query_cache",
+    "set_query_cache_store",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.cache.rate_limiter": ["RateLimiter", "Limit"],
+        "larapy.cache.cache_manager": ["CacheManager", "cache", "reset_cache"],
+        "larapy.cache.stores": ["ArrayStore", "FileStore", "RedisStore", "make_store"],
+        "larapy.cache.query_cache": ["QueryCache", "query_cache", "set_query_cache_store"],
+    },
+)
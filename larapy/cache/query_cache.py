@@ -0,0 +1,107 @@
+"""
+Query Result Cache for Larapy
+
+Caches remembered query results tagged by the tables they read. Each table
+has a version token kept in the store; a write to the table replaces the
+token, so results cached under the old one are never served again and can
+be kept with long TTLs.
+"""
+
+import uuid
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+from larapy.cache.cache_manager import cache
+
+
+class QueryCache:
+    """
+    Versioned cache of query results.
+
+    Results are stored under their key combined with the current version of
+    every table they read. Without an explicit store the global cache() is
+    used.
+    """
+
+    VERSION_PREFIX = "query_cache:version:"
+
+    def __init__(self, store: Any = None):
+        self._store = store
+
+    @property
+    def store(self) -> Any:
+        return self._store if self._store is not None else cache()
+
+    def versioned_key(self, key: str, tables: Iterable[str]) -> str:
+        """
+        Combine a query's key with the current version of its tables.
+
+        Compute this before running the query, so a result read while a write
+        commits is stored under the outdated version and never served.
+        """
+        versions = ":".join(self._version(table) for table in sorted(set(tables)))
+        return f"query_cache:{key}:{versions}"
+
+    def get(self, versioned_key: str) -> Optional[Any]:
+        return self.store.get(versioned_key)
+
+    def put(self, versioned_key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.store.put(versioned_key, value, ttl)
+
+    def flush_tables(self, *tables: str) -> None:
+        """Invalidate every cached result that read any of the tables."""
+        for table in tables:
+            self.store.put(self.VERSION_PREFIX + table, self._new_version())
+
+    def _version(self, table: str) -> str:
+        version = self.store.get(self.VERSION_PREFIX + table)
+
+        if version is None:
+            # A lost version (evicted, expired or never set) starts a new one,
+            # so entries stored under the old version cannot come back.
+            version = self._new_version()
+            self.store.put(self.VERSION_PREFIX + table, version)
+
+        return version
+
+    @staticmethod
+    def _new_version() -> str:
+        return uuid.uuid4().hex[:16]
+
+
+# Global query cache instance
+_query_cache_instance: Optional[QueryCache] = None
+_query_cache_lock = Lock()
+
+
+def query_cache() -> QueryCache:
+    """
+    Get the global query cache used by QueryBuilder.remember().
+
+    Returns:
+        The global QueryCache instance
+    """
+    global _query_cache_instance
+    if _query_cache_instance is None:
+        with _query_cache_lock:
+            if _query_cache_instance is None:
+                _query_cache_instance = QueryCache()
+    return _query_cache_instance
+
+
+def set_query_cache_store(store: Any = None) -> QueryCache:
+    """
+    Store remembered query results in the given store.
+
+    Args:
+        store: An ArrayStore, FileStore, RedisStore or any object with
+            get/put/forget/flush; None goes back to the global cache()
+
+    Returns:
+        The new global QueryCache instance
+    """
+    global _query_cache_instance
+    with _query_cache_lock:
+        _query_cache_instance = QueryCache(store)
+    return _query_cache_instance
+
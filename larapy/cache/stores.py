@@ -0,0 +1,199 @@
+"""
+Cache Stores for Larapy
+
+Interchangeable backends for cached values such as remembered query results.
+Every store implements get(), put(), forget() and flush(), the same methods
+as CacheManager, so any of them can stand in for the global cache.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+
+class ArrayStore:
+    """
+    In-memory store that evicts the least recently used entry when full.
+
+    Thread-safe; entries live as long as the process.
+    """
+
+    def __init__(self, max_items: Optional[int] = 10000):
+        """
+        Args:
+            max_items: Number of entries kept before the least recently used
+                one is evicted (None for no limit)
+        """
+        self.max_items = max_items
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and time.time() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            if self.max_items is not None:
+                while len(self._entries) > self.max_items:
+                    self._entries.popitem(last=False)
+
+    def forget(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def flush(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class FileStore:
+    """
+    Store that pickles each entry into its own file under a directory.
+
+    Entries survive restarts and are shared by every process using the same
+    directory. Files are replaced atomically, so readers never see a
+    partially written entry.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as handle:
+                expires_at, value = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if expires_at is not None and time.time() > expires_at:
+            self.forget(key)
+            return None
+
+        return value
+
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                pickle.dump((expires_at, value), handle, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    def forget(self, key: str) -> bool:
+        try:
+            os.remove(self._path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def flush(self) -> None:
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+
+class RedisStore:
+    """
+    Store backed by a Redis client (redis-py or compatible).
+
+    Values are pickled; integers are stored as plain numbers so they stay
+    readable from other clients. All keys are namespaced by ``prefix``.
+    """
+
+    def __init__(self, redis: Any, prefix: str = "larapy_cache:"):
+        self.redis = redis
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.redis.get(self.prefix + key)
+        if raw is None:
+            return None
+
+        if isinstance(raw, bytes) and raw.lstrip(b"-").isdigit():
+            return int(raw)
+        return pickle.loads(raw)
+
+    def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        if isinstance(value, int) and not isinstance(value, bool):
+            payload = str(value).encode()
+        else:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        if ttl is not None:
+            self.redis.setex(self.prefix + key, max(int(ttl), 1), payload)
+        else:
+            self.redis.set(self.prefix + key, payload)
+
+    def forget(self, key: str) -> bool:
+        return bool(self.redis.delete(self.prefix + key))
+
+    def flush(self) -> None:
+        keys = list(self.redis.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.redis.delete(*keys)
+
+
+def make_store(config: Dict[str, Any], redis: Any = None):
+    """
+    Build a store from a config dictionary.
+
+    Args:
+        config: {"driver": "array", "max_items": ...}, {"driver": "file",
+            "path": ...} or {"driver": "redis", "prefix": ...}
+        redis: Redis client, required for the redis driver
+
+    Returns:
+        The configured store
+    """
+    driver = config.get("driver", "array")
+
+    if driver == "array":
+        return ArrayStore(config.get("max_items", 10000))
+
+    if driver == "file":
+        return FileStore(config.get("path", "storage/framework/cache/queries"))
+
+    if driver == "redis":
+        if redis is None:
+            raise ValueError("The redis cache store requires a Redis client")
+        return RedisStore(redis, config.get("prefix", "larapy_cache:"))
+
+    raise ValueError(f"Unsupported cache store driver: {driver}")
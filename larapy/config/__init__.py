@@ -4,20 +4,18 @@ Configuration Module
 Provides configuration management for the framework.
 """
 
-from larapy.config.repository import Repository
-from larapy.config.environment import Environment, env
-from larapy.config.config_service_provider import ConfigServiceProvider
-from larapy.config.helpers import config, set_config_instance
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Repository",
-    "Environment",
-    "env",
-    "ConfigServiceProvider",
-    "config",
-    "set_config_instance",
 ]
 
-__all__ = [
-    "Repository",
-]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.config.repository": ["Repository"],
+        "larapy.config.environment": ["Environment", "env"],
+        "larapy.config.config_service_provider": ["ConfigServiceProvider"],
+        "larapy.config.helpers": ["config", "set_config_instance"],
+    },
+)
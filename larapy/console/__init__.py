@@ -1,4 +1,11 @@
-from larapy.console.command import Command
-from larapy.console.kernel import Kernel
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Command", "Kernel"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.console.command": ["Command"],
+        "larapy.console.kernel": ["Kernel"],
+    },
+)
@@ -1,13 +1,4 @@
-from larapy.console.commands.migrate_command import MigrateCommand
-from larapy.console.commands.migrate_rollback_command import MigrateRollbackCommand
-from larapy.console.commands.migrate_reset_command import MigrateResetCommand
-from larapy.console.commands.migrate_refresh_command import MigrateRefreshCommand
-from larapy.console.commands.migrate_fresh_command import MigrateFreshCommand
-from larapy.console.commands.migrate_status_command import MigrateStatusCommand
-from larapy.console.commands.db_seed_command import DbSeedCommand
-from larapy.console.commands.make_migration_command import MakeMigrationCommand
-from larapy.console.commands.make_seeder_command import MakeSeederCommand
-from larapy.console.commands.make_factory_command import MakeFactoryCommand
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "MigrateCommand",
@@ -21,3 +12,19 @@ __all__ = [
     "MakeSeederCommand",
     "MakeFactoryCommand",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.console.commands.migrate_command": ["MigrateCommand"],
+        "larapy.console.commands.migrate_rollback_command": ["MigrateRollbackCommand"],
+        "larapy.console.commands.migrate_reset_command": ["MigrateResetCommand"],
+        "larapy.console.commands.migrate_refresh_command": ["MigrateRefreshCommand"],
+        "larapy.console.commands.migrate_fresh_command": ["MigrateFreshCommand"],
+        "larapy.console.commands.migrate_status_command": ["MigrateStatusCommand"],
+        "larapy.console.commands.db_seed_command": ["DbSeedCommand"],
+        "larapy.console.commands.make_migration_command": ["MakeMigrationCommand"],
+        "larapy.console.commands.make_seeder_command": ["MakeSeederCommand"],
+        "larapy.console.commands.make_factory_command": ["MakeFactoryCommand"],
+    },
+)
@@ -0,0 +1,31 @@
+from larapy.console.command import Command
+from larapy.routing.route_cache import RouteCache, RouteCacheException
+
+
+class RouteCacheCommand(Command):
+    signature = "route:cache"
+    description = "Create a route cache file for faster route registration"
+
+    def __init__(self, container=None):
+        super().__init__()
+        self.container = container
+
+    def handle(self) -> int:
+        if self.container is None or not self.container.bound("router"):
+            self.error("No router is registered in the container.")
+            return 1
+
+        cache = RouteCache(self.container.get_cached_routes_path())
+        cache.clear()
+
+        router = self.container.make("router")
+
+        try:
+            count = cache.write(router)
+        except RouteCacheException as e:
+            self.error(str(e))
+            return 1
+
+        self.info(f"Routes cached successfully ({count} routes).")
+
+        return 0
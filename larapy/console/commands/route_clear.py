@@ -0,0 +1,22 @@
+from larapy.console.command import Command
+from larapy.routing.route_cache import RouteCache
+
+
+class RouteClearCommand(Command):
+    signature = "route:clear"
+    description = "Remove the route cache file"
+
+    def __init__(self, container=None):
+        super().__init__()
+        self.container = container
+
+    def handle(self) -> int:
+        if self.container is None:
+            self.error("No application container is available.")
+            return 1
+
+        RouteCache(self.container.get_cached_routes_path()).clear()
+
+        self.info("Route cache cleared successfully.")
+
+        return 0
@@ -1,11 +1,4 @@
-from larapy.console.scheduling.schedule import Schedule
-from larapy.console.scheduling.event import Event
-from larapy.console.scheduling.command_event import CommandEvent
-from larapy.console.scheduling.callback_event import CallbackEvent
-from larapy.console.scheduling.job_event import JobEvent
-from larapy.console.scheduling.exec_event import ExecEvent
-from larapy.console.scheduling.event_mutex import EventMutex
-from larapy.console.scheduling.schedule_runner import ScheduleRunner
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Schedule",
@@ -17,3 +10,17 @@ __all__ = [
     "EventMutex",
     "ScheduleRunner",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.console.scheduling.schedule": ["Schedule"],
+        "larapy.console.scheduling.event": ["Event"],
+        "larapy.console.scheduling.command_event": ["CommandEvent"],
+        "larapy.console.scheduling.callback_event": ["CallbackEvent"],
+        "larapy.console.scheduling.job_event": ["JobEvent"],
+        "larapy.console.scheduling.exec_event": ["ExecEvent"],
+        "larapy.console.scheduling.event_mutex": ["EventMutex"],
+        "larapy.console.scheduling.schedule_runner": ["ScheduleRunner"],
+    },
+)
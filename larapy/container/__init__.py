@@ -5,13 +5,7 @@ Provides dependency injection and inversion of control capabilities
 inspired by Laravel's service container.
 """
 
-from larapy.container.binding import Binding
-from larapy.container.container import Container
-from larapy.container.exceptions import (
-    BindingResolutionException,
-    CircularDependencyException,
-    ContainerException,
-)
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Container",
@@ -19,4 +13,19 @@ __all__ = [
     "ContainerException",
     "BindingResolutionException",
     "CircularDependencyException",
+    "ContainerCompilationException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.container.binding": ["Binding"],
+        "larapy.container.container": ["Container"],
+        "larapy.container.exceptions": [
+            "BindingResolutionException",
+            "CircularDependencyException",
+            "ContainerCompilationException",
+            "ContainerException",
+        ],
+    },
+)
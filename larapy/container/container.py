@@ -6,16 +6,23 @@ inspired by Laravel's service container.
 """
 
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from larapy.container.binding import Binding
 from larapy.container.exceptions import (
     BindingResolutionException,
     CircularDependencyException,
+    ContainerCompilationException,
+    ContainerException,
 )
+from larapy.container.resolution_plan import Dependency, ResolutionPlan, compile_dependencies
 
 T = TypeVar("T")
 
+# Upper bound on cached call() plans; closures created per request would
+# otherwise grow the cache without limit
+MAX_CALL_PLANS = 2048
+
 
 class Container:
     """
@@ -42,6 +49,13 @@ class Container:
         self._contextual: Dict[str, Dict[str, Any]] = {}
         self._build_stack: List[str] = []
         self._with: List[Dict[str, Any]] = []
+        self._concretes: Dict[Any, Tuple[str, Any, bool, bool]] = {}
+        self._concrete_index: Dict[str, Set[Any]] = {}
+        self._build_plans: Dict[type, ResolutionPlan] = {}
+        self._call_plans: Dict[Any, Tuple[Dependency, ...]] = {}
+        self._plan_hits = 0
+        self._plan_misses = 0
+        self._compiled = False
 
     def bind(
         self,
@@ -79,7 +93,9 @@ class Container:
         self._drop_stale_instances(abstract_key)
 
         # Store the binding
+        self._forget_compilation()
         self._bindings[abstract_key] = Binding(concrete=concrete, shared=shared)
+        self._forget_plans(abstract_key)
 
         # If this was resolved before, fire rebinding callbacks
         if abstract_key in self._resolved:
@@ -127,6 +143,7 @@ class Container:
 
         # Store the instance
         self._instances[abstract_key] = instance
+        self._forget_plans(abstract_key)
 
         return instance
 
@@ -172,10 +189,15 @@ class Container:
         Returns:
             The resolved instance
         """
-        # Keep original abstract for auto-wiring
-        original_abstract = abstract
-        abstract_key = self._get_abstract_key(abstract)
-        abstract_key = self._get_alias(abstract_key)
+        # Look up the cached key and concrete for this abstract
+        entry = self._concretes.get(abstract)
+
+        if entry is None:
+            entry = self._get_concrete_entry(abstract)
+        else:
+            self._plan_hits += 1
+
+        abstract_key, concrete, buildable, shared = entry
 
         # Check if we already have a singleton instance
         if abstract_key in self._instances:
@@ -189,11 +211,8 @@ class Container:
         if self._with:
             parameters = {**self._with[-1], **parameters}
 
-        # Get concrete implementation
-        concrete = self._get_concrete(abstract_key, original_abstract)
-
         # Build the instance
-        if self._is_buildable(concrete, abstract_key):
+        if buildable:
             instance = self._build(concrete, parameters)
         else:
             instance = self.make(concrete, parameters)
@@ -205,7 +224,7 @@ class Container:
         self._resolved[abstract_key] = True
 
         # If this is a shared binding, store the instance
-        if self._is_shared(abstract_key):
+        if shared:
             self._instances[abstract_key] = instance
 
         return instance
@@ -235,15 +254,41 @@ class Container:
         if parameters is None:
             parameters = {}
 
-        # Get the signature
-        sig = inspect.signature(callback)
-
         # Resolve dependencies
-        dependencies = self._resolve_dependencies(sig, parameters)
+        dependencies = self._resolve_dependencies(self._get_call_plan(callback), parameters)
 
         # Call the callback
         return callback(**dependencies)
 
+    def _get_concrete_entry(self, abstract: Union[str, Type]) -> Tuple[str, Any, bool, bool]:
+        """
+        Get the cached key, concrete, buildable and shared flags for an abstract.
+
+        Args:
+            abstract: The abstract type or identifier
+
+        Returns:
+            Tuple of (abstract key, concrete, buildable, shared)
+        """
+        entry = self._concretes.get(abstract)
+
+        if entry is not None:
+            return entry
+
+        self._plan_misses += 1
+        abstract_key = self._get_alias(self._get_abstract_key(abstract))
+        concrete = self._get_concrete(abstract_key, abstract)
+        entry = (
+            abstract_key,
+            concrete,
+            self._is_buildable(concrete, abstract_key),
+            self._is_shared(abstract_key),
+        )
+        self._concretes[abstract] = entry
+        self._concrete_index.setdefault(abstract_key, set()).add(abstract)
+
+        return entry
+
     def _build(self, concrete: Union[Type[T], Callable], parameters: Dict[str, Any]) -> T:
         """
         Instantiate a concrete instance of the given type.
@@ -270,132 +315,161 @@ class Container:
                 f"Target '{concrete}' is not instantiable",
             )
 
+        plan = self._get_build_plan(concrete)
+
         # Check for circular dependencies
-        concrete_key = self._get_abstract_key(concrete)
-        if concrete_key in self._build_stack:
-            chain = self._build_stack + [concrete_key]
+        if plan.key in self._build_stack:
+            chain = self._build_stack + [plan.key]
             raise CircularDependencyException(chain)
 
         # Add to build stack
-        self._build_stack.append(concrete_key)
+        self._build_stack.append(plan.key)
 
         try:
-            # Get constructor
-            constructor = concrete.__init__
-
-            # Check if this class has its own __init__ or inherits from object
-            # If it inherits from object and has no custom __init__, just instantiate
-            if constructor is object.__init__:
-                # No custom constructor, just create instance
-                instance = concrete()
-            else:
-                # Custom constructor, resolve dependencies
-                sig = inspect.signature(constructor)
-                dependencies = self._resolve_dependencies(sig, parameters)
-                instance = concrete(**dependencies)
+            # Classes without a constructor of their own are just instantiated
+            if plan.dependencies is None:
+                return concrete()
 
-            # Remove from build stack
+            dependencies = self._resolve_dependencies(
+                plan.dependencies, parameters, plan.contextual
+            )
+            return concrete(**dependencies)
+        finally:
             self._build_stack.pop()
 
-            return instance
+    def _get_build_plan(self, concrete: type) -> ResolutionPlan:
+        """
+        Get the cached resolution plan for a class, compiling it on a miss.
+
+        Args:
+            concrete: The class to build
+
+        Returns:
+            Resolution plan
+        """
+        plan = self._build_plans.get(concrete)
+
+        if plan is not None:
+            self._plan_hits += 1
+            return plan
+
+        self._plan_misses += 1
+        key = self._get_abstract_key(concrete)
 
-        except Exception as e:
-            # Clean up build stack on error
-            if concrete_key in self._build_stack:
-                self._build_stack.pop()
-            raise
+        if concrete.__init__ is object.__init__:
+            plan = ResolutionPlan(concrete, key, None, {})
+        else:
+            dependencies = compile_dependencies(concrete.__init__)
+            contextual: Dict[str, Any] = {}
+            bindings = self._contextual.get(key)
+            if bindings:
+                for dependency in dependencies:
+                    if dependency.annotation is not None:
+                        needed = self._get_abstract_key(dependency.annotation)
+                        if needed in bindings:
+                            contextual[dependency.name] = bindings[needed]
+            plan = ResolutionPlan(concrete, key, dependencies, contextual)
+
+        self._build_plans[concrete] = plan
+        return plan
+
+    def _get_call_plan(self, callback: Callable) -> Tuple[Dependency, ...]:
+        """
+        Get the cached dependencies of a callable, compiling them on a miss.
+
+        Bound methods are cached by their underlying function so a new
+        instance per request still hits the cache.
+
+        Args:
+            callback: The callable to analyze
+
+        Returns:
+            Ordered dependencies
+        """
+        bound = inspect.ismethod(callback)
+        target = callback.__func__ if bound else callback
+
+        try:
+            dependencies = self._call_plans.get((target, bound))
+        except TypeError:
+            # Unhashable callables are analyzed on every call
+            self._plan_misses += 1
+            return compile_dependencies(callback)
+
+        if dependencies is not None:
+            self._plan_hits += 1
+            return dependencies
+
+        self._plan_misses += 1
+        dependencies = compile_dependencies(target, skip_first=bound)
+
+        if len(self._call_plans) >= MAX_CALL_PLANS:
+            self._call_plans.clear()
+        self._call_plans[(target, bound)] = dependencies
+
+        return dependencies
 
     def _resolve_dependencies(
         self,
-        signature: inspect.Signature,
+        dependencies: Tuple[Dependency, ...],
         parameters: Dict[str, Any],
+        contextual: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Resolve all dependencies for a given signature.
+        Resolve the dependencies of a plan.
 
         Uses type hints to automatically resolve dependencies from the container.
 
         Args:
-            signature: The function/method signature
+            dependencies: Compiled dependencies
             parameters: Already provided parameters
+            contextual: Contextual bindings by parameter name (looked up from
+                the build stack when None)
 
         Returns:
             Dictionary of parameter names to resolved values
         """
-        # Builtins that should not be auto-wired
-        BUILTINS = (str, int, float, bool, list, dict, set, tuple, bytes, bytearray)
+        resolved = {}
 
-        dependencies = {}
+        for dependency in dependencies:
+            name = dependency.name
 
-        for param_name, param in signature.parameters.items():
-            # Skip 'self' and 'cls'
-            if param_name in ("self", "cls"):
+            # Use provided parameter if available
+            if name in parameters:
+                resolved[name] = parameters[name]
                 continue
 
-            # Skip *args and **kwargs
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+            annotation = dependency.annotation
 
-            # Use provided parameter if available
-            if param_name in parameters:
-                dependencies[param_name] = parameters[param_name]
-                continue
+            # No resolvable type hint: let Python use the default
+            if annotation is None:
+                if dependency.has_default:
+                    continue
+                raise BindingResolutionException(name, dependency.error)
 
-            # Try to resolve from type hint
-            if param.annotation != inspect.Parameter.empty:
-                annotation = param.annotation
-
-                # Skip forward references (strings) for now
-                # They can't be easily resolved without the module context
-                if isinstance(annotation, str):
-                    if param.default != inspect.Parameter.empty:
-                        # Don't add to dependencies, let Python use the default
-                        continue
-                    else:
-                        raise BindingResolutionException(
-                            param_name,
-                            f"Unable to resolve forward reference '{annotation}'. Consider using actual class references.",
-                        )
-
-                # Skip builtin types - they should use defaults or be explicitly provided
-                if annotation in BUILTINS:
-                    if param.default != inspect.Parameter.empty:
-                        continue
-                    else:
-                        raise BindingResolutionException(
-                            param_name,
-                            f"Cannot auto-wire builtin type '{annotation.__name__}' for parameter '{param_name}'. Provide a default or pass it explicitly.",
-                        )
-
-                # Check for contextual binding first
-                contextual = self._get_contextual_concrete(annotation)
-                if contextual is not None:
-                    dependencies[param_name] = self.make(contextual)
-                else:
-                    # Try to resolve the type hint
-                    try:
-                        dependencies[param_name] = self.make(annotation)
-                    except BindingResolutionException:
-                        # If can't resolve and has default, don't add to dependencies
-                        # Let Python use the default value
-                        if param.default != inspect.Parameter.empty:
-                            continue
-                        else:
-                            raise BindingResolutionException(
-                                param_name,
-                                f"Unable to resolve dependency '{param_name}' of type '{annotation}'",
-                            )
-            elif param.default != inspect.Parameter.empty:
-                # Has default value, don't add to dependencies
-                # Let Python use the default
-                continue
+            # Check for contextual binding first
+            if contextual is None:
+                concrete = self._get_contextual_concrete(annotation)
             else:
+                concrete = contextual.get(name)
+
+            if concrete is not None:
+                resolved[name] = self.make(concrete)
+                continue
+
+            # Try to resolve the type hint
+            try:
+                resolved[name] = self.make(annotation)
+            except BindingResolutionException:
+                # If can't resolve and has default, let Python use the default value
+                if dependency.has_default:
+                    continue
                 raise BindingResolutionException(
-                    param_name,
-                    f"Unresolvable dependency '{param_name}' with no type hint or default",
+                    name,
+                    f"Unable to resolve dependency '{name}' of type '{annotation}'",
                 )
 
-        return dependencies
+        return resolved
 
     def _get_concrete(self, abstract_key: str, original_abstract: Union[str, Type] = None) -> Any:
         """Get the concrete implementation for an abstract type."""
@@ -501,7 +575,9 @@ class Container:
             >>> container.alias('app.cache', 'cache')
             >>> cache = container.make('cache')  # Resolves 'app.cache'
         """
+        self._forget_compilation()
         self._aliases[alias] = abstract
+        self.forget_resolution_plans()
 
     def tag(self, abstracts: List[Union[str, Type]], tags: List[str]) -> None:
         """
@@ -515,6 +591,8 @@ class Container:
             >>> container.tag([RedisCache, FileCache], ['cache', 'storage'])
             >>> caches = container.tagged('cache')
         """
+        self._forget_compilation()
+
         for tag in tags:
             if tag not in self._tags:
                 self._tags[tag] = []
@@ -551,6 +629,7 @@ class Container:
 
         Useful for testing or resetting the container state.
         """
+        self._forget_compilation()
         self._bindings.clear()
         self._instances.clear()
         self._aliases.clear()
@@ -561,6 +640,186 @@ class Container:
         self._contextual.clear()
         self._build_stack.clear()
         self._with.clear()
+        self.forget_resolution_plans()
+
+    def add_contextual_binding(
+        self,
+        concrete: Union[str, Type],
+        abstract: Union[str, Type],
+        implementation: Any,
+    ) -> None:
+        """
+        Register a contextual binding: when building concrete, resolve
+        dependencies on abstract with implementation.
+
+        Args:
+            concrete: The class being built
+            abstract: The dependency type it needs
+            implementation: What to give it
+
+        Example:
+            >>> container.add_contextual_binding(PhotoController, Filesystem, S3Filesystem)
+        """
+        concrete_key = self._get_abstract_key(concrete)
+        abstract_key = self._get_abstract_key(abstract)
+
+        self._forget_compilation()
+        self._contextual.setdefault(concrete_key, {})[abstract_key] = implementation
+
+        for cls in [cls for cls, plan in self._build_plans.items() if plan.key == concrete_key]:
+            del self._build_plans[cls]
+
+    def compile(self) -> None:
+        """
+        Compile and validate the resolution plans of every registered service.
+
+        Walks the bindings, aliases and tagged services, compiles the plan of
+        each class they resolve to and checks that every dependency graph is
+        satisfiable and acyclic, so misconfiguration fails at boot instead of
+        on a request. The binding tables stay writable: registering another
+        binding afterwards (as deferred providers do) leaves the container
+        uncompiled until compile() validates it again.
+
+        Raises:
+            ContainerCompilationException: Listing every misconfigured service
+
+        Example:
+            >>> container.singleton(Mailer, SmtpMailer)
+            >>> container.compile()
+        """
+        self._forget_compilation()
+
+        errors: Dict[str, ContainerException] = {}
+        validated: Set[str] = set()
+
+        for abstract in self._compile_targets():
+            try:
+                self._validate(abstract, [], validated)
+            except ContainerException as e:
+                errors[self._get_abstract_key(abstract)] = e
+
+        if errors:
+            raise ContainerCompilationException(errors)
+
+        self._compiled = True
+
+    def is_compiled(self) -> bool:
+        """
+        Determine if every registered service was validated by compile().
+
+        Returns:
+            True if compiled, False otherwise
+        """
+        return self._compiled
+
+    def _compile_targets(self) -> List[Union[str, Type]]:
+        """Get the abstracts compile() validates."""
+        targets: List[Union[str, Type]] = list(self._bindings)
+        targets.extend(self._aliases)
+
+        for keys in self._tags.values():
+            targets.extend(keys)
+
+        return list(dict.fromkeys(targets))
+
+    def _validate(self, abstract: Any, stack: List[str], validated: Set[str]) -> None:
+        """
+        Check that an abstract can be resolved without building it.
+
+        Args:
+            abstract: The abstract type or identifier
+            stack: Classes being validated, for cycle detection
+            validated: Keys already known to resolve
+
+        Raises:
+            BindingResolutionException: If a dependency cannot be satisfied
+            CircularDependencyException: If the dependency graph has a cycle
+        """
+        if not isinstance(abstract, (str, type)):
+            raise BindingResolutionException(str(abstract), f"Target '{abstract}' is not instantiable")
+
+        abstract_key, concrete, buildable, _ = self._get_concrete_entry(abstract)
+
+        if abstract_key in self._instances or abstract_key in validated:
+            return
+
+        if not buildable:
+            if abstract_key in stack:
+                raise CircularDependencyException(stack + [abstract_key])
+            self._validate(concrete, stack + [abstract_key], validated)
+            validated.add(abstract_key)
+            return
+
+        # Factories are opaque until called
+        if not inspect.isclass(concrete):
+            if not callable(concrete):
+                raise BindingResolutionException(
+                    str(concrete),
+                    f"Target '{concrete}' is not instantiable",
+                )
+            validated.add(abstract_key)
+            return
+
+        plan = self._get_build_plan(concrete)
+
+        if plan.key in stack:
+            raise CircularDependencyException(stack + [plan.key])
+
+        if inspect.isabstract(concrete):
+            raise BindingResolutionException(plan.key, f"Target '{plan.key}' is not instantiable")
+
+        for dependency in plan.dependencies or ():
+            target = plan.contextual.get(dependency.name, dependency.annotation)
+
+            if target is None:
+                if dependency.has_default:
+                    continue
+                raise BindingResolutionException(dependency.name, dependency.error)
+
+            try:
+                self._validate(target, stack + [plan.key], validated)
+            except BindingResolutionException as e:
+                if dependency.has_default:
+                    continue
+                raise BindingResolutionException(
+                    dependency.name,
+                    f"Unable to resolve dependency '{dependency.name}' of type "
+                    f"'{dependency.annotation}' for '{plan.key}': {e}",
+                ) from e
+
+        validated.add(plan.key)
+        validated.add(abstract_key)
+
+    def _forget_compilation(self) -> None:
+        """Mark the container unvalidated after its bindings changed."""
+        self._compiled = False
+
+    def resolution_plan_stats(self) -> Dict[str, int]:
+        """
+        Get resolution plan cache counters.
+
+        Returns:
+            Hits, misses and the number of cached plans
+        """
+        return {
+            "hits": self._plan_hits,
+            "misses": self._plan_misses,
+            "concretes": len(self._concretes),
+            "build_plans": len(self._build_plans),
+            "call_plans": len(self._call_plans),
+        }
+
+    def forget_resolution_plans(self) -> None:
+        """Drop every cached resolution plan."""
+        self._concretes.clear()
+        self._concrete_index.clear()
+        self._build_plans.clear()
+        self._call_plans.clear()
+
+    def _forget_plans(self, abstract_key: str) -> None:
+        """Drop the cached concrete lookups that resolve to an abstract key."""
+        for abstract in self._concrete_index.pop(abstract_key, ()):
+            self._concretes.pop(abstract, None)
 
     def __repr__(self) -> str:
         """String representation of the container."""
@@ -28,3 +28,13 @@ class CircularDependencyException(ContainerException):
         self.chain = chain
         message = f"Circular dependency detected: {' -> '.join(chain)}"
         super().__init__(message)
+
+
+class ContainerCompilationException(ContainerException):
+    """Raised when compiling the container finds misconfigured services."""
+
+    def __init__(self, errors: dict[str, ContainerException]) -> None:
+        self.errors = errors
+        details = "\n".join(f"  {abstract}: {error}" for abstract, error in errors.items())
+        message = f"Unable to compile the container ({len(errors)} misconfigured):\n{details}"
+        super().__init__(message)
@@ -0,0 +1,159 @@
+"""
+Resolution Plans
+
+Pre-computed parameter analysis for the classes and callables the container
+resolves, so a signature is inspected once instead of on every make() or
+call().
+"""
+
+import inspect
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Builtins that should not be auto-wired
+BUILTINS = (str, int, float, bool, list, dict, set, tuple, bytes, bytearray)
+
+
+class Dependency:
+    """
+    A parameter of a constructor or callable and how to fill it.
+
+    When the caller does not pass the parameter, an annotated dependency is
+    resolved from the container; otherwise the default is used or ``error``
+    is raised.
+    """
+
+    __slots__ = ("name", "annotation", "has_default", "error")
+
+    def __init__(
+        self,
+        name: str,
+        annotation: Optional[Any],
+        has_default: bool,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a dependency.
+
+        Args:
+            name: Parameter name
+            annotation: Type to resolve from the container, or None
+            has_default: Whether the parameter has a default value
+            error: Message raised when an unresolvable parameter has no default
+        """
+        self.name = name
+        self.annotation = annotation
+        self.has_default = has_default
+        self.error = error
+
+    def __repr__(self) -> str:
+        """String representation of the dependency."""
+        return f"<Dependency {self.name}: {self.annotation!r}>"
+
+
+class ResolutionPlan:
+    """
+    Cached recipe for building a class.
+
+    ``dependencies`` is None when the class has no constructor of its own.
+    ``contextual`` maps parameter names to contextual bindings registered
+    for the class.
+    """
+
+    __slots__ = ("concrete", "key", "dependencies", "contextual")
+
+    def __init__(
+        self,
+        concrete: type,
+        key: str,
+        dependencies: Optional[Tuple[Dependency, ...]],
+        contextual: Dict[str, Any],
+    ) -> None:
+        """
+        Initialize a resolution plan.
+
+        Args:
+            concrete: The class to build
+            key: The class's container key
+            dependencies: Constructor dependencies (None for object.__init__)
+            contextual: Contextual bindings by parameter name
+        """
+        self.concrete = concrete
+        self.key = key
+        self.dependencies = dependencies
+        self.contextual = contextual
+
+    def __repr__(self) -> str:
+        """String representation of the plan."""
+        return f"<ResolutionPlan {self.key} dependencies={self.dependencies!r}>"
+
+
+def compile_dependencies(target: Callable, skip_first: bool = False) -> Tuple[Dependency, ...]:
+    """
+    Analyze the parameters of a callable.
+
+    Args:
+        target: Function, method or class constructor
+        skip_first: Drop the first positional parameter (for bound methods
+            compiled from their underlying function)
+
+    Returns:
+        Ordered dependencies
+    """
+    dependencies = []
+    parameters = list(inspect.signature(target).parameters.values())
+
+    if skip_first and parameters and parameters[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        parameters = parameters[1:]
+
+    for param in parameters:
+        name = param.name
+
+        # Skip 'self' and 'cls'
+        if name in ("self", "cls"):
+            continue
+
+        # Skip *args and **kwargs
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+
+        has_default = param.default is not inspect.Parameter.empty
+        annotation = param.annotation
+
+        if annotation is inspect.Parameter.empty:
+            dependencies.append(
+                Dependency(
+                    name,
+                    None,
+                    has_default,
+                    f"Unresolvable dependency '{name}' with no type hint or default",
+                )
+            )
+        elif isinstance(annotation, str):
+            # Forward references can't be resolved without the module context
+            dependencies.append(
+                Dependency(
+                    name,
+                    None,
+                    has_default,
+                    f"Unable to resolve forward reference '{annotation}'. "
+                    "Consider using actual class references.",
+                )
+            )
+        elif annotation in BUILTINS:
+            # Builtins should use defaults or be explicitly provided
+            dependencies.append(
+                Dependency(
+                    name,
+                    None,
+                    has_default,
+                    f"Cannot auto-wire builtin type '{annotation.__name__}' for parameter "
+                    f"'{name}'. Provide a default or pass it explicitly.",
+                )
+            )
+        else:
+            dependencies.append(Dependency(name, annotation, has_default))
+
+    return tuple(dependencies)
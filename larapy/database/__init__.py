@@ -1,11 +1,6 @@
 """Database query builder and schema builder."""
 
-from larapy.database.connection import Connection
-from larapy.database.database_manager import DatabaseManager
-from larapy.database.database_service_provider import DatabaseServiceProvider
-from larapy.database.query.builder import QueryBuilder
-from larapy.database.schema.schema import Schema, Blueprint
-
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Connection",
@@ -15,3 +10,14 @@ __all__ = [
     "Schema",
     "Blueprint",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.connection": ["Connection"],
+        "larapy.database.database_manager": ["DatabaseManager"],
+        "larapy.database.database_service_provider": ["DatabaseServiceProvider"],
+        "larapy.database.query.builder": ["QueryBuilder"],
+        "larapy.database.schema.schema": ["Schema", "Blueprint"],
+    },
+)
@@ -1,17 +1,63 @@
-from typing import Any, Dict, List, Optional, Union
-from sqlalchemy import create_engine, text, MetaData, Table
+import random
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import bindparam, create_engine, text, MetaData, Table
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.engine import Engine, Connection as SQLAlchemyConnection, Result
 from sqlalchemy.pool import NullPool, QueuePool
 
+from larapy.database.connection_pool import ConnectionPool, PooledConnection
+
+
+class ExpandingList(list):
+    """
+    Binding rendered as a parenthesised list of parameters ("id IN ?").
+
+    where_in() and where_not_in() wrap their values in one; any other list
+    or tuple binding is passed to the driver as a single value (ARRAY and
+    JSON columns).
+    """
+
+
+class _PinnedConnection:
+    """Connection held by one thread or task for the length of a transaction."""
+
+    def __init__(self, connection: SQLAlchemyConnection, pooled: Optional[PooledConnection]):
+        self.connection = connection
+        self.pooled = pooled
+        self.transactions = []
+        self.callbacks = []
+
 
 class Connection:
     def __init__(self, config: Dict[str, Any]):
+        if "read" in config or "write" in config:
+            self._read_configs = _expand_hosts(_merge_role(config, "read"))
+            config = random.choice(_expand_hosts(_merge_role(config, "write")))
+        else:
+            self._read_configs = []
+
         self._config = config
         self._engine = None
+        self._read_connections: Optional[List["Connection"]] = None
+        self._read_lock = threading.Lock()
+        self._records_modified: ContextVar[bool] = ContextVar(
+            f"larapy_records_modified_{id(self)}", default=False
+        )
         self._connection = None
-        self._transactions = []
-        self._in_transaction = False
+        self._pool: Optional[ConnectionPool] = None
+        self._pinned: ContextVar[Optional[_PinnedConnection]] = ContextVar(
+            f"larapy_connection_{id(self)}", default=None
+        )
         self._metadata = MetaData()
+        self._statements: "OrderedDict[tuple, Tuple[TextClause, Tuple[str, ...]]]" = OrderedDict()
+        self._statement_cache_size = config.get("statement_cache_size", 256)
+        self._statement_hits = 0
+        self._statement_misses = 0
 
     def connect(self) -> "Connection":
         if self._engine is None:
@@ -24,6 +70,11 @@ class Connection:
         if driver == "sqlite":
             database = self._config.get("database", ":memory:")
             url = f"sqlite:///{database}"
+            if self.is_pooled():
+                # Pooled connections move between threads, one at a time
+                return create_engine(
+                    url, poolclass=NullPool, connect_args={"check_same_thread": False}
+                )
             return create_engine(url, poolclass=NullPool)
 
         elif driver == "mysql":
@@ -37,6 +88,8 @@ class Connection:
             url = (
                 f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}?charset={charset}"
             )
+            if self.is_pooled():
+                return create_engine(url, poolclass=NullPool)
             return create_engine(url, poolclass=QueuePool, pool_size=5, max_overflow=10)
 
         elif driver in ["postgresql", "pgsql"]:
@@ -47,125 +100,518 @@ class Connection:
             password = self._config.get("password")
 
             url = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}"
+            if self.is_pooled():
+                return create_engine(url, poolclass=NullPool)
             return create_engine(url, poolclass=QueuePool, pool_size=5, max_overflow=10)
 
         else:
             raise ValueError(f"Unsupported database driver: {driver}")
 
     def get_connection(self):
-        """Get or create a database connection."""
+        """
+        Get the connection pinned by the current transaction, or else the
+        connection's own dedicated (unpooled) database connection.
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            return pinned.connection
+
         if self._connection is None:
             self._connection = self._engine.connect()
         return self._connection
 
+    def is_pooled(self) -> bool:
+        """
+        Determine if statements check connections out of a pool.
+
+        Pooling is on unless the "pooling" option is false; in-memory SQLite
+        databases exist only on the connection that created them, so they
+        always use a single dedicated connection.
+        """
+        return self._config.get("pooling", True) and not self._is_memory_database()
+
+    def _get_pool(self) -> ConnectionPool:
+        if self._pool is None:
+            self.connect()
+            self._pool = ConnectionPool(
+                self._engine.connect,
+                min_size=self._config.get("pool_min_size", 0),
+                max_size=self._config.get("pool_size", 5),
+                max_overflow=self._config.get("max_overflow", 10),
+                max_idle_time=self._config.get("pool_idle_timeout", 300),
+                max_lifetime=self._config.get("pool_recycle"),
+                timeout=self._config.get("pool_timeout", 30.0),
+                validator=self._ping if self._config.get("pool_pre_ping") else None,
+                enable_cleanup=False,
+            )
+        return self._pool
+
+    def _ping(self, conn: SQLAlchemyConnection) -> bool:
+        conn.exec_driver_sql("SELECT 1")
+        conn.rollback()
+        return True
+
+    def _acquire(self) -> Tuple[SQLAlchemyConnection, Optional[PooledConnection]]:
+        if not self.is_pooled():
+            return self.get_connection(), None
+
+        pooled = self._get_pool().get_connection()
+        return pooled.connection, pooled
+
+    def _release(self, conn: SQLAlchemyConnection, pooled: Optional[PooledConnection]) -> None:
+        if pooled is None:
+            return
+
+        try:
+            if conn.in_transaction():
+                conn.rollback()
+        finally:
+            if self._pool is not None:
+                self._pool.return_connection(pooled)
+            else:
+                pooled.close()
+
+    @contextmanager
+    def _checkout(self, write: bool = True):
+        """
+        Provide a connection for one statement.
+
+        Inside a transaction this is the connection the transaction pinned.
+        Otherwise a connection is checked out of the pool, committed after a
+        write (rolled back on error or after a read) and returned.
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            yield pinned.connection
+            if write:
+                self.record_modified()
+            return
+
+        conn, pooled = self._acquire()
+        try:
+            yield conn
+            if write:
+                conn.commit()
+                self.record_modified()
+        except BaseException:
+            if conn.in_transaction():
+                conn.rollback()
+            raise
+        finally:
+            self._release(conn, pooled)
+
+    def has_read_connections(self) -> bool:
+        """Determine if the connection is configured with read replicas."""
+        return bool(self._read_configs)
+
+    def get_read_connection(self) -> "Connection":
+        """
+        Get the connection the next read should use.
+
+        Reads go to the primary inside a transaction, and after the current
+        thread or task wrote through a sticky connection. Otherwise the
+        replica with the fewest checked-out connections is used, ties broken
+        at random.
+        """
+        if not self._read_configs or self.in_transaction():
+            return self
+
+        if self._config.get("sticky", True) and self._records_modified.get():
+            return self
+
+        if self._read_connections is None:
+            with self._read_lock:
+                if self._read_connections is None:
+                    self._read_connections = [
+                        Connection(config).connect() for config in self._read_configs
+                    ]
+
+        replicas = self._read_connections
+        if len(replicas) == 1:
+            return replicas[0]
+
+        loads = [replica._checked_out() for replica in replicas]
+        least = min(loads)
+        return random.choice([r for r, load in zip(replicas, loads) if load == least])
+
+    def _checked_out(self) -> int:
+        return self._pool.in_use() if self._pool is not None else 0
+
+    def record_modified(self) -> None:
+        """Mark that the current thread or task wrote through this connection."""
+        if not self._records_modified.get():
+            self._records_modified.set(True)
+
+    def has_modified_records(self) -> bool:
+        """Determine if the current thread or task wrote through this connection."""
+        return self._records_modified.get()
+
+    def forget_records_modification(self) -> None:
+        """Send reads back to the replicas after a write made them sticky."""
+        self._records_modified.set(False)
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get statistics about the connection pool.
+
+        Returns:
+            The pool's size, checked out and idle connections, waiting
+            callers and time spent waiting, or None when pooling is off
+        """
+        if not self.is_pooled():
+            return None
+
+        stats = self._get_pool().stats()
+        stats["checked_out"] = stats["in_use"]
+        return stats
+
     def _prepare_bindings(self, query: str, bindings: List) -> tuple[str, Dict]:
         """Convert positional bindings (?) to named parameters (:param_N)."""
         if not bindings:
             return query, {}
 
-        params = {}
-        result_query = query
+        names = [f"param_{i}" for i in range(len(bindings))]
+        parts = query.split("?", len(names))
+        result_query = parts[0] + "".join(
+            f":{name}{part}" for name, part in zip(names, parts[1:])
+        )
+
+        return result_query, dict(zip(names, bindings))
+
+    def _compile_statement(
+        self, query: str, bindings: Optional[List] = None
+    ) -> Tuple[TextClause, Dict[str, Any]]:
+        """
+        Get the compiled statement and parameters for a query.
+
+        Statements are cached by SQL text and by which bindings expand, so a
+        query shape is compiled once. An ExpandingList binding becomes an
+        expanding parameter rendered as a parenthesised list ("id IN ?"), so
+        the same statement serves IN lists of any length.
+        """
+        bindings = bindings or []
+        expanding = tuple(
+            i for i, value in enumerate(bindings) if isinstance(value, ExpandingList)
+        )
+        key = (query, len(bindings), expanding)
+
+        entry = self._statements.get(key)
+        if entry is None:
+            self._statement_misses += 1
+            entry = self._build_statement(query, len(bindings), expanding)
+
+            if self._statement_cache_size > 0:
+                self._statements[key] = entry
+                if len(self._statements) > self._statement_cache_size:
+                    self._statements.popitem(last=False)
+        else:
+            self._statement_hits += 1
+            self._statements.move_to_end(key)
+
+        statement, names = entry
+        return statement, dict(zip(names, bindings))
+
+    def _build_statement(
+        self, query: str, count: int, expanding: Tuple[int, ...]
+    ) -> Tuple[TextClause, Tuple[str, ...]]:
+        """Compile a query with positional placeholders into a text() statement."""
+        names = tuple(f"param_{i}" for i in range(count))
+        query, _ = self._prepare_bindings(query, list(names))
+        statement = text(query)
+
+        if expanding:
+            statement = statement.bindparams(
+                *(bindparam(names[i], expanding=True) for i in expanding)
+            )
+
+        return statement, names
+
+    def statement_cache_stats(self) -> Dict[str, int]:
+        """
+        Get statistics about the compiled statement cache.
 
-        for i, value in enumerate(bindings):
-            param_name = f"param_{i}"
-            params[param_name] = value
-            result_query = result_query.replace("?", f":{param_name}", 1)
+        Returns:
+            Dictionary with the cache size, limit, hits and misses
+        """
+        return {
+            "size": len(self._statements),
+            "max_size": self._statement_cache_size,
+            "hits": self._statement_hits,
+            "misses": self._statement_misses,
+        }
 
-        return result_query, params
+    def flush_statement_cache(self) -> None:
+        """Forget all compiled statements."""
+        self._statements.clear()
+        self._statement_hits = 0
+        self._statement_misses = 0
 
     def table(self, table_name: str):
         from larapy.database.query.builder import QueryBuilder
 
         return QueryBuilder(self, table_name)
 
-    def select(self, query: str, bindings: Optional[List] = None) -> List[Dict]:
-        conn = self.get_connection()
-
-        if bindings:
-            query, params = self._prepare_bindings(query, bindings)
-            result = conn.execute(text(query), params)
-        else:
-            result = conn.execute(text(query))
+    def select(
+        self, query: str, bindings: Optional[List] = None, use_read_pdo: bool = True
+    ) -> List[Dict]:
+        """
+        Run a select and fetch its rows.
+
+        Args:
+            query: Select statement with positional placeholders
+            bindings: Query bindings
+            use_read_pdo: Whether the select may run on a read replica
+
+        Returns:
+            Result rows as dictionaries
+        """
+        columns, rows = self.select_rows(query, bindings, use_read_pdo)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def select_rows(
+        self, query: str, bindings: Optional[List] = None, use_read_pdo: bool = True
+    ) -> Tuple[List[str], List[Sequence[Any]]]:
+        """
+        Run a select and fetch its rows as tuples sharing one column list.
+
+        Skips building a dictionary per row; callers that hydrate objects
+        zip the columns with each row themselves.
+
+        Args:
+            query: Select statement with positional placeholders
+            bindings: Query bindings
+            use_read_pdo: Whether the select may run on a read replica
+
+        Returns:
+            The column names and the result rows
+        """
+        if use_read_pdo:
+            target = self.get_read_connection()
+            if target is not self:
+                return target.select_rows(query, bindings, False)
+
+        with self._checkout(write=False) as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
+            columns = list(result.keys())
+            rows = result.fetchall()
+
+        return columns, rows
+
+    def cursor(
+        self,
+        query: str,
+        bindings: Optional[List] = None,
+        chunk_size: int = 1000,
+        use_read_pdo: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        Run a select and yield its rows as the driver streams them.
+
+        The query runs with a server-side cursor, buffering at most
+        ``chunk_size`` rows, and keeps its checked-out connection until the
+        rows are exhausted or the generator is closed.
+
+        Args:
+            query: Select statement with positional placeholders
+            bindings: Query bindings
+            chunk_size: Number of rows fetched from the driver at a time
+            use_read_pdo: Whether the select may run on a read replica
+
+        Yields:
+            Result rows as dictionaries
+        """
+        if use_read_pdo:
+            target = self.get_read_connection()
+            if target is not self:
+                yield from target.cursor(query, bindings, chunk_size, False)
+                return
+
+        with self._checkout(write=False) as conn:
+            result = conn.execute(
+                *self._compile_statement(query, bindings),
+                execution_options={"stream_results": True, "yield_per": chunk_size},
+            )
 
-        rows = result.fetchall()
+            for row in result:
+                yield dict(row._mapping)
 
-        if rows and hasattr(rows[0], "_mapping"):
-            return [dict(row._mapping) for row in rows]
-        return [dict(row) for row in rows]
+    def _is_memory_database(self) -> bool:
+        return self.get_driver_name() == "sqlite" and self._config.get(
+            "database", ":memory:"
+        ) in ("", ":memory:")
 
     def insert(self, query: str, bindings: Optional[List] = None) -> int:
-        conn = self.get_connection()
+        with self._checkout() as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
 
-        if bindings:
-            query, params = self._prepare_bindings(query, bindings)
-            result = conn.execute(text(query), params)
-        else:
-            result = conn.execute(text(query))
-
-        if not self._in_transaction:
-            conn.commit()
         return result.lastrowid if hasattr(result, "lastrowid") else 0
 
-    def update(self, query: str, bindings: Optional[List] = None) -> int:
-        conn = self.get_connection()
+    def insert_many(self, query: str, bindings: List[List]) -> int:
+        """
+        Run an insert once per set of bindings through the driver's executemany.
 
-        if bindings:
-            query, params = self._prepare_bindings(query, bindings)
-            result = conn.execute(text(query), params)
-        else:
-            result = conn.execute(text(query))
+        Args:
+            query: Insert statement with positional placeholders
+            bindings: One list of bindings per row
+
+        Returns:
+            Number of rows inserted
+        """
+        if not bindings:
+            return 0
+
+        with self._checkout() as conn:
+            statement, _ = self._compile_statement(query, bindings[0])
+            names = [f"param_{i}" for i in range(len(bindings[0]))]
+            result = conn.execute(statement, [dict(zip(names, row)) for row in bindings])
+
+        return result.rowcount if result.rowcount >= 0 else len(bindings)
+
+    def insert_returning(self, query: str, bindings: Optional[List] = None) -> List[Dict]:
+        """
+        Run an insert ending in a RETURNING clause and fetch the returned rows.
+
+        Args:
+            query: Insert statement with positional placeholders
+            bindings: Query bindings
+
+        Returns:
+            The returned rows
+        """
+        with self._checkout() as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
+            rows = [dict(row._mapping) for row in result.fetchall()]
+
+        return rows
+
+    def supports_returning(self) -> bool:
+        """Determine if the driver supports INSERT ... RETURNING."""
+        driver = self.get_driver_name()
+
+        if driver == "sqlite":
+            return sqlite3.sqlite_version_info >= (3, 35, 0)
+        return driver in ["postgresql", "pgsql"]
+
+    def get_max_bindings(self) -> int:
+        """
+        Get the largest number of bindings a single statement may carry.
+
+        Uses the "max_bindings" connection option when set, otherwise the
+        driver's limit: 999 for SQLite before 3.32 and 32766 after, 65535
+        for MySQL and PostgreSQL.
+        """
+        configured = self._config.get("max_bindings")
+        if configured:
+            return configured
+
+        driver = self.get_driver_name()
+
+        if driver == "sqlite":
+            return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+        return 65535
+
+    def in_transaction(self) -> bool:
+        """Determine if the current thread or task has a transaction open."""
+        return self._pinned.get() is not None
+
+    def update(self, query: str, bindings: Optional[List] = None) -> int:
+        with self._checkout() as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
 
-        if not self._in_transaction:
-            conn.commit()
         return result.rowcount
 
     def delete(self, query: str, bindings: Optional[List] = None) -> int:
-        conn = self.get_connection()
+        with self._checkout() as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
 
-        if bindings:
-            query, params = self._prepare_bindings(query, bindings)
-            result = conn.execute(text(query), params)
-        else:
-            result = conn.execute(text(query))
+        return result.rowcount
+
+    def affecting_statement(self, query: str, bindings: Optional[List] = None) -> int:
+        """Run a statement and return the number of rows it affected."""
+        with self._checkout() as conn:
+            result = conn.execute(*self._compile_statement(query, bindings))
 
-        if not self._in_transaction:
-            conn.commit()
         return result.rowcount
 
     def statement(self, query: str, bindings: Optional[List] = None) -> bool:
-        conn = self.get_connection()
+        with self._checkout() as conn:
+            conn.execute(*self._compile_statement(query, bindings))
 
-        if bindings:
-            query, params = self._prepare_bindings(query, bindings)
-            conn.execute(text(query), params)
-        else:
-            conn.execute(text(query))
-
-        if not self._in_transaction:
-            conn.commit()
         return True
 
     def raw(self, query: str):
         return text(query)
 
     def begin_transaction(self):
-        conn = self.get_connection()
-        trans = conn.begin()
-        self._transactions.append(trans)
-        return trans
+        """
+        Start a transaction, or a savepoint when one is already open.
+
+        The outermost transaction pins a connection to the current thread or
+        task; every statement runs on it until the transaction ends.
+        """
+        pinned = self._pinned.get()
+
+        if pinned is not None:
+            trans = pinned.connection.begin_nested()
+            pinned.transactions.append(trans)
+            pinned.callbacks.append([])
+            return trans
+
+        conn, pooled = self._acquire()
+        if conn.in_transaction():
+            # End the transaction SQLAlchemy autobegan for earlier selects
+            conn.commit()
+
+        pinned = _PinnedConnection(conn, pooled)
+        pinned.transactions.append(conn.begin())
+        pinned.callbacks.append([])
+        self._pinned.set(pinned)
+        return pinned.transactions[-1]
 
     def commit(self):
-        if self._transactions:
-            trans = self._transactions.pop()
-            trans.commit()
+        self._end_transaction(commit=True)
 
     def rollback(self):
-        if self._transactions:
-            trans = self._transactions.pop()
-            trans.rollback()
+        self._end_transaction(commit=False)
+
+    def _end_transaction(self, commit: bool) -> None:
+        pinned = self._pinned.get()
+        if pinned is None or not pinned.transactions:
+            return
+
+        trans = pinned.transactions.pop()
+        callbacks = pinned.callbacks.pop()
+        try:
+            trans.commit() if commit else trans.rollback()
+        finally:
+            if not pinned.transactions:
+                self._pinned.set(None)
+                self._release(pinned.connection, pinned.pooled)
+
+        if not commit:
+            return
+
+        if pinned.transactions:
+            pinned.callbacks[-1].extend(callbacks)
+        else:
+            for callback in callbacks:
+                callback()
+
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """
+        Run a callback once the current transaction commits.
+
+        Runs it immediately when no transaction is open. Callbacks registered
+        inside a transaction or savepoint that rolls back are discarded.
+        """
+        pinned = self._pinned.get()
+
+        if pinned is None:
+            callback()
+        else:
+            pinned.callbacks[-1].append(callback)
 
     def transaction(self, callback):
-        self._in_transaction = True
         self.begin_transaction()
 
         try:
@@ -175,18 +621,25 @@ class Connection:
         except Exception as e:
             self.rollback()
             raise e
-        finally:
-            self._in_transaction = False
 
     def get_table_metadata(self, table_name: str) -> Table:
         return Table(table_name, self._metadata, autoload_with=self._engine)
 
     def disconnect(self):
-        """Close the database connection."""
+        """Close the dedicated connection, every pooled connection and the replicas."""
         if self._connection:
             self._connection.close()
             self._connection = None
 
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+        if self._read_connections is not None:
+            for replica in self._read_connections:
+                replica.disconnect()
+            self._read_connections = None
+
     def get_driver_name(self) -> str:
         """Get the database driver name."""
         return self._config.get("driver", "sqlite")
@@ -204,3 +657,21 @@ class Connection:
 
     def get_driver_name(self) -> str:
         return self._config.get("driver", "sqlite")
+
+
+def _merge_role(config: Dict[str, Any], role: str) -> Dict[str, Any]:
+    """Merge the "read" or "write" options over the shared connection options."""
+    merged = {key: value for key, value in config.items() if key not in ("read", "write")}
+    merged.update(config.get(role) or {})
+    return merged
+
+
+def _expand_hosts(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split a config whose "host" (or SQLite "database") is a list into one per entry."""
+    key = "database" if config.get("driver", "sqlite") == "sqlite" else "host"
+    values = config.get(key)
+
+    if not isinstance(values, (list, tuple)):
+        return [config]
+
+    return [{**config, key: value} for value in values]
@@ -25,11 +25,13 @@ Example:
     ```
 """
 
+import asyncio
+import inspect
 import threading
 import time
-from queue import Queue, Empty, Full
-from typing import Callable, Optional, Any, Generator
-from contextlib import contextmanager
+from collections import deque
+from typing import AsyncGenerator, Callable, Deque, Optional, Any, Generator, Set
+from contextlib import asynccontextmanager, contextmanager
 import logging
 
 logger = logging.getLogger(__name__)
@@ -60,6 +62,12 @@ class PooledConnection:
         if self.in_use:
             return False
         return (time.time() - self.last_used_at) > max_idle_time
+
+    def is_stale(self, max_lifetime: Optional[float]) -> bool:
+        """Check if the connection has outlived the pool's maximum lifetime"""
+        if not max_lifetime:
+            return False
+        return (time.time() - self.created_at) > max_lifetime
     
     def close(self):
         """Close the underlying connection"""
@@ -70,17 +78,35 @@ class PooledConnection:
             logger.error(f"Error closing connection: {e}")
 
 
+class _Waiter:
+    """A caller queued for a connection, woken by the thread that serves it"""
+
+    __slots__ = ("condition", "connection", "can_open")
+
+    def __init__(self, lock: threading.Lock):
+        self.condition = threading.Condition(lock)
+        self.connection: Optional[PooledConnection] = None
+        self.can_open = False
+
+
 class ConnectionPool:
     """
     Thread-safe connection pool for database connections.
     
     The pool maintains a minimum number of connections and can grow up to
     a maximum size. Idle connections are automatically cleaned up.
+
+    Callers that find the pool exhausted queue up in FIFO order and sleep on
+    a condition until a returned connection is handed to them directly, or
+    until a discarded connection frees room to open a new one.
     
     Attributes:
         min_size (int): Minimum number of connections to maintain
-        max_size (int): Maximum number of connections allowed
+        max_size (int): Maximum number of idle connections kept open
+        max_overflow (int): Extra connections allowed beyond max_size under load;
+            they are closed when returned
         max_idle_time (int): Maximum idle time before closing a connection (seconds)
+        max_lifetime (float): Maximum age of a connection before it is replaced (seconds)
         timeout (int): Timeout for acquiring a connection (seconds)
     """
     
@@ -91,7 +117,10 @@ class ConnectionPool:
         max_size: int = 10,
         max_idle_time: int = 300,
         timeout: float = 30.0,
-        enable_cleanup: bool = True
+        enable_cleanup: bool = True,
+        max_overflow: int = 0,
+        max_lifetime: Optional[float] = None,
+        validator: Optional[Callable[[Any], bool]] = None,
     ):
         """
         Initialize the connection pool.
@@ -99,32 +128,39 @@ class ConnectionPool:
         Args:
             connection_factory: Callable that creates new connections
             min_size: Minimum number of connections to maintain
-            max_size: Maximum number of connections allowed
+            max_size: Maximum number of connections kept open
             max_idle_time: Maximum idle time in seconds before closing a connection
             timeout: Timeout in seconds for acquiring a connection
             enable_cleanup: Whether to enable automatic cleanup of idle connections
+            max_overflow: Connections allowed beyond max_size when the pool is exhausted
+            max_lifetime: Age in seconds after which a connection is replaced on borrow
+            validator: Callable run on each borrowed connection; a connection for
+                which it returns False or raises is discarded (pre-ping)
         """
-        if min_size < 0:
-            raise ValueError("min_size must be >= 0")
-        if max_size < min_size:
-            raise ValueError("max_size must be >= min_size")
-        if max_idle_time < 0:
-            raise ValueError("max_idle_time must be >= 0")
-        if timeout <= 0:
-            raise ValueError("timeout must be > 0")
+        _validate_pool_options(min_size, max_size, max_idle_time, timeout, max_overflow)
             
         self.connection_factory = connection_factory
         self.min_size = min_size
         self.max_size = max_size
         self.max_idle_time = max_idle_time
         self.timeout = timeout
+        self.max_overflow = max_overflow
+        self.max_lifetime = max_lifetime
+        self.validator = validator
         
-        self._pool: Queue = Queue(maxsize=max_size)
         self._lock = threading.Lock()
-        self._all_connections: list[PooledConnection] = []
+        self._idle: Deque[PooledConnection] = deque()
+        self._waiters: Deque[_Waiter] = deque()
+        self._all_connections: Set[PooledConnection] = set()
+        self._opening = 0
         self._closed = False
+        self._closed_event = threading.Event()
         self._cleanup_interval = 60  # Seconds between cleanup runs
         self._enable_cleanup = enable_cleanup
+        self._waiting = 0
+        self._wait_count = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
         
         # Create minimum connections
         self._initialize_pool()
@@ -138,32 +174,37 @@ class ConnectionPool:
         """Create initial minimum connections"""
         for i in range(self.min_size):
             try:
-                conn = self._create_connection_unsafe()
-                self._pool.put(conn, block=False)  # Non-blocking put
+                conn = PooledConnection(self.connection_factory(), self)
+                self._all_connections.add(conn)
+                self._idle.append(conn)
                 logger.debug(f"Initialized connection {i+1}/{self.min_size}")
             except Exception as e:
                 logger.error(f"Error creating initial connection: {e}")
-                
-    def _create_connection_unsafe(self) -> PooledConnection:
-        """
-        Create a new pooled connection without acquiring lock.
-        MUST be called while holding self._lock.
-        """
-        if len(self._all_connections) >= self.max_size:
-            raise RuntimeError("Connection pool is at maximum capacity")
-            
-        raw_conn = self.connection_factory()
-        pooled_conn = PooledConnection(raw_conn, self)
-        self._all_connections.append(pooled_conn)
-        
+
+    def _capacity(self) -> int:
+        return self.max_size + self.max_overflow
+
+    def _has_room(self) -> bool:
+        """Whether another connection may be opened. MUST hold self._lock."""
+        return len(self._all_connections) + self._opening < self._capacity()
+
+    def _open_connection(self) -> PooledConnection:
+        """Open a connection in a slot already reserved through self._opening"""
+        try:
+            pooled_conn = PooledConnection(self.connection_factory(), self)
+        except BaseException:
+            with self._lock:
+                self._opening -= 1
+                self._grant_room_unsafe()
+            raise
+
+        with self._lock:
+            self._opening -= 1
+            self._all_connections.add(pooled_conn)
+
         logger.debug(f"Created new connection. Pool size: {len(self._all_connections)}")
         return pooled_conn
-                
-    def _create_connection(self) -> PooledConnection:
-        """Create a new pooled connection"""
-        with self._lock:
-            return self._create_connection_unsafe()
-    
+
     def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
         """
         Get a connection from the pool.
@@ -182,48 +223,120 @@ class ConnectionPool:
             raise RuntimeError("Connection pool is closed")
             
         actual_timeout = timeout if timeout is not None else self.timeout
-        start_time = time.time()
-        
+        start_time = time.monotonic()
+
+        try:
+            conn = self._acquire(start_time + actual_timeout, actual_timeout)
+        finally:
+            waited = time.monotonic() - start_time
+            with self._lock:
+                self._wait_count += 1
+                self._wait_time_total += waited
+                self._wait_time_max = max(self._wait_time_max, waited)
+
+        return conn
+
+    def _acquire(self, deadline: float, actual_timeout: float) -> PooledConnection:
+        """Take an idle connection, open a new one, or queue for a hand-off"""
         while True:
-            try:
-                # Try to get an existing connection
-                conn = self._pool.get(timeout=0.1)
-                
-                # Check if connection is still valid
-                if conn.is_expired(self.max_idle_time):
-                    logger.debug("Discarding expired connection")
-                    self._remove_connection(conn)
-                    conn.close()
-                    continue
-                    
-                conn.mark_in_use()
-                logger.debug(f"Acquired connection from pool. Available: {self._pool.qsize()}")
-                return conn
-                
-            except Empty:
-                # No available connections, try to create a new one
-                with self._lock:
-                    if len(self._all_connections) < self.max_size:
-                        try:
-                            conn = self._create_connection_unsafe()
-                            conn.mark_in_use()
-                            return conn
-                        except Exception as e:
-                            logger.error(f"Error creating connection: {e}")
-                            
-                # Check timeout
-                if time.time() - start_time > actual_timeout:
+            conn = None
+
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                if self._idle and not self._waiters:
+                    conn = self._idle.pop()
+                elif self._has_room() and not self._waiters:
+                    self._opening += 1
+                else:
+                    conn = self._wait_unsafe(deadline, actual_timeout)
+
+            if conn is None:
+                conn = self._open_connection()
+            elif not self._is_usable(conn):
+                self._discard(conn)
+                continue
+
+            conn.mark_in_use()
+            return conn
+
+    def _wait_unsafe(self, deadline: float, actual_timeout: float) -> Optional[PooledConnection]:
+        """
+        Queue behind earlier waiters until served. MUST hold self._lock.
+
+        Returns the connection handed over, or None when the waiter was given
+        room to open a new connection (already reserved through self._opening).
+        """
+        waiter = _Waiter(self._lock)
+        self._waiters.append(waiter)
+        self._waiting += 1
+
+        try:
+            while waiter.connection is None and not waiter.can_open:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._waiters.remove(waiter)
                     raise TimeoutError(
                         f"Unable to acquire connection within {actual_timeout} seconds. "
-                        f"Pool size: {len(self._all_connections)}/{self.max_size}"
+                        f"Pool size: {len(self._all_connections)}/{self._capacity()}"
                     )
-                    
-                # Wait a bit before retrying
-                time.sleep(0.1)
-    
+                waiter.condition.wait(remaining)
+        finally:
+            self._waiting -= 1
+
+        return waiter.connection
+
+    def _next_waiter_unsafe(self) -> Optional[_Waiter]:
+        """Pop the longest-waiting caller. MUST hold self._lock."""
+        return self._waiters.popleft() if self._waiters else None
+
+    def _grant_room_unsafe(self):
+        """Let the next waiter open a connection if there is room. MUST hold self._lock."""
+        if self._has_room():
+            waiter = self._next_waiter_unsafe()
+            if waiter is not None:
+                self._opening += 1
+                waiter.can_open = True
+                waiter.condition.notify()
+
+    def _is_usable(self, conn: PooledConnection) -> bool:
+        """Check a connection's age and health before lending it out"""
+        if conn.is_expired(self.max_idle_time) or conn.is_stale(self.max_lifetime):
+            logger.debug("Discarding expired connection")
+            return False
+
+        if not self._is_healthy(conn):
+            logger.debug("Discarding connection that failed its health check")
+            return False
+
+        return True
+
+    def _is_healthy(self, conn: PooledConnection) -> bool:
+        """Run the validator against a connection taken from the idle queue"""
+        if self.validator is None:
+            return True
+        try:
+            return bool(self.validator(conn.connection))
+        except Exception as e:
+            logger.debug(f"Connection health check failed: {e}")
+            return False
+
+    def _discard(self, conn: PooledConnection):
+        """Close a connection and give its slot to the next waiter"""
+        self._remove_connection(conn)
+        conn.close()
+
     def return_connection(self, conn: PooledConnection):
         """
         Return a connection to the pool.
+
+        The connection goes straight to the longest-waiting caller if there
+        is one; otherwise it is kept idle, or closed if it was an overflow
+        connection.
         
         Args:
             conn: The connection to return
@@ -231,17 +344,24 @@ class ConnectionPool:
         if self._closed:
             conn.close()
             return
-            
-        conn.mark_returned()
-        
-        try:
-            self._pool.put_nowait(conn)
-            logger.debug(f"Returned connection to pool. Available: {self._pool.qsize()}")
-        except Full:
-            # Pool is full, close the connection
-            logger.debug("Pool is full, closing connection")
-            self._remove_connection(conn)
-            conn.close()
+
+        with self._lock:
+            waiter = self._next_waiter_unsafe()
+            if waiter is not None:
+                conn.last_used_at = time.time()
+                waiter.connection = conn
+                waiter.condition.notify()
+                return
+
+            conn.mark_returned()
+            if len(self._idle) < self.max_size:
+                self._idle.append(conn)
+                logger.debug(f"Returned connection to pool. Available: {len(self._idle)}")
+                return
+
+        # Pool is full, close the connection
+        logger.debug("Pool is full, closing connection")
+        self._discard(conn)
     
     @contextmanager
     def connection(self, timeout: Optional[float] = None) -> Generator[Any, None, None]:
@@ -270,54 +390,31 @@ class ConnectionPool:
         """Remove a connection from tracking"""
         with self._lock:
             if conn in self._all_connections:
-                self._all_connections.remove(conn)
+                self._all_connections.discard(conn)
                 logger.debug(f"Removed connection. Pool size: {len(self._all_connections)}")
+                self._grant_room_unsafe()
     
     def _cleanup_idle_connections(self):
         """Background thread that cleans up idle connections"""
-        while not self._closed:
+        while not self._closed_event.wait(self._cleanup_interval):
             try:
-                time.sleep(self._cleanup_interval)
-                
-                if self._closed:
-                    break
-                
+                expired = []
+
                 with self._lock:
-                    if len(self._all_connections) <= self.min_size:
-                        continue
-                        
-                    # Find expired connections
-                    expired = []
-                    for conn in self._all_connections:
+                    removable = len(self._all_connections) - self.min_size
+
+                    for conn in list(self._idle):
+                        if len(expired) >= removable:
+                            break
                         if conn.is_expired(self.max_idle_time):
                             expired.append(conn)
-                            
-                    # Remove expired connections (but keep minimum)
-                    to_remove = min(
-                        len(expired),
-                        len(self._all_connections) - self.min_size
-                    )
-                    
-                    for i in range(to_remove):
-                        conn = expired[i]
-                        if not conn.in_use:
-                            try:
-                                # Try to remove from queue
-                                temp_queue = Queue(maxsize=self.max_size)
-                                while not self._pool.empty():
-                                    c = self._pool.get_nowait()
-                                    if c != conn:
-                                        temp_queue.put_nowait(c)
-                                        
-                                # Restore queue
-                                while not temp_queue.empty():
-                                    self._pool.put_nowait(temp_queue.get_nowait())
-                                    
-                                self._all_connections.remove(conn)
-                                conn.close()
-                                logger.debug(f"Cleaned up idle connection. Pool size: {len(self._all_connections)}")
-                            except Exception as e:
-                                logger.error(f"Error cleaning up connection: {e}")
+
+                    for conn in expired:
+                        self._idle.remove(conn)
+
+                for conn in expired:
+                    self._discard(conn)
+                    logger.debug(f"Cleaned up idle connection. Pool size: {len(self._all_connections)}")
                                 
             except Exception as e:
                 logger.error(f"Error in cleanup thread: {e}")
@@ -328,6 +425,7 @@ class ConnectionPool:
             return
             
         self._closed = True
+        self._closed_event.set()
         
         with self._lock:
             # Close all connections
@@ -338,13 +436,12 @@ class ConnectionPool:
                     logger.error(f"Error closing connection: {e}")
                     
             self._all_connections.clear()
-            
-            # Clear the queue
-            while not self._pool.empty():
-                try:
-                    self._pool.get_nowait()
-                except Empty:
-                    break
+            self._idle.clear()
+
+            # Wake waiters so they see the pool is closed
+            for waiter in self._waiters:
+                waiter.condition.notify()
+            self._waiters.clear()
                     
         logger.info("Connection pool closed")
     
@@ -355,7 +452,7 @@ class ConnectionPool:
     
     def available(self) -> int:
         """Get the number of available connections"""
-        return self._pool.qsize()
+        return len(self._idle)
     
     def in_use(self) -> int:
         """Get the number of connections currently in use"""
@@ -370,7 +467,7 @@ class ConnectionPool:
         """
         with self._lock:
             total = len(self._all_connections)
-            available = self._pool.qsize()
+            available = len(self._idle)
             in_use = total - available
             
             return {
@@ -379,7 +476,12 @@ class ConnectionPool:
                 'in_use': in_use,
                 'min_size': self.min_size,
                 'max_size': self.max_size,
+                'max_overflow': self.max_overflow,
                 'max_idle_time': self.max_idle_time,
+                'waiting': self._waiting,
+                'wait_count': self._wait_count,
+                'wait_time_total': self._wait_time_total,
+                'wait_time_max': self._wait_time_max,
             }
     
     def __enter__(self):
@@ -399,6 +501,290 @@ class ConnectionPool:
             pass  # Ignore errors during cleanup
 
 
+class AsyncConnectionPool:
+    """
+    Connection pool for asyncio code, with the same sizing, FIFO hand-off and
+    health checks as ConnectionPool.
+
+    Waiters are futures on the running event loop, so the pool must be used
+    from a single loop. The factory, validator and connection ``close`` may
+    be plain callables or coroutine functions.
+
+    Example:
+        ```python
+        pool = AsyncConnectionPool(connect, max_size=8)
+
+        async with pool.connection() as conn:
+            await conn.execute("SELECT 1")
+        ```
+    """
+
+    def __init__(
+        self,
+        connection_factory: Callable[[], Any],
+        min_size: int = 0,
+        max_size: int = 10,
+        max_idle_time: int = 300,
+        timeout: float = 30.0,
+        max_overflow: int = 0,
+        max_lifetime: Optional[float] = None,
+        validator: Optional[Callable[[Any], Any]] = None,
+    ):
+        _validate_pool_options(min_size, max_size, max_idle_time, timeout, max_overflow)
+
+        self.connection_factory = connection_factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+        self.max_overflow = max_overflow
+        self.max_lifetime = max_lifetime
+        self.validator = validator
+
+        self._idle: Deque[PooledConnection] = deque()
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._all_connections: Set[PooledConnection] = set()
+        self._opening = 0
+        self._closed = False
+        self._wait_count = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def _capacity(self) -> int:
+        return self.max_size + self.max_overflow
+
+    def _has_room(self) -> bool:
+        return len(self._all_connections) + self._opening < self._capacity()
+
+    async def get_connection(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Get a connection from the pool.
+
+        Raises:
+            RuntimeError: If the pool is closed
+            TimeoutError: If unable to acquire a connection within the timeout
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        actual_timeout = timeout if timeout is not None else self.timeout
+        start_time = time.monotonic()
+
+        try:
+            conn = await self._acquire(start_time + actual_timeout, actual_timeout)
+        finally:
+            waited = time.monotonic() - start_time
+            self._wait_count += 1
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+
+        return conn
+
+    async def _acquire(self, deadline: float, actual_timeout: float) -> PooledConnection:
+        while True:
+            if self._closed:
+                raise RuntimeError("Connection pool is closed")
+
+            if self._idle and not self._waiters:
+                conn = self._idle.pop()
+            elif self._has_room() and not self._waiters:
+                self._opening += 1
+                conn = None
+            else:
+                conn = await self._wait(deadline, actual_timeout)
+
+            if conn is None:
+                conn = await self._open_connection()
+            elif not await self._is_usable(conn):
+                await self._discard(conn)
+                continue
+
+            conn.mark_in_use()
+            return conn
+
+    async def _wait(self, deadline: float, actual_timeout: float) -> Optional[PooledConnection]:
+        """
+        Queue behind earlier waiters; resolves to a handed-over connection, or
+        None when room was reserved to open a new one.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(waiter), max(deadline - time.monotonic(), 0)
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # Served just as the wait ended; pass the grant on
+                self._release_grant(waiter.result())
+            else:
+                waiter.cancel()
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+            if isinstance(e, asyncio.TimeoutError):
+                raise TimeoutError(
+                    f"Unable to acquire connection within {actual_timeout} seconds. "
+                    f"Pool size: {len(self._all_connections)}/{self._capacity()}"
+                ) from None
+            raise
+
+    def _release_grant(self, conn: Optional[PooledConnection]):
+        if conn is not None:
+            self.return_connection(conn)
+        else:
+            self._opening -= 1
+            self._grant_room()
+
+    async def _open_connection(self) -> PooledConnection:
+        try:
+            raw_conn = await _maybe_await(self.connection_factory())
+        except BaseException:
+            self._opening -= 1
+            self._grant_room()
+            raise
+
+        self._opening -= 1
+        pooled_conn = PooledConnection(raw_conn, self)
+        self._all_connections.add(pooled_conn)
+        return pooled_conn
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                return waiter
+        return None
+
+    def _grant_room(self):
+        if self._has_room():
+            waiter = self._next_waiter()
+            if waiter is not None:
+                self._opening += 1
+                waiter.set_result(None)
+
+    async def _is_usable(self, conn: PooledConnection) -> bool:
+        if conn.is_expired(self.max_idle_time) or conn.is_stale(self.max_lifetime):
+            return False
+
+        if self.validator is None:
+            return True
+        try:
+            return bool(await _maybe_await(self.validator(conn.connection)))
+        except Exception as e:
+            logger.debug(f"Connection health check failed: {e}")
+            return False
+
+    async def _discard(self, conn: PooledConnection):
+        self._all_connections.discard(conn)
+        self._grant_room()
+        await _close_async(conn)
+
+    def return_connection(self, conn: PooledConnection):
+        """Return a connection, handing it straight to the longest-waiting caller"""
+        if self._closed:
+            asyncio.ensure_future(_close_async(conn))
+            return
+
+        waiter = self._next_waiter()
+        if waiter is not None:
+            conn.last_used_at = time.time()
+            waiter.set_result(conn)
+            return
+
+        conn.mark_returned()
+        if len(self._idle) < self.max_size:
+            self._idle.append(conn)
+        else:
+            self._all_connections.discard(conn)
+            asyncio.ensure_future(_close_async(conn))
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncGenerator[Any, None]:
+        """Async context manager yielding a raw connection and returning it afterwards"""
+        pooled_conn = await self.get_connection(timeout=timeout)
+        try:
+            yield pooled_conn.connection
+        finally:
+            self.return_connection(pooled_conn)
+
+    async def close(self):
+        """Close all connections and fail pending waiters"""
+        if self._closed:
+            return
+
+        self._closed = True
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(RuntimeError("Connection pool is closed"))
+        self._waiters.clear()
+
+        connections = list(self._all_connections)
+        self._all_connections.clear()
+        self._idle.clear()
+        for conn in connections:
+            await _close_async(conn)
+
+    def size(self) -> int:
+        return len(self._all_connections)
+
+    def available(self) -> int:
+        return len(self._idle)
+
+    def in_use(self) -> int:
+        return self.size() - self.available()
+
+    def stats(self) -> dict:
+        """Get pool statistics, with the same keys as ConnectionPool.stats()"""
+        total = len(self._all_connections)
+        available = len(self._idle)
+
+        return {
+            'total': total,
+            'available': available,
+            'in_use': total - available,
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'max_overflow': self.max_overflow,
+            'max_idle_time': self.max_idle_time,
+            'waiting': sum(1 for waiter in self._waiters if not waiter.done()),
+            'wait_count': self._wait_count,
+            'wait_time_total': self._wait_time_total,
+            'wait_time_max': self._wait_time_max,
+        }
+
+
+def _validate_pool_options(
+    min_size: int, max_size: int, max_idle_time: int, timeout: float, max_overflow: int
+):
+    if min_size < 0:
+        raise ValueError("min_size must be >= 0")
+    if max_size < min_size:
+        raise ValueError("max_size must be >= min_size")
+    if max_idle_time < 0:
+        raise ValueError("max_idle_time must be >= 0")
+    if timeout <= 0:
+        raise ValueError("timeout must be > 0")
+    if max_overflow < 0:
+        raise ValueError("max_overflow must be >= 0")
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _close_async(conn: PooledConnection):
+    """Close a connection whose ``close`` may be a coroutine function"""
+    try:
+        if hasattr(conn.connection, 'close'):
+            await _maybe_await(conn.connection.close())
+    except Exception as e:
+        logger.error(f"Error closing connection: {e}")
+
+
 # Global pool instance (optional convenience)
 _global_pool: Optional[ConnectionPool] = None
 _pool_lock = threading.Lock()
@@ -1,4 +1,5 @@
-from typing import Dict, Optional
+import threading
+from typing import Any, Dict, Optional
 from larapy.database.connection import Connection
 
 
@@ -7,12 +8,15 @@ class DatabaseManager:
         self._config = config
         self._connections: Dict[str, Connection] = {}
         self._default_connection = config.get("default", "sqlite")
+        self._lock = threading.Lock()
 
     def connection(self, name: Optional[str] = None) -> Connection:
         name = name or self._default_connection
 
         if name not in self._connections:
-            self._connections[name] = self._make_connection(name)
+            with self._lock:
+                if name not in self._connections:
+                    self._connections[name] = self._make_connection(name)
 
         return self._connections[name]
 
@@ -70,6 +74,25 @@ class DatabaseManager:
                 connection.disconnect()
             self._connections.clear()
 
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get pool statistics for every open connection that uses pooling.
+
+        Returns:
+            Connection names mapped to their Connection.pool_stats()
+        """
+        stats = {}
+        for name, connection in list(self._connections.items()):
+            connection_stats = connection.pool_stats()
+            if connection_stats is not None:
+                stats[name] = connection_stats
+        return stats
+
+    def forget_records_modification(self) -> None:
+        """Send the current thread or task's reads back to the read replicas."""
+        for connection in list(self._connections.values()):
+            connection.forget_records_modification()
+
     def get_default_connection(self) -> str:
         return self._default_connection
 
@@ -13,7 +13,29 @@ class DatabaseServiceProvider(ServiceProvider):
             return DatabaseManager(config.get("database", {}))
 
         self.app.singleton("db", make_database_manager)
+        self.app.singleton(DatabaseManager, lambda app: app.make("db"))
 
     def boot(self):
         """Bootstrap the database system."""
-        pass
+        self._configure_query_cache()
+
+    def _configure_query_cache(self):
+        """
+        Use the store from the "database.query_cache" config for remembered
+        query results, e.g. {"driver": "redis", "connection": "cache"}.
+        """
+        if not self.app.bound("config"):
+            return
+
+        config = self.app.make("config").get("database.query_cache")
+        if not config:
+            return
+
+        from larapy.cache.query_cache import set_query_cache_store
+        from larapy.cache.stores import make_store
+
+        redis = None
+        if config.get("driver") == "redis":
+            redis = self.app.make("redis").connection(config.get("connection", "default"))
+
+        set_query_cache_store(make_store(config, redis))
@@ -1,8 +1,4 @@
-from .migration import Migration
-from .migration_repository import MigrationRepository
-from .migrator import Migrator
-from .migration_creator import MigrationCreator
-from .migration_service_provider import MigrationServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Migration",
@@ -11,3 +7,14 @@ __all__ = [
     "MigrationCreator",
     "MigrationServiceProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.migrations.migration": ["Migration"],
+        "larapy.database.migrations.migration_repository": ["MigrationRepository"],
+        "larapy.database.migrations.migrator": ["Migrator"],
+        "larapy.database.migrations.migration_creator": ["MigrationCreator"],
+        "larapy.database.migrations.migration_service_provider": ["MigrationServiceProvider"],
+    },
+)
@@ -1,5 +1,12 @@
-from larapy.database.orm.model import Model
-from larapy.database.orm.builder import Builder
-from larapy.database.orm.collection import Collection
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Model", "Builder", "Collection"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.orm.model": ["Model"],
+        "larapy.database.orm.builder": ["Builder"],
+        "larapy.database.orm.collection": ["Collection"],
+    },
+)
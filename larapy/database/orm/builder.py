@@ -1,4 +1,14 @@
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+
+from larapy.database.orm.identity_map import current_identity_map
+from larapy.database.orm.relationships.relation import Relation
+
+if TYPE_CHECKING:
+    from larapy.database.orm.collection import Collection
+    from larapy.pagination.cursor import Cursor
+    from larapy.pagination.cursor_paginator import CursorPaginator
+    from larapy.pagination.paginator import Paginator
+    from larapy.support.lazy_collection import LazyCollection
 
 
 class Builder:
@@ -8,30 +18,35 @@ class Builder:
         self._model_class = model_class
         self._connection = connection
         self._eager_load = {}
+        self._boolean_aggregates = []
 
     def find(self, id: Any) -> Optional[Any]:
+        identity_map = current_identity_map()
+        if identity_map is not None and not self._query._wheres and self._selects_whole_rows():
+            mapped = identity_map.get(self._connection, self._query._table, id)
+            if mapped is not None:
+                return mapped
+
         model = self._model_class()
-        results = self._query.where(model.get_key_name(), id).get()
+        columns, rows = self._query.where(model.get_key_name(), id).get_rows()
 
-        if not results:
+        if not rows:
             return None
 
-        return self._hydrate_model(results[0])
+        return self._hydrate_rows(columns, rows[:1])[0]
 
     def first(self) -> Optional[Any]:
-        results = self._query.limit(1).get()
+        columns, rows = self._query.limit(1).get_rows()
 
-        if not results:
+        if not rows:
             return None
 
-        return self._hydrate_model(results[0])
+        return self._hydrate_rows(columns, rows[:1])[0]
 
     def get(self) -> "Collection":
-        results = self._query.get()
-
-        models = []
-        for row in results:
-            models.append(self._hydrate_model(row))
+        columns, rows = self._query.get_rows()
+        models = self._hydrate_rows(columns, rows)
+        self._model_class._track_result_set(models)
 
         from larapy.database.orm.collection import Collection
 
@@ -46,13 +61,43 @@ class Builder:
         return self.get()
 
     def _hydrate_model(self, attributes: Dict[str, Any]) -> Any:
-        model = self._model_class(connection=self._connection)
-        model._attributes = attributes.copy()
-        model._original = attributes.copy()
-        model._exists = True
-        model._was_recently_created = False
-
-        return model
+        return self._hydrate_rows(tuple(attributes), [tuple(attributes.values())])[0]
+
+    def _hydrate_rows(self, columns: List[str], rows: List[Any]) -> List[Any]:
+        new_from_row = self._model_class._new_from_row
+        connection = self._connection
+        models = [new_from_row(columns, row, connection) for row in rows]
+
+        identity_map = current_identity_map()
+        if identity_map is not None and self._selects_whole_rows():
+            models = [identity_map.add(connection, model) for model in models]
+
+        # with_exists() selects 1 or 0, which compare equal to the booleans
+        # so the models are not dirty
+        for alias in self._boolean_aggregates:
+            for model in models:
+                model._attributes[alias] = bool(model._attributes[alias])
+
+        return models
+
+    def _selects_whole_rows(self) -> bool:
+        """Whether each result row is a whole row of the model's table."""
+        query = self._query
+        return (
+            query._select_columns in (["*"], [f"{query._table}.*"])
+            and not query._joins
+            and not query._group_by_columns
+        )
+
+    def _forget_mapped_models(self) -> None:
+        """Drop the table's models from the identity map before a bulk write."""
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.forget_table(self._connection, self._query._table)
+
+    def select(self, *columns) -> "Builder":
+        self._query.select(*columns)
+        return self
 
     def where(self, *args, **kwargs) -> "Builder":
         self._query.where(*args, **kwargs)
@@ -90,6 +135,10 @@ class Builder:
         self._query.offset(value)
         return self
 
+    def use_write_pdo(self) -> "Builder":
+        self._query.use_write_pdo()
+        return self
+
     def count(self) -> int:
         return self._query.count()
 
@@ -111,9 +160,44 @@ class Builder:
         return model
 
     def update(self, attributes: Dict[str, Any]) -> int:
+        self._forget_mapped_models()
         return self._query.update(attributes)
 
+    def upsert(
+        self,
+        values: Union[Dict[str, Any], List[Dict[str, Any]]],
+        unique_by: Union[str, List[str]],
+        update: Optional[List[str]] = None,
+    ) -> int:
+        if isinstance(values, dict):
+            values = [values]
+
+        if not values:
+            return 0
+
+        model = self._model_class()
+
+        if update is None:
+            unique = [unique_by] if isinstance(unique_by, str) else unique_by
+            update = [column for column in values[0] if column not in unique]
+
+        if model._timestamps:
+            time = model._fresh_timestamp_string()
+            stamps = {
+                column: time for column in (model.CREATED_AT, model.UPDATED_AT) if column
+            }
+            values = [{**stamps, **row} for row in values]
+
+            if model.UPDATED_AT and update and model.UPDATED_AT not in update:
+                update = [*update, model.UPDATED_AT]
+
+        values = [model._serialize_attributes(row) for row in values]
+
+        self._forget_mapped_models()
+        return self._query.upsert(values, unique_by, update)
+
     def delete(self) -> int:
+        self._forget_mapped_models()
         return self._query.delete()
 
     def with_(self, *relations) -> "Builder":
@@ -130,87 +214,102 @@ class Builder:
         return self
 
     def _eager_load_relations(self, collection: "Collection") -> "Collection":
-        for relation_name in self._eager_load.keys():
-            collection = self._eager_load_relation(collection, relation_name)
+        from larapy.database.orm.eager_loader import eager_load
 
+        eager_load(collection.all(), self._eager_load)
         return collection
 
-    def _eager_load_relation(self, collection: "Collection", relation: str) -> "Collection":
-        if not collection or collection.is_empty():
-            return collection
-
-        nested_relations = self._parse_nested_relations(relation)
-        base_relation = nested_relations["base"]
-        nested = nested_relations["nested"]
-
-        first_model = collection.first()
-        if not first_model or not hasattr(first_model.__class__, base_relation):
-            return collection
-
-        relation_method = getattr(first_model.__class__, base_relation, None)
-        if not relation_method or not callable(relation_method):
-            return collection
-
-        relation_instance = relation_method(first_model)
-
-        # Special handling for MorphTo relationships
-        from larapy.database.orm.relationships.morph_to import MorphTo
-        if isinstance(relation_instance, MorphTo):
-            # MorphTo needs special eager loading - group by type and load each type
-            results_by_type = relation_instance.morph_with(collection.all())
-            
-            # Match results back to models
-            for model in collection.all():
-                morph_type = model.get_attribute(relation_instance._morph_type_field)
-                morph_id = model.get_attribute(relation_instance._morph_id_field)
-                
-                if morph_type and morph_id and morph_type in results_by_type:
-                    type_results = results_by_type[morph_type]
-                    if morph_id in type_results:
-                        model.set_relation(base_relation, type_results[morph_id])
-                    else:
-                        model.set_relation(base_relation, None)
-                else:
-                    model.set_relation(base_relation, None)
-            
-            return collection
-
-        if not hasattr(relation_instance, "add_eager_constraints"):
-            return collection
-
-        relation_instance.add_eager_constraints(collection.all())
-
-        if base_relation in self._eager_load:
-            callback = self._eager_load[base_relation]
-            if callable(callback):
-                callback(relation_instance.get_query())
-
-        results = relation_instance.get_eager()
-
-        if hasattr(relation_instance, "match"):
-            from larapy.database.orm.collection import Collection
-
-            matched_models = relation_instance.match(collection.all(), results, base_relation)
-            collection = Collection(matched_models)
-
-        if nested and results:
-            from larapy.database.orm.collection import Collection
-
-            for model in collection.all():
-                relation_value = model.get_relation(base_relation)
-                if relation_value is not None:
-                    if isinstance(relation_value, Collection):
-                        for item in relation_value.all():
-                            if hasattr(item, "load"):
-                                item.load(nested)
-                    elif hasattr(relation_value, "load"):
-                        relation_value.load(nested)
+    def with_count(self, *relations) -> "Builder":
+        """
+        Add the number of related models of each relation to the results,
+        e.g. with_count("comments") sets comments_count on every model.
+
+        Relations may be renamed with "comments as approved_count" and
+        constrained with {"comments": callback} dictionaries, whose callback
+        receives the query of the counted rows.
+        """
+        return self.with_aggregate(relations, None, "count")
+
+    def with_sum(self, relation: Union[str, Dict], column: str) -> "Builder":
+        """Add the sum of a related column, e.g. comments_sum_votes."""
+        return self.with_aggregate(relation, column, "sum")
+
+    def with_avg(self, relation: Union[str, Dict], column: str) -> "Builder":
+        """Add the average of a related column, e.g. comments_avg_votes."""
+        return self.with_aggregate(relation, column, "avg")
+
+    def with_max(self, relation: Union[str, Dict], column: str) -> "Builder":
+        """Add the largest value of a related column, e.g. comments_max_votes."""
+        return self.with_aggregate(relation, column, "max")
+
+    def with_min(self, relation: Union[str, Dict], column: str) -> "Builder":
+        """Add the smallest value of a related column, e.g. comments_min_votes."""
+        return self.with_aggregate(relation, column, "min")
+
+    def with_exists(self, *relations) -> "Builder":
+        """Add whether each relation has any related model, e.g. comments_exists."""
+        return self.with_aggregate(relations, None, "exists")
+
+    def with_aggregate(self, relations, column: Optional[str], function: str) -> "Builder":
+        """
+        Select an aggregate of each relation's rows as a correlated subquery,
+        so the models and their aggregates load with one query.
+
+        Args:
+            relations: A relation name, "name as alias", {name: callback}
+                dictionary, or a list of those
+            column: Related column to aggregate; None for count and exists
+            function: count, sum, avg, max, min or exists
+
+        Returns:
+            self for method chaining
+        """
+        from larapy.database.orm.eager_loader import parse_relations
+
+        if isinstance(relations, (str, dict)):
+            relations = [relations]
+
+        if self._query._select_columns == ["*"]:
+            self._query.select(f"{self._query._table}.*")
+
+        for relation, callback in parse_relations(relations).items():
+            name, _, alias = (part.strip() for part in relation.partition(" as "))
+            if not alias:
+                suffix = column.split(".")[-1] if column else None
+                alias = "_".join(part for part in (name, function, suffix) if part)
+
+            query = self._get_relation(name).get_relation_existence_query()
+            if callback:
+                callback(query)
+
+            if function == "exists":
+                self._query.select_sub(query, alias, exists=True)
+                self._boolean_aggregates.append(alias)
+                continue
+
+            if column is None:
+                expression = "*"
+            elif "." in column:
+                expression = column
+            else:
+                expression = f"{query._table.split()[-1]}.{column}"
+
+            self._query.select_sub(query.select(f"{function.upper()}({expression})"), alias)
 
-        return collection
+        return self
+
+    def _get_relation(self, name: str) -> Any:
+        """Get a relation of the model, not constrained to any parent."""
+        method = getattr(self._model_class, name, None)
+        if not callable(method):
+            from larapy.exceptions.database_exceptions import RelationNotFoundException
 
-    def _parse_nested_relations(self, relation: str) -> dict:
-        parts = relation.split(".", 1)
-        return {"base": parts[0], "nested": parts[1] if len(parts) > 1 else None}
+            raise RelationNotFoundException(self._model_class.__name__, name)
+
+        relation = method(self._model_class())
+        if isinstance(relation, Relation):
+            relation._relation_name = name
+        return relation
 
     def paginate(self, per_page: int = 15, page: int = 1) -> Dict[str, Any]:
         total = self.count()
@@ -242,17 +341,157 @@ class Builder:
 
             page += 1
 
+    def chunk_by_id(
+        self, count: int, callback, column: Optional[str] = None, alias: Optional[str] = None
+    ) -> bool:
+        column = column or self._model_class().get_key_name()
+        # Models hold "users.id" under "id"
+        alias = alias or column.rsplit(".", 1)[-1]
+        last_id = None
+
+        while True:
+            builder = self._clone()
+            builder._query.for_page_after_id(count, last_id, column)
+            results = builder.get()
+
+            if results.is_empty():
+                break
+
+            if callback(results) is False:
+                return False
+
+            last_id = results.last().get_attribute(alias)
+
+            if results.count() < count:
+                break
+
+        return True
+
+    def each_by_id(
+        self, callback, count: int = 1000, column: Optional[str] = None, alias: Optional[str] = None
+    ) -> bool:
+        def each_chunk(models):
+            for model in models:
+                if callback(model) is False:
+                    return False
+
+        return self.chunk_by_id(count, each_chunk, column, alias)
+
+    def lazy_by_id(
+        self, chunk_size: int = 1000, column: Optional[str] = None, alias: Optional[str] = None
+    ) -> "LazyCollection":
+        from larapy.support.lazy_collection import LazyCollection
+
+        column = column or self._model_class().get_key_name()
+        alias = alias or column.rsplit(".", 1)[-1]
+
+        def generator():
+            last_id = None
+            while True:
+                builder = self._clone()
+                builder._query.for_page_after_id(chunk_size, last_id, column)
+                results = builder.get()
+
+                yield from results
+
+                if results.count() < chunk_size:
+                    break
+                last_id = results.last().get_attribute(alias)
+
+        return LazyCollection(generator)
+
+    def simple_paginate(
+        self, per_page: int = 15, page: int = 1, path: str = "/", page_name: str = "page"
+    ) -> "Paginator":
+        from larapy.pagination.paginator import Paginator
+
+        items = self.offset((page - 1) * per_page).limit(per_page + 1).get()
+
+        return Paginator(
+            items.take(per_page), per_page, page, items.count() > per_page, path, page_name
+        )
+
+    def cursor_paginate(
+        self,
+        per_page: int = 15,
+        cursor: Union["Cursor", str, None] = None,
+        path: str = "/",
+        cursor_name: str = "cursor",
+    ) -> "CursorPaginator":
+        from larapy.pagination.cursor import Cursor
+        from larapy.pagination.cursor_paginator import CursorPaginator
+
+        if not isinstance(cursor, Cursor):
+            cursor = Cursor.from_encoded(cursor)
+
+        query = self._query.clone()
+
+        if not query._orders:
+            query.order_by(self._model_class().get_key_name())
+
+        orders = list(query._orders)
+
+        # A cursor from another ordering (or a forged one) starts over
+        if cursor is not None and any(
+            column not in cursor.parameters() for column, _ in orders
+        ):
+            cursor = None
+
+        if cursor is not None:
+            query.where(lambda q: self._add_cursor_conditions(q, orders, cursor))
+
+            if cursor.points_to_previous_items():
+                query._orders = [
+                    (column, "DESC" if direction == "ASC" else "ASC")
+                    for column, direction in orders
+                ]
+
+        items = self._clone(query).limit(per_page + 1).get()
+        has_more = items.count() > per_page
+        items = items.take(per_page)
+
+        if cursor is not None and cursor.points_to_previous_items():
+            items = items.reverse()
+
+        return CursorPaginator(
+            items, per_page, [column for column, _ in orders], cursor, has_more, path, cursor_name
+        )
+
+    def _add_cursor_conditions(self, query, orders: List[tuple], cursor: "Cursor") -> None:
+        """
+        Constrain the query to rows past the cursor in the given order:
+        (a > ?) OR (a = ? AND b > ?) ... for each ordered column.
+        """
+
+        def seek(q, position):
+            for column, _ in orders[:position]:
+                q.where(column, "=", cursor.parameter(column))
+
+            column, direction = orders[position]
+            ascending = direction == "ASC"
+            operator = ">" if ascending == cursor.points_to_next_items() else "<"
+            q.where(column, operator, cursor.parameter(column))
+
+        for position in range(len(orders)):
+            query.or_where(lambda q, position=position: seek(q, position))
+
+    def _clone(self, query=None) -> "Builder":
+        builder = Builder(query or self._query.clone(), self._model_class, self._connection)
+        builder._eager_load = dict(self._eager_load)
+        builder._boolean_aggregates = list(self._boolean_aggregates)
+        return builder
+
     def exists(self) -> bool:
         return self.count() > 0
 
     def doesnt_exist(self) -> bool:
         return not self.exists()
 
-    def cursor(self) -> "LazyCollection":
+    def cursor(self, chunk_size: int = 1000) -> "LazyCollection":
         from larapy.support.lazy_collection import LazyCollection
 
         def generator():
-            for row in self._query.get():
+            for row in self._query.cursor(chunk_size):
                 yield self._hydrate_model(row)
 
         return LazyCollection(generator)
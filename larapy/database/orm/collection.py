@@ -516,104 +516,65 @@ class Collection(Macroable):
         if not first_item or not hasattr(first_item, 'load'):
             return self
         
-        # Process each relation
-        for relation in relations:
-            self._load_relation(relation)
+        from larapy.database.orm.eager_loader import eager_load, parse_relations
+
+        # Each level of a nested path is loaded with one query for all models
+        eager_load(self._items, parse_relations(relations))
         
         return self
     
-    def _load_relation(self, relation: Union[str, Dict[str, Callable]]):
-        """
-        Load a single relationship on all models in the collection.
-        
-        Args:
-            relation: Either a string relation name or dict with constraints
-        """
-        if not self._items:
-            return
-        
-        # Handle dict format: {'posts': lambda q: q.where('published', True)}
-        if isinstance(relation, dict):
-            for rel_name, callback in relation.items():
-                self._load_relation_with_callback(rel_name, callback)
-            return
-        
-        # Handle string format: 'posts' or 'posts.comments'
-        self._load_relation_string(relation)
-    
-    def _load_relation_string(self, relation: str, callback: Optional[Callable] = None):
+    def load_count(self, *relations) -> "Collection":
         """
-        Load a relationship by name on all models.
-        
-        Args:
-            relation: The relationship name (can be nested like 'posts.comments')
-            callback: Optional callback to constrain the relationship query
+        Load the number of related models of each relation onto the
+        collection models, like Builder.with_count(), with one query.
+
+        Example:
+            posts.load_count('comments')
+            posts.first().comments_count
+
+            posts.load_count({'comments': lambda q: q.where('approved', True)})
         """
-        if not self._items:
-            return
-        
-        # Check if this is a nested relation (e.g., 'posts.comments')
-        if '.' in relation:
-            parts = relation.split('.', 1)
-            base_relation = parts[0]
-            nested_relation = parts[1]
-            
-            # Load the base relation first
-            self._load_relation_string(base_relation)
-            
-            # Then load the nested relation on the loaded models
-            for model in self._items:
-                if hasattr(model, 'get_relation') and model.relation_loaded(base_relation):
-                    related = model.get_relation(base_relation)
-                    if related:
-                        if hasattr(related, 'load'):
-                            # Single model
-                            related.load(nested_relation)
-                        elif isinstance(related, Collection):
-                            # Collection of models
-                            related.load(nested_relation)
-            return
-        
-        # Get the first model to check for relation method
-        first_model = self.first()
-        if not hasattr(first_model.__class__, relation):
-            return
-        
-        relation_method = getattr(first_model.__class__, relation)
-        if not callable(relation_method):
-            return
-        
-        # Get the relation instance from first model
-        relation_instance = relation_method(first_model)
-        
-        # Check if this relation supports eager loading
-        if not hasattr(relation_instance, 'add_eager_constraints'):
-            return
-        
-        # Add eager constraints for all models in collection
-        relation_instance.add_eager_constraints(self._items)
-        
-        # Apply callback if provided
-        if callback:
-            callback(relation_instance.get_query())
-        
-        # Execute the eager load query
-        results = relation_instance.get_eager()
-        
-        # Match results to models
-        if hasattr(relation_instance, 'match'):
-            relation_instance.match(self._items, results, relation)
-    
-    def _load_relation_with_callback(self, relation: str, callback: Callable):
+        return self.load_aggregate(relations, None, 'count')
+
+    def load_aggregate(self, relations, column: Optional[str], function: str) -> "Collection":
         """
-        Load a relationship with a query constraint callback.
-        
-        Args:
-            relation: The relationship name
-            callback: Callback function to constrain the query
+        Load a relation aggregate (see Builder.with_aggregate()) onto the
+        collection models.
+
+        One query per EAGER_CHUNK_SIZE model keys selects the aggregate
+        subqueries; the loaded values are synced as original attributes, so
+        the models do not become dirty.
         """
-        self._load_relation_string(relation, callback)
-    
+        from larapy.database.orm.relationships.relation import Relation
+
+        if not self._items or not relations:
+            return self
+
+        first_item = self.first()
+        if not hasattr(first_item, 'new_query'):
+            return self
+
+        key_name = first_item.get_key_name()
+        qualified_key = f"{first_item.get_table()}.{key_name}"
+        keys = list(dict.fromkeys(key for key in self.model_keys() if key is not None))
+        size = Relation.EAGER_CHUNK_SIZE
+
+        loaded = {}
+        for start in range(0, len(keys), size):
+            query = first_item.new_query()
+            query._query.select(qualified_key).where_in(qualified_key, keys[start:start + size])
+            for model in query.with_aggregate(relations, column, function).get():
+                loaded[model.get_key()] = model.get_attributes()
+
+        for model in self._items:
+            attributes = loaded.get(model.get_key(), {})
+            for attribute, value in attributes.items():
+                if attribute != key_name:
+                    model._attributes[attribute] = value
+                    model._original[attribute] = value
+
+        return self
+
     def load_missing(self, *relations) -> "Collection":
         """
         Load relationships that haven't been loaded yet.
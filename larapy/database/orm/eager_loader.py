@@ -0,0 +1,185 @@
+"""
+Eager Loading for Larapy Models
+
+Loads requested relations level by level. For a path such as
+"posts.comments.author" every post of every user is constrained into one
+comments query, and every comment into one author query, so a load costs
+one query per relation in the path (per chunk of keys), whatever the number
+of parent models.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from larapy.database.orm.relationships.morph_to import MorphTo
+from larapy.database.orm.relationships.relation import Relation
+
+
+def parse_relations(relations: Iterable[Any]) -> Dict[str, Optional[Callable]]:
+    """
+    Normalise with_()/load() arguments into a {path: callback} dictionary.
+
+    Strings load without a constraint; dictionaries map paths to callbacks
+    that receive the relation's query.
+    """
+    parsed: Dict[str, Optional[Callable]] = {}
+
+    for relation in relations:
+        if isinstance(relation, str):
+            if relation:
+                parsed.setdefault(relation, None)
+        elif isinstance(relation, dict):
+            parsed.update(relation)
+
+    return parsed
+
+
+def eager_load(models: List[Any], relations: Dict[str, Optional[Callable]]) -> None:
+    """
+    Load relations, including dotted nested paths, onto a list of models.
+
+    Args:
+        models: Models of the same class
+        relations: Relation paths mapped to an optional callback that
+            constrains the query of the last relation in the path
+    """
+    if models:
+        _load_tree(models, _build_tree(relations))
+
+
+def autoload_relation(models: List[Any], name: str) -> None:
+    """
+    Load a relation for every model of a result set with one query.
+
+    The results are kept apart from the loaded relations, so the relation
+    methods stay callable, and Relation.get_results() returns them without
+    querying. Models that already had the relation loaded reuse it.
+    """
+    pending = []
+    for model in models:
+        autoloaded = model.__dict__.setdefault("_autoloaded_relations", {})
+        if name in autoloaded:
+            continue
+
+        if model.relation_loaded(name):
+            autoloaded[name] = model.get_relation(name)
+        else:
+            pending.append(model)
+
+    if pending:
+        eager_load(pending, {name: None})
+
+    for model in pending:
+        model.__dict__["_autoloaded_relations"][name] = model._relations.pop(name, None)
+
+
+def _build_tree(relations: Dict[str, Optional[Callable]]) -> Dict[str, Dict]:
+    """Merge dotted paths into a tree so shared prefixes load only once."""
+    tree: Dict[str, Dict] = {}
+
+    for path, callback in relations.items():
+        if not path:
+            continue
+
+        children = tree
+        names = path.split(".")
+        for depth, name in enumerate(names):
+            node = children.setdefault(name, {"callback": None, "nested": {}})
+            if depth == len(names) - 1 and callback is not None:
+                node["callback"] = callback
+            children = node["nested"]
+
+    return tree
+
+
+def _load_tree(models: List[Any], tree: Dict[str, Dict]) -> None:
+    for name, node in tree.items():
+        for related in _load_relation(models, name, node["callback"]):
+            if related and node["nested"]:
+                _load_tree(list(related), node["nested"])
+
+
+def _load_relation(models: List[Any], name: str, callback: Optional[Callable]) -> List[List[Any]]:
+    """
+    Load one relation onto all models and match the results back.
+
+    Returns the loaded related models grouped by class, ready to have the
+    next level of the path loaded onto them.
+    """
+    first = models[0]
+    relation_method = getattr(first.__class__, name, None)
+    if relation_method is None or not callable(relation_method):
+        return []
+
+    relation = relation_method(first)
+
+    if isinstance(relation, MorphTo):
+        return _load_morph_to(models, relation, name, callback)
+
+    if not hasattr(relation, "add_eager_constraints"):
+        return []
+    relation._relation_name = name
+
+    results: Any = []
+    for index, chunk in enumerate(_chunk_models(relation, models)):
+        chunk_relation = relation if index == 0 else relation_method(first)
+        chunk_relation.add_eager_constraints(chunk)
+
+        if callback:
+            callback(chunk_relation.get_query())
+
+        chunk_results = chunk_relation.get_eager()
+        results = chunk_results if index == 0 else [*results, *chunk_results]
+
+    if hasattr(relation, "match"):
+        relation.match(models, results, name)
+
+    if isinstance(relation, Relation) and results:
+        type(results[0])._track_result_set(results)
+
+    return [results]
+
+
+def _chunk_models(relation: Any, models: List[Any]) -> List[List[Any]]:
+    """
+    Split models so each eager query binds at most EAGER_CHUNK_SIZE keys.
+
+    Models sharing a key always land in the same chunk, so no related row
+    is fetched twice. Models without a key are left out; when none has one
+    there is nothing to query.
+    """
+    if not isinstance(relation, Relation):
+        return [models]
+
+    keyed: Dict[Any, List[Any]] = {}
+    for model in models:
+        key = relation.get_eager_key(model)
+        if key is not None:
+            keyed.setdefault(key, []).append(model)
+
+    size = relation.EAGER_CHUNK_SIZE
+    if len(keyed) <= size:
+        return [models] if keyed else []
+
+    groups = list(keyed.values())
+    return [
+        [model for group in groups[start : start + size] for model in group]
+        for start in range(0, len(groups), size)
+    ]
+
+
+def _load_morph_to(
+    models: List[Any], relation: MorphTo, name: str, callback: Optional[Callable]
+) -> List[List[Any]]:
+    """Load a MorphTo relation with one query per morph type."""
+    results_by_type = relation.morph_with(models, callback)
+
+    for model in models:
+        results = results_by_type.get(model.get_attribute(relation._morph_type_field), {})
+        model.set_relation(name, results.get(model.get_attribute(relation._morph_id_field)))
+
+    groups = [list(results.values()) for results in results_by_type.values()]
+    for group in groups:
+        if group:
+            type(group[0])._track_result_set(group)
+
+    return groups
@@ -0,0 +1,97 @@
+"""
+Identity Map for Larapy Models
+
+Within a unit of work, usually one HTTP request, a row is loaded into at
+most one model instance. Builder.find(), BelongsTo and MorphTo relations and
+route model binding look a primary key up in the map before querying, and
+models hydrated from whole rows are added to it, so the same User found by
+id, reached through post.author() and bound from a route is one object and
+one query.
+
+The map is opt-in: it only exists inside unit_of_work() (which the
+UseIdentityMap middleware opens for each request) and lives in a context
+variable, so concurrent requests and tasks never share one.
+
+    with unit_of_work():
+        user = User.find(1)
+        assert post.author().get_results() is user  # no query
+
+Mapped models are not refreshed by later queries. Updates and deletes made
+through a model or the ORM builder drop the affected entries; raw statements
+and writes from other processes are not seen until the unit of work ends.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+_current: ContextVar[Optional["IdentityMap"]] = ContextVar("larapy_identity_map", default=None)
+
+
+class IdentityMap:
+    """Models keyed by connection, table and primary key."""
+
+    def __init__(self) -> None:
+        self._models: Dict[Tuple[Any, str, str], Any] = {}
+
+    def get(self, connection: Any, table: str, key: Any) -> Optional[Any]:
+        """Get the model mapped for a row, if it was loaded before."""
+        if key is None:
+            return None
+        # Route parameters arrive as strings; "5" and 5 are the same row
+        return self._models.get((connection, table, str(key)))
+
+    def add(self, connection: Any, model: Any) -> Any:
+        """
+        Map a model hydrated from a whole row.
+
+        Returns:
+            The model already mapped for the row, if any, else the model
+        """
+        key = model.get_key()
+        if key is None:
+            return model
+        return self._models.setdefault((connection, model.get_table(), str(key)), model)
+
+    def forget(self, connection: Any, table: str, key: Any) -> None:
+        """Drop the model mapped for a row."""
+        self._models.pop((connection, table, str(key)), None)
+
+    def forget_table(self, connection: Any, table: str) -> None:
+        """Drop every model mapped for a table."""
+        for entry in [entry for entry in self._models if entry[:2] == (connection, table)]:
+            del self._models[entry]
+
+    def flush(self) -> None:
+        """Drop every mapped model."""
+        self._models.clear()
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """Get the identity map of the current unit of work, or None outside one."""
+    return _current.get()
+
+
+@contextmanager
+def unit_of_work(enabled: bool = True) -> Iterator[Optional[IdentityMap]]:
+    """
+    Run a block with its own identity map, flushed when the block exits.
+
+    Args:
+        enabled: With False the block runs without an identity map, even
+            inside another unit of work
+
+    Yields:
+        The identity map, or None when disabled
+    """
+    identity_map = IdentityMap() if enabled else None
+    token = _current.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current.reset(token)
+        if identity_map is not None:
+            identity_map.flush()
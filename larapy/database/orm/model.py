@@ -1,9 +1,74 @@
 from abc import ABC
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+import inspect
 import re
 import json
 
+from larapy.database.orm.identity_map import current_identity_map, unit_of_work
+from larapy.database.orm.relationships.relation import Relation
+
+# Casts whose results are immutable, so a model can keep them between reads
+_CACHED_CASTS = frozenset({"int", "float", "str", "bool", "datetime"})
+
+
+class _AttributeAccessor:
+    """
+    Class attribute reading a column of the model's attributes.
+
+    Installed on a model class the first time an attribute is read through
+    __getattr__, so later reads of the column skip the failed instance and
+    class lookups. It is a non-data descriptor: writes still go through
+    Model.__setattr__.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.get_attribute(self.name)
+
+
+class _RelationAccessor:
+    """
+    Class attribute serving a loaded relation under its method's name.
+
+    Wraps the public methods a model class adds, and is installed by
+    set_relation() for other names: model.posts is the loaded relation once
+    one is set and the method until then, and a relation the method returns
+    is named "posts". On the class it is the plain function, so relation
+    lookups by name keep working.
+    """
+
+    __slots__ = ("name", "function")
+
+    def __init__(self, name: str, function=None):
+        self.name = name
+        self.function = function
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self if self.function is None else self.function
+
+        relations = instance.__dict__.get("_relations")
+        if relations and self.name in relations:
+            return relations[self.name]
+        if self.function is not None:
+            function, name = self.function, self.name
+
+            def method(*args, **kwargs):
+                result = function(instance, *args, **kwargs)
+                if isinstance(result, Relation):
+                    result._relation_name = name
+                return result
+
+            return method
+        return instance.get_attribute(self.name)
+
 
 class Model(ABC):
 
@@ -18,10 +83,18 @@ class Model(ABC):
     _guarded: List[str] = ["*"]
     _casts: Dict[str, str] = {}
     _attributes: Dict[str, Any] = {}
-    _original: Dict[str, Any] = {}
+    _original_attributes: Optional[Dict[str, Any]] = None
+    _original_columns: Optional[Sequence[str]] = None
+    _original_row: Optional[Sequence[Any]] = None
     _exists: bool = False
     _was_recently_created: bool = False
 
+    # Lazy loading guards (see prevent_lazy_loading()); while one is on,
+    # models from a multi-row result share the tuple of their siblings
+    _prevents_lazy_loading: bool = False
+    _automatically_eager_loads: bool = False
+    _result_set: Optional[Tuple["Model", ...]] = None
+
     # Serialization properties
     _hidden: List[str] = []
     _visible: List[str] = []
@@ -29,14 +102,23 @@ class Model(ABC):
     _with_relations: List[str] = []
     _dateFormat: str = "iso8601"
 
-    # Runtime visibility modifications
-    _runtime_hidden: Set[str] = set()
-    _runtime_visible: Set[str] = set()
-    _runtime_appends: List[str] = []
+    # Runtime visibility modifications, replaced (never mutated) per instance
+    _runtime_hidden: FrozenSet[str] = frozenset()
+    _runtime_visible: FrozenSet[str] = frozenset()
+    _runtime_appends: Tuple[str, ...] = ()
 
     CREATED_AT = "created_at"
     UPDATED_AT = "updated_at"
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Methods a model adds may define relations, which are named by the
+        # attribute they are called through
+        for name, value in list(cls.__dict__.items()):
+            if inspect.isfunction(value) and not name.startswith("_") and not hasattr(Model, name):
+                setattr(cls, name, _RelationAccessor(name, value))
+
     def __init__(self, attributes: Optional[Dict[str, Any]] = None, connection=None):
         if connection:
             self._connection = connection
@@ -45,14 +127,62 @@ class Model(ABC):
         self._original = {}
         self._relations = {}
 
-        # Initialize runtime visibility modifications
-        self._runtime_hidden = set()
-        self._runtime_visible = set()
-        self._runtime_appends = []
-
         if attributes:
             self.fill(attributes)
 
+    @classmethod
+    def _new_from_row(cls, columns: Sequence[str], row: Sequence[Any], connection=None) -> "Model":
+        """
+        Build a model for an existing row returned by a query.
+
+        The attributes dictionary is the only copy of the row made; the
+        original attributes are rebuilt from the immutable row the first time
+        they are read (dirty checks, saving). Models that override __init__
+        are constructed normally.
+        """
+        if cls.__init__ is not Model.__init__:
+            model = cls(connection=connection)
+            model.__dict__.update(
+                _attributes=dict(zip(columns, row)),
+                _original_attributes=None,
+                _original_columns=columns,
+                _original_row=row,
+                _exists=True,
+            )
+            return model
+
+        model = cls.__new__(cls)
+        state = {
+            "_attributes": dict(zip(columns, row)),
+            "_original_columns": columns,
+            "_original_row": row,
+            "_relations": {},
+            "_exists": True,
+        }
+        if connection:
+            state["_connection"] = connection
+        object.__setattr__(model, "__dict__", state)
+        return model
+
+    @property
+    def _original(self) -> Dict[str, Any]:
+        state = self.__dict__
+        original = state.get("_original_attributes")
+
+        if original is None:
+            row = state.get("_original_row")
+            original = dict(zip(state["_original_columns"], row)) if row is not None else {}
+            state["_original_attributes"] = original
+            state["_original_row"] = None
+
+        return original
+
+    @_original.setter
+    def _original(self, value: Dict[str, Any]) -> None:
+        state = self.__dict__
+        state["_original_attributes"] = value
+        state["_original_row"] = None
+
     def get_table(self) -> str:
         if self._table:
             return self._table
@@ -110,18 +240,34 @@ class Model(ABC):
         return self._guarded
 
     def get_attribute(self, key: str) -> Any:
-        if key in self._attributes:
-            value = self._attributes[key]
-
-            if key in self._casts:
-                return self.cast_attribute(key, value)
-
-            return value
+        attributes = self._attributes
+        if key not in attributes:
+            return None
 
-        return None
+        value = attributes[key]
+        cast_type = self._casts.get(key)
+        if cast_type not in _CACHED_CASTS:
+            return self.cast_attribute(key, value) if cast_type else value
+
+        # A cast is reused for as long as the raw value is the same object,
+        # which also covers writes that bypass set_attribute()
+        state = self.__dict__
+        cache = state.get("_cast_cache")
+        if cache is None:
+            cache = state["_cast_cache"] = {}
+        cached = cache.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        cast = self.cast_attribute(key, value)
+        cache[key] = (value, cast)
+        return cast
 
     def set_attribute(self, key: str, value: Any) -> None:
         self._attributes[key] = value
+        cache = self.__dict__.get("_cast_cache")
+        if cache:
+            cache.pop(key, None)
 
     def cast_attribute(self, key: str, value: Any) -> Any:
         cast_type = self._casts.get(key)
@@ -284,13 +430,19 @@ class Model(ABC):
 
         self._exists = False
 
+        identity_map = current_identity_map()
+        if identity_map is not None:
+            identity_map.forget(connection, self.get_table(), self.get_key())
+
         return affected > 0
 
     def fresh(self) -> Optional["Model"]:
         if not self._exists:
             return None
 
-        return self.new_query().find(self.get_key())
+        # The identity map would hand back this very instance
+        with unit_of_work(enabled=False):
+            return self.new_query().find(self.get_key())
 
     def refresh(self) -> "Model":
         if not self._exists:
@@ -347,7 +499,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
 
-        return HasManyThrough(
+        relation = HasManyThrough(
             query,
             self,
             related_class,
@@ -357,6 +509,7 @@ class Model(ABC):
             local_key,
             second_local_key,
         )
+        return relation
     
     def has_one_through(
         self,
@@ -373,7 +526,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
 
-        return HasOneThrough(
+        relation = HasOneThrough(
             query,
             self,
             related_class,
@@ -383,6 +536,7 @@ class Model(ABC):
             local_key,
             second_local_key,
         )
+        return relation
 
     def belongs_to(
         self,
@@ -413,7 +567,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
 
-        return BelongsToMany(
+        relation = BelongsToMany(
             query,
             self,
             related_class,
@@ -423,6 +577,7 @@ class Model(ABC):
             parent_key,
             related_key,
         )
+        return relation
     
     def morph_to(
         self,
@@ -460,7 +615,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
         
-        return MorphOne(
+        relation = MorphOne(
             query,
             self,
             related_class,
@@ -469,6 +624,7 @@ class Model(ABC):
             morph_id,
             local_key
         )
+        return relation
     
     def morph_many(
         self,
@@ -484,7 +640,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
         
-        return MorphMany(
+        relation = MorphMany(
             query,
             self,
             related_class,
@@ -493,6 +649,7 @@ class Model(ABC):
             morph_id,
             local_key
         )
+        return relation
     
     def morph_to_many(
         self,
@@ -510,7 +667,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
         
-        return MorphToMany(
+        relation = MorphToMany(
             query,
             self,
             related_class,
@@ -521,6 +678,7 @@ class Model(ABC):
             parent_key,
             related_key,
         )
+        return relation
     
     def morphed_by_many(
         self,
@@ -538,7 +696,7 @@ class Model(ABC):
         related_instance = related_class()
         query = connection.table(related_instance.get_table())
         
-        return MorphedByMany(
+        relation = MorphedByMany(
             query,
             self,
             related_class,
@@ -549,11 +707,27 @@ class Model(ABC):
             parent_key,
             related_key,
         )
+        return relation
 
     def set_relation(self, relation: str, value: Any) -> "Model":
         self._relations[relation] = value
+
+        model_class = type(self)
+        if not isinstance(model_class.__dict__.get(relation), _RelationAccessor):
+            model_class._install_relation_accessor(relation)
         return self
 
+    @classmethod
+    def _install_relation_accessor(cls, relation: str) -> None:
+        """Let instances read a loaded relation in place of its method."""
+        current = inspect.getattr_static(cls, relation, None)
+        if inspect.isfunction(current):
+            setattr(cls, relation, _RelationAccessor(relation, current))
+        elif isinstance(current, _RelationAccessor):
+            setattr(cls, relation, _RelationAccessor(relation, current.function))
+        elif current is None or isinstance(current, _AttributeAccessor):
+            setattr(cls, relation, _RelationAccessor(relation))
+
     def get_relation(self, relation: str) -> Any:
         return self._relations.get(relation)
 
@@ -561,89 +735,73 @@ class Model(ABC):
         return key in self._relations
 
     def load(self, *relations) -> "Model":
-        if not relations:
-            return self
-
-        from larapy.database.orm.collection import Collection
+        if relations:
+            from larapy.database.orm.eager_loader import eager_load, parse_relations
 
-        collection = Collection([self])
-
-        for relation in relations:
-            if isinstance(relation, str):
-                self._load_relation(collection, relation)
-            elif isinstance(relation, dict):
-                for rel_name, callback in relation.items():
-                    self._load_relation(collection, rel_name, callback)
+            eager_load([self], parse_relations(relations))
 
         return self
 
-    def load_missing(self, *relations) -> "Model":
-        relations_to_load = [rel for rel in relations if not self.relation_loaded(rel)]
-        if relations_to_load:
-            return self.load(*relations_to_load)
-        return self
-
-    def _load_relation(self, collection, relation: str, callback=None):
-        if not hasattr(self.__class__, relation):
-            return
-
-        relation_method = getattr(self.__class__, relation)
-        if not callable(relation_method):
-            return
-
-        relation_instance = relation_method(self)
-
-        if not hasattr(relation_instance, "add_eager_constraints"):
-            return
+    def load_count(self, *relations) -> "Model":
+        from larapy.database.orm.collection import Collection
 
-        relation_instance.add_eager_constraints(collection.all())
+        Collection([self]).load_count(*relations)
+        return self
 
-        if callback:
-            callback(relation_instance.get_query())
+    @classmethod
+    def prevent_lazy_loading(cls, value: bool = True) -> None:
+        """
+        Raise LazyLoadingViolationException when a relation is lazy loaded on
+        a model that was loaded together with others, instead of running one
+        query per model. Meant for development and tests; call it on Model to
+        cover every model class.
+        """
+        cls._prevents_lazy_loading = value
 
-        results = relation_instance.get_eager()
+    @classmethod
+    def prevents_lazy_loading(cls) -> bool:
+        return cls._prevents_lazy_loading
 
-        if hasattr(relation_instance, "match"):
-            relation_instance.match(collection.all(), results, relation)
+    @classmethod
+    def automatically_eager_load_relationships(cls, value: bool = True) -> None:
+        """
+        Lazy loading a relation on a model that was loaded together with
+        others loads it for all of them with one query; get_results() on the
+        other models' relations then returns their part without querying.
+        Takes precedence over prevent_lazy_loading() for relations used
+        exactly as defined (no constraints added).
+        """
+        cls._automatically_eager_loads = value
 
-    def __getattribute__(self, key: str) -> Any:
-        if (
-            key.startswith("_")
-            or key.isupper()
-            or key
-            in [
-                "get_attribute",
-                "set_attribute",
-                "get_relation",
-                "set_relation",
-                "relation_loaded",
-                "__dict__",
-                "__class__",
-            ]
-        ):
-            return super().__getattribute__(key)
+    @classmethod
+    def is_automatically_eager_loading_relationships(cls) -> bool:
+        return cls._automatically_eager_loads
 
-        _relations = super().__getattribute__("_relations") if hasattr(self, "_relations") else {}
-        if key in _relations:
-            return _relations[key]
+    @classmethod
+    def _track_result_set(cls, models: List["Model"]) -> None:
+        """Let models loaded by one query find each other on lazy loads."""
+        if len(models) > 1 and (cls._prevents_lazy_loading or cls._automatically_eager_loads):
+            siblings = tuple(models)
+            for model in siblings:
+                model.__dict__["_result_set"] = siblings
 
-        return super().__getattribute__(key)
+    def load_missing(self, *relations) -> "Model":
+        relations_to_load = [rel for rel in relations if not self.relation_loaded(rel)]
+        if relations_to_load:
+            return self.load(*relations_to_load)
+        return self
 
     def __getattr__(self, key: str) -> Any:
+        # Only reached when no instance or class attribute matched
         if key.startswith("_"):
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{key}'")
 
-        if key in self._relations:
-            return self._relations[key]
+        relations = self.__dict__.get("_relations")
+        if relations and key in relations:
+            return relations[key]
 
-        if hasattr(self.__class__, key):
-            method = getattr(self.__class__, key)
-            if callable(method):
-                result = method(self)
-                if hasattr(result, "get_results"):
-                    value = result.get_results()
-                    self._relations[key] = value
-                    return value
+        if key in self._attributes and not key.isupper():
+            setattr(type(self), key, _AttributeAccessor(key))
 
         return self.get_attribute(key)
 
@@ -659,6 +817,15 @@ class Model(ABC):
         model.save()
         return model
 
+    @classmethod
+    def upsert(
+        cls,
+        values: List[Dict[str, Any]],
+        unique_by: Any,
+        update: Optional[List[str]] = None,
+    ) -> int:
+        return cls.new_query().upsert(values, unique_by, update)
+
     @classmethod
     def find(cls, id: Any) -> Optional["Model"]:
         return cls.new_query().find(id)
@@ -955,9 +1122,8 @@ class Model(ABC):
         Returns:
             self for chaining
         """
-        for attr in attributes:
-            self._runtime_visible.add(attr)
-            self._runtime_hidden.discard(attr)
+        self._runtime_visible = self._runtime_visible | frozenset(attributes)
+        self._runtime_hidden = self._runtime_hidden - frozenset(attributes)
 
         return self
 
@@ -971,9 +1137,8 @@ class Model(ABC):
         Returns:
             self for chaining
         """
-        for attr in attributes:
-            self._runtime_hidden.add(attr)
-            self._runtime_visible.discard(attr)
+        self._runtime_hidden = self._runtime_hidden | frozenset(attributes)
+        self._runtime_visible = self._runtime_visible - frozenset(attributes)
 
         return self
 
@@ -987,7 +1152,7 @@ class Model(ABC):
         Returns:
             self for chaining
         """
-        self._runtime_visible = set(visible)
+        self._runtime_visible = frozenset(visible)
         return self
 
     def setHidden(self, hidden: List[str]) -> "Model":
@@ -1000,7 +1165,7 @@ class Model(ABC):
         Returns:
             self for chaining
         """
-        self._runtime_hidden = set(hidden)
+        self._runtime_hidden = frozenset(hidden)
         return self
 
     def append(self, attributes: List[str]) -> "Model":
@@ -1013,7 +1178,7 @@ class Model(ABC):
         Returns:
             self for chaining
         """
-        self._runtime_appends.extend(attributes)
+        self._runtime_appends = (*self._runtime_appends, *attributes)
         return self
 
     def getArrayableAttributes(self) -> Dict[str, Any]:
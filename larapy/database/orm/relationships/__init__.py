@@ -1,15 +1,4 @@
-from larapy.database.orm.relationships.relation import Relation
-from larapy.database.orm.relationships.has_one import HasOne
-from larapy.database.orm.relationships.has_many import HasMany
-from larapy.database.orm.relationships.belongs_to import BelongsTo
-from larapy.database.orm.relationships.belongs_to_many import BelongsToMany
-from larapy.database.orm.relationships.morph_to import MorphTo
-from larapy.database.orm.relationships.morph_one import MorphOne
-from larapy.database.orm.relationships.morph_many import MorphMany
-from larapy.database.orm.relationships.morph_to_many import MorphToMany
-from larapy.database.orm.relationships.morphed_by_many import MorphedByMany
-from larapy.database.orm.relationships.has_many_through import HasManyThrough
-from larapy.database.orm.relationships.has_one_through import HasOneThrough
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Relation",
@@ -25,3 +14,21 @@ __all__ = [
     "MorphToMany",
     "MorphedByMany",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.orm.relationships.relation": ["Relation"],
+        "larapy.database.orm.relationships.has_one": ["HasOne"],
+        "larapy.database.orm.relationships.has_many": ["HasMany"],
+        "larapy.database.orm.relationships.belongs_to": ["BelongsTo"],
+        "larapy.database.orm.relationships.belongs_to_many": ["BelongsToMany"],
+        "larapy.database.orm.relationships.morph_to": ["MorphTo"],
+        "larapy.database.orm.relationships.morph_one": ["MorphOne"],
+        "larapy.database.orm.relationships.morph_many": ["MorphMany"],
+        "larapy.database.orm.relationships.morph_to_many": ["MorphToMany"],
+        "larapy.database.orm.relationships.morphed_by_many": ["MorphedByMany"],
+        "larapy.database.orm.relationships.has_many_through": ["HasManyThrough"],
+        "larapy.database.orm.relationships.has_one_through": ["HasOneThrough"],
+    },
+)
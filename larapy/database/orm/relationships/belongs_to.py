@@ -1,4 +1,5 @@
 from typing import Optional, List
+from larapy.database.orm.identity_map import current_identity_map
 from larapy.database.orm.relationships.relation import Relation
 
 
@@ -31,6 +32,9 @@ class BelongsTo(Relation):
         if keys:
             self._query.where_in(owner_key, keys)
 
+    def get_eager_key(self, model):
+        return model.get_attribute(self.get_foreign_key())
+
     def match(self, models: List, results: List, relation: str) -> List:
         dictionary = {result.get_attribute(self.get_owner_key()): result for result in results}
 
@@ -43,7 +47,17 @@ class BelongsTo(Relation):
 
         return models
 
-    def get_results(self):
+    def _load_results(self):
+        identity_map = self._owner_identity_map()
+        connection = self._query._connection
+
+        if identity_map is not None and not self._query._wheres:
+            owner = identity_map.get(
+                connection, self._query._table, self._parent.get_attribute(self.get_foreign_key())
+            )
+            if owner is not None:
+                return owner
+
         if not self._constraints_applied:
             self.add_constraints()
 
@@ -52,14 +66,60 @@ class BelongsTo(Relation):
         if not results:
             return None
 
-        return self._hydrate_model(results[0])
+        model = self._hydrate_model(results[0])
+        return identity_map.add(connection, model) if identity_map is not None else model
 
     def get_eager(self):
-        results = self._query.get()
-        models = []
-        for row in results:
-            models.append(self._hydrate_model(row))
-        return models
+        identity_map = self._owner_identity_map()
+        if identity_map is None:
+            results = self._query.get()
+            models = []
+            for row in results:
+                models.append(self._hydrate_model(row))
+            return models
+
+        # Owners already in the identity map are only queried when the
+        # eager key constraint is the query's only one
+        connection = self._query._connection
+        mapped = []
+        wheres = self._query._wheres
+        if len(wheres) == 1 and wheres[0][0] == "in":
+            keys = []
+            for key in wheres[0][2]:
+                owner = identity_map.get(connection, self._query._table, key)
+                if owner is None:
+                    keys.append(key)
+                else:
+                    mapped.append(owner)
+
+            if not keys:
+                return mapped
+
+            self._query._wheres, self._query._bindings = [], []
+            self._query.where_in(wheres[0][1], keys)
+
+        return mapped + [
+            identity_map.add(connection, self._hydrate_model(row)) for row in self._query.get()
+        ]
+
+    def _owner_identity_map(self):
+        """
+        The current identity map, when the query selects whole rows of the
+        related model by primary key.
+        """
+        identity_map = current_identity_map()
+        if identity_map is None or self._query._select_columns != ["*"] or self._query._joins:
+            return None
+
+        if self.get_owner_key() != self._related_class().get_key_name():
+            return None
+
+        return identity_map
+
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        query.where_column(
+            f"{related_table}.{self.get_owner_key()}", f"{parent_table}.{self.get_foreign_key()}"
+        )
 
     def get_owner_key(self) -> str:
         if self._local_key:
@@ -57,10 +57,15 @@ class BelongsToMany(Relation):
         ]
 
         if keys:
+            self._set_join()
+
             foreign_pivot_key = self._get_foreign_pivot_key()
             table = self._get_table()
             self._query.where_in(f"{table}.{foreign_pivot_key}", keys)
 
+    def get_eager_key(self, model):
+        return model.get_attribute(self._get_parent_key())
+
     def match(self, models: List, results: List, relation: str) -> List:
         from larapy.database.orm.collection import Collection
 
@@ -75,7 +80,7 @@ class BelongsToMany(Relation):
 
         return models
 
-    def get_results(self):
+    def _load_results(self):
         from larapy.database.orm.collection import Collection
 
         if not self._constraints_applied:
@@ -133,6 +138,19 @@ class BelongsToMany(Relation):
             pivot_table, f"{related_table}.{related_key}", "=", f"{pivot_table}.{related_pivot_key}"
         )
 
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        pivot_table = self._get_table()
+        query.join(
+            pivot_table,
+            f"{related_table}.{self._get_related_key()}",
+            "=",
+            f"{pivot_table}.{self._get_related_pivot_key()}",
+        )
+        query.where_column(
+            f"{pivot_table}.{self._get_foreign_pivot_key()}",
+            f"{parent_table}.{self._get_parent_key()}",
+        )
+
     def _set_where(self):
         parent_key = self._get_parent_key()
         parent_id = self._parent.get_attribute(parent_key)
@@ -201,6 +219,7 @@ class BelongsToMany(Relation):
         related_pivot_key = self._get_related_pivot_key()
         parent_id = self._parent.get_attribute(self._get_parent_key())
 
+        records = []
         for id_value in ids:
             record = {foreign_pivot_key: parent_id, related_pivot_key: id_value}
 
@@ -216,7 +235,10 @@ class BelongsToMany(Relation):
 
                 record["updated_at"] = datetime.now()
 
-            connection.table(table).insert(record)
+            records.append(record)
+
+        if records:
+            connection.table(table).insert(records)
 
     def detach(self, ids=None):
         connection = self._parent.get_connection()
@@ -240,7 +262,7 @@ class BelongsToMany(Relation):
 
         changes = {"attached": [], "detached": [], "updated": []}
 
-        current = self.get().pluck(self._get_related_key())
+        current = self._load_results().pluck(self._get_related_key())
         current_ids = [int(id) for id in current]
 
         records_to_attach = [id for id in ids if id not in current_ids]
@@ -263,7 +285,7 @@ class BelongsToMany(Relation):
 
         changes = {"attached": [], "detached": []}
 
-        current = self.get().pluck(self._get_related_key())
+        current = self._load_results().pluck(self._get_related_key())
         current_ids = [int(id) for id in current]
 
         for id in ids:
@@ -45,7 +45,7 @@ class HasMany(Relation):
 
         return models
 
-    def get_results(self):
+    def _load_results(self):
         from larapy.database.orm.collection import Collection
 
         if not self._constraints_applied:
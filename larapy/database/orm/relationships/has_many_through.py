@@ -4,6 +4,10 @@ from larapy.database.orm.relationships.relation import Relation
 
 class HasManyThrough(Relation):
     
+    # Column alias carrying the through model's first key in eager results,
+    # used to match each result back to its parent
+    THROUGH_KEY_ALIAS = 'larapy_through_key'
+    
     def __init__(
         self,
         query,
@@ -44,6 +48,10 @@ class HasManyThrough(Relation):
         
         if keys:
             self._set_join()
+            self._query.select(
+                f'{self._get_related_table()}.*',
+                f'{self._get_qualified_first_key_name()} as {self.THROUGH_KEY_ALIAS}',
+            )
             self._query.where_in(table, keys)
     
     def match(self, models: List, results: List, relation: str) -> List:
@@ -59,7 +67,7 @@ class HasManyThrough(Relation):
                 
         return models
     
-    def get_results(self):
+    def _load_results(self):
         if not self._constraints_applied:
             self.add_constraints()
             
@@ -98,6 +106,18 @@ class HasManyThrough(Relation):
         
         self._query.select(f'{final_table}.*')
         
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        through_table = self._get_through_table()
+        query.join(
+            through_table,
+            f"{through_table}.{self._get_second_local_key()}",
+            "=",
+            f"{related_table}.{self._get_second_key()}",
+        )
+        query.where_column(
+            f"{through_table}.{self._get_first_key()}", f"{parent_table}.{self._get_local_key()}"
+        )
+
     def _set_where(self):
         local_key = self._get_local_key()
         local_value = self._parent.get_attribute(local_key)
@@ -133,7 +153,9 @@ class HasManyThrough(Relation):
         pivot_data = {}
         
         for key, value in row.items():
-            if '.' in key:
+            if key == self.THROUGH_KEY_ALIAS:
+                pivot_data[self._get_first_key()] = value
+            elif '.' in key:
                 table_name, column_name = key.split('.', 1)
                 
                 if table_name == self._get_through_table():
@@ -143,10 +165,9 @@ class HasManyThrough(Relation):
             else:
                 attributes[key] = value
         
-        model = self._related_class(connection=self._parent.get_connection())
-        model._attributes = attributes.copy()
-        model._original = attributes.copy()
-        model._exists = True
+        model = self._related_class._new_from_row(
+            tuple(attributes), tuple(attributes.values()), self._parent.get_connection()
+        )
         
         if pivot_data:
             model._pivot_data = pivot_data
@@ -43,7 +43,7 @@ class HasOne(Relation):
 
         return models
 
-    def get_results(self):
+    def _load_results(self):
         if not self._constraints_applied:
             self.add_constraints()
 
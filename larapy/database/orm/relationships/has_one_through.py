@@ -4,7 +4,7 @@ from larapy.database.orm.relationships.has_many_through import HasManyThrough
 
 class HasOneThrough(HasManyThrough):
     
-    def get_results(self):
+    def _load_results(self):
         if not self._constraints_applied:
             self.add_constraints()
             
@@ -53,6 +53,12 @@ class MorphMany(MorphRelation):
             self._query.where(self._morph_type, morph_class)
             self._query.where_in(self._morph_id, keys)
     
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        query.where(f"{related_table}.{self._morph_type}", self.get_morph_class())
+        query.where_column(
+            f"{related_table}.{self._morph_id}", f"{parent_table}.{self.get_local_key()}"
+        )
+
     def match(self, models: List, results: List, relation: str) -> List:
         from larapy.database.orm.collection import Collection
         
@@ -67,7 +73,7 @@ class MorphMany(MorphRelation):
         
         return models
     
-    def get_results(self):
+    def _load_results(self):
         from larapy.database.orm.collection import Collection
         
         if not self._constraints_applied:
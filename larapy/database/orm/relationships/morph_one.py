@@ -53,6 +53,12 @@ class MorphOne(MorphRelation):
             self._query.where(self._morph_type, morph_class)
             self._query.where_in(self._morph_id, keys)
     
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        query.where(f"{related_table}.{self._morph_type}", self.get_morph_class())
+        query.where_column(
+            f"{related_table}.{self._morph_id}", f"{parent_table}.{self.get_local_key()}"
+        )
+
     def match(self, models: List, results: List, relation: str) -> List:
         dictionary = self._build_dictionary(results)
         
@@ -65,7 +71,7 @@ class MorphOne(MorphRelation):
         
         return models
     
-    def get_results(self):
+    def _load_results(self):
         if not self._constraints_applied:
             self.add_constraints()
         
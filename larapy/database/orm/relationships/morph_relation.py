@@ -52,5 +52,5 @@ class MorphRelation(Relation):
         pass
     
     @abstractmethod
-    def get_results(self):
+    def _load_results(self):
         pass
@@ -1,6 +1,7 @@
 from typing import List, Optional, Type
 from larapy.database.orm.relationships.morph_relation import MorphRelation
 from larapy.database.orm.morph_map import MorphMap
+from larapy.database.orm.identity_map import current_identity_map
 
 
 class MorphTo(MorphRelation):
@@ -48,10 +49,11 @@ class MorphTo(MorphRelation):
         """
         return None
     
-    def morph_with(self, models: List):
+    def morph_with(self, models: List, callback=None):
         """
         Load morphTo relationships for a collection of models.
-        Groups by morph type and executes one query per type.
+        Groups by morph type and executes one query per type (per chunk of
+        EAGER_CHUNK_SIZE ids), passing each query to the optional callback.
         """
         from larapy.database.query.builder import QueryBuilder
         
@@ -68,28 +70,46 @@ class MorphTo(MorphRelation):
                 grouped[morph_type]['models'].append(model)
         
         # Load each morph type separately
+        identity_map = current_identity_map()
+        connection = self._parent.get_connection()
         results_by_type = {}
         for morph_type, data in grouped.items():
             related_class = self._resolve_related_class(morph_type)
             if not related_class:
                 continue
             
-            related_instance = related_class(connection=self._parent.get_connection())
+            related_instance = related_class(connection=connection)
             owner_key = self._owner_key or related_instance.get_key_name()
             
-            query = QueryBuilder(
-                connection=self._parent.get_connection(),
-                table_name=related_instance.get_table()
-            )
+            ids = list(dict.fromkeys(data['ids']))
             
-            results = query.where_in(owner_key, data['ids']).get()
-            
-            # Build dictionary for this type
+            # Build dictionary for this type, starting with the models
+            # already in the identity map unless a callback constrains them
             results_dict = {}
-            for row in results:
-                key_value = row.get(owner_key)
-                model = self._hydrate_related_model(related_class, row)
-                results_dict[key_value] = model
+            if identity_map is not None and callback is None and owner_key == related_instance.get_key_name():
+                table = related_instance.get_table()
+                for id_value in ids:
+                    mapped = identity_map.get(connection, table, id_value)
+                    if mapped is not None:
+                        results_dict[id_value] = mapped
+                ids = [id_value for id_value in ids if id_value not in results_dict]
+            
+            for start in range(0, len(ids), self.EAGER_CHUNK_SIZE):
+                query = QueryBuilder(
+                    connection=self._parent.get_connection(),
+                    table_name=related_instance.get_table()
+                )
+                query.where_in(owner_key, ids[start:start + self.EAGER_CHUNK_SIZE])
+                
+                if callback:
+                    callback(query)
+                
+                for row in query.get():
+                    key_value = row.get(owner_key)
+                    model = self._hydrate_related_model(related_class, row)
+                    if identity_map is not None and query._select_columns == ["*"]:
+                        model = identity_map.add(connection, model)
+                    results_dict[key_value] = model
             
             results_by_type[morph_type] = results_dict
         
@@ -119,7 +139,7 @@ class MorphTo(MorphRelation):
         
         return models
     
-    def get_results(self):
+    def _load_results(self):
         if self._loaded_parent is not None:
             return self._loaded_parent
         
@@ -133,12 +153,20 @@ class MorphTo(MorphRelation):
         if not related_class:
             return None
         
-        related_instance = related_class(connection=self._parent.get_connection())
+        connection = self._parent.get_connection()
+        related_instance = related_class(connection=connection)
         owner_key = self._owner_key or related_instance.get_key_name()
         
+        identity_map = current_identity_map()
+        if identity_map is not None and owner_key == related_instance.get_key_name():
+            mapped = identity_map.get(connection, related_instance.get_table(), morph_id)
+            if mapped is not None:
+                self._loaded_parent = mapped
+                return mapped
+        
         from larapy.database.query.builder import QueryBuilder
         query = QueryBuilder(
-            connection=self._parent.get_connection(),
+            connection=connection,
             table_name=related_instance.get_table()
         )
         
@@ -147,9 +175,22 @@ class MorphTo(MorphRelation):
         if not results:
             return None
         
-        self._loaded_parent = self._hydrate_related_model(related_class, results[0])
+        model = self._hydrate_related_model(related_class, results[0])
+        if identity_map is not None:
+            model = identity_map.add(connection, model)
+        
+        self._loaded_parent = model
         return self._loaded_parent
     
+    def get_relation_existence_query(self):
+        from larapy.exceptions.database_exceptions import InvalidRelationException
+
+        raise InvalidRelationException(
+            type(self._parent).__name__,
+            self._relation_name or self._morph_name,
+            "a MorphTo relation has no single related table to aggregate",
+        )
+
     def _resolve_related_class(self, morph_type: str) -> Optional[Type]:
         resolved_type = MorphMap.resolve_type(morph_type)
         
@@ -166,12 +207,9 @@ class MorphTo(MorphRelation):
             return None
     
     def _hydrate_related_model(self, related_class: Type, attributes: dict):
-        instance = related_class(connection=self._parent.get_connection())
-        instance._attributes = attributes.copy()
-        instance._original = attributes.copy()
-        instance._exists = True
-        instance._was_recently_created = False
-        return instance
+        return related_class._new_from_row(
+            tuple(attributes), tuple(attributes.values()), self._parent.get_connection()
+        )
     
     def associate(self, model):
         morph_class = self._get_morph_class_for_model(model)
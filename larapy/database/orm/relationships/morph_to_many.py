@@ -74,6 +74,9 @@ class MorphToMany(MorphRelation):
                     morph_class_alias = related_class_name
                 self._query.where(f"{table}.{self._morph_type}", morph_class_alias)
 
+    def get_eager_key(self, model):
+        return model.get_attribute(self._get_parent_key())
+
     def match(self, models: List, results: List, relation: str) -> List:
         from larapy.database.orm.collection import Collection
 
@@ -88,7 +91,7 @@ class MorphToMany(MorphRelation):
 
         return models
 
-    def get_results(self):
+    def _load_results(self):
         from larapy.database.orm.collection import Collection
 
         if not self._constraints_applied:
@@ -147,6 +150,20 @@ class MorphToMany(MorphRelation):
             pivot_table, f"{related_table}.{related_key}", "=", f"{pivot_table}.{related_pivot_key}"
         )
 
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        pivot_table = self._get_table()
+        query.join(
+            pivot_table,
+            f"{related_table}.{self._get_related_key()}",
+            "=",
+            f"{pivot_table}.{self._get_related_pivot_key()}",
+        )
+        query.where(f"{pivot_table}.{self._morph_type}", self.get_morph_class())
+        query.where_column(
+            f"{pivot_table}.{self._get_foreign_pivot_key()}",
+            f"{parent_table}.{self._get_parent_key()}",
+        )
+
     def _set_where(self):
         parent_key = self._get_parent_key()
         parent_id = self._parent.get_attribute(parent_key)
@@ -219,6 +236,7 @@ class MorphToMany(MorphRelation):
         related_pivot_key = self._get_related_pivot_key()
         parent_id = self._parent.get_attribute(self._get_parent_key())
 
+        records = []
         for id_value in ids:
             record = {
                 foreign_pivot_key: parent_id,
@@ -236,7 +254,10 @@ class MorphToMany(MorphRelation):
                 from datetime import datetime
                 record["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            connection.table(table).insert(record)
+            records.append(record)
+
+        if records:
+            connection.table(table).insert(records)
 
     def detach(self, ids=None):
         connection = self._parent.get_connection()
@@ -263,7 +284,7 @@ class MorphToMany(MorphRelation):
 
         changes = {"attached": [], "detached": [], "updated": []}
 
-        current = self.get_results().pluck(self._get_related_key())
+        current = self._load_results().pluck(self._get_related_key())
         current_ids = [int(id) for id in current]
 
         records_to_attach = [id for id in ids if id not in current_ids]
@@ -286,7 +307,7 @@ class MorphToMany(MorphRelation):
 
         changes = {"attached": [], "detached": []}
 
-        current = self.get_results().pluck(self._get_related_key())
+        current = self._load_results().pluck(self._get_related_key())
         current_ids = [int(id) for id in current]
 
         for id in ids:
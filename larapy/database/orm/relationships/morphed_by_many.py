@@ -63,6 +63,24 @@ class MorphedByMany(MorphToMany):
             pivot_table, f"{related_table}.{related_key}", "=", f"{pivot_table}.{foreign_pivot_key}"
         )
 
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        from larapy.database.orm.morph_map import MorphMap
+
+        pivot_table = self._get_table()
+        related_class_name = f"{self._related_class.__module__}.{self._related_class.__name__}"
+
+        query.join(
+            pivot_table,
+            f"{related_table}.{self._get_related_key()}",
+            "=",
+            f"{pivot_table}.{self._get_foreign_pivot_key()}",
+        )
+        query.where(f"{pivot_table}.{self._morph_type}", MorphMap.get_morph_alias(related_class_name))
+        query.where_column(
+            f"{pivot_table}.{self._get_related_pivot_key()}",
+            f"{parent_table}.{self._get_parent_key()}",
+        )
+
     def _set_where(self):
         parent_key = self._get_parent_key()
         parent_id = self._parent.get_attribute(parent_key)
@@ -93,6 +111,7 @@ class MorphedByMany(MorphToMany):
         related_pivot_key = self._get_related_pivot_key()
         parent_id = self._parent.get_attribute(self._get_parent_key())
 
+        records = []
         for id_value in ids:
             record = {
                 foreign_pivot_key: id_value,
@@ -110,7 +129,10 @@ class MorphedByMany(MorphToMany):
                 from datetime import datetime
                 record["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            connection.table(table).insert(record)
+            records.append(record)
+
+        if records:
+            connection.table(table).insert(records)
 
     def detach(self, ids=None):
         connection = self._parent.get_connection()
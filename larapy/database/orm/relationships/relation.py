@@ -4,6 +4,19 @@ from typing import Any, Optional, Type, List, Dict
 
 class Relation(ABC):
 
+    # Most parent keys bound into one eager loading query; larger loads
+    # run one query per chunk
+    EAGER_CHUNK_SIZE = 1000
+
+    # Name of the model method defining the relation, set where the method
+    # is looked up by name: model attribute access, eager loading and
+    # relation aggregates
+    _relation_name: Optional[str] = None
+
+    # Alias of the related table in existence queries of relations from a
+    # table to itself, so the subquery can tell its rows from the parent's
+    SELF_RELATION_ALIAS = "larapy_reserved_0"
+
     def __init__(
         self,
         query,
@@ -32,15 +45,107 @@ class Relation(ABC):
         pass
 
     @abstractmethod
-    def get_results(self):
+    def _load_results(self):
         pass
 
+    def get_results(self):
+        """
+        Run the relation's query for its parent model (a lazy load).
+
+        When the parent was loaded together with other models, automatic
+        eager loading loads the relation for all of them with one query and
+        serves later calls from memory, and prevent_lazy_loading() raises
+        LazyLoadingViolationException instead of querying.
+        """
+        parent = self._parent
+        siblings = parent.__dict__.get("_result_set")
+        if siblings is None:
+            return self._load_results()
+
+        parent_class = type(parent)
+
+        if parent_class._automatically_eager_loads and self._matches_definition():
+            from larapy.database.orm.eager_loader import autoload_relation
+
+            autoloaded = parent.__dict__.get("_autoloaded_relations")
+            if autoloaded is None or self._relation_name not in autoloaded:
+                autoload_relation(siblings, self._relation_name)
+
+            return parent.__dict__["_autoloaded_relations"][self._relation_name]
+
+        if parent_class._prevents_lazy_loading:
+            from larapy.exceptions.database_exceptions import LazyLoadingViolationException
+
+            raise LazyLoadingViolationException(
+                parent_class.__name__, self._relation_name or self.__class__.__name__
+            )
+
+        return self._load_results()
+
+    def _matches_definition(self) -> bool:
+        """
+        Whether this relation is exactly what its model method returns, with
+        no constraints added since, so loading it for other models is safe.
+        """
+        method = getattr(type(self._parent), self._relation_name or "", None)
+        if not callable(method):
+            return False
+
+        fresh = method(self._parent)
+        if type(fresh) is not type(self):
+            return False
+
+        ignored = ("_query", "_relation_name")
+        state = {key: value for key, value in vars(self).items() if key not in ignored}
+        fresh_state = {key: value for key, value in vars(fresh).items() if key not in ignored}
+        if state != fresh_state:
+            return False
+
+        query, fresh_query = self._query, fresh._query
+        if query is None or fresh_query is None:
+            return query is fresh_query
+
+        return (query._build_select_query(), query._bindings) == (
+            fresh_query._build_select_query(),
+            fresh_query._bindings,
+        )
+
     def get_eager(self):
-        return self.get()
+        return self._load_results()
+
+    def get_eager_key(self, model) -> Any:
+        """The value of a parent model that add_eager_constraints() filters on."""
+        return model.get_attribute(self.get_local_key())
 
     def get(self):
         return self.get_results()
 
+    def get_relation_existence_query(self):
+        """
+        Build a query for the related rows of a parent row, correlated to
+        the parent table so it can run as a subquery of a query on the
+        parents (with_count() and friends).
+
+        Returns:
+            A copy of the relation's query, keeping the constraints of the
+            relation definition
+        """
+        query = self._query.clone()
+        parent_table = self._parent.get_table()
+        related_table = self._related_class().get_table()
+
+        if related_table == parent_table:
+            query._table = f"{related_table} as {self.SELF_RELATION_ALIAS}"
+            related_table = self.SELF_RELATION_ALIAS
+
+        self._add_existence_constraints(query, related_table, parent_table)
+        return query
+
+    def _add_existence_constraints(self, query, related_table: str, parent_table: str) -> None:
+        query.where_column(
+            f"{related_table}.{self.get_foreign_key()}", f"{parent_table}.{self.get_local_key()}"
+        )
+
     def get_query(self):
         return self._query
 
@@ -67,13 +172,9 @@ class Relation(ABC):
         return self._parent.get_key_name()
 
     def _hydrate_model(self, attributes):
-        related_instance = self._related_class(connection=self._parent.get_connection())
-        related_instance._attributes = attributes.copy()
-        related_instance._original = attributes.copy()
-        related_instance._exists = True
-        related_instance._was_recently_created = False
-
-        return related_instance
+        return self._related_class._new_from_row(
+            tuple(attributes), tuple(attributes.values()), self._parent.get_connection()
+        )
 
     def _build_dictionary(self, results: List) -> Dict:
         return {self._get_dictionary_key(result): result for result in results}
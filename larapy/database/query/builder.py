@@ -1,6 +1,8 @@
-from typing import Any, Dict, List, Optional, Union, Callable
+import copy
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from sqlalchemy import text, select, insert, update, delete, func, and_, or_
-from larapy.cache import cache
+from larapy.cache import cache, query_cache
+from larapy.database.connection import ExpandingList
 
 
 class QueryBuilder:
@@ -8,6 +10,8 @@ class QueryBuilder:
         self._connection = connection
         self._table = table_name
         self._select_columns = ["*"]
+        self._select_bindings = []
+        self._select_subquery_tables = []
         self._wheres = []
         self._bindings = []
         self._joins = []
@@ -20,10 +24,42 @@ class QueryBuilder:
         self._cache_enabled = False
         self._cache_ttl = None
         self._cache_key = None
+        self._use_write_pdo = False
 
     def select(self, *columns):
         if columns:
             self._select_columns = list(columns)
+            self._select_bindings = []
+            self._select_subquery_tables = []
+        return self
+
+    def add_select(self, *columns):
+        """Add columns to the select clause, keeping those already selected."""
+        if self._select_columns == ["*"]:
+            self._select_columns = list(columns)
+        else:
+            self._select_columns = [*self._select_columns, *columns]
+        return self
+
+    def select_raw(self, expression: str, bindings: Optional[List[Any]] = None):
+        """Add a raw expression, with bindings for its placeholders, to the select clause."""
+        self.add_select(expression)
+        self._select_bindings.extend(bindings or [])
+        return self
+
+    def select_sub(self, query: "QueryBuilder", alias: str, exists: bool = False):
+        """
+        Add a subquery to the select clause under ``alias``.
+
+        With ``exists`` the column is 1 when the subquery returns a row and
+        0 otherwise. Remembered results are tagged with the subquery's tables
+        too, so writes to them invalidate the cache.
+        """
+        sql = query._build_select_query()
+        expression = f"CASE WHEN EXISTS ({sql}) THEN 1 ELSE 0 END" if exists else f"({sql})"
+
+        self.select_raw(f"{expression} as {alias}", query.get_bindings())
+        self._select_subquery_tables.extend(query._tables_read())
         return self
 
     def where(self, column: Union[str, Callable], operator: Any = None, value: Any = None):
@@ -45,7 +81,16 @@ class QueryBuilder:
         self._bindings.append(value)
         return self
 
-    def or_where(self, column: str, operator: Any = None, value: Any = None):
+    def or_where(self, column: Union[str, Callable], operator: Any = None, value: Any = None):
+        if callable(column):
+            nested_builder = QueryBuilder(self._connection, self._table)
+            column(nested_builder)
+
+            if nested_builder._wheres:
+                self._wheres.append(("or_nested", nested_builder._wheres))
+                self._bindings.extend(nested_builder._bindings)
+            return self
+
         if value is None and operator is not None:
             value = operator
             operator = "="
@@ -55,13 +100,15 @@ class QueryBuilder:
         return self
 
     def where_in(self, column: str, values: List):
+        values = ExpandingList(values)
         self._wheres.append(("in", column, values))
-        self._bindings.extend(values)
+        self._bindings.append(values)
         return self
 
     def where_not_in(self, column: str, values: List):
+        values = ExpandingList(values)
         self._wheres.append(("not_in", column, values))
-        self._bindings.extend(values)
+        self._bindings.append(values)
         return self
 
     def where_null(self, column: str):
@@ -77,6 +124,14 @@ class QueryBuilder:
         self._bindings.extend([min_value, max_value])
         return self
 
+    def where_column(self, first: str, operator: str, second: Optional[str] = None):
+        """Compare two columns, e.g. where_column("posts.user_id", "users.id")."""
+        if second is None:
+            first, operator, second = first, "=", operator
+
+        self._wheres.append(("column", first, operator, second))
+        return self
+
     def join(self, table: str, first: str, operator: str, second: str):
         self._joins.append(("inner", table, first, operator, second))
         return self
@@ -114,9 +169,48 @@ class QueryBuilder:
         self._distinct_flag = True
         return self
 
+    def for_page_after_id(self, per_page: int = 15, last_id: Any = None, column: str = "id"):
+        """
+        Constrain the query to the page of rows following ``last_id``,
+        ordered by ``column``, for keyset pagination.
+        """
+        self._orders = [order for order in self._orders if order[0] != column]
+
+        if last_id is not None:
+            self.where(column, ">", last_id)
+
+        return self.order_by(column, "asc").limit(per_page)
+
+    def clone(self) -> "QueryBuilder":
+        """Copy the query so constraints added to the copy leave this one unchanged."""
+        query = copy.copy(self)
+        for attribute in (
+            "_select_columns",
+            "_select_bindings",
+            "_select_subquery_tables",
+            "_wheres",
+            "_bindings",
+            "_joins",
+            "_orders",
+            "_group_by_columns",
+            "_having_conditions",
+        ):
+            setattr(query, attribute, list(getattr(self, attribute)))
+        return query
+
+    def use_write_pdo(self) -> "QueryBuilder":
+        """Run this query's selects on the write connection instead of a replica."""
+        self._use_write_pdo = True
+        return self
+
     def remember(self, ttl: int = 3600, key: Optional[str] = None):
         """
         Enable caching for this query.
+
+        Results are tagged with every table the query reads, and writes made
+        through the query builder (or a model) to any of those tables
+        invalidate them, so long TTLs never serve stale rows. Writes through
+        raw Connection statements do not invalidate.
         
         Args:
             ttl: Time to live in seconds (default: 3600 = 1 hour)
@@ -146,23 +240,27 @@ class QueryBuilder:
         """
         if self._cache_key:
             return self._cache_key
-        
-        # Build a representation of the query
-        key_parts = [
-            self._table,
-            str(self._select_columns),
-            str(self._wheres),
-            str(self._bindings),
-            str(self._joins),
-            str(self._orders),
-            str(self._group_by_columns),
-            str(self._having_conditions),
-            str(self._limit_value),
-            str(self._offset_value),
-            str(self._distinct_flag)
-        ]
-        
-        return cache().generate_key(*key_parts)
+
+        # The compiled SQL covers every clause; repr() keeps 1 and "1" apart
+        return cache().generate_key(
+            self._build_select_query(), *[repr(binding) for binding in self.get_bindings()]
+        )
+
+    def get_bindings(self) -> List[Any]:
+        """Get the bindings of a select, in placeholder order."""
+        if self._select_bindings:
+            return [*self._select_bindings, *self._bindings]
+        return self._bindings
+
+    def _tables_read(self) -> List[str]:
+        """Get the tables the query reads, without aliases."""
+        tables = [self._table] + [join[1] for join in self._joins]
+        return [table.split()[0] for table in tables] + self._select_subquery_tables
+
+    def _invalidate_cache(self) -> None:
+        """Expire remembered results that read this table once the write commits."""
+        table = self._table.split()[0]
+        self._connection.after_commit(lambda: query_cache().flush_tables(table))
 
     def _build_select_query(self) -> str:
         distinct = "DISTINCT " if self._distinct_flag else ""
@@ -221,16 +319,21 @@ class QueryBuilder:
 
             elif where_type == "in":
                 _, column, values = where
-                placeholders = ", ".join(["?" for _ in values])
-                clause = f"{column} IN ({placeholders})"
+                clause = f"{column} IN ?"
                 if i > 0 and self._wheres[i - 1][0] != "or":
                     parts.append("AND")
                 parts.append(clause)
 
             elif where_type == "not_in":
                 _, column, values = where
-                placeholders = ", ".join(["?" for _ in values])
-                clause = f"{column} NOT IN ({placeholders})"
+                clause = f"{column} NOT IN ?"
+                if i > 0 and self._wheres[i - 1][0] != "or":
+                    parts.append("AND")
+                parts.append(clause)
+
+            elif where_type == "column":
+                _, first, operator, second = where
+                clause = f"{first} {operator} {second}"
                 if i > 0 and self._wheres[i - 1][0] != "or":
                     parts.append("AND")
                 parts.append(clause)
@@ -266,6 +369,15 @@ class QueryBuilder:
                     parts.append("AND")
                 parts.append(clause)
 
+            elif where_type == "or_nested":
+                _, nested_wheres = where
+                nested_builder = QueryBuilder(self._connection, self._table)
+                nested_builder._wheres = nested_wheres
+                clause = f"({nested_builder._build_where_clause()})"
+                if i > 0:
+                    parts.append("OR")
+                parts.append(clause)
+
         return " ".join(parts)
 
     def get(self) -> List[Dict]:
@@ -279,25 +391,64 @@ class QueryBuilder:
         """
         # Check cache if enabled
         if self._cache_enabled:
-            cache_key = self._generate_cache_key()
+            results_cache = query_cache()
+            cache_key = results_cache.versioned_key(
+                self._generate_cache_key(), self._tables_read()
+            )
             
             # Try to get from cache
-            cached_result = cache().get(cache_key)
+            cached_result = results_cache.get(cache_key)
             if cached_result is not None:
                 return cached_result
             
             # Execute query
-            query = self._build_select_query()
-            results = self._connection.select(query, self._bindings)
+            results = self._run_select()
             
             # Store in cache
-            cache().put(cache_key, results, self._cache_ttl)
+            results_cache.put(cache_key, results, self._cache_ttl)
             
             return results
         
         # No caching, execute normally
+        return self._run_select()
+
+    def get_rows(self) -> tuple:
+        """
+        Execute the query and return its rows as tuples.
+
+        Returns:
+            Tuple of (column names, rows) where each row is a tuple of values
+            in column order; remembered queries are served from the cache
+        """
+        if self._cache_enabled:
+            results = self.get()
+            columns = list(results[0]) if results else []
+            return columns, [tuple(row.values()) for row in results]
+
+        query = self._build_select_query()
+
+        if self._use_write_pdo:
+            return self._connection.select_rows(query, self.get_bindings(), use_read_pdo=False)
+        return self._connection.select_rows(query, self.get_bindings())
+
+    def _run_select(self) -> List[Dict]:
         query = self._build_select_query()
-        return self._connection.select(query, self._bindings)
+
+        if self._use_write_pdo:
+            return self._connection.select(query, self.get_bindings(), use_read_pdo=False)
+        return self._connection.select(query, self.get_bindings())
+
+    def cursor(self, chunk_size: int = 1000) -> Iterator[Dict]:
+        """
+        Execute the query and yield rows as they stream from the database.
+
+        Unlike get(), results are never held in memory all at once and
+        remember() caching does not apply.
+        """
+        query = self._build_select_query()
+        if self._use_write_pdo:
+            return self._connection.cursor(query, self.get_bindings(), chunk_size, use_read_pdo=False)
+        return self._connection.cursor(query, self.get_bindings(), chunk_size)
 
     def first(self) -> Optional[Dict]:
         self.limit(1)
@@ -317,57 +468,259 @@ class QueryBuilder:
         return row[column] if row and column in row else None
 
     def count(self) -> int:
-        original_select = self._select_columns
-        self._select_columns = ["COUNT(*) as count"]
-        result = self.first()
-        self._select_columns = original_select
-        return result["count"] if result else 0
+        result = self._aggregate("COUNT(*)", "count")
+        return result if result is not None else 0
 
     def sum(self, column: str) -> Union[int, float]:
-        original_select = self._select_columns
-        self._select_columns = [f"SUM({column}) as sum"]
-        result = self.first()
-        self._select_columns = original_select
-        return result["sum"] if result and result["sum"] is not None else 0
+        result = self._aggregate(f"SUM({column})", "sum")
+        return result if result is not None else 0
 
     def avg(self, column: str) -> Union[int, float]:
-        original_select = self._select_columns
-        self._select_columns = [f"AVG({column}) as avg"]
-        result = self.first()
-        self._select_columns = original_select
-        return result["avg"] if result and result["avg"] is not None else 0
+        result = self._aggregate(f"AVG({column})", "avg")
+        return result if result is not None else 0
 
     def min(self, column: str) -> Any:
-        original_select = self._select_columns
-        self._select_columns = [f"MIN({column}) as min"]
-        result = self.first()
-        self._select_columns = original_select
-        return result["min"] if result else None
+        return self._aggregate(f"MIN({column})", "min")
 
     def max(self, column: str) -> Any:
-        original_select = self._select_columns
-        self._select_columns = [f"MAX({column}) as max"]
-        result = self.first()
-        self._select_columns = original_select
-        return result["max"] if result else None
+        return self._aggregate(f"MAX({column})", "max")
+
+    def _aggregate(self, expression: str, alias: str) -> Any:
+        """Select only the aggregate, leaving the select clause as it was."""
+        original = self._select_columns, self._select_bindings, self._select_subquery_tables
+        self._select_columns = [f"{expression} as {alias}"]
+        self._select_bindings, self._select_subquery_tables = [], []
+        try:
+            result = self.first()
+        finally:
+            self._select_columns, self._select_bindings, self._select_subquery_tables = original
+        return result[alias] if result else None
 
     def exists(self) -> bool:
         return self.count() > 0
 
-    def insert(self, data: Union[Dict, List[Dict]]) -> int:
-        if isinstance(data, list):
+    def insert(self, data: Union[Dict, List[Dict]], chunk_size: Optional[int] = None) -> int:
+        """
+        Insert one row, or many rows with multi-row INSERT statements.
+
+        Rows are sent in chunks of at most ``chunk_size`` rows (default 1000),
+        fewer when the driver's parameter limit requires it. Chunks run in
+        one transaction unless a transaction is already open.
+
+        Returns:
+            The driver's last insert id
+        """
+        if not isinstance(data, list):
+            last_id = self._insert_single(data)
+            self._invalidate_cache()
+            return last_id
+
+        statements = self._compile_insert_chunks(data, chunk_size)
+
+        def run() -> int:
             last_id = 0
-            for row in data:
-                last_id = self._insert_single(row)
+            for query, bindings in statements:
+                last_id = self._connection.insert(query, bindings)
             return last_id
-        return self._insert_single(data)
+
+        last_id = self._run_in_transaction(run, len(statements))
+        self._invalidate_cache()
+        return last_id
+
+    def insert_many(self, data: List[Dict]) -> int:
+        """
+        Insert rows with a single-row INSERT run through the driver's executemany.
+
+        Rows with the same columns share one statement; useful when very wide
+        multi-row statements are undesirable.
+
+        Returns:
+            Number of rows inserted
+        """
+        groups = []
+        for row in data:
+            columns = tuple(row.keys())
+            if groups and groups[-1][0] == columns:
+                groups[-1][1].append(list(row.values()))
+            else:
+                groups.append((columns, [list(row.values())]))
+
+        def run() -> int:
+            return sum(
+                self._connection.insert_many(self._compile_insert(columns, 1), rows)
+                for columns, rows in groups
+            )
+
+        inserted = self._run_in_transaction(run, len(groups))
+        self._invalidate_cache()
+        return inserted
+
+    def insert_get_ids(
+        self, data: List[Dict], column: str = "id", chunk_size: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Insert rows and return the value of ``column`` for each, in order.
+
+        Uses INSERT ... RETURNING in chunks where the driver supports it, and
+        falls back to one insert per row otherwise.
+        """
+        if not self._connection.supports_returning():
+            ids = self._run_in_transaction(
+                lambda: [self._insert_single(row) for row in data], len(data)
+            )
+            self._invalidate_cache()
+            return ids
+
+        statements = self._compile_insert_chunks(data, chunk_size, f" RETURNING {column}")
+
+        def run() -> List[Any]:
+            ids = []
+            for query, bindings in statements:
+                ids.extend(
+                    row[column] for row in self._connection.insert_returning(query, bindings)
+                )
+            return ids
+
+        ids = self._run_in_transaction(run, len(statements))
+        self._invalidate_cache()
+        return ids
+
+    def insert_or_ignore(self, data: Union[Dict, List[Dict]], chunk_size: Optional[int] = None) -> int:
+        """
+        Insert rows, skipping any that would violate a unique constraint.
+
+        Compiles to ON CONFLICT DO NOTHING on SQLite and PostgreSQL and to
+        INSERT IGNORE on MySQL, batched like insert().
+
+        Returns:
+            Number of rows inserted
+        """
+        if not isinstance(data, list):
+            data = [data]
+
+        if self._connection.get_driver_name() == "mysql":
+            statements = [
+                (query.replace("INSERT INTO", "INSERT IGNORE INTO", 1), bindings)
+                for query, bindings in self._compile_insert_chunks(data, chunk_size)
+            ]
+        else:
+            statements = self._compile_insert_chunks(data, chunk_size, " ON CONFLICT DO NOTHING")
+
+        return self._run_affecting(statements)
+
+    def upsert(
+        self,
+        data: Union[Dict, List[Dict]],
+        unique_by: Union[str, List[str]],
+        update: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Insert rows, or update the existing row when ``unique_by`` collides.
+
+        Compiles to ON CONFLICT ... DO UPDATE on SQLite and PostgreSQL and to
+        ON DUPLICATE KEY UPDATE on MySQL, batched like insert(). MySQL ignores
+        ``unique_by`` and matches on any unique index of the table.
+
+        Args:
+            data: Row or rows to insert
+            unique_by: Column or columns of the unique index to match on
+            update: Columns to overwrite on conflict; defaults to every
+                inserted column not in ``unique_by``
+
+        Returns:
+            Number of rows affected, as reported by the driver
+        """
+        if not isinstance(data, list):
+            data = [data]
+
+        if not data:
+            return 0
+
+        unique_by = [unique_by] if isinstance(unique_by, str) else list(unique_by)
+
+        if update is None:
+            update = [column for column in data[0] if column not in unique_by]
+
+        if not update:
+            return self.insert_or_ignore(data, chunk_size)
+
+        return self._run_affecting(
+            self._compile_insert_chunks(data, chunk_size, self._compile_upsert(unique_by, update))
+        )
+
+    def _compile_upsert(self, unique_by: List[str], update: List[str]) -> str:
+        if self._connection.get_driver_name() == "mysql":
+            columns = ", ".join(f"{column} = VALUES({column})" for column in update)
+            return f" ON DUPLICATE KEY UPDATE {columns}"
+
+        columns = ", ".join(f"{column} = excluded.{column}" for column in update)
+        return f" ON CONFLICT ({', '.join(unique_by)}) DO UPDATE SET {columns}"
+
+    def _run_affecting(self, statements: List[tuple]) -> int:
+        """Run compiled insert chunks and sum the rows they affected."""
+
+        def run() -> int:
+            return sum(
+                self._connection.affecting_statement(query, bindings)
+                for query, bindings in statements
+            )
+
+        affected = self._run_in_transaction(run, len(statements))
+        self._invalidate_cache()
+        return affected
 
     def _insert_single(self, data: Dict) -> int:
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-        query = f"INSERT INTO {self._table} ({columns}) VALUES ({placeholders})"
+        query = self._compile_insert(tuple(data.keys()), 1)
         return self._connection.insert(query, list(data.values()))
 
+    def _compile_insert(self, columns: tuple, rows: int) -> str:
+        row = f"({', '.join(['?'] * len(columns))})"
+        values = ", ".join([row] * rows)
+        return f"INSERT INTO {self._table} ({', '.join(columns)}) VALUES {values}"
+
+    def _compile_insert_chunks(
+        self, data: List[Dict], chunk_size: Optional[int] = None, suffix: str = ""
+    ) -> List[tuple]:
+        """Build a (query, bindings) multi-row insert for each chunk of rows."""
+        return [
+            (self._compile_insert(columns, len(chunk)) + suffix, [v for row in chunk for v in row])
+            for columns, chunk in self._insert_chunks(data, chunk_size)
+        ]
+
+    def _insert_chunks(self, data: List[Dict], chunk_size: Optional[int] = None):
+        """
+        Split rows into chunks that share the same columns and stay within
+        the driver's parameter limit, preserving order.
+
+        Yields:
+            Tuples of (columns, list of row value lists)
+        """
+        chunk_size = chunk_size or 1000
+        max_bindings = self._connection.get_max_bindings()
+        columns = None
+        chunk = []
+
+        for row in data:
+            row_columns = tuple(row.keys())
+            limit = max(1, min(chunk_size, max_bindings // max(len(row_columns), 1)))
+
+            if chunk and (row_columns != columns or len(chunk) >= limit):
+                yield columns, chunk
+                chunk = []
+
+            columns = row_columns
+            chunk.append(list(row.values()))
+
+        if chunk:
+            yield columns, chunk
+
+    def _run_in_transaction(self, callback: Callable, statements: int):
+        """Run several statements in one transaction unless one is already open."""
+        if statements > 1 and not self._connection.in_transaction():
+            return self._connection.transaction(callback)
+        return callback()
+
     def insert_get_id(self, data: Dict) -> int:
         return self.insert(data)
 
@@ -382,7 +735,9 @@ class QueryBuilder:
             query += f" WHERE {where_clause}"
             bindings.extend(self._bindings)
 
-        return self._connection.update(query, bindings)
+        affected = self._connection.update(query, bindings)
+        self._invalidate_cache()
+        return affected
 
     def increment(self, column: str, amount: int = 1) -> int:
         query = f"UPDATE {self._table} SET {column} = {column} + ?"
@@ -393,7 +748,9 @@ class QueryBuilder:
             query += f" WHERE {where_clause}"
             bindings.extend(self._bindings)
 
-        return self._connection.update(query, bindings)
+        affected = self._connection.update(query, bindings)
+        self._invalidate_cache()
+        return affected
 
     def decrement(self, column: str, amount: int = 1) -> int:
         query = f"UPDATE {self._table} SET {column} = {column} - ?"
@@ -404,7 +761,9 @@ class QueryBuilder:
             query += f" WHERE {where_clause}"
             bindings.extend(self._bindings)
 
-        return self._connection.update(query, bindings)
+        affected = self._connection.update(query, bindings)
+        self._invalidate_cache()
+        return affected
 
     def delete(self) -> int:
         query = f"DELETE FROM {self._table}"
@@ -412,13 +771,18 @@ class QueryBuilder:
         if self._wheres:
             where_clause = self._build_where_clause()
             query += f" WHERE {where_clause}"
-            return self._connection.delete(query, self._bindings)
+            affected = self._connection.delete(query, self._bindings)
+        else:
+            affected = self._connection.delete(query)
 
-        return self._connection.delete(query)
+        self._invalidate_cache()
+        return affected
 
     def truncate(self) -> bool:
         query = f"DELETE FROM {self._table}"
-        return self._connection.statement(query)
+        result = self._connection.statement(query)
+        self._invalidate_cache()
+        return result
 
     def to_sql(self) -> str:
         return self._build_select_query()
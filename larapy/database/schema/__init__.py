@@ -1,3 +1,10 @@
-from .schema import Schema, Blueprint
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ['Schema', 'Blueprint']
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.schema.schema": ["Schema", "Blueprint"],
+    },
+)
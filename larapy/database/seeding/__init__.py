@@ -1,8 +1,4 @@
-from .seeder import Seeder
-from .factory import Factory
-from .seeder_runner import SeederRunner
-from .database_seeder import DatabaseSeeder
-from .seeder_service_provider import SeederServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Seeder",
@@ -11,3 +7,14 @@ __all__ = [
     "DatabaseSeeder",
     "SeederServiceProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.database.seeding.seeder": ["Seeder"],
+        "larapy.database.seeding.factory": ["Factory"],
+        "larapy.database.seeding.seeder_runner": ["SeederRunner"],
+        "larapy.database.seeding.database_seeder": ["DatabaseSeeder"],
+        "larapy.database.seeding.seeder_service_provider": ["SeederServiceProvider"],
+    },
+)
@@ -54,8 +54,7 @@ class Factory(ABC):
 
         table_name = self._get_table_name()
 
-        for instance in instances:
-            self._connection.table(table_name).insert(instance)
+        self._connection.table(table_name).insert(instances)
 
         if self._count == 1:
             return instances[0]
@@ -1,11 +1,15 @@
-from larapy.encryption.encrypter import Encrypter
-from larapy.encryption.exceptions import (
-    EncryptionException,
-    DecryptionException,
-)
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Encrypter",
     "EncryptionException",
     "DecryptionException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.encryption.encrypter": ["Encrypter"],
+        "larapy.encryption.exceptions": ["EncryptionException", "DecryptionException"],
+    },
+)
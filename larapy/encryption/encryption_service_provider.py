@@ -1,9 +1,11 @@
-from larapy.support.service_provider import ServiceProvider
+from typing import Any, List
+
+from larapy.support.service_provider import DeferrableProvider, ServiceProvider
 from larapy.encryption import Encrypter
 from larapy.encryption.exceptions import InvalidKeyException
 
 
-class EncryptionServiceProvider(ServiceProvider):
+class EncryptionServiceProvider(ServiceProvider, DeferrableProvider):
     def register(self) -> None:
         self.app.singleton("encrypter", self._create_encrypter)
         self.app.singleton(Encrypter, self._create_encrypter)
@@ -34,3 +36,6 @@ class EncryptionServiceProvider(ServiceProvider):
 
     def boot(self) -> None:
         pass
+
+    def provides(self) -> List[Any]:
+        return ["encrypter", Encrypter]
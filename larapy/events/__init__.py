@@ -1,8 +1,4 @@
-from larapy.events.dispatcher import Dispatcher
-from larapy.events.event import Event, Dispatchable
-from larapy.events.subscriber import EventSubscriber
-from larapy.events.helpers import event, set_event_dispatcher, get_event_dispatcher
-from larapy.events.event_service_provider import EventServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Dispatcher",
@@ -14,3 +10,14 @@ __all__ = [
     "set_event_dispatcher",
     "get_event_dispatcher",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.events.dispatcher": ["Dispatcher"],
+        "larapy.events.event": ["Event", "Dispatchable"],
+        "larapy.events.subscriber": ["EventSubscriber"],
+        "larapy.events.helpers": ["event", "set_event_dispatcher", "get_event_dispatcher"],
+        "larapy.events.event_service_provider": ["EventServiceProvider"],
+    },
+)
@@ -1,34 +1,4 @@
-from .exception_handler import ExceptionHandler, ReportableRegistration
-from .exception_context import ExceptionContext, ContextProvider
-from .error_renderer import ErrorRenderer
-
-# Database exceptions
-from .database_exceptions import (
-    DatabaseException,
-    QueryException,
-    ConnectionException,
-    TransactionException,
-    MigrationException,
-    ModelNotFoundException,
-    RecordNotFoundException,
-    DuplicateRecordException,
-    RelationNotFoundException,
-    InvalidRelationException,
-    SchemaException,
-    DeadlockException,
-)
-
-# Validation exceptions
-from .validation_exceptions import (
-    ValidationException,
-    InvalidRuleException,
-    RuleParseException,
-    ValidatorException,
-    AuthorizationException,
-    AuthenticationException,
-    TokenMismatchException,
-    ThrottleException,
-)
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     # Handler and context
@@ -48,6 +18,7 @@ __all__ = [
     "DuplicateRecordException",
     "RelationNotFoundException",
     "InvalidRelationException",
+    "LazyLoadingViolationException",
     "SchemaException",
     "DeadlockException",
     # Validation exceptions
@@ -60,3 +31,37 @@ __all__ = [
     "TokenMismatchException",
     "ThrottleException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.exceptions.exception_handler": ["ExceptionHandler", "ReportableRegistration"],
+        "larapy.exceptions.exception_context": ["ExceptionContext", "ContextProvider"],
+        "larapy.exceptions.error_renderer": ["ErrorRenderer"],
+        "larapy.exceptions.database_exceptions": [
+            "DatabaseException",
+            "QueryException",
+            "ConnectionException",
+            "TransactionException",
+            "MigrationException",
+            "ModelNotFoundException",
+            "RecordNotFoundException",
+            "DuplicateRecordException",
+            "RelationNotFoundException",
+            "InvalidRelationException",
+            "LazyLoadingViolationException",
+            "SchemaException",
+            "DeadlockException",
+        ],
+        "larapy.exceptions.validation_exceptions": [
+            "ValidationException",
+            "InvalidRuleException",
+            "RuleParseException",
+            "ValidatorException",
+            "AuthorizationException",
+            "AuthenticationException",
+            "TokenMismatchException",
+            "ThrottleException",
+        ],
+    },
+)
@@ -349,6 +349,30 @@ class InvalidRelationException(DatabaseException):
         super().__init__(message)
 
 
+class LazyLoadingViolationException(DatabaseException):
+    """
+    Exception raised when a relation is lazy loaded on a model that was
+    loaded together with other models while lazy loading is prevented.
+    
+    Example:
+        ```python
+        Model.prevent_lazy_loading()
+        
+        for post in Post.all():
+            post.author().get_results()  # raises: eager load with with_('author')
+        ```
+    """
+    
+    def __init__(self, model: str, relation_name: str):
+        self.model = model
+        self.relation_name = relation_name
+        message = (
+            f"Attempted to lazy load [{relation_name}] on model [{model}] "
+            f"but lazy loading is disabled"
+        )
+        super().__init__(message)
+
+
 class SchemaException(DatabaseException):
     """
     Exception raised during schema operations.
@@ -1,6 +1,13 @@
-from larapy.filesystem.storage import Storage
-from larapy.filesystem.storage_manager import StorageManager
-from larapy.filesystem.filesystem_adapter import FilesystemAdapter
-from larapy.filesystem.fake import FakeStorage
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Storage", "StorageManager", "FilesystemAdapter", "FakeStorage"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.filesystem.storage": ["Storage"],
+        "larapy.filesystem.storage_manager": ["StorageManager"],
+        "larapy.filesystem.filesystem_adapter": ["FilesystemAdapter"],
+        "larapy.filesystem.fake": ["FakeStorage"],
+    },
+)
@@ -4,8 +4,15 @@ Application Foundation Module
 Core application components for bootstrapping and lifecycle management.
 """
 
-from larapy.foundation.application import Application
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Application",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.foundation.application": ["Application"],
+    },
+)
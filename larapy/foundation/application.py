@@ -6,10 +6,12 @@ bootstraps service providers, and coordinates the application lifecycle.
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Set, Type, Union
 
 from larapy.container import Container
+from larapy.foundation.provider_repository import ProviderRepository, load_provider_class
 from larapy.support import ServiceProvider
 
 
@@ -39,6 +41,8 @@ class Application(Container):
         self._service_providers: List[ServiceProvider] = []
         self._loaded_providers: Dict[str, bool] = {}
         self._deferred_services: Dict[str, str] = {}
+        self._deferred_lock = threading.RLock()
+        self._registering_deferred: Set[str] = set()
 
         self._register_base_bindings()
         self._register_base_service_providers()
@@ -138,6 +142,33 @@ class Application(Container):
         """
         return self.base_path(os.path.join("resources", path))
 
+    def get_cached_routes_path(self) -> str:
+        """
+        Get the path to the routes cache file.
+
+        Returns:
+            The full path
+        """
+        return self.bootstrap_path(os.path.join("cache", "routes.json"))
+
+    def get_cached_services_path(self) -> str:
+        """
+        Get the path to the cached service provider manifest.
+
+        Returns:
+            The full path
+        """
+        return self.bootstrap_path(os.path.join("cache", "services.json"))
+
+    def routes_are_cached(self) -> bool:
+        """
+        Determine if the application routes are cached.
+
+        Returns:
+            True if the route cache file exists
+        """
+        return os.path.isfile(self.get_cached_routes_path())
+
     def environment(self) -> str:
         """
         Get the current application environment.
@@ -212,8 +243,120 @@ class Application(Container):
                 spec.loader.exec_module(module)
 
                 if hasattr(module, "providers"):
-                    for provider_class in module.providers:
-                        self.register(provider_class)
+                    ProviderRepository(self, self.get_cached_services_path()).load(
+                        list(module.providers)
+                    )
+
+    def add_deferred_services(self, services: Dict[str, str]) -> None:
+        """
+        Record services supplied by deferred providers.
+
+        Args:
+            services: Service keys mapped to provider import names
+        """
+        self._deferred_services.update(services)
+
+        for service in services:
+            self._forget_plans(service)
+
+    def get_deferred_services(self) -> Dict[str, str]:
+        """
+        Get the services whose providers have not been loaded yet.
+
+        Returns:
+            Service keys mapped to provider import names
+        """
+        return dict(self._deferred_services)
+
+    def is_deferred_service(self, service: Union[str, Type]) -> bool:
+        """
+        Determine if a service is supplied by a provider that is not loaded yet.
+
+        Args:
+            service: The service key or type
+
+        Returns:
+            True if the service is deferred, False otherwise
+        """
+        return self._get_abstract_key(service) in self._deferred_services
+
+    def load_deferred_providers(self) -> None:
+        """Register every deferred provider."""
+        with self._deferred_lock:
+            for provider in set(self._deferred_services.values()):
+                self.register_deferred_provider(provider)
+
+    def load_deferred_provider(self, service: str) -> None:
+        """
+        Register the deferred provider that supplies a service.
+
+        A thread resolving a service while another registers its provider
+        waits for the registration, then finds the service bound.
+
+        Args:
+            service: The service key
+        """
+        with self._deferred_lock:
+            provider = self._deferred_services.get(service)
+
+            # The provider resolving its own services while it registers
+            if provider is not None and provider not in self._registering_deferred:
+                self.register_deferred_provider(provider)
+
+    def register_deferred_provider(self, provider: str) -> ServiceProvider:
+        """
+        Register a deferred provider and forget the services it supplies.
+
+        The provider is booted immediately if the application has booted;
+        otherwise it is booted with the other providers. If loading or
+        registering the provider fails its services stay deferred, so the
+        next resolve raises the provider's error again.
+
+        Args:
+            provider: Provider import name
+
+        Returns:
+            The registered service provider instance
+        """
+        with self._deferred_lock:
+            self._registering_deferred.add(provider)
+            try:
+                registered = self.register(load_provider_class(provider))
+            finally:
+                self._registering_deferred.discard(provider)
+
+            for service, name in list(self._deferred_services.items()):
+                if name == provider:
+                    del self._deferred_services[service]
+
+            return registered
+
+    def bound(self, abstract: Union[str, Type]) -> bool:
+        """
+        Check if an abstract type is bound or supplied by a deferred provider.
+
+        Args:
+            abstract: The abstract type to check
+
+        Returns:
+            True if bound, False otherwise
+        """
+        return self.is_deferred_service(abstract) or super().bound(abstract)
+
+    def _get_concrete_entry(self, abstract: Union[str, Type]) -> Any:
+        """Load a deferred provider on the first resolve of one of its services."""
+        if self._deferred_services and abstract not in self._concretes:
+            self.load_deferred_provider(self._get_alias(self._get_abstract_key(abstract)))
+
+        return super()._get_concrete_entry(abstract)
+
+    def _validate(self, abstract: Any, stack: List[str], validated: Set[str]) -> None:
+        """Accept deferred services without loading their providers."""
+        if isinstance(abstract, (str, type)) and self._deferred_services:
+            if self._get_alias(self._get_abstract_key(abstract)) in self._deferred_services:
+                return
+
+        super()._validate(abstract, stack, validated)
 
     def _mark_as_registered(self, provider: ServiceProvider) -> None:
         """
@@ -228,6 +371,9 @@ class Application(Container):
     def boot(self) -> None:
         """
         Boot the application's service providers.
+
+        In production the container is compiled once every provider has
+        booted, so misconfigured bindings fail here rather than on a request.
         """
         if self._booted:
             return
@@ -237,6 +383,9 @@ class Application(Container):
 
         self._booted = True
 
+        if self.is_production():
+            self.compile()
+
     def _boot_provider(self, provider: ServiceProvider) -> None:
         """
         Boot the given service provider.
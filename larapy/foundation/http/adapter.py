@@ -0,0 +1,253 @@
+"""
+HTTP Server Adapter
+
+Shared plumbing for the ASGI and WSGI entry points: route dispatch through
+the HTTP kernel, response normalization, header rendering and error
+responses.
+"""
+
+import inspect
+import json
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from larapy.http.exceptions import HttpException
+from larapy.http.kernel import Kernel
+from larapy.http.response import JsonResponse, Response
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+FORM_CONTENT_TYPES = ("application/x-www-form-urlencoded", "application/json")
+
+
+def parse_query(query_string: str) -> Dict[str, Any]:
+    """
+    Parse a query string into request input.
+
+    Repeated keys are collected into a list.
+    """
+    query: Dict[str, Any] = {}
+
+    for key, value in parse_qsl(query_string, keep_blank_values=True):
+        if key.endswith("[]"):
+            query.setdefault(key[:-2], []).append(value)
+        elif key in query:
+            existing = query[key]
+            query[key] = existing + [value] if isinstance(existing, list) else [existing, value]
+        else:
+            query[key] = value
+
+    return query
+
+
+def parse_cookies(header: str) -> Dict[str, str]:
+    """Parse a Cookie header."""
+    cookies: Dict[str, str] = {}
+
+    for part in header.split(";"):
+        name, separator, value = part.strip().partition("=")
+        if separator and name:
+            cookies[name] = value.strip('"')
+
+    return cookies
+
+
+def format_cookie(cookie: Dict[str, Any]) -> str:
+    """Render a response cookie as a Set-Cookie header value."""
+    parts = [f"{cookie['name']}={cookie['value']}", f"Path={cookie.get('path') or '/'}"]
+
+    if cookie.get("domain"):
+        parts.append(f"Domain={cookie['domain']}")
+
+    minutes = cookie.get("minutes", 0)
+    if minutes < 0:
+        parts.append("Max-Age=0")
+        parts.append("Expires=Thu, 01 Jan 1970 00:00:00 GMT")
+    elif minutes > 0:
+        parts.append(f"Max-Age={int(minutes * 60)}")
+
+    if cookie.get("secure"):
+        parts.append("Secure")
+    if cookie.get("http_only"):
+        parts.append("HttpOnly")
+
+    return "; ".join(parts)
+
+
+async def resolve(value: Any) -> Any:
+    """Await the value if it is awaitable."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def encode_chunk(chunk: Any) -> bytes:
+    """Convert a streamed body chunk to bytes."""
+    if isinstance(chunk, bytes):
+        return chunk
+    if isinstance(chunk, (bytearray, memoryview)):
+        return bytes(chunk)
+    return str(chunk).encode("utf-8")
+
+
+def status_line(status: int) -> str:
+    """Build a status line such as "200 OK"."""
+    try:
+        return f"{status} {HTTPStatus(status).phrase}"
+    except ValueError:
+        return f"{status} Unknown"
+
+
+def is_buffered_content_type(content_type: str) -> bool:
+    """Check if a request body is parsed into request input."""
+    return any(content_type.startswith(kind) for kind in FORM_CONTENT_TYPES)
+
+
+class HttpAdapter:
+    """
+    Base class for server entry points.
+
+    Requests are matched once, run through the kernel's compiled middleware
+    pipeline for the route, and the action result is normalized into a
+    Response. Subclasses translate between the server protocol and
+    Request/Response objects.
+    """
+
+    def __init__(
+        self,
+        router: Any,
+        kernel: Optional[Kernel] = None,
+        exception_handler: Optional[Any] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_buffered_body: int = 1024 * 1024,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            router: Router requests are dispatched to
+            kernel: HTTP kernel providing the middleware stack
+            exception_handler: ExceptionHandler used to report and render errors
+            chunk_size: Size of file and body chunks
+            max_buffered_body: Largest form or JSON body read into request input
+        """
+        self.router = router
+        self.kernel = kernel
+        self.exception_handler = exception_handler
+        self.chunk_size = chunk_size
+        self.max_buffered_body = max_buffered_body
+
+    @classmethod
+    def from_application(cls, app: Any, **options: Any) -> "HttpAdapter":
+        """
+        Create an adapter from the application's bound router and kernel.
+
+        Args:
+            app: Application container
+            **options: Adapter options
+
+        Returns:
+            Adapter instance
+        """
+        kernel = app.make(Kernel) if app.bound(Kernel) else None
+        handler = app.make("exception.handler") if app.bound("exception.handler") else None
+
+        return cls(app.make("router"), kernel, handler, **options)
+
+    def match(self, request: Any) -> Any:
+        """
+        Match the request and record the route middleware on it.
+
+        Returns:
+            Route match or None
+        """
+        match = self.router.findRoute(request)
+
+        if match is not None:
+            request._route_middleware = list(match.getMiddleware())
+
+        return match
+
+    def middleware(self, request: Any) -> List[Any]:
+        """Get the resolved middleware instances for a matched request."""
+        if self.kernel is None:
+            return []
+
+        return self.kernel.pipeline(request).pipes
+
+    def run_route(self, request: Any, match: Any) -> Any:
+        """Run the matched route action."""
+        if match is None:
+            return Response("Not Found", 404)
+
+        return self.router.dispatchToRoute(request, match)
+
+    def terminate(self, request: Any, response: Response) -> None:
+        """Run terminable middleware once the response has been sent."""
+        if self.kernel is not None:
+            self.kernel.terminate(request, response)
+
+    def prepare_response(self, value: Any, request: Any = None) -> Response:
+        """
+        Convert an action result into a Response.
+
+        Args:
+            value: Value returned by the route action or middleware
+            request: Current request
+
+        Returns:
+            Response instance
+        """
+        if isinstance(value, Response):
+            return value
+        if value is None:
+            return Response("")
+        if isinstance(value, (dict, list)):
+            return JsonResponse(value)
+        if hasattr(value, "to_response"):
+            return JsonResponse(value.to_response(request))
+        return Response(value)
+
+    def render_exception(self, request: Any, exception: Exception) -> Response:
+        """
+        Report an exception and convert it into a Response.
+
+        Args:
+            request: Current request
+            exception: Raised exception
+
+        Returns:
+            Error response
+        """
+        if self.exception_handler is not None:
+            self.exception_handler.report(exception)
+            rendered = self.exception_handler.render(request, exception)
+
+            if isinstance(rendered, Response):
+                return rendered
+
+            headers = dict(rendered.get("headers") or {})
+            headers.setdefault("Content-Type", rendered.get("content_type", "text/html"))
+            return Response(rendered["content"], rendered["status_code"], headers)
+
+        if isinstance(exception, HttpException):
+            return Response(str(exception), exception.get_status_code(), dict(exception.get_headers()))
+
+        return Response("Server Error", 500)
+
+    def response_headers(self, response: Response) -> List[Tuple[str, str]]:
+        """Render the response headers, including Set-Cookie lines."""
+        headers = [(str(name), str(value)) for name, value in response.getHeaders().items()]
+        headers.extend(("Set-Cookie", format_cookie(cookie)) for cookie in response.getCookies())
+        return headers
+
+    def body(self, response: Response) -> bytes:
+        """Encode the content of a non-streamed response."""
+        content = response.content()
+
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, (dict, list)):
+            return json.dumps(content, default=str).encode("utf-8")
+        return str(content).encode("utf-8")
@@ -0,0 +1,648 @@
+"""
+ASGI Adapter
+
+Serves the application from any ASGI 3 server (uvicorn, hypercorn, daphne).
+Request bodies are pulled from the server on demand, async routes and
+middleware run on the event loop, synchronous code runs on a bounded thread
+pool, and streamed and file responses are sent chunk by chunk.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from larapy.foundation.http.adapter import (
+    DEFAULT_CHUNK_SIZE,
+    HttpAdapter,
+    encode_chunk,
+    is_buffered_content_type,
+    parse_cookies,
+    parse_query,
+    resolve,
+)
+from larapy.http.exceptions import HttpException
+from larapy.http.kernel import Kernel, MiddlewareWithParameters
+from larapy.http.request import Request
+from larapy.http.response import BinaryFileResponse, Response, StreamedResponse
+
+_END = object()
+
+
+class ClientDisconnect(Exception):
+    """Exception raised when the client disconnects while its body is being read."""
+
+    pass
+
+
+def _pipe_handler(pipe: Any) -> Optional[Callable]:
+    """Get the callable a compiled pipeline would invoke for a pipe."""
+    if callable(pipe):
+        return pipe
+    return getattr(pipe, "handle", None)
+
+
+def _is_coroutine_callable(target: Any) -> bool:
+    """Check if calling the target returns a coroutine."""
+    if target is None:
+        return False
+    if inspect.iscoroutinefunction(target):
+        return True
+    return inspect.iscoroutinefunction(getattr(target, "__call__", None))
+
+
+def _is_async_pipe(pipe: Any) -> bool:
+    """Check if a middleware must be awaited."""
+    if isinstance(pipe, MiddlewareWithParameters):
+        inner = pipe.middleware
+        return _is_coroutine_callable(getattr(inner, "handle", inner))
+    return _is_coroutine_callable(_pipe_handler(pipe))
+
+
+_current_worker: ContextVar[Optional["_RequestWorker"]] = ContextVar(
+    "larapy_asgi_worker", default=None
+)
+
+
+class _RequestWorker:
+    """
+    A pool thread parked while it waits for the event loop.
+
+    Synchronous work the event loop needs for the same request (a sync
+    middleware behind an async one, a sync route) is handed back to this
+    thread instead of taking another pool worker, so a request holds at most
+    one thread and interleaved sync/async chains cannot deadlock a saturated
+    pool.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+    def wait(self, future: Future) -> Any:
+        """Serve submitted work until the future completes."""
+        future.add_done_callback(self._queue.put)
+
+        while True:
+            item = self._queue.get()
+            if item is future:
+                return future.result()
+            item()
+
+    def submit(self, loop: asyncio.AbstractEventLoop, call: Callable[[], Any]) -> asyncio.Future:
+        """Run a call on the parked thread and resolve an event loop future."""
+        result: asyncio.Future = loop.create_future()
+
+        def run() -> None:
+            try:
+                value = call()
+            except BaseException as e:
+                loop.call_soon_threadsafe(_set_exception, result, e)
+            else:
+                loop.call_soon_threadsafe(_set_result, result, value)
+
+        self._queue.put(run)
+        return result
+
+
+def _set_result(future: asyncio.Future, value: Any) -> None:
+    if not future.cancelled():
+        future.set_result(value)
+
+
+def _set_exception(future: asyncio.Future, exception: BaseException) -> None:
+    if not future.cancelled():
+        future.set_exception(exception)
+
+
+class AsgiRequestBody:
+    """
+    Request body read from the ASGI receive channel on demand.
+
+    Supports ``async for`` on the event loop and plain ``for`` on worker
+    threads; each chunk is pulled from the server only when it is consumed.
+    The body can be iterated once.
+    """
+
+    def __init__(self, receive: Callable, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Initialize the body.
+
+        Args:
+            receive: ASGI receive callable
+            loop: Event loop the receive callable belongs to
+        """
+        self._receive = receive
+        self._loop = loop
+        self._more_body = True
+        self.started = False
+        self.disconnected = False
+
+    @property
+    def complete(self) -> bool:
+        """Check if the whole body has been received."""
+        return not self._more_body
+
+    async def _next_chunk(self) -> Optional[bytes]:
+        """Receive the next non-empty chunk, or None at the end of the body."""
+        while self._more_body:
+            message = await self._receive()
+
+            if message["type"] == "http.disconnect":
+                self._more_body = False
+                self.disconnected = True
+                raise ClientDisconnect()
+
+            self._more_body = message.get("more_body", False)
+            chunk = message.get("body", b"")
+            if chunk:
+                return chunk
+
+        return None
+
+    def _start(self) -> None:
+        if self.started:
+            raise RuntimeError("The request body has already been consumed.")
+        self.started = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self._start()
+
+        while True:
+            chunk = await self._next_chunk()
+            if chunk is None:
+                return
+            yield chunk
+
+    def __iter__(self) -> Any:
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+
+        if on_loop:
+            raise RuntimeError("Use 'async for' to read the request body on the event loop.")
+
+        self._start()
+
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(self._next_chunk(), self._loop).result()
+            if chunk is None:
+                return
+            yield chunk
+
+    async def read(self, limit: Optional[int] = None) -> bytes:
+        """
+        Read the whole body.
+
+        Args:
+            limit: Maximum number of bytes to accept
+
+        Raises:
+            HttpException: 413 if the body exceeds the limit
+        """
+        chunks: List[bytes] = []
+        size = 0
+
+        async for chunk in self:
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise HttpException(413, "Payload Too Large")
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    async def wait_for_disconnect(self) -> None:
+        """Wait until the client disconnects, discarding unread body chunks."""
+        self.started = True
+
+        while True:
+            message = await self._receive()
+            if message["type"] == "http.disconnect":
+                self.disconnected = True
+                return
+
+
+class AsgiApplication(HttpAdapter):
+    """
+    ASGI 3 application serving the router.
+
+    Usage:
+        application = AsgiApplication.from_application(app)
+        # uvicorn module:application
+
+    Middleware and route actions may be plain functions or ``async def``.
+    Coroutines run on the event loop. Synchronous middleware, actions,
+    streamed generators and file reads run on a thread pool of
+    ``max_workers`` threads, so slow clients only cost a coroutine each.
+    """
+
+    def __init__(
+        self,
+        router: Any,
+        kernel: Optional[Kernel] = None,
+        exception_handler: Optional[Any] = None,
+        max_workers: int = 40,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_buffered_body: int = 1024 * 1024,
+    ) -> None:
+        """
+        Initialize the ASGI application.
+
+        Args:
+            router: Router requests are dispatched to
+            kernel: HTTP kernel providing the middleware stack
+            exception_handler: ExceptionHandler used to report and render errors
+            max_workers: Size of the thread pool for synchronous code
+            chunk_size: Size of file chunks
+            max_buffered_body: Largest form or JSON body read into request input
+        """
+        super().__init__(router, kernel, exception_handler, chunk_size, max_buffered_body)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="larapy-asgi"
+                    )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    async def run_sync(self, func: Callable, *args: Any) -> Any:
+        """
+        Run synchronous code off the event loop.
+
+        The call runs on the thread already serving the current request if
+        there is one, otherwise on the thread pool. Context variables are
+        propagated.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args)
+        worker = _current_worker.get()
+
+        if worker is not None:
+            return await worker.submit(loop, call)
+
+        return await loop.run_in_executor(self.executor, call)
+
+    def _await_from_thread(self, awaitable: Any, loop: asyncio.AbstractEventLoop) -> Any:
+        """Run an awaitable on the event loop from a worker thread and wait for it."""
+        worker = _current_worker.get() or _RequestWorker()
+        token = _current_worker.set(worker)
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(resolve(awaitable), loop)
+            return worker.wait(future)
+        finally:
+            _current_worker.reset(token)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """ASGI entry point."""
+        if scope["type"] == "http":
+            await self.handle(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        else:
+            raise RuntimeError(f"Unsupported ASGI scope type [{scope['type']}].")
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        """Handle the lifespan protocol."""
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def handle(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """
+        Handle one HTTP request.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        body = AsgiRequestBody(receive, asyncio.get_running_loop())
+        request: Optional[Request] = None
+
+        try:
+            request = await self.build_request(scope, body)
+            response = await self.dispatch(request)
+        except ClientDisconnect:
+            return
+        except Exception as e:
+            response = await self.run_sync(self.render_exception, request, e)
+
+        await self.send_response(scope, response, send, body, request)
+
+        if request is not None:
+            await self.run_sync(self.terminate, request, response)
+
+    async def build_request(self, scope: Dict[str, Any], body: AsgiRequestBody) -> Request:
+        """
+        Build a Request from the ASGI scope.
+
+        Form and JSON bodies up to max_buffered_body are read so they are
+        available as request input; any other body stays on the server and
+        is read through request.stream().
+        """
+        headers: Dict[str, str] = {}
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").lower()
+            value = raw_value.decode("latin-1")
+            if name in headers:
+                separator = "; " if name == "cookie" else ", "
+                headers[name] = f"{headers[name]}{separator}{value}"
+            else:
+                headers[name] = value
+
+        method = scope.get("method", "GET")
+        path = scope.get("path") or "/"
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        uri = f"{path}?{query_string}" if query_string else path
+
+        server = {
+            "REQUEST_METHOD": method,
+            "REQUEST_URI": uri,
+            "QUERY_STRING": query_string,
+            "SCRIPT_NAME": scope.get("root_path", ""),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "HTTP_SCHEME": scope.get("scheme", "http"),
+        }
+        if scope.get("server"):
+            server["SERVER_NAME"], server["SERVER_PORT"] = scope["server"][0], scope["server"][1]
+        if scope.get("client"):
+            server["REMOTE_ADDR"], server["REMOTE_PORT"] = scope["client"][0], scope["client"][1]
+        if "host" in headers:
+            server["HTTP_HOST"] = headers["host"]
+        elif scope.get("server"):
+            server["HTTP_HOST"] = f"{server['SERVER_NAME']}:{server['SERVER_PORT']}"
+
+        content: Optional[str] = None
+        post: Dict[str, Any] = {}
+        content_type = headers.get("content-type", "")
+
+        if is_buffered_content_type(content_type):
+            length = headers.get("content-length")
+            if length is not None and length.isdigit() and int(length) > self.max_buffered_body:
+                raise HttpException(413, "Payload Too Large")
+
+            content = (await body.read(self.max_buffered_body)).decode("utf-8", errors="replace")
+            if content_type.startswith("application/x-www-form-urlencoded"):
+                post = parse_query(content)
+
+        request = Request(
+            uri,
+            method,
+            server=server,
+            headers=headers,
+            query=parse_query(query_string),
+            post=post,
+            cookies=parse_cookies(headers.get("cookie", "")),
+            content=content,
+        )
+
+        if content is None:
+            request.setBodyStream(body)
+
+        return request
+
+    async def dispatch(self, request: Request) -> Response:
+        """
+        Run the request through its middleware and route.
+
+        Returns:
+            Normalized response
+        """
+        match = self.match(request)
+        result = await self._call_pipe(self.middleware(request), 0, request, match)
+        return self.prepare_response(result, request)
+
+    async def _call_pipe(self, pipes: List[Any], index: int, request: Any, match: Any) -> Any:
+        """Run the pipe at index on the event loop."""
+        while index < len(pipes) and _pipe_handler(pipes[index]) is None:
+            index += 1
+
+        if index == len(pipes):
+            return await self._call_route(request, match)
+
+        pipe = pipes[index]
+
+        if not _is_async_pipe(pipe):
+            loop = asyncio.get_running_loop()
+            return await self.run_sync(self._call_pipe_sync, pipes, index, request, match, loop)
+
+        def next_handler(passable: Any) -> Any:
+            return self._call_pipe(pipes, index + 1, passable, match)
+
+        return await resolve(_pipe_handler(pipe)(request, next_handler))
+
+    def _call_pipe_sync(
+        self,
+        pipes: List[Any],
+        index: int,
+        request: Any,
+        match: Any,
+        loop: asyncio.AbstractEventLoop,
+    ) -> Any:
+        """Run the pipe at index on a worker thread."""
+        while index < len(pipes) and _pipe_handler(pipes[index]) is None:
+            index += 1
+
+        if index == len(pipes):
+            result = self.run_route(request, match)
+            if inspect.isawaitable(result):
+                return self._await_from_thread(result, loop)
+            return result
+
+        pipe = pipes[index]
+
+        if _is_async_pipe(pipe):
+            return self._await_from_thread(self._call_pipe(pipes, index, request, match), loop)
+
+        def next_handler(passable: Any) -> Any:
+            return self._call_pipe_sync(pipes, index + 1, passable, match, loop)
+
+        return _pipe_handler(pipe)(request, next_handler)
+
+    async def _call_route(self, request: Any, match: Any) -> Any:
+        """Run the route action, on the event loop if it is a coroutine function."""
+        if match is not None and _is_coroutine_callable(match.getAction("uses")):
+            return await resolve(self.run_route(request, match))
+
+        return await resolve(await self.run_sync(self.run_route, request, match))
+
+    async def send_response(
+        self,
+        scope: Dict[str, Any],
+        response: Response,
+        send: Callable,
+        body: AsgiRequestBody,
+        request: Optional[Request] = None,
+    ) -> None:
+        """
+        Send a response to the server.
+
+        Args:
+            scope: ASGI connection scope
+            response: Response to send
+            send: ASGI send callable
+            body: Request body, watched for disconnects while streaming
+            request: Request the response answers
+        """
+        if isinstance(response, BinaryFileResponse):
+            await self.run_sync(response.prepare, request)
+
+        headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.response_headers(response)
+        ]
+        head_only = scope.get("method") == "HEAD"
+
+        if isinstance(response, BinaryFileResponse):
+            await self._send_file(scope, response, headers, send, head_only)
+        elif isinstance(response, StreamedResponse):
+            await self._send_stream(response, headers, send, body, head_only)
+        else:
+            content = self.body(response)
+            if not any(name == b"content-length" for name, _ in headers):
+                headers.append((b"content-length", str(len(content)).encode("latin-1")))
+
+            await send({"type": "http.response.start", "status": response.status(), "headers": headers})
+            await send({"type": "http.response.body", "body": b"" if head_only else content})
+
+    async def _send_file(
+        self,
+        scope: Dict[str, Any],
+        response: BinaryFileResponse,
+        headers: List[Tuple[bytes, bytes]],
+        send: Callable,
+        head_only: bool,
+    ) -> None:
+        """Send a file (or its requested range) in chunks, or hand it to the server via pathsend."""
+        await send({"type": "http.response.start", "status": response.status(), "headers": headers})
+
+        offset, length = response.getRange()
+
+        if head_only or not length:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if response.status() == 200 and "http.response.pathsend" in scope.get("extensions", {}):
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(response.getFile())})
+            return
+
+        handle = await self.run_sync(open, response.getFile(), "rb")
+
+        try:
+            await self.run_sync(handle.seek, offset)
+            while length > 0:
+                chunk = await self.run_sync(handle.read, min(self.chunk_size, length))
+                if not chunk:
+                    break
+                length -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            await self.run_sync(handle.close)
+
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send_stream(
+        self,
+        response: StreamedResponse,
+        headers: List[Tuple[bytes, bytes]],
+        send: Callable,
+        body: AsgiRequestBody,
+        head_only: bool,
+    ) -> None:
+        """Send a streamed response, stopping early if the client disconnects."""
+        await send({"type": "http.response.start", "status": response.status(), "headers": headers})
+
+        if head_only:
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        watcher: Optional[asyncio.Task] = None
+        if not body.started or body.complete:
+            watcher = asyncio.ensure_future(body.wait_for_disconnect())
+
+        chunks = self._stream_chunks(response)
+
+        try:
+            async for chunk in chunks:
+                if watcher is not None and watcher.done():
+                    break
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            await chunks.aclose()
+            if watcher is not None:
+                watcher.cancel()
+
+        if not body.disconnected:
+            await send({"type": "http.response.body", "body": b""})
+
+    async def _stream_chunks(self, response: StreamedResponse) -> AsyncIterator[bytes]:
+        """
+        Iterate a streamed response's callback.
+
+        Async generators are consumed on the event loop. Sync generators,
+        iterables and callables run on worker threads one chunk at a time.
+        """
+        source = response.getCallback()
+
+        if inspect.isasyncgenfunction(source) or inspect.iscoroutinefunction(source):
+            source = await resolve(source())
+        elif callable(source) and not inspect.isgenerator(source):
+            source = await self.run_sync(source)
+
+        if source is None:
+            return
+
+        if hasattr(source, "__aiter__"):
+            try:
+                async for chunk in source:
+                    yield encode_chunk(chunk)
+            finally:
+                aclose = getattr(source, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return
+
+        if isinstance(source, (str, bytes, bytearray, memoryview)):
+            yield encode_chunk(source)
+            return
+
+        iterator = iter(source)
+
+        try:
+            while True:
+                chunk = await self.run_sync(next, iterator, _END)
+                if chunk is _END:
+                    break
+                yield encode_chunk(chunk)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self.run_sync(close)
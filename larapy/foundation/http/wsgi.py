@@ -0,0 +1,349 @@
+"""
+WSGI Adapter
+
+Serves the application from a WSGI server (gunicorn, uWSGI, mod_wsgi).
+Request bodies are read from wsgi.input on demand, file responses are handed
+to the server's wsgi.file_wrapper so they can be sent with sendfile, and
+streamed bodies are iterated lazily.
+"""
+
+import asyncio
+import contextvars
+import inspect
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from larapy.foundation.http.adapter import (
+    HttpAdapter,
+    encode_chunk,
+    is_buffered_content_type,
+    parse_cookies,
+    parse_query,
+    resolve,
+    status_line,
+)
+from larapy.http.exceptions import HttpException
+from larapy.http.request import Request
+from larapy.http.response import BinaryFileResponse, Response, StreamedResponse
+
+
+def _run(value: Any) -> Any:
+    """Run an awaitable returned by an async route action to completion."""
+    if inspect.isawaitable(value):
+        return asyncio.run(resolve(value))
+    return value
+
+
+class WsgiRequestBody:
+    """
+    Request body read from wsgi.input in chunks as it is iterated.
+
+    Only CONTENT_LENGTH bytes are read, or everything up to EOF when the
+    server sets wsgi.input_terminated. The body can be iterated once.
+    """
+
+    def __init__(self, stream: Any, length: Optional[int], chunk_size: int) -> None:
+        """
+        Initialize the body.
+
+        Args:
+            stream: The wsgi.input stream
+            length: Number of bytes to read (None reads to EOF)
+            chunk_size: Size of each read
+        """
+        self._stream = stream
+        self._length = length
+        self._chunk_size = chunk_size
+        self.started = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.started:
+            raise RuntimeError("The request body has already been consumed.")
+        self.started = True
+
+        remaining = self._length
+
+        while remaining is None or remaining > 0:
+            size = self._chunk_size if remaining is None else min(self._chunk_size, remaining)
+            chunk = self._stream.read(size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+    def read(self, limit: Optional[int] = None) -> bytes:
+        """
+        Read the whole body.
+
+        Args:
+            limit: Maximum number of bytes to accept
+
+        Raises:
+            HttpException: 413 if the body exceeds the limit
+        """
+        chunks: List[bytes] = []
+        size = 0
+
+        for chunk in self:
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise HttpException(413, "Payload Too Large")
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+
+class _ClosingIterable:
+    """Response body that runs a callback when the server closes it."""
+
+    def __init__(self, iterable: Iterable[bytes], callback: Callable[[], None]) -> None:
+        self._iterable = iterable
+        self._callback = callback
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._iterable)
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._iterable, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._callback()
+
+
+class _ClosingFile:
+    """
+    File handle proxy for wsgi.file_wrapper that runs a callback on close.
+
+    Exposes fileno() so servers can still use sendfile.
+    """
+
+    def __init__(self, handle: Any, callback: Callable[[], None]) -> None:
+        self._handle = handle
+        self._callback = callback
+
+    def fileno(self) -> int:
+        return self._handle.fileno()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._handle.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._handle.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._handle.tell()
+
+    def close(self) -> None:
+        try:
+            self._handle.close()
+        finally:
+            self._callback()
+
+
+def _read_range(handle: Any, offset: int, length: int, chunk_size: int) -> Iterator[bytes]:
+    """Read a byte range of an open file in chunks."""
+    handle.seek(offset)
+
+    while length > 0:
+        chunk = handle.read(min(chunk_size, length))
+        if not chunk:
+            return
+        length -= len(chunk)
+        yield chunk
+
+
+def _stream_body(chunks: Iterator[Any]) -> Iterator[bytes]:
+    """Encode streamed chunks, closing the source when the server stops early."""
+    try:
+        for chunk in chunks:
+            yield encode_chunk(chunk)
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class WsgiApplication(HttpAdapter):
+    """
+    WSGI application serving the router.
+
+    Usage:
+        application = WsgiApplication.from_application(app)
+        # gunicorn module:application
+
+    Full-file BinaryFileResponses go through wsgi.file_wrapper; byte ranges
+    and StreamedResponse bodies are produced lazily, so files are never read
+    into memory whole. Coroutines returned by async route actions are run to
+    completion on a fresh event loop; async middleware need the ASGI adapter.
+    Terminable middleware run when the server closes the response body.
+    Each request is dispatched in a copy of the context, so context variables
+    it sets do not leak into later requests served by the same thread.
+    """
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        """WSGI entry point."""
+        request: Optional[Request] = None
+
+        try:
+            request = self.build_request(environ)
+            response = contextvars.copy_context().run(self.dispatch, request)
+        except Exception as e:
+            response = self.render_exception(request, e)
+
+        def terminate() -> None:
+            if request is not None:
+                self.terminate(request, response)
+
+        return self.send_response(environ, start_response, response, request, terminate)
+
+    def build_request(self, environ: Dict[str, Any]) -> Request:
+        """
+        Build a Request from the WSGI environ.
+
+        Form and JSON bodies up to max_buffered_body are read so they are
+        available as request input; any other body stays in wsgi.input and
+        is read through request.stream().
+        """
+        headers: Dict[str, str] = {}
+        for key, value in environ.items():
+            if key.startswith("HTTP_"):
+                headers[key[5:].replace("_", "-")] = value
+        if environ.get("CONTENT_TYPE"):
+            headers["Content-Type"] = environ["CONTENT_TYPE"]
+        if environ.get("CONTENT_LENGTH"):
+            headers["Content-Length"] = environ["CONTENT_LENGTH"]
+
+        path = environ.get("PATH_INFO", "").encode("latin-1").decode("utf-8", errors="replace")
+        path = path or "/"
+        query_string = environ.get("QUERY_STRING", "")
+        uri = f"{path}?{query_string}" if query_string else path
+
+        server = {key: value for key, value in environ.items() if not key.startswith("wsgi.")}
+        server["HTTP_SCHEME"] = environ.get("wsgi.url_scheme", "http")
+        server.setdefault("REQUEST_URI", uri)
+        if "HTTP_HOST" not in server and "SERVER_NAME" in server:
+            server["HTTP_HOST"] = f"{server['SERVER_NAME']}:{server.get('SERVER_PORT', '80')}"
+
+        length_header = environ.get("CONTENT_LENGTH", "")
+        if length_header.isdigit():
+            length: Optional[int] = int(length_header)
+        elif environ.get("wsgi.input_terminated"):
+            length = None
+        else:
+            length = 0
+
+        body = WsgiRequestBody(environ.get("wsgi.input"), length, self.chunk_size)
+        content: Optional[str] = None
+        post: Dict[str, Any] = {}
+        content_type = environ.get("CONTENT_TYPE", "")
+
+        if is_buffered_content_type(content_type):
+            if length is not None and length > self.max_buffered_body:
+                raise HttpException(413, "Payload Too Large")
+
+            content = body.read(self.max_buffered_body).decode("utf-8", errors="replace")
+            if content_type.startswith("application/x-www-form-urlencoded"):
+                post = parse_query(content)
+
+        request = Request(
+            uri,
+            environ.get("REQUEST_METHOD", "GET"),
+            server=server,
+            headers=headers,
+            query=parse_query(query_string),
+            post=post,
+            cookies=parse_cookies(environ.get("HTTP_COOKIE", "")),
+            content=content,
+        )
+
+        if content is None:
+            request.setBodyStream(body)
+
+        return request
+
+    def dispatch(self, request: Request) -> Response:
+        """
+        Run the request through its middleware and route.
+
+        Returns:
+            Normalized response
+        """
+        match = self.match(request)
+
+        def destination(passable: Any) -> Any:
+            return _run(self.run_route(passable, match))
+
+        if self.kernel is None:
+            result = destination(request)
+        else:
+            result = self.kernel.pipeline(request).then(request, destination)
+
+        return self.prepare_response(_run(result), request)
+
+    def send_response(
+        self,
+        environ: Dict[str, Any],
+        start_response: Callable,
+        response: Response,
+        request: Optional[Request],
+        callback: Callable[[], None],
+    ) -> Iterable[bytes]:
+        """
+        Start the response and return its body iterable.
+
+        Args:
+            environ: WSGI environ
+            start_response: WSGI start_response callable
+            response: Response to send
+            request: Request the response answers
+            callback: Called when the server closes the body
+
+        Returns:
+            Body iterable
+        """
+        head_only = environ.get("REQUEST_METHOD") == "HEAD"
+
+        if isinstance(response, BinaryFileResponse):
+            response.prepare(request)
+            start_response(status_line(response.status()), self.response_headers(response))
+            return self._file_body(environ, response, head_only, callback)
+
+        if isinstance(response, StreamedResponse):
+            start_response(status_line(response.status()), self.response_headers(response))
+            if head_only:
+                return _ClosingIterable([], callback)
+            return _ClosingIterable(_stream_body(response.chunks()), callback)
+
+        content = self.body(response)
+        headers = self.response_headers(response)
+        if not any(name.lower() == "content-length" for name, _ in headers):
+            headers.append(("Content-Length", str(len(content))))
+
+        start_response(status_line(response.status()), headers)
+        return _ClosingIterable([] if head_only else [content], callback)
+
+    def _file_body(
+        self,
+        environ: Dict[str, Any],
+        response: BinaryFileResponse,
+        head_only: bool,
+        callback: Callable[[], None],
+    ) -> Iterable[bytes]:
+        """Build the body of a file response without reading the file into memory."""
+        offset, length = response.getRange()
+
+        if head_only or not length:
+            return _ClosingIterable([], callback)
+
+        handle = open(response.getFile(), "rb")
+        file_wrapper = environ.get("wsgi.file_wrapper")
+
+        # wsgi.file_wrapper sends from the current position to EOF, so it is
+        # only used for whole files; ranges are read with bounded chunks
+        if file_wrapper is not None and response.status() == 200:
+            return file_wrapper(_ClosingFile(handle, callback), self.chunk_size)
+
+        closing = _ClosingFile(handle, callback)
+        return _ClosingIterable(_read_range(handle, offset, length, self.chunk_size), closing.close)
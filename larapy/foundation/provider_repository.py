@@ -0,0 +1,207 @@
+"""
+Provider Repository
+
+Loads the application's configured service providers. Eager providers are
+registered immediately; deferred providers are only recorded in a manifest
+cached on disk, so their modules are not imported until one of the services
+they provide is resolved from the container.
+"""
+
+import importlib
+import json
+import os
+from typing import Any, Dict, List, Type, Union
+
+from larapy.support.service_provider import ServiceProvider
+
+MANIFEST_VERSION = 1
+
+ProviderReference = Union[str, Type[ServiceProvider]]
+
+
+def provider_name(provider: ProviderReference) -> str:
+    """
+    Get the import name of a provider class.
+
+    Args:
+        provider: Provider class, or an import name ("package.module:Class"
+            or "package.module.Class")
+
+    Returns:
+        Import name in "package.module:Class" form
+    """
+    if isinstance(provider, str):
+        if ":" in provider:
+            return provider
+        module_name, _, qualname = provider.rpartition(".")
+        return f"{module_name}:{qualname}"
+
+    return f"{provider.__module__}:{provider.__qualname__}"
+
+
+def load_provider_class(name: str) -> Type[ServiceProvider]:
+    """
+    Import a provider class by its import name.
+
+    Args:
+        name: Import name in "package.module:Class" form
+
+    Returns:
+        The provider class
+    """
+    module_name, qualname = provider_name(name).split(":", 1)
+    value: Any = importlib.import_module(module_name)
+
+    for part in qualname.split("."):
+        value = getattr(value, part)
+
+    return value
+
+
+class ProviderRepository:
+    """
+    Registers configured providers using a cached manifest.
+
+    The manifest records which providers are eager, which services each
+    deferred provider supplies and the events that should load it. It is
+    compiled on the first boot and rebuilt whenever the configured provider
+    list changes.
+    """
+
+    def __init__(self, app: Any, manifest_path: str) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            app: The application
+            manifest_path: Path of the cached manifest file
+        """
+        self.app = app
+        self.manifest_path = manifest_path
+
+    def load(self, providers: List[ProviderReference]) -> None:
+        """
+        Register the application's service providers.
+
+        Args:
+            providers: Provider classes or import names, in registration order
+        """
+        classes = {provider_name(p): p for p in providers if not isinstance(p, str)}
+        names = [provider_name(provider) for provider in providers]
+
+        manifest = self.load_manifest()
+
+        if self.should_recompile(manifest, names):
+            manifest = self.compile_manifest(providers)
+
+        for name in manifest["eager"]:
+            self.app.register(classes.get(name) or load_provider_class(name))
+
+        self.app.add_deferred_services(manifest["deferred"])
+
+        for name, events in manifest["when"].items():
+            self.register_load_events(name, events)
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """
+        Read the cached manifest.
+
+        Returns:
+            The manifest, or an empty dict if it is missing or outdated
+        """
+        if not os.path.isfile(self.manifest_path):
+            return {}
+
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+
+        return manifest
+
+    def should_recompile(self, manifest: Dict[str, Any], names: List[str]) -> bool:
+        """
+        Determine if the manifest must be compiled again.
+
+        Args:
+            manifest: The cached manifest
+            names: Import names of the configured providers
+
+        Returns:
+            True if the manifest is missing or lists other providers
+        """
+        return not manifest or manifest.get("providers") != names
+
+    def compile_manifest(self, providers: List[ProviderReference]) -> Dict[str, Any]:
+        """
+        Build the manifest by instantiating every provider, and write it.
+
+        Args:
+            providers: Provider classes or import names
+
+        Returns:
+            The manifest
+        """
+        manifest: Dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "providers": [provider_name(provider) for provider in providers],
+            "eager": [],
+            "deferred": {},
+            "when": {},
+        }
+
+        for provider in providers:
+            name = provider_name(provider)
+            provider_class = load_provider_class(name) if isinstance(provider, str) else provider
+            instance = provider_class(self.app)
+
+            if not instance.is_deferred():
+                manifest["eager"].append(name)
+                continue
+
+            for service in instance.provides():
+                manifest["deferred"][self.app._get_abstract_key(service)] = name
+
+            events = list(instance.when())
+            if events:
+                manifest["when"][name] = events
+
+        self.write_manifest(manifest)
+
+        return manifest
+
+    def write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Write the manifest to disk.
+
+        Args:
+            manifest: The manifest to cache
+        """
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, separators=(",", ":"))
+        os.replace(temporary, self.manifest_path)
+
+    def register_load_events(self, name: str, events: List[str]) -> None:
+        """
+        Load a deferred provider when one of its events is dispatched.
+
+        Args:
+            name: Provider import name
+            events: Event names that load the provider
+        """
+        if not events or not self.app.bound("events"):
+            return
+
+        def load(*args: Any, **kwargs: Any) -> None:
+            self.app.register_deferred_provider(name)
+
+        self.app.make("events").listen(events, load)
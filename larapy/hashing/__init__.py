@@ -1,7 +1,14 @@
-from larapy.hashing.hasher import Hasher
-from larapy.hashing.exceptions import HashingException
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Hasher",
     "HashingException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.hashing.hasher": ["Hasher"],
+        "larapy.hashing.exceptions": ["HashingException"],
+    },
+)
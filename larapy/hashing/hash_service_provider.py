@@ -1,8 +1,10 @@
-from larapy.support.service_provider import ServiceProvider
+from typing import Any, List
+
+from larapy.support.service_provider import DeferrableProvider, ServiceProvider
 from larapy.hashing import Hasher
 
 
-class HashServiceProvider(ServiceProvider):
+class HashServiceProvider(ServiceProvider, DeferrableProvider):
     def register(self) -> None:
         self.app.singleton("hasher", self._create_hasher)
         self.app.singleton(Hasher, self._create_hasher)
@@ -37,3 +39,6 @@ class HashServiceProvider(ServiceProvider):
 
     def boot(self) -> None:
         pass
+
+    def provides(self) -> List[Any]:
+        return ["hasher", Hasher]
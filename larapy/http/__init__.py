@@ -4,20 +4,7 @@ HTTP Foundation
 HTTP request and response handling.
 """
 
-from .request import Request
-from .response import (
-    Response,
-    JsonResponse,
-    RedirectResponse,
-    StreamedResponse,
-    BinaryFileResponse,
-    ViewResponse,
-    response,
-    redirect,
-    back,
-)
-from .uploaded_file import UploadedFile
-from .kernel import Kernel
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Request",
@@ -33,3 +20,23 @@ __all__ = [
     "redirect",
     "back",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.request": ["Request"],
+        "larapy.http.response": [
+            "Response",
+            "JsonResponse",
+            "RedirectResponse",
+            "StreamedResponse",
+            "BinaryFileResponse",
+            "ViewResponse",
+            "response",
+            "redirect",
+            "back",
+        ],
+        "larapy.http.uploaded_file": ["UploadedFile"],
+        "larapy.http.kernel": ["Kernel"],
+    },
+)
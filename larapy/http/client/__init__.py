@@ -1,8 +1,4 @@
-from larapy.http.client.client import HttpClient
-from larapy.http.client.response import Response
-from larapy.http.client.pending_request import PendingRequest
-from larapy.http.client.http_facade import Http
-from larapy.http.client.exceptions import RequestException, ConnectionException, TimeoutException
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "HttpClient",
@@ -13,3 +9,18 @@ __all__ = [
     "ConnectionException",
     "TimeoutException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.client.client": ["HttpClient"],
+        "larapy.http.client.response": ["Response"],
+        "larapy.http.client.pending_request": ["PendingRequest"],
+        "larapy.http.client.http_facade": ["Http"],
+        "larapy.http.client.exceptions": [
+            "RequestException",
+            "ConnectionException",
+            "TimeoutException",
+        ],
+    },
+)
@@ -4,8 +4,7 @@ HTTP Controllers
 Controller base classes for handling HTTP requests.
 """
 
-from .controller import Controller, ResourceController, ApiResourceController
-from .dispatcher import ControllerDispatcher
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Controller",
@@ -13,3 +12,15 @@ __all__ = [
     "ApiResourceController",
     "ControllerDispatcher",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.controllers.controller": [
+            "Controller",
+            "ResourceController",
+            "ApiResourceController",
+        ],
+        "larapy.http.controllers.dispatcher": ["ControllerDispatcher"],
+    },
+)
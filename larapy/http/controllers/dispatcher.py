@@ -40,7 +40,7 @@ class ControllerDispatcher:
         Dispatch request to controller.
 
         Args:
-            route: Route instance
+            route: Route match (or Route)
             request: HTTP request
             controller: Controller class name or instance
             method: Method name (optional for single action)
@@ -156,7 +156,7 @@ class ControllerDispatcher:
         Args:
             controller: Controller instance
             method: Method name
-            route: Route instance
+            route: Route match (or Route)
             request: HTTP request
 
         Returns:
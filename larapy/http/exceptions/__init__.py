@@ -1,10 +1,4 @@
-from .http_exception import HttpException
-from .not_found_http_exception import NotFoundHttpException
-from .forbidden_http_exception import ForbiddenHttpException
-from .unauthorized_http_exception import UnauthorizedHttpException
-from .method_not_allowed_http_exception import MethodNotAllowedHttpException
-from .server_error_http_exception import ServerErrorHttpException
-from .service_unavailable_http_exception import ServiceUnavailableHttpException
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "HttpException",
@@ -15,3 +9,20 @@ __all__ = [
     "ServerErrorHttpException",
     "ServiceUnavailableHttpException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.exceptions.http_exception": ["HttpException"],
+        "larapy.http.exceptions.not_found_http_exception": ["NotFoundHttpException"],
+        "larapy.http.exceptions.forbidden_http_exception": ["ForbiddenHttpException"],
+        "larapy.http.exceptions.unauthorized_http_exception": ["UnauthorizedHttpException"],
+        "larapy.http.exceptions.method_not_allowed_http_exception": [
+            "MethodNotAllowedHttpException",
+        ],
+        "larapy.http.exceptions.server_error_http_exception": ["ServerErrorHttpException"],
+        "larapy.http.exceptions.service_unavailable_http_exception": [
+            "ServiceUnavailableHttpException",
+        ],
+    },
+)
@@ -1,5 +1,5 @@
-from typing import Any, Callable, List, Optional, Dict, Union
-from larapy.pipeline.pipeline import Pipeline
+from typing import Any, Callable, List, Optional, Dict, Tuple, Union
+from larapy.pipeline.pipeline import CompiledPipeline, Pipeline
 
 
 class MiddlewareWithParameters:
@@ -22,24 +22,68 @@ class Kernel:
         self._middleware_groups = {"web": [], "api": []}
         self._route_middleware = {}
         self._middleware_priority = []
+        self._pipelines: Dict[Tuple, CompiledPipeline] = {}
 
     def handle(self, request: Any, handler: Callable) -> Any:
-        pipeline = Pipeline(self._container)
+        return self.pipeline(request).then(request, handler)
 
-        return pipeline.send(request).through(self._gather_route_middleware(request)).then(handler)
+    def pipeline(self, request: Any) -> CompiledPipeline:
+        route_middleware = tuple(getattr(request, "_route_middleware", ()))
+
+        try:
+            pipeline = self._pipelines.get(route_middleware)
+        except TypeError:
+            return self._compile_pipeline(request)
+
+        if pipeline is None:
+            pipeline = self._compile_pipeline(request)
+            self._pipelines[route_middleware] = pipeline
+
+        return pipeline
+
+    def _compile_pipeline(self, request: Any) -> CompiledPipeline:
+        middleware = [self._resolve_middleware(m) for m in self._gather_route_middleware(request)]
+
+        return Pipeline(self._container).through(middleware).compile()
+
+    def _resolve_middleware(self, middleware: Any) -> Any:
+        if isinstance(middleware, MiddlewareWithParameters):
+            return MiddlewareWithParameters(
+                self._resolve_middleware(middleware.middleware), middleware.parameters
+            )
+
+        if isinstance(middleware, str) and self._container:
+            name, _, parameters = middleware.partition(":")
+            instance = self._container.make(name)
+            if parameters:
+                return MiddlewareWithParameters(
+                    instance, [p.strip() for p in parameters.split(",")]
+                )
+            return instance
+
+        if isinstance(middleware, type):
+            return self._container.make(middleware) if self._container else middleware()
+
+        return middleware
+
+    def _flush_pipelines(self) -> None:
+        self._pipelines = {}
 
     def append(self, middleware: Union[str, type]) -> "Kernel":
         if middleware not in self._middleware:
             self._middleware.append(middleware)
+            self._flush_pipelines()
         return self
 
     def prepend(self, middleware: Union[str, type]) -> "Kernel":
         if middleware not in self._middleware:
             self._middleware.insert(0, middleware)
+            self._flush_pipelines()
         return self
 
     def use(self, middleware: List[Union[str, type]]) -> "Kernel":
         self._middleware = middleware
+        self._flush_pipelines()
         return self
 
     def appendToGroup(self, group: str, middleware: List[Union[str, type]]) -> "Kernel":
@@ -49,6 +93,7 @@ class Kernel:
         for m in middleware:
             if m not in self._middleware_groups[group]:
                 self._middleware_groups[group].append(m)
+        self._flush_pipelines()
         return self
 
     def prependToGroup(self, group: str, middleware: List[Union[str, type]]) -> "Kernel":
@@ -58,23 +103,28 @@ class Kernel:
         for m in reversed(middleware):
             if m not in self._middleware_groups[group]:
                 self._middleware_groups[group].insert(0, m)
+        self._flush_pipelines()
         return self
 
     def group(self, name: str, middleware: List[Union[str, type]]) -> "Kernel":
         self._middleware_groups[name] = middleware
+        self._flush_pipelines()
         return self
 
     def alias(self, aliases: Dict[str, Union[str, type]]) -> "Kernel":
         for alias_name, middleware in aliases.items():
             self._route_middleware[alias_name] = middleware
+        self._flush_pipelines()
         return self
 
     def aliasMiddleware(self, name: str, middleware: Union[str, type]) -> "Kernel":
         self._route_middleware[name] = middleware
+        self._flush_pipelines()
         return self
 
     def priority(self, middleware: List[Union[str, type]]) -> "Kernel":
         self._middleware_priority = middleware
+        self._flush_pipelines()
         return self
 
     def hasMiddleware(self, middleware: Union[str, type]) -> bool:
@@ -140,21 +190,8 @@ class Kernel:
         return sorted(middleware, key=get_priority)
 
     def terminate(self, request: Any, response: Any) -> None:
-        middleware_to_terminate = []
-
-        middleware_list = self._gather_route_middleware(request)
-
-        for m in middleware_list:
-            if isinstance(m, str):
-                if self._container:
-                    instance = self._container.make(m.split(":")[0])
-                else:
-                    continue
-            else:
-                instance = m if callable(m) else (m() if isinstance(m, type) else m)
+        for m in self.pipeline(request).pipes:
+            instance = m.middleware if isinstance(m, MiddlewareWithParameters) else m
 
             if hasattr(instance, "terminate"):
-                middleware_to_terminate.append(instance)
-
-        for middleware_instance in middleware_to_terminate:
-            middleware_instance.terminate(request, response)
+                instance.terminate(request, response)
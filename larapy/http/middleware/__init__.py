@@ -1,11 +1,22 @@
-from larapy.http.middleware.middleware import Middleware
-from larapy.http.middleware.verify_csrf_token import VerifyCsrfToken
-from larapy.http.middleware.trim_strings import TrimStrings
-from larapy.http.middleware.convert_empty_strings_to_null import ConvertEmptyStringsToNull
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Middleware",
     "VerifyCsrfToken",
     "TrimStrings",
     "ConvertEmptyStringsToNull",
+    "UseIdentityMap",
+    "ForgetRecordsModification",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.middleware.middleware": ["Middleware"],
+        "larapy.http.middleware.verify_csrf_token": ["VerifyCsrfToken"],
+        "larapy.http.middleware.trim_strings": ["TrimStrings"],
+        "larapy.http.middleware.convert_empty_strings_to_null": ["ConvertEmptyStringsToNull"],
+        "larapy.http.middleware.use_identity_map": ["UseIdentityMap"],
+        "larapy.http.middleware.forget_records_modification": ["ForgetRecordsModification"],
+    },
+)
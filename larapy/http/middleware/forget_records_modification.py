@@ -0,0 +1,30 @@
+"""
+Forget Records Modification Middleware
+
+Sends reads back to the read replicas once a request has finished.
+"""
+
+from typing import Any, Callable
+
+from larapy.database.database_manager import DatabaseManager
+from larapy.http.middleware.middleware import Middleware
+
+
+class ForgetRecordsModification(Middleware):
+    """
+    Reset read stickiness when the request terminates.
+
+    After a write, reads in the same thread or task go to the primary. The
+    WSGI and ASGI adapters dispatch each request in a fresh context, which
+    resets that on its own; this middleware resets it for requests handled
+    without one, such as direct Kernel.handle() calls.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+
+    def handle(self, request: Any, next_handler: Callable) -> Any:
+        return next_handler(request)
+
+    def terminate(self, request: Any, response: Any) -> None:
+        self._db.forget_records_modification()
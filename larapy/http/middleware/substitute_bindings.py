@@ -9,6 +9,7 @@ from typing import Callable
 from larapy.http.request import Request
 from larapy.http.response import Response
 from larapy.routing.model_binder import ModelBinder, ModelNotFoundException
+from larapy.routing.route_match import RouteMatch
 
 
 class SubstituteBindings:
@@ -42,13 +43,18 @@ class SubstituteBindings:
         Raises:
             ModelNotFoundException: Converted to 404 response
         """
-        # Get route from request
-        route = getattr(request, "route", None)
+        # Prefer the immutable route match set by the router; fall back to a
+        # route object assigned to the request directly
+        match = request.getRouteMatch() if hasattr(request, "getRouteMatch") else None
+        route = match if match is not None else getattr(request, "route", None)
 
         if route:
             try:
                 # Perform model binding substitution
-                self._substituteBindings(request, route)
+                if match is not None:
+                    self._substituteMatchBindings(request, match)
+                else:
+                    self._substituteBindings(request, route)
             except ModelNotFoundException as e:
                 # Convert to 404 response
                 from larapy.http.response import JsonResponse
@@ -65,6 +71,26 @@ class SubstituteBindings:
         # Continue to next middleware
         return next_handler(request)
 
+    def _substituteMatchBindings(self, request: Request, match: RouteMatch):
+        """
+        Substitute the parameters of a route match with bound models.
+
+        The match is immutable, so a new match carrying the models is stored
+        on the request instead of modifying the shared route.
+
+        Args:
+            request: HTTP request
+            match: Route match resolved by the router
+        """
+        parameters = match.parameters()
+        self._resolveParameters(request, match, parameters)
+
+        request.setRouteMatch(match.withParameters(parameters))
+
+        route_parameters = request.route()
+        if isinstance(route_parameters, dict):
+            request.setRouteParameters({**route_parameters, **parameters})
+
     def _substituteBindings(self, request: Request, route):
         """
         Substitute route parameters with bound models.
@@ -85,6 +111,17 @@ class SubstituteBindings:
         else:
             parameters = {}
 
+        self._resolveParameters(request, route, parameters)
+
+    def _resolveParameters(self, request: Request, route, parameters: dict):
+        """
+        Replace bound parameter values with resolved models in place.
+
+        Args:
+            request: HTTP request
+            route: Route or route match providing binding configuration
+            parameters: Parameter values to substitute
+        """
         parameter_names = getattr(route, "parameter_names", [])
 
         # Get binding configuration from route
@@ -0,0 +1,25 @@
+"""
+Use Identity Map Middleware
+
+Gives each request its own ORM identity map.
+"""
+
+from typing import Any, Callable
+
+from larapy.database.orm.identity_map import unit_of_work
+from larapy.http.middleware.middleware import Middleware
+
+
+class UseIdentityMap(Middleware):
+    """
+    Run the rest of the request inside a unit of work.
+
+    A row loaded through find(), a belongs-to or morph-to relation or route
+    model binding becomes one model instance and one query for the whole
+    request. The map is flushed once the response has been built. Register
+    this middleware before SubstituteBindings so route model binding uses it.
+    """
+
+    def handle(self, request: Any, next_handler: Callable) -> Any:
+        with unit_of_work():
+            return next_handler(request)
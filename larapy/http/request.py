@@ -53,7 +53,9 @@ class Request:
         self._cookies = cookies or {}
         self._files = files or {}
         self._content = content
+        self._body_stream: Optional[Any] = None
         self._route_parameters: Dict[str, Any] = {}
+        self._route_match: Optional[Any] = None
         self._route_middleware: List[str] = []
         self._json: Optional[Dict[str, Any]] = None
         self._session: Optional[Dict[str, Any]] = None
@@ -501,11 +503,52 @@ class Request:
         """Get server variable."""
         return self._server.get(key, default)
 
+    def getContent(self) -> Optional[str]:
+        """Get the raw request body if it was buffered."""
+        return self._content
+
+    def setBodyStream(self, stream: Any) -> "Request":
+        """
+        Set the stream an unbuffered request body is read from.
+
+        Args:
+            stream: Iterable of byte chunks (server adapters also support async for)
+
+        Returns:
+            Self for method chaining
+        """
+        self._body_stream = stream
+        return self
+
+    def stream(self) -> Any:
+        """
+        Get the request body as an iterable of byte chunks.
+
+        Bodies that were buffered when the request was created are returned
+        as a single chunk.
+        """
+        if self._body_stream is not None:
+            return self._body_stream
+
+        if self._content:
+            return iter([self._content.encode("utf-8")])
+
+        return iter(())
+
     def setRouteParameters(self, parameters: Dict[str, Any]) -> "Request":
         """Set route parameters."""
         self._route_parameters = parameters
         return self
 
+    def setRouteMatch(self, match: Any) -> "Request":
+        """Set the route match resolved for this request."""
+        self._route_match = match
+        return self
+
+    def getRouteMatch(self) -> Any:
+        """Get the route match resolved for this request."""
+        return self._route_match
+
     def route(self, key: Optional[str] = None, default: Any = None) -> Any:
         """Get route parameter."""
         if key is None:
@@ -1,9 +1,4 @@
-from larapy.http.resources.resource import JsonResource
-from larapy.http.resources.resource_collection import ResourceCollection
-from larapy.http.resources.anonymous_resource import AnonymousResourceCollection
-from larapy.http.resources.conditional_attributes import ConditionalValue, MergeValue, MissingValue
-from larapy.http.resources.pagination import PaginatedResourceResponse
-from larapy.http.resources.resource_response import ResourceResponse
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "JsonResource",
@@ -15,3 +10,19 @@ __all__ = [
     "PaginatedResourceResponse",
     "ResourceResponse",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.http.resources.resource": ["JsonResource"],
+        "larapy.http.resources.resource_collection": ["ResourceCollection"],
+        "larapy.http.resources.anonymous_resource": ["AnonymousResourceCollection"],
+        "larapy.http.resources.conditional_attributes": [
+            "ConditionalValue",
+            "MergeValue",
+            "MissingValue",
+        ],
+        "larapy.http.resources.pagination": ["PaginatedResourceResponse"],
+        "larapy.http.resources.resource_response": ["ResourceResponse"],
+    },
+)
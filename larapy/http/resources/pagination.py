@@ -14,6 +14,14 @@ class PaginatedResourceResponse:
         }
 
     def _get_links(self) -> Dict[str, Optional[str]]:
+        if self._is_cursor_paginator():
+            return {
+                "first": None,
+                "last": None,
+                "prev": self.paginator.previous_page_url(),
+                "next": self.paginator.next_page_url(),
+            }
+
         return {
             "first": self.paginator.url(1) if hasattr(self.paginator, "url") else None,
             "last": (
@@ -34,6 +42,20 @@ class PaginatedResourceResponse:
     def _get_meta(self) -> Dict[str, Any]:
         meta = {}
 
+        if self._is_cursor_paginator():
+            next_cursor = self.paginator.next_cursor()
+            previous_cursor = self.paginator.previous_cursor()
+
+            return {
+                "path": self.paginator.path(),
+                "per_page": self.paginator.per_page(),
+                "next_cursor": next_cursor.encode() if next_cursor else None,
+                "prev_cursor": previous_cursor.encode() if previous_cursor else None,
+            }
+
+        if hasattr(self.paginator, "path"):
+            meta["path"] = self.paginator.path()
+
         if hasattr(self.paginator, "current_page"):
             meta["current_page"] = self.paginator.current_page()
 
@@ -53,3 +75,6 @@ class PaginatedResourceResponse:
             meta["total"] = self.paginator.total()
 
         return meta
+
+    def _is_cursor_paginator(self) -> bool:
+        return hasattr(self.paginator, "next_cursor")
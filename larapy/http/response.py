@@ -5,7 +5,10 @@ HTTP response handling with headers, cookies, and content.
 """
 
 import json
-from typing import Any, Callable, Dict, Generator, List, Optional, Union
+import mimetypes
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple, Union
 
 
 class Response:
@@ -233,6 +236,25 @@ class StreamedResponse(Response):
         """Get streaming callback."""
         return self._callback
 
+    def chunks(self) -> Iterator[Any]:
+        """
+        Iterate the streamed content lazily.
+
+        Generators and iterables are consumed as they are; a callable is
+        called and its return value iterated. Callables that write their
+        output instead of returning it produce no chunks.
+        """
+        source = self._callback
+
+        if callable(source) and not isinstance(source, Generator):
+            source = source()
+
+        if source is None:
+            return iter(())
+        if isinstance(source, (str, bytes)):
+            return iter([source])
+        return iter(source)
+
     def sendContent(self) -> None:
         """Send streamed content."""
         if isinstance(self._callback, Generator):
@@ -256,6 +278,8 @@ class BinaryFileResponse(Response):
         headers: Optional[Dict[str, str]] = None,
         disposition: str = "inline",
         filename: Optional[str] = None,
+        auto_etag: bool = True,
+        auto_last_modified: bool = True,
     ) -> None:
         """
         Initialize binary file response.
@@ -266,11 +290,17 @@ class BinaryFileResponse(Response):
             headers: HTTP headers
             disposition: Content disposition (inline or attachment)
             filename: Download filename
+            auto_etag: Set an ETag derived from the file's size and mtime
+            auto_last_modified: Set Last-Modified from the file's mtime
         """
         super().__init__("", status, headers)
         self._file_path = file_path
         self._disposition = disposition
         self._filename = filename or file_path.split("/")[-1]
+        self._auto_etag = auto_etag
+        self._auto_last_modified = auto_last_modified
+        self._offset = 0
+        self._max_length: Optional[int] = None
 
     def getFile(self) -> str:
         """Get file path."""
@@ -284,6 +314,133 @@ class BinaryFileResponse(Response):
         """Get filename."""
         return self._filename
 
+    def getRange(self) -> Tuple[int, Optional[int]]:
+        """
+        Get the part of the file to send.
+
+        Returns:
+            Offset and length (None until prepare() has run)
+        """
+        return self._offset, self._max_length
+
+    def prepare(self, request: Any = None) -> "BinaryFileResponse":
+        """
+        Fill in file headers and apply conditional and range requests.
+
+        Sets Content-Type, Content-Length, Content-Disposition, Accept-Ranges,
+        ETag and Last-Modified. If-None-Match / If-Modified-Since produce a
+        304, and a single-range Range header (subject to If-Range) produces a
+        206 or 416. Only the file's metadata is read.
+
+        Args:
+            request: Current request
+
+        Returns:
+            Self for method chaining
+        """
+        stat = os.stat(self._file_path)
+        size = stat.st_size
+        names = {name.lower() for name in self._headers}
+
+        if "content-type" not in names:
+            content_type, _ = mimetypes.guess_type(self._filename)
+            self._headers["Content-Type"] = content_type or "application/octet-stream"
+        if "content-disposition" not in names:
+            self._headers["Content-Disposition"] = f'{self._disposition}; filename="{self._filename}"'
+        if self._auto_last_modified:
+            self._headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+        if self._auto_etag:
+            self._headers["ETag"] = f'"{stat.st_mtime_ns // 1000:x}-{size:x}"'
+
+        self._headers["Accept-Ranges"] = "bytes"
+        self._offset, self._max_length = 0, size
+
+        if request is not None and self._status == 200 and request.method() in ("GET", "HEAD"):
+            if self._is_not_modified(request, int(stat.st_mtime)):
+                self._status = 304
+                self._max_length = 0
+                for name in ("Content-Type", "Content-Disposition"):
+                    self._headers.pop(name, None)
+                return self
+
+            range_header = request.header("Range")
+            if range_header and self._if_range_matches(request.header("If-Range"), int(stat.st_mtime)):
+                self._apply_range(range_header, size)
+
+        self._headers["Content-Length"] = str(self._max_length)
+        return self
+
+    def _etag(self) -> Optional[str]:
+        return self._headers.get("ETag")
+
+    def _is_not_modified(self, request: Any, mtime: int) -> bool:
+        """Evaluate If-None-Match, falling back to If-Modified-Since."""
+        if_none_match = request.header("If-None-Match")
+        etag = self._etag()
+
+        if if_none_match:
+            if etag is None:
+                return False
+            if if_none_match.strip() == "*":
+                return True
+            candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return etag.removeprefix("W/") in candidates
+
+        if_modified_since = request.header("If-Modified-Since")
+        if if_modified_since and self._auto_last_modified:
+            try:
+                return mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+
+        return False
+
+    def _if_range_matches(self, if_range: Optional[str], mtime: int) -> bool:
+        """Check an If-Range validator; a mismatch means the full file is sent."""
+        if not if_range:
+            return True
+
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            return not if_range.startswith("W/") and if_range == self._etag()
+
+        if not self._auto_last_modified:
+            return False
+        try:
+            return parsedate_to_datetime(if_range).timestamp() == mtime
+        except (TypeError, ValueError):
+            return False
+
+    def _apply_range(self, range_header: str, size: int) -> None:
+        """Apply a single byte range; multiple ranges are answered with the full file."""
+        unit, _, spec = range_header.partition("=")
+        if unit.strip().lower() != "bytes" or "," in spec:
+            return
+
+        first, separator, last = spec.strip().partition("-")
+        if not separator:
+            return
+
+        try:
+            if first == "":
+                start = max(size - int(last), 0)
+                end = size - 1
+            else:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+        except ValueError:
+            return
+
+        if start < 0 or start > end or start >= size:
+            self._status = 416
+            self._headers["Content-Range"] = f"bytes */{size}"
+            self._max_length = 0
+            return
+
+        self._status = 206
+        self._headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        self._offset = start
+        self._max_length = end - start + 1
+
 
 def response(
     content: Any = "", status: int = 200, headers: Optional[Dict[str, str]] = None
@@ -1,18 +1,4 @@
-from .log import Log
-from .log_manager import LogManager
-from .logger import Logger
-from .log_level import (
-    LogLevel,
-    LEVEL_DEBUG,
-    LEVEL_INFO,
-    LEVEL_NOTICE,
-    LEVEL_WARNING,
-    LEVEL_ERROR,
-    LEVEL_CRITICAL,
-    LEVEL_ALERT,
-    LEVEL_EMERGENCY,
-)
-from .log_record import LogRecord
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Log",
@@ -29,3 +15,24 @@ __all__ = [
     "LEVEL_ALERT",
     "LEVEL_EMERGENCY",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.logging.log": ["Log"],
+        "larapy.logging.log_manager": ["LogManager"],
+        "larapy.logging.logger": ["Logger"],
+        "larapy.logging.log_level": [
+            "LogLevel",
+            "LEVEL_DEBUG",
+            "LEVEL_INFO",
+            "LEVEL_NOTICE",
+            "LEVEL_WARNING",
+            "LEVEL_ERROR",
+            "LEVEL_CRITICAL",
+            "LEVEL_ALERT",
+            "LEVEL_EMERGENCY",
+        ],
+        "larapy.logging.log_record": ["LogRecord"],
+    },
+)
@@ -1,5 +1,12 @@
-from .formatter import Formatter
-from .line_formatter import LineFormatter
-from .json_formatter import JsonFormatter
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Formatter", "LineFormatter", "JsonFormatter"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.logging.formatters.formatter": ["Formatter"],
+        "larapy.logging.formatters.line_formatter": ["LineFormatter"],
+        "larapy.logging.formatters.json_formatter": ["JsonFormatter"],
+    },
+)
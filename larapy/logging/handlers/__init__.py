@@ -1,9 +1,4 @@
-from .handler import Handler
-from .file_handler import FileHandler
-from .stream_handler import StreamHandler
-from .null_handler import NullHandler
-from .daily_file_handler import DailyFileHandler
-from .stack_handler import StackHandler
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Handler",
@@ -13,3 +8,15 @@ __all__ = [
     "DailyFileHandler",
     "StackHandler",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.logging.handlers.handler": ["Handler"],
+        "larapy.logging.handlers.file_handler": ["FileHandler"],
+        "larapy.logging.handlers.stream_handler": ["StreamHandler"],
+        "larapy.logging.handlers.null_handler": ["NullHandler"],
+        "larapy.logging.handlers.daily_file_handler": ["DailyFileHandler"],
+        "larapy.logging.handlers.stack_handler": ["StackHandler"],
+    },
+)
@@ -1,8 +1,4 @@
-from .mail_manager import MailManager
-from .mailer import Mailer
-from .mailable import Mailable, Address
-from .message import Message
-from .transports import Transport, SmtpTransport
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "MailManager",
@@ -13,3 +9,14 @@ __all__ = [
     "Transport",
     "SmtpTransport",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.mail.mail_manager": ["MailManager"],
+        "larapy.mail.mailer": ["Mailer"],
+        "larapy.mail.mailable": ["Mailable", "Address"],
+        "larapy.mail.message": ["Message"],
+        "larapy.mail.transports": ["Transport", "SmtpTransport"],
+    },
+)
@@ -1,4 +1,11 @@
-from .transport import Transport
-from .smtp import SmtpTransport
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Transport", "SmtpTransport"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.mail.transports.transport": ["Transport"],
+        "larapy.mail.transports.smtp": ["SmtpTransport"],
+    },
+)
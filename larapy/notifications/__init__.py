@@ -1,10 +1,4 @@
-from larapy.notifications.notification import Notification
-from larapy.notifications.notifiable import Notifiable
-from larapy.notifications.anonymous_notifiable import AnonymousNotifiable
-from larapy.notifications.channel_manager import ChannelManager
-from larapy.notifications.notification_sender import NotificationSender
-from larapy.notifications.has_database_notifications import HasDatabaseNotifications
-from larapy.notifications.events import NotificationSending, NotificationSent, NotificationFailed
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Notification",
@@ -17,3 +11,20 @@ __all__ = [
     "NotificationSent",
     "NotificationFailed",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.notifications.notification": ["Notification"],
+        "larapy.notifications.notifiable": ["Notifiable"],
+        "larapy.notifications.anonymous_notifiable": ["AnonymousNotifiable"],
+        "larapy.notifications.channel_manager": ["ChannelManager"],
+        "larapy.notifications.notification_sender": ["NotificationSender"],
+        "larapy.notifications.has_database_notifications": ["HasDatabaseNotifications"],
+        "larapy.notifications.events": [
+            "NotificationSending",
+            "NotificationSent",
+            "NotificationFailed",
+        ],
+    },
+)
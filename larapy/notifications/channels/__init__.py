@@ -1,7 +1,14 @@
-from larapy.notifications.channels.channel import Channel
-from larapy.notifications.channels.mail_channel import MailChannel
-from larapy.notifications.channels.database_channel import DatabaseChannel
-from larapy.notifications.channels.slack_channel import SlackChannel
-from larapy.notifications.channels.broadcast_channel import BroadcastChannel
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Channel", "MailChannel", "DatabaseChannel", "SlackChannel", "BroadcastChannel"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.notifications.channels.channel": ["Channel"],
+        "larapy.notifications.channels.mail_channel": ["MailChannel"],
+        "larapy.notifications.channels.database_channel": ["DatabaseChannel"],
+        "larapy.notifications.channels.slack_channel": ["SlackChannel"],
+        "larapy.notifications.channels.broadcast_channel": ["BroadcastChannel"],
+    },
+)
@@ -1,4 +1,11 @@
-from larapy.notifications.messages.mail_message import MailMessage
-from larapy.notifications.messages.slack_message import SlackMessage, SlackAttachment
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["MailMessage", "SlackMessage", "SlackAttachment"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.notifications.messages.mail_message": ["MailMessage"],
+        "larapy.notifications.messages.slack_message": ["SlackMessage", "SlackAttachment"],
+    },
+)
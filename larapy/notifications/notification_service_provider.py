@@ -1,9 +1,9 @@
-from larapy.support import ServiceProvider
+from larapy.support import DeferrableProvider, ServiceProvider
 from larapy.notifications.channel_manager import ChannelManager
 from larapy.notifications.notification_sender import NotificationSender
 
 
-class NotificationServiceProvider(ServiceProvider):
+class NotificationServiceProvider(ServiceProvider, DeferrableProvider):
     def register(self):
         self.app.singleton("notification.channel", lambda c: ChannelManager(c))
 
@@ -16,3 +16,6 @@ class NotificationServiceProvider(ServiceProvider):
 
     def boot(self):
         pass
+
+    def provides(self):
+        return ["notification", "notification.channel"]
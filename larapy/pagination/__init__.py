@@ -0,0 +1,22 @@
+"""
+Larapy Pagination Module
+
+Provides paginators for simple (count-free) and cursor (keyset) pagination.
+"""
+
+from larapy.support.lazy_loader import lazy_exports
+
+__all__ = [
+    "Cursor",
+    "CursorPaginator",
+    "Paginator",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.pagination.cursor": ["Cursor"],
+        "larapy.pagination.cursor_paginator": ["CursorPaginator"],
+        "larapy.pagination.paginator": ["Paginator"],
+    },
+)
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional
+
+
+class Cursor:
+    """
+    Position in a keyset-paginated result: the ordered column values of the
+    row at the edge of a page and the direction to read from it.
+    """
+
+    def __init__(self, parameters: Dict[str, Any], points_to_next_items: bool = True):
+        self._parameters = parameters
+        self._points_to_next_items = points_to_next_items
+
+    def parameter(self, name: str) -> Any:
+        if name not in self._parameters:
+            raise KeyError(f"Unable to find parameter [{name}] in pagination cursor.")
+
+        return self._parameters[name]
+
+    def parameters(self) -> Dict[str, Any]:
+        return dict(self._parameters)
+
+    def points_to_next_items(self) -> bool:
+        return self._points_to_next_items
+
+    def points_to_previous_items(self) -> bool:
+        return not self._points_to_next_items
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque, URL-safe string."""
+        payload = {**self._parameters, "_pointsToNextItems": self._points_to_next_items}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, default=str).encode())
+        return encoded.decode().rstrip("=")
+
+    @classmethod
+    def from_encoded(cls, encoded: Optional[str]) -> Optional["Cursor"]:
+        """Decode a cursor produced by encode(), or None if it is missing or malformed."""
+        if not encoded:
+            return None
+
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            return None
+
+        if not isinstance(payload, dict) or "_pointsToNextItems" not in payload:
+            return None
+
+        points_to_next_items = bool(payload.pop("_pointsToNextItems"))
+        return cls(payload, points_to_next_items)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Cursor) and self.encode() == other.encode()
+
+    def __str__(self) -> str:
+        return self.encode()
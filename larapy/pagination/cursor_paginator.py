@@ -0,0 +1,99 @@
+from typing import Any, Dict, List, Optional
+
+from larapy.pagination.cursor import Cursor
+
+
+class CursorPaginator:
+    """
+    Keyset paginator whose pages are addressed by an encoded cursor instead
+    of a page number, so neither an offset scan nor a count is needed.
+    """
+
+    def __init__(
+        self,
+        items: Any,
+        per_page: int,
+        columns: List[str],
+        cursor: Optional[Cursor] = None,
+        has_more: bool = False,
+        path: str = "/",
+        cursor_name: str = "cursor",
+    ):
+        self._items = items
+        self._per_page = per_page
+        self._columns = columns
+        self._cursor = cursor
+        self._has_more = has_more
+        self._path = path
+        self._cursor_name = cursor_name
+
+    def items(self) -> List[Any]:
+        return list(self._items)
+
+    def per_page(self) -> int:
+        return self._per_page
+
+    def cursor(self) -> Optional[Cursor]:
+        return self._cursor
+
+    def has_more_pages(self) -> bool:
+        """Determine if there are more items in the direction the cursor reads."""
+        return self._has_more
+
+    def next_cursor(self) -> Optional[Cursor]:
+        if not self._items:
+            return None
+
+        if (self._cursor is None or self._cursor.points_to_next_items()) and not self._has_more:
+            return None
+
+        return self._cursor_for(self.items()[-1], True)
+
+    def previous_cursor(self) -> Optional[Cursor]:
+        if not self._items or self._cursor is None:
+            return None
+
+        if self._cursor.points_to_previous_items() and not self._has_more:
+            return None
+
+        return self._cursor_for(self.items()[0], False)
+
+    def _cursor_for(self, item: Any, points_to_next_items: bool) -> Cursor:
+        parameters = {}
+        for column in self._columns:
+            # Rows and models hold "users.id" under "id"
+            name = column.rsplit(".", 1)[-1]
+            parameters[column] = item[name] if isinstance(item, dict) else item.get_attribute(name)
+        return Cursor(parameters, points_to_next_items)
+
+    def path(self) -> str:
+        return self._path
+
+    def url(self, cursor: Optional[Cursor]) -> str:
+        if cursor is None:
+            return self._path
+
+        separator = "&" if "?" in self._path else "?"
+        return f"{self._path}{separator}{self._cursor_name}={cursor.encode()}"
+
+    def previous_page_url(self) -> Optional[str]:
+        cursor = self.previous_cursor()
+        return self.url(cursor) if cursor else None
+
+    def next_page_url(self) -> Optional[str]:
+        cursor = self.next_cursor()
+        return self.url(cursor) if cursor else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        next_cursor = self.next_cursor()
+        previous_cursor = self.previous_cursor()
+
+        return {
+            "data": self._items,
+            "path": self._path,
+            "per_page": self._per_page,
+            "next_cursor": next_cursor.encode() if next_cursor else None,
+            "next_page_url": self.url(next_cursor) if next_cursor else None,
+            "prev_cursor": previous_cursor.encode() if previous_cursor else None,
+            "prev_page_url": self.url(previous_cursor) if previous_cursor else None,
+        }
@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, Optional
+
+
+class Paginator:
+    """
+    Offset paginator that knows whether another page exists without counting
+    the total number of rows.
+    """
+
+    def __init__(
+        self,
+        items: Any,
+        per_page: int,
+        current_page: int = 1,
+        has_more: bool = False,
+        path: str = "/",
+        page_name: str = "page",
+    ):
+        self._items = items
+        self._per_page = per_page
+        self._current_page = current_page
+        self._has_more = has_more
+        self._path = path
+        self._page_name = page_name
+
+    def items(self) -> List[Any]:
+        return list(self._items)
+
+    def per_page(self) -> int:
+        return self._per_page
+
+    def current_page(self) -> int:
+        return self._current_page
+
+    def has_more_pages(self) -> bool:
+        return self._has_more
+
+    def on_first_page(self) -> bool:
+        return self._current_page <= 1
+
+    def first_item(self) -> Optional[int]:
+        if not self._items:
+            return None
+        return (self._current_page - 1) * self._per_page + 1
+
+    def last_item(self) -> Optional[int]:
+        if not self._items:
+            return None
+        return self.first_item() + len(self._items) - 1
+
+    def path(self) -> str:
+        return self._path
+
+    def url(self, page: int) -> str:
+        separator = "&" if "?" in self._path else "?"
+        return f"{self._path}{separator}{self._page_name}={max(page, 1)}"
+
+    def previous_page_url(self) -> Optional[str]:
+        if self.on_first_page():
+            return None
+        return self.url(self._current_page - 1)
+
+    def next_page_url(self) -> Optional[str]:
+        if not self._has_more:
+            return None
+        return self.url(self._current_page + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "data": self._items,
+            "per_page": self._per_page,
+            "current_page": self._current_page,
+            "from": self.first_item(),
+            "to": self.last_item(),
+            "path": self._path,
+            "prev_page_url": self.previous_page_url(),
+            "next_page_url": self.next_page_url(),
+        }
@@ -1,3 +1,10 @@
-from .pipeline import Pipeline
+from larapy.support.lazy_loader import lazy_exports
 
-__all__ = ["Pipeline"]
+__all__ = ["Pipeline", "CompiledPipeline"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.pipeline.pipeline": ["CompiledPipeline", "Pipeline"],
+    },
+)
@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from typing import Any, Callable, List, Union, Optional
 
 
@@ -52,6 +53,30 @@ class Pipeline:
     def thenReturn(self) -> Any:
         return self.then(lambda passable: passable)
 
+    def compile(self) -> "CompiledPipeline":
+        """Resolve the pipes once and build a chain that can be run repeatedly."""
+        return CompiledPipeline(
+            [self._resolve_pipe(pipe) for pipe in self._pipes],
+            self._method,
+            self._exception_handler,
+        )
+
+    def _resolve_pipe(self, pipe: Any) -> Any:
+        if isinstance(pipe, str):
+            name, parameters = self._parse_pipe_string(pipe)
+            instance = self._container.make(name) if self._container else None
+            if instance is None:
+                return None
+            if parameters:
+                handle = getattr(instance, self._method)
+                return lambda passable, destination: handle(passable, destination, *parameters)
+            return instance
+
+        if isinstance(pipe, type):
+            return self._container.make(pipe) if self._container else pipe()
+
+        return pipe
+
     def _build_pipeline(self, destination: Callable) -> Callable:
         pipeline = destination
 
@@ -93,3 +118,69 @@ class Pipeline:
             parameters = [p.strip() for p in parameters.split(",")]
             return name, parameters
         return pipe, []
+
+
+class CompiledPipeline:
+    """
+    A pipeline whose slices are built once; the destination is read from a
+    context variable so the same chain can serve concurrent requests.
+    """
+
+    def __init__(
+        self,
+        pipes: List[Any],
+        method: str = "handle",
+        exception_handler: Optional[Callable] = None,
+    ):
+        self.pipes = pipes
+        self._method = method
+        self._exception_handler = exception_handler
+        self._destination: ContextVar[Callable] = ContextVar("pipeline_destination")
+
+        pipeline = self._call_destination
+        for pipe in reversed(pipes):
+            pipeline = self._create_slice(pipeline, pipe)
+        self._pipeline = pipeline
+
+    def then(self, passable: Any, destination: Callable) -> Any:
+        token = self._destination.set(destination)
+
+        try:
+            return self._pipeline(passable)
+        except PipelineException as e:
+            return e.result
+        except Exception as e:
+            if self._exception_handler:
+                return self._exception_handler(passable, e)
+            raise
+        finally:
+            self._destination.reset(token)
+
+    def _call_destination(self, passable: Any) -> Any:
+        return self._destination.get()(passable)
+
+    def _create_slice(self, destination: Callable, pipe: Any) -> Callable:
+        if pipe is None:
+            return destination
+
+        if callable(pipe):
+            handle = pipe
+        elif hasattr(pipe, self._method):
+            handle = getattr(pipe, self._method)
+        else:
+            return destination
+
+        if self._exception_handler is None:
+            return lambda passable: handle(passable, destination)
+
+        exception_handler = self._exception_handler
+
+        def slice_handler(passable: Any) -> Any:
+            try:
+                return handle(passable, destination)
+            except PipelineException:
+                raise
+            except Exception as e:
+                raise PipelineException(exception_handler(passable, e))
+
+        return slice_handler
@@ -1,14 +1,4 @@
-from larapy.queue.job import Job, ShouldQueue
-from larapy.queue.dispatcher import dispatch, dispatch_sync, set_queue_manager
-from larapy.queue.queue_interface import QueueInterface
-from larapy.queue.sync_queue import SyncQueue
-from larapy.queue.database_queue import DatabaseQueue
-from larapy.queue.redis_queue import RedisQueue
-from larapy.queue.queue_manager import QueueManager
-from larapy.queue.worker import Worker
-from larapy.queue.batch import Batch, PendingBatch, Bus, DatabaseBatchRepository
-from larapy.queue.chain import Chain, chain
-from larapy.queue.failed.database_failed_job_provider import DatabaseFailedJobProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Job",
@@ -30,3 +20,20 @@ __all__ = [
     "chain",
     "DatabaseFailedJobProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.queue.job": ["Job", "ShouldQueue"],
+        "larapy.queue.dispatcher": ["dispatch", "dispatch_sync", "set_queue_manager"],
+        "larapy.queue.queue_interface": ["QueueInterface"],
+        "larapy.queue.sync_queue": ["SyncQueue"],
+        "larapy.queue.database_queue": ["DatabaseQueue"],
+        "larapy.queue.redis_queue": ["RedisQueue"],
+        "larapy.queue.queue_manager": ["QueueManager"],
+        "larapy.queue.worker": ["Worker"],
+        "larapy.queue.batch": ["Batch", "PendingBatch", "Bus", "DatabaseBatchRepository"],
+        "larapy.queue.chain": ["Chain", "chain"],
+        "larapy.queue.failed.database_failed_job_provider": ["DatabaseFailedJobProvider"],
+    },
+)
@@ -1,3 +1,10 @@
-from larapy.queue.failed.database_failed_job_provider import DatabaseFailedJobProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["DatabaseFailedJobProvider"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.queue.failed.database_failed_job_provider": ["DatabaseFailedJobProvider"],
+    },
+)
@@ -1,4 +1,11 @@
-from larapy.queue.jobs.database_job import DatabaseJob
-from larapy.queue.jobs.redis_job import RedisJob
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["DatabaseJob", "RedisJob"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.queue.jobs.database_job": ["DatabaseJob"],
+        "larapy.queue.jobs.redis_job": ["RedisJob"],
+    },
+)
@@ -95,16 +95,30 @@ class Worker:
             return None
 
     def process(self, job, connection: str, options: Dict[str, Any]):
-        try:
-            self.raise_before_job_event(connection, job)
-
-            self.mark_job_as_started(job)
-
-            self.run_job(job, connection, options)
-
-            self.raise_after_job_event(connection, job)
-        except Exception as e:
-            self.handle_job_exception(job, connection, e, options)
+        from larapy.database.orm.identity_map import unit_of_work
+
+        # A long-running worker must not serve models loaded by earlier jobs,
+        # so the identity map is off unless the "identity_map" option gives
+        # each job its own
+        with unit_of_work(enabled=options.get("identity_map", False)):
+            try:
+                self.raise_before_job_event(connection, job)
+
+                self.mark_job_as_started(job)
+
+                self.run_job(job, connection, options)
+
+                self.raise_after_job_event(connection, job)
+            except Exception as e:
+                self.handle_job_exception(job, connection, e, options)
+            finally:
+                self.forget_records_modification()
+
+    def forget_records_modification(self):
+        # Jobs share the worker's context, so a write must not keep the
+        # next job's reads on the primary
+        if self.container and self.container.bound("db"):
+            self.container.make("db").forget_records_modification()
 
     def run_job(self, job, connection: str, options: Dict[str, Any]):
         try:
@@ -1,4 +1,11 @@
-from larapy.cache.rate_limiter import RateLimiter, Limit
-from larapy.ratelimiting.rate_limit import RateLimit
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["RateLimiter", "Limit", "RateLimit"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.cache.rate_limiter": ["RateLimiter", "Limit"],
+        "larapy.ratelimiting.rate_limit": ["RateLimit"],
+    },
+)
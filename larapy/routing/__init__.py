@@ -1,6 +1,14 @@
-from larapy.routing.route import Route
-from larapy.routing.router import Router
-from larapy.routing.route_collection import RouteCollection
-from larapy.routing.controller import Controller
+from larapy.support.lazy_loader import lazy_exports
 
-__all__ = ["Route", "Router", "RouteCollection", "Controller"]
+__all__ = ["Route", "Router", "RouteCollection", "RouteMatch", "Controller"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.routing.route": ["Route"],
+        "larapy.routing.router": ["Router"],
+        "larapy.routing.route_collection": ["RouteCollection"],
+        "larapy.routing.route_match": ["RouteMatch"],
+        "larapy.routing.controller": ["Controller"],
+    },
+)
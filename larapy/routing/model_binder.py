@@ -6,6 +6,7 @@ Integrates with the router to automatically resolve models from route parameters
 """
 
 from typing import Any, Callable, Dict, Optional, Type
+from larapy.database.orm.identity_map import current_identity_map
 from larapy.database.orm.model import Model
 from larapy.container.container import Container
 
@@ -142,6 +143,18 @@ class ModelBinder:
         # Create model instance to access methods
         instance = model_class()
 
+        # A model already loaded in this unit of work is bound by primary key
+        # without a query, unless the model customises its route binding
+        identity_map = current_identity_map()
+        if (
+            identity_map is not None
+            and getattr(model_class, "resolveRouteBinding", None) is Model.resolveRouteBinding
+            and (field or instance.getRouteKeyName()) == instance.get_key_name()
+        ):
+            mapped = identity_map.get(instance.get_connection(), instance.get_table(), value)
+            if mapped is not None:
+                return mapped
+
         # Use custom resolution if model supports it
         if hasattr(instance, "resolveRouteBinding"):
             result = instance.resolveRouteBinding(value, field)
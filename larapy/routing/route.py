@@ -5,7 +5,16 @@ Represents an individual route with URI pattern, HTTP methods, and action.
 """
 
 import re
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from larapy.routing.route_match import RouteMatch
+
+# Match {param} or {param?} or {param:field} or {param:field?}
+PARAMETER_PATTERN = r"\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-zA-Z_][a-zA-Z0-9_]*))?\??}"
+
+# Characters that give a static URI segment regex meaning in the compiled pattern
+REGEX_METACHARACTERS = frozenset(".^$*+?()[]{}|\\")
 
 
 class Route:
@@ -37,7 +46,9 @@ class Route:
         self._parameters: Dict[str, Any] = {}
         self._parameter_names: List[str] = []
         self._where: Dict[str, str] = {}
+        self._pattern: str = ""
         self._compiled_pattern: Optional[re.Pattern] = None
+        self._segments: Optional[List[Tuple[str, ...]]] = None
         self._name: Optional[str] = None
         self._name_prefix: Optional[str] = None
         self._middleware: List[str] = []
@@ -60,19 +71,22 @@ class Route:
     def _compile(self) -> None:
         """Compile the route URI pattern to a regex."""
         uri = self._uri.strip("/")
+        self._parameter_names = []
+
+        if hasattr(self, "_collection"):
+            self._collection.invalidateMatchers()
 
         if not uri:
-            self._compiled_pattern = re.compile("^/$")
+            self._pattern = "^/$"
+            self._compiled_pattern = re.compile(self._pattern)
+            self._segments = [("static", "")]
             return
 
         pattern = uri
-        # Match {param} or {param?} or {param:field} or {param:field?}
-        param_pattern = r"\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-zA-Z_][a-zA-Z0-9_]*))?\??}"
-
         segments = []
         last_end = 0
 
-        for match in re.finditer(param_pattern, uri):
+        for match in re.finditer(PARAMETER_PATTERN, uri):
             param_name = match.group(1)
             binding_field = match.group(2)  # Will be None if no :field specified
             is_optional = match.group(0).endswith("?}")
@@ -106,13 +120,66 @@ class Route:
         segments.append(uri[last_end:])
         pattern = "".join(segments)
 
-        pattern = f"^/{pattern}$"
-        self._compiled_pattern = re.compile(pattern)
+        self._pattern = f"^/{pattern}$"
+        self._compiled_pattern = re.compile(self._pattern)
+        self._segments = self._compile_segments(uri)
+
+    def getCompiledPattern(self) -> Optional[re.Pattern]:
+        """
+        Get the compiled route regex.
+
+        Routes hydrated from the route cache compile their regex on first use.
+
+        Returns:
+            Compiled pattern or None
+        """
+        if self._compiled_pattern is None and self._pattern:
+            self._compiled_pattern = re.compile(self._pattern)
+
+        return self._compiled_pattern
+
+    def _compile_segments(self, uri: str) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Split the URI into the segment list used by the compiled route matcher.
+
+        Each entry is ("static", text) or ("param", name, constraint, optional).
+        Returns None when the URI cannot be expressed one segment at a time
+        (parameters mixed with static text, regex characters in static text,
+        or a leading optional parameter), in which case only the regex applies.
+
+        Args:
+            uri: Route URI without leading and trailing slashes
+
+        Returns:
+            Segment list or None
+        """
+        compiled: List[Tuple[str, ...]] = []
+
+        for index, segment in enumerate(uri.split("/")):
+            match = re.fullmatch(PARAMETER_PATTERN, segment)
+
+            if match:
+                name = match.group(1)
+                optional = segment.endswith("?}")
+
+                if optional and index == 0:
+                    return None
+
+                compiled.append(("param", name, self._where.get(name, "[^/]+"), optional))
+            elif not segment or REGEX_METACHARACTERS.intersection(segment):
+                return None
+            else:
+                compiled.append(("static", segment))
+
+        return compiled
 
     def matches(self, uri: str, method: str) -> bool:
         """
         Check if route matches the given URI and method.
 
+        The captured parameters are stored on the route; prefer match() when
+        the route is shared between concurrent requests.
+
         Args:
             uri: Request URI
             method: HTTP method
@@ -126,16 +193,47 @@ class Route:
         uri = uri.strip("/") if uri != "/" else "/"
         uri = "/" + uri if uri and not uri.startswith("/") else uri
 
-        if self._compiled_pattern is None:
+        pattern = self.getCompiledPattern()
+        if pattern is None:
             return False
 
-        match = self._compiled_pattern.match(uri)
+        match = pattern.match(uri)
         if match:
             self._parameters = {k: v for k, v in match.groupdict().items() if v is not None}
             return True
 
         return False
 
+    def match(self, uri: str, method: str) -> Optional["RouteMatch"]:
+        """
+        Match the route against a URI without storing the parameters.
+
+        Unlike matches(), the route itself is left untouched, so this is
+        safe to call from concurrent requests.
+
+        Args:
+            uri: Request URI
+            method: HTTP method
+
+        Returns:
+            Route match or None
+        """
+        pattern = self.getCompiledPattern()
+        if method.upper() not in self._methods or pattern is None:
+            return None
+
+        uri = uri.strip("/") if uri != "/" else "/"
+        uri = "/" + uri if uri and not uri.startswith("/") else uri
+
+        match = pattern.match(uri)
+        if match is None:
+            return None
+
+        from larapy.routing.route_match import RouteMatch
+
+        parameters = {k: v for k, v in match.groupdict().items() if v is not None}
+        return RouteMatch(self, parameters, self._name)
+
     def bind(self, container: Any) -> "Route":
         """
         Bind route to container for dependency injection.
@@ -149,21 +247,28 @@ class Route:
         self._action["container"] = container
         return self
 
-    def run(self) -> Any:
+    def run(self, parameters: Optional[Dict[str, Any]] = None) -> Any:
         """
         Execute the route action.
 
+        Args:
+            parameters: Parameters to call the action with (defaults to the
+                parameters captured by the last matches() call)
+
         Returns:
             Action result
         """
         action = self._action.get("uses")
 
+        if parameters is None:
+            parameters = self._parameters
+
         if callable(action):
             container = self._action.get("container")
             if container:
-                return container.call(action, self._parameters)
+                return container.call(action, parameters)
             else:
-                return action(**self._parameters)
+                return action(**parameters)
 
         return None
 
@@ -0,0 +1,282 @@
+"""
+Route Cache
+
+Serializes the fully resolved route table to a single file so a process can
+hydrate its router without executing route files or re-parsing route URIs.
+"""
+
+import importlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from larapy.routing.route import Route
+
+CACHE_VERSION = 1
+
+
+class RouteCacheException(Exception):
+    """Exception raised when routes cannot be cached or loaded from cache."""
+
+    pass
+
+
+def _reference(value: Any, route: Optional[Route] = None) -> Dict[str, str]:
+    """
+    Build an import reference for a module-level class or function.
+
+    Raises:
+        RouteCacheException: If the value cannot be imported by name
+    """
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+
+    if not module or not qualname or "<" in qualname:
+        if route is not None:
+            raise RouteCacheException(
+                f"Unable to prepare route [{route.getUri()}] for serialization. Uses Closure."
+            )
+        raise RouteCacheException(
+            f"Unable to prepare [{value!r}] for serialization. Uses Closure."
+        )
+
+    return {"__ref__": f"{module}:{qualname}"}
+
+
+def _resolve_reference(reference: str) -> Any:
+    """Import the object an import reference points to."""
+    module_name, qualname = reference.split(":", 1)
+    value: Any = importlib.import_module(module_name)
+
+    for part in qualname.split("."):
+        value = getattr(value, part)
+
+    return value
+
+
+def _dump_value(value: Any, route: Optional[Route] = None) -> Any:
+    """Convert a route attribute value into JSON-compatible data."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_dump_value(item, route) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _dump_value(item, route) for key, item in value.items()}
+    return _reference(value, route)
+
+
+def _load_value(value: Any) -> Any:
+    """Reverse _dump_value()."""
+    if isinstance(value, list):
+        return [_load_value(item) for item in value]
+    if isinstance(value, dict):
+        if set(value) == {"__ref__"}:
+            return _resolve_reference(value["__ref__"])
+        return {key: _load_value(item) for key, item in value.items()}
+    return value
+
+
+class RouteCache:
+    """
+    Reads and writes the compiled route table.
+
+    The cache stores each route's methods, URI, action, name, middleware,
+    where-constraints and bindings together with its compiled regex source
+    and segment list, plus the router's global patterns, middleware aliases
+    and model bindings. Closures cannot be cached.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the route cache.
+
+        Args:
+            path: Path of the cache file
+        """
+        self.path = path
+
+    def exists(self) -> bool:
+        """Check if the cache file exists."""
+        return os.path.isfile(self.path)
+
+    def clear(self) -> bool:
+        """
+        Delete the cache file.
+
+        Returns:
+            True if a cache file was removed
+        """
+        if self.exists():
+            os.remove(self.path)
+            return True
+        return False
+
+    def compile(self, router: Any) -> Dict[str, Any]:
+        """
+        Compile the router's route table into serializable data.
+
+        Args:
+            router: Router to compile
+
+        Returns:
+            Cache payload
+
+        Raises:
+            RouteCacheException: If a route uses a closure
+        """
+        routes = [self._compile_route(route) for route in router.getRoutes()]
+
+        return {
+            "version": CACHE_VERSION,
+            "routes": routes,
+            "patterns": dict(router._patterns),
+            "middleware": _dump_value(router._middleware),
+            "middleware_groups": _dump_value(router._middleware_groups),
+            "bindings": self._compile_bindings(router),
+        }
+
+    def write(self, router: Any) -> int:
+        """
+        Write the router's route table to the cache file.
+
+        Args:
+            router: Router to cache
+
+        Returns:
+            Number of cached routes
+
+        Raises:
+            RouteCacheException: If a route uses a closure
+        """
+        payload = self.compile(router)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+        return len(payload["routes"])
+
+    def read(self) -> Dict[str, Any]:
+        """
+        Read the cache payload.
+
+        Returns:
+            Cache payload
+
+        Raises:
+            RouteCacheException: If the file is missing or from another version
+        """
+        if not self.exists():
+            raise RouteCacheException(f"Route cache [{self.path}] does not exist.")
+
+        with open(self.path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+
+        if payload.get("version") != CACHE_VERSION:
+            raise RouteCacheException(
+                f"Route cache [{self.path}] was written by an incompatible version. "
+                "Run route:cache again."
+            )
+
+        return payload
+
+    def load(self, router: Any) -> int:
+        """
+        Hydrate a router from the cache file.
+
+        Args:
+            router: Router to populate
+
+        Returns:
+            Number of loaded routes
+        """
+        payload = self.read()
+
+        router._patterns.update(payload["patterns"])
+        router._middleware.update(_load_value(payload["middleware"]))
+        router._middleware_groups.update(_load_value(payload["middleware_groups"]))
+
+        for key, binding in payload["bindings"].items():
+            callback = _load_value(binding["callback"])
+            if binding["model_class"] is not None:
+                router.model(key, _load_value(binding["model_class"]), callback)
+            else:
+                router.bind(key, callback)
+
+        for data in payload["routes"]:
+            router.routes.add(self._hydrate_route(data))
+
+        return len(payload["routes"])
+
+    def _compile_route(self, route: Route) -> Dict[str, Any]:
+        """Convert a route into cache data."""
+        action = {key: value for key, value in route.getAction().items() if key != "container"}
+
+        return {
+            "methods": route.getMethods(),
+            "uri": route.getUri(),
+            "action": _dump_value(action, route),
+            "name": route.getName(),
+            "name_prefix": route._name_prefix,
+            "middleware": _dump_value(route.getMiddleware(), route),
+            "where": dict(route._where),
+            "bindings": _dump_value(route.getBindings(), route),
+            "with_trashed": route.shouldIncludeTrashed(),
+            "parameter_names": list(route._parameter_names),
+            "pattern": route._pattern,
+            "segments": route._segments,
+        }
+
+    def _hydrate_route(self, data: Dict[str, Any]) -> Route:
+        """Rebuild a route from cache data without recompiling its URI."""
+        route = Route.__new__(Route)
+        route._methods = list(data["methods"])
+        route._uri = data["uri"]
+        route._action = _load_value(data["action"])
+        route._parameters = {}
+        route._parameter_names = list(data["parameter_names"])
+        route._where = dict(data["where"])
+        route._pattern = data["pattern"]
+        route._compiled_pattern = None
+        route._segments = (
+            [tuple(segment) for segment in data["segments"]]
+            if data["segments"] is not None
+            else None
+        )
+        route._name = data["name"]
+        route._name_prefix = data["name_prefix"]
+        route._middleware = _load_value(data["middleware"])
+        route._bindings = _load_value(data["bindings"])
+        route._with_trashed = data["with_trashed"]
+        return route
+
+    def _compile_bindings(self, router: Any) -> Dict[str, Dict[str, Any]]:
+        """Convert the router's global model bindings into cache data."""
+        binder = router._binder
+        bindings: Dict[str, Dict[str, Any]] = {}
+
+        if binder is None:
+            return bindings
+
+        for key, callback in binder.bindings.items():
+            scoped = binder.scoped_bindings.get(key)
+
+            # ModelBinder.model() without a callback installs a local default
+            # callback that is recreated when the binding is registered again
+            if scoped is not None and getattr(callback, "__qualname__", "").startswith(
+                "ModelBinder.model.<locals>"
+            ):
+                callback = None
+
+            bindings[key] = {
+                "model_class": _dump_value(scoped["model_class"]) if scoped else None,
+                "callback": _dump_value(callback),
+            }
+
+        return bindings
+
@@ -6,6 +6,8 @@ Manages collection of routes and provides route matching capabilities.
 
 from typing import Dict, List, Optional
 from larapy.routing.route import Route
+from larapy.routing.route_match import RouteMatch
+from larapy.routing.route_matcher import CompiledRouteMatcher
 
 
 class RouteCollection:
@@ -15,11 +17,19 @@ class RouteCollection:
     Handles route storage, lookup by name/method, and route matching.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty route collection."""
+    def __init__(self, combined_regex: bool = True) -> None:
+        """
+        Initialize empty route collection.
+
+        Args:
+            combined_regex: Match routes the segment trie cannot express with a
+                single combined regex instead of one regex per route
+        """
         self._routes: List[Route] = []
         self._named_routes: Dict[str, Route] = {}
         self._method_routes: Dict[str, List[Route]] = {}
+        self._matchers: Dict[str, CompiledRouteMatcher] = {}
+        self._combined_regex = combined_regex
 
     def add(self, route: Route) -> Route:
         """
@@ -43,29 +53,59 @@ class RouteCollection:
                 self._method_routes[method] = []
             self._method_routes[method].append(route)
 
+        self._matchers.clear()
+
         return route
 
-    def match(self, uri: str, method: str) -> Optional[Route]:
+    def match(self, uri: str, method: str) -> Optional[RouteMatch]:
         """
         Find first route matching the given URI and method.
 
+        The matched route is not modified; the captured parameters are
+        returned on the match, so matching is safe across threads.
+
         Args:
             uri: Request URI
             method: HTTP method
 
         Returns:
-            Matching route or None
+            Route match or None
         """
-        method = method.upper()
+        matcher = self.getMatcher(method)
 
-        if method not in self._method_routes:
+        if matcher is None:
             return None
 
-        for route in self._method_routes[method]:
-            if route.matches(uri, method):
-                return route
+        result = matcher.match(uri)
+
+        if result is None:
+            return None
+
+        route, parameters = result
+        return RouteMatch(route, parameters, route.getName())
+
+    def getMatcher(self, method: str) -> Optional[CompiledRouteMatcher]:
+        """
+        Get the compiled matcher for an HTTP method, building it if needed.
+
+        Args:
+            method: HTTP method
+
+        Returns:
+            Compiled matcher or None if no routes use the method
+        """
+        method = method.upper()
+
+        if method not in self._matchers and method in self._method_routes:
+            self._matchers[method] = CompiledRouteMatcher(
+                self._method_routes[method], self._combined_regex
+            )
+
+        return self._matchers.get(method)
 
-        return None
+    def invalidateMatchers(self) -> None:
+        """Discard compiled matchers so they are rebuilt on the next match."""
+        self._matchers.clear()
 
     def getByName(self, name: str) -> Optional[Route]:
         """
@@ -112,6 +152,7 @@ class RouteCollection:
         """Refresh named and method route indexes."""
         self._named_routes.clear()
         self._method_routes.clear()
+        self._matchers.clear()
 
         for route in self._routes:
             if route.getName():
@@ -0,0 +1,114 @@
+"""
+Route Match
+
+Immutable result of matching a request against the route collection.
+"""
+
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+from larapy.routing.route import Route
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """
+    A matched route together with the parameters captured for one request.
+
+    Routes are shared by every request, so per-request state lives here
+    instead of on the Route. Instances are frozen; use withParameters() to
+    derive a match with substituted values (e.g. bound models).
+
+    The read-only part of the Route API is mirrored so a match can be passed
+    anywhere a matched route was accepted before.
+    """
+
+    route: Route
+    params: Mapping[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Freeze the parameter mapping."""
+        if not isinstance(self.params, MappingProxyType):
+            object.__setattr__(self, "params", MappingProxyType(dict(self.params)))
+
+    def parameters(self) -> Dict[str, Any]:
+        """Get a copy of the matched parameters."""
+        return dict(self.params)
+
+    def parameter(self, name: str, default: Any = None) -> Any:
+        """Get a specific parameter."""
+        return self.params.get(name, default)
+
+    def getParameters(self) -> Dict[str, Any]:
+        """Get a copy of the matched parameters."""
+        return dict(self.params)
+
+    def withParameters(self, parameters: Mapping[str, Any]) -> "RouteMatch":
+        """
+        Create a match for the same route with different parameters.
+
+        Args:
+            parameters: Replacement parameters
+
+        Returns:
+            New route match
+        """
+        return replace(self, params=MappingProxyType(dict(parameters)))
+
+    def run(self) -> Any:
+        """
+        Execute the route action with the matched parameters.
+
+        Returns:
+            Action result
+        """
+        return self.route.run(self.parameters())
+
+    def getName(self) -> Optional[str]:
+        """Get the route name."""
+        return self.name
+
+    def getAction(self, key: Optional[str] = None) -> Any:
+        """Get route action or specific action attribute."""
+        return self.route.getAction(key)
+
+    def getMiddleware(self) -> List[str]:
+        """Get route middleware."""
+        return self.route.getMiddleware()
+
+    def getMethods(self) -> List[str]:
+        """Get allowed HTTP methods."""
+        return self.route.getMethods()
+
+    def getUri(self) -> str:
+        """Get the route URI."""
+        return self.route.getUri()
+
+    def getBindings(self) -> Dict[str, Dict[str, Any]]:
+        """Get the binding configuration of the route."""
+        return self.route.getBindings()
+
+    def shouldIncludeTrashed(self) -> bool:
+        """Check if soft-deleted models should be included in binding resolution."""
+        return self.route.shouldIncludeTrashed()
+
+    @property
+    def parameter_names(self) -> List[str]:
+        """Get parameter names (for middleware access)."""
+        return self.route.parameter_names
+
+    @property
+    def bindings(self) -> Dict[str, Dict[str, Any]]:
+        """Get binding configuration (for middleware access)."""
+        return self.route.bindings
+
+    @property
+    def with_trashed(self) -> bool:
+        """Get with_trashed flag (for middleware access)."""
+        return self.route.with_trashed
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<RouteMatch {self.route!r} {dict(self.params)}>"
@@ -0,0 +1,354 @@
+"""
+Compiled Route Matcher
+
+Segment trie used by RouteCollection to match a URI against every route
+registered for an HTTP method without running each route's regex in turn.
+"""
+
+import re
+from re import _parser as sre_parse
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from larapy.routing.route import Route
+
+DEFAULT_CONSTRAINT = "[^/]+"
+
+# Upper bound on trie paths generated for one route by its optional parameters
+MAX_VARIANTS = 16
+
+# Character categories that can never match "/"
+_SLASH_FREE_CATEGORIES = frozenset(
+    {sre_parse.CATEGORY_DIGIT, sre_parse.CATEGORY_SPACE, sre_parse.CATEGORY_WORD}
+)
+
+_SLASH = ord("/")
+
+
+def _matches_slash(items: Any) -> bool:
+    """
+    Check whether a parsed regex could match a "/" character.
+
+    The answer is conservative: any construct that is not understood is
+    treated as able to match a slash.
+    """
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if av == _SLASH:
+                return True
+        elif op is sre_parse.NOT_LITERAL:
+            if av != _SLASH:
+                return True
+        elif op is sre_parse.IN:
+            if _class_matches_slash(av):
+                return True
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT):
+            if _matches_slash(av[2]):
+                return True
+        elif op is sre_parse.SUBPATTERN:
+            if _matches_slash(av[3]):
+                return True
+        elif op is sre_parse.ATOMIC_GROUP:
+            if _matches_slash(av):
+                return True
+        elif op is sre_parse.BRANCH:
+            if any(_matches_slash(branch) for branch in av[1]):
+                return True
+        else:
+            return True
+
+    return False
+
+
+def _class_matches_slash(items: Any) -> bool:
+    """Check whether a parsed character class could match "/"."""
+    negated = bool(items) and items[0][0] is sre_parse.NEGATE
+    contains_slash = False
+
+    for op, av in items[1:] if negated else items:
+        if op is sre_parse.LITERAL:
+            contains_slash = contains_slash or av == _SLASH
+        elif op is sre_parse.RANGE:
+            contains_slash = contains_slash or av[0] <= _SLASH <= av[1]
+        elif op is sre_parse.CATEGORY:
+            if av not in _SLASH_FREE_CATEGORIES:
+                return True
+        else:
+            return True
+
+    return contains_slash != negated
+
+
+def is_segment_constraint(constraint: str) -> bool:
+    """
+    Check whether a where() constraint is confined to a single URI segment.
+
+    Args:
+        constraint: Regex constraint of a route parameter
+
+    Returns:
+        True if the constraint can never match a "/"
+    """
+    if constraint == DEFAULT_CONSTRAINT:
+        return True
+
+    try:
+        return not _matches_slash(sre_parse.parse(constraint))
+    except (re.error, RecursionError):
+        return False
+
+
+class _Node:
+    """Node in the segment trie."""
+
+    __slots__ = ("static", "params", "catch_alls", "terminal", "min_index")
+
+    def __init__(self, index: int) -> None:
+        self.static: Dict[str, "_Node"] = {}
+        self.params: List[Tuple[Optional[Pattern], "_Node"]] = []
+        self.catch_alls: List[Tuple[int, Route, List[str], Pattern]] = []
+        self.terminal: Optional[Tuple[int, Route, List[str]]] = None
+        self.min_index = index
+
+    def param_child(self, constraint: str, index: int) -> "_Node":
+        """Get or create the child reached through a parameter segment."""
+        pattern = None if constraint == DEFAULT_CONSTRAINT else re.compile(constraint)
+
+        for existing, child in self.params:
+            if existing == pattern:
+                return child
+
+        child = _Node(index)
+        self.params.append((pattern, child))
+        return child
+
+
+class CompiledRouteMatcher:
+    """
+    Route matcher for the routes of a single HTTP method.
+
+    Routes are inserted into a segment trie whose edges are tried static
+    segments first, then constrained parameters, then trailing catch-all
+    parameters. Every node remembers the lowest registration index in its
+    subtree, so the search can stop exploring as soon as no branch can beat
+    the best match found; this keeps first-registered-wins semantics.
+
+    Routes that cannot be expressed one segment at a time fall back to their
+    regex, optionally joined into a single combined alternation.
+
+    Trie entries are ordered by a key of registration index times
+    MAX_VARIANTS plus the rank of the optional-parameter variant, which
+    mirrors the regex preference for including optional parameters.
+    """
+
+    def __init__(self, routes: List[Route], combined_regex: bool = True) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            routes: Routes in registration order
+            combined_regex: Match fallback routes with one combined regex
+        """
+        self._count = len(routes) * MAX_VARIANTS
+        self._root = _Node(self._count)
+        self._fallback: List[Tuple[int, Route]] = []
+        self._combined: Optional[Pattern] = None
+        self._combined_groups: Dict[str, Tuple[int, Route, List[Tuple[str, str]]]] = {}
+
+        for index, route in enumerate(routes):
+            if not self._insert(index * MAX_VARIANTS, route):
+                self._fallback.append((index * MAX_VARIANTS, route))
+
+        if combined_regex and self._fallback:
+            self._compile_combined()
+
+    def _insert(self, key: int, route: Route) -> bool:
+        """
+        Insert a route into the trie.
+
+        Returns:
+            False if the route must be matched by its regex instead
+        """
+        segments = route._segments
+
+        if segments is None:
+            return False
+
+        # Optional parameters are expanded into one trie path per combination,
+        # ranked the way the regex tries them: included before omitted
+        variants: List[List[Tuple[str, ...]]] = [[]]
+
+        for segment in segments:
+            if segment[0] == "param" and segment[3]:
+                variants = [c for v in variants for c in (v + [segment], v)]
+            else:
+                variants = [v + [segment] for v in variants]
+
+            if len(variants) > MAX_VARIANTS:
+                return False
+
+        for variant in variants:
+            for position, segment in enumerate(variant):
+                if segment[0] != "param":
+                    continue
+                try:
+                    re.compile(segment[2])
+                except re.error:
+                    return False
+                if position != len(variant) - 1 and not is_segment_constraint(segment[2]):
+                    return False
+
+        for rank, variant in enumerate(variants):
+            self._insert_variant(key + rank, route, variant)
+
+        return True
+
+    def _insert_variant(self, index: int, route: Route, segments: List[Tuple[str, ...]]) -> None:
+        """Insert one concrete segment path for a route."""
+        node = self._root
+        node.min_index = min(node.min_index, index)
+        names: List[str] = []
+
+        for position, segment in enumerate(segments):
+            if segment[0] == "static":
+                child = node.static.get(segment[1])
+                if child is None:
+                    child = node.static[segment[1]] = _Node(index)
+                node = child
+            elif position == len(segments) - 1 and not is_segment_constraint(segment[2]):
+                names.append(segment[1])
+                node.catch_alls.append((index, route, names, re.compile(segment[2])))
+                return
+            else:
+                names.append(segment[1])
+                node = node.param_child(segment[2], index)
+
+            node.min_index = min(node.min_index, index)
+
+        if node.terminal is None or node.terminal[0] > index:
+            node.terminal = (index, route, names)
+
+    def _compile_combined(self) -> None:
+        """Join the fallback route regexes into a single alternation."""
+        alternatives = []
+
+        for index, route in self._fallback:
+            groups: List[Tuple[str, str]] = []
+            prefix = f"_r{index}_"
+
+            def rename(match: "re.Match[str]") -> str:
+                groups.append((prefix + match.group(1), match.group(1)))
+                return f"(?P<{prefix}{match.group(1)}>"
+
+            body = re.sub(
+                r"\(\?P<([a-zA-Z_][a-zA-Z0-9_]*)>", rename, route._pattern
+            )
+            marker = f"_m{index}"
+            alternatives.append(f"(?:{body}(?P<{marker}>))")
+            self._combined_groups[marker] = (index, route, groups)
+
+        try:
+            self._combined = re.compile("|".join(alternatives))
+        except (re.error, RecursionError, OverflowError):
+            self._combined = None
+            self._combined_groups.clear()
+
+    def match(self, uri: str) -> Optional[Tuple[Route, Dict[str, str]]]:
+        """
+        Find the first registered route matching a URI.
+
+        Args:
+            uri: Request URI
+
+        Returns:
+            Tuple of matching route and its parameters, or None
+        """
+        uri = uri.strip("/") if uri != "/" else "/"
+        uri = "/" + uri if uri and not uri.startswith("/") else uri
+
+        if not uri:
+            return None
+
+        segments = uri[1:].split("/")
+        best = self._search(self._root, segments, 0, [], None)
+        before = best[0] if best is not None else self._count
+
+        if self._fallback and self._fallback[0][0] < before:
+            fallback = self._match_fallback(uri, before)
+            if fallback is not None:
+                return fallback
+
+        if best is None:
+            return None
+
+        _, route, names, values = best
+        return route, {name: value for name, value in zip(names, values)}
+
+    def _search(
+        self,
+        node: _Node,
+        segments: List[str],
+        position: int,
+        values: List[str],
+        best: Optional[Tuple[int, Route, List[str], List[str]]],
+    ) -> Optional[Tuple[int, Route, List[str], List[str]]]:
+        """Depth-first trie search keeping the lowest registration index."""
+        if best is not None and node.min_index >= best[0]:
+            return best
+
+        if position == len(segments):
+            terminal = node.terminal
+            if terminal is not None and (best is None or terminal[0] < best[0]):
+                return (terminal[0], terminal[1], terminal[2], list(values))
+            return best
+
+        segment = segments[position]
+
+        child = node.static.get(segment)
+        if child is not None:
+            best = self._search(child, segments, position + 1, values, best)
+
+        for pattern, child in node.params:
+            if best is not None and child.min_index >= best[0]:
+                continue
+            if segment if pattern is None else pattern.fullmatch(segment):
+                values.append(segment)
+                best = self._search(child, segments, position + 1, values, best)
+                values.pop()
+
+        if node.catch_alls:
+            rest = "/".join(segments[position:])
+            for index, route, names, pattern in node.catch_alls:
+                if best is not None and index >= best[0]:
+                    break
+                if pattern.fullmatch(rest):
+                    best = (index, route, names, values + [rest])
+                    break
+
+        return best
+
+    def _match_fallback(self, uri: str, before: int) -> Optional[Tuple[Route, Dict[str, str]]]:
+        """Match the regex-only routes registered before the given index."""
+        if self._combined is not None:
+            match = self._combined.match(uri)
+            if match is None:
+                return None
+
+            index, route, groups = self._combined_groups[match.lastgroup]
+            if index >= before:
+                return None
+
+            parameters = {}
+            for group, name in groups:
+                value = match.group(group)
+                if value is not None:
+                    parameters[name] = value
+            return route, parameters
+
+        for index, route in self._fallback:
+            if index >= before:
+                break
+            match = route.getCompiledPattern().match(uri)
+            if match:
+                return route, {k: v for k, v in match.groupdict().items() if v is not None}
+
+        return None
@@ -7,6 +7,7 @@ Main router class matching Laravel's Router.
 from typing import Any, Callable, Dict, List, Optional, Union, Type
 from larapy.routing.route import Route
 from larapy.routing.route_collection import RouteCollection
+from larapy.routing.route_match import RouteMatch
 
 
 class Router:
@@ -539,6 +540,45 @@ class Router:
         """Get the route collection."""
         return self.routes
 
+    def loadRoutesFrom(self, path: str) -> "Router":
+        """
+        Execute a route file against this router.
+
+        The file is run as a module with this router available as the
+        global ``router``.
+
+        Args:
+            path: Path of the route file
+
+        Returns:
+            Self for chaining
+        """
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(f"routes_{abs(hash(path))}", path)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            module.router = self
+            spec.loader.exec_module(module)
+
+        return self
+
+    def loadCachedRoutes(self, path: str) -> int:
+        """
+        Hydrate the router from a route cache written by route:cache.
+
+        Route files are not executed and route URIs are not recompiled.
+
+        Args:
+            path: Path of the route cache file
+
+        Returns:
+            Number of loaded routes
+        """
+        from larapy.routing.route_cache import RouteCache
+
+        return RouteCache(path).load(self)
+
     def dispatch(self, request: Any) -> Any:
         """
         Dispatch request to matching route.
@@ -549,21 +589,36 @@ class Router:
         Returns:
             Route response
         """
-        route = self.findRoute(request)
+        match = self.findRoute(request)
 
-        if route is None:
+        if match is None:
             from larapy.http.response import Response
 
             return Response("Not Found", 404)
 
-        request.setRouteParameters(route.parameters())
+        return self.dispatchToRoute(request, match)
+
+    def dispatchToRoute(self, request: Any, match: RouteMatch) -> Any:
+        """
+        Dispatch request to an already matched route.
+
+        Args:
+            request: HTTP request
+            match: Route match
+
+        Returns:
+            Route response
+        """
+        if match.name:
+            request.setRouteParameters({**match.parameters(), "_route_name": match.name})
+        else:
+            request.setRouteParameters(match.parameters())
 
-        if hasattr(route, "_name") and route._name:
-            request.setRouteParameters({**route.parameters(), "_route_name": route._name})
+        request.setRouteMatch(match)
 
-        return self.runRoute(request, route)
+        return self.runRoute(request, match)
 
-    def findRoute(self, request: Any) -> Optional[Route]:
+    def findRoute(self, request: Any) -> Optional[RouteMatch]:
         """
         Find matching route for request.
 
@@ -571,20 +626,20 @@ class Router:
             request: HTTP request
 
         Returns:
-            Matching route or None
+            Route match or None
         """
         path = request.path()
         method = request.method()
 
         return self.routes.match(path, method)
 
-    def runRoute(self, request: Any, route: Route) -> Any:
+    def runRoute(self, request: Any, route: RouteMatch) -> Any:
         """
         Execute route action.
 
         Args:
             request: HTTP request
-            route: Matched route
+            route: Route match
 
         Returns:
             Route response
@@ -602,13 +657,13 @@ class Router:
 
         return None
 
-    def dispatchToController(self, request: Any, route: Route, action: str) -> Any:
+    def dispatchToController(self, request: Any, route: RouteMatch, action: str) -> Any:
         """
         Dispatch request to controller.
 
         Args:
             request: HTTP request
-            route: Matched route
+            route: Route match
             action: Controller action string (e.g., 'UserController@index')
 
         Returns:
@@ -1,6 +1,13 @@
-from .store import Store
-from .session_manager import SessionManager
-from .array_session_handler import ArraySessionHandler
-from .file_session_handler import FileSessionHandler
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["Store", "SessionManager", "ArraySessionHandler", "FileSessionHandler"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.session.store": ["Store"],
+        "larapy.session.session_manager": ["SessionManager"],
+        "larapy.session.array_session_handler": ["ArraySessionHandler"],
+        "larapy.session.file_session_handler": ["FileSessionHandler"],
+    },
+)
@@ -4,12 +4,20 @@ Larapy Support Module
 Provides support classes and utilities for the framework.
 """
 
-from larapy.support.service_provider import ServiceProvider
-from larapy.support.lazy_collection import LazyCollection
-from larapy.support.macroable import Macroable
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "ServiceProvider",
+    "DeferrableProvider",
     "LazyCollection",
     "Macroable",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.support.service_provider": ["DeferrableProvider", "ServiceProvider"],
+        "larapy.support.lazy_collection": ["LazyCollection"],
+        "larapy.support.macroable": ["Macroable"],
+    },
+)
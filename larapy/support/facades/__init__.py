@@ -1,7 +1,4 @@
-from larapy.support.facades.facade import Facade
-from larapy.support.facades.crypt import Crypt
-from larapy.support.facades.hash import Hash
-from larapy.support.facades.rate_limiting import RateLimiting
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Facade",
@@ -9,3 +6,13 @@ __all__ = [
     "Hash",
     "RateLimiting",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.support.facades.facade": ["Facade"],
+        "larapy.support.facades.crypt": ["Crypt"],
+        "larapy.support.facades.hash": ["Hash"],
+        "larapy.support.facades.rate_limiting": ["RateLimiting"],
+    },
+)
@@ -0,0 +1,79 @@
+"""
+Lazy Loader
+
+PEP 562 helpers that let a package ``__init__`` expose its public names
+without importing the modules that define them until first access.
+"""
+
+import importlib
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, List[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Each name is imported from its module on first access and then stored on
+    the package, so later lookups are plain attribute reads. Submodules stay
+    reachable as attributes, as they were when the package imported them.
+    A name that is also a submodule (``larapy.http.response``) is bound
+    eagerly, since importing the submodule would otherwise shadow it.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Module names mapped to the names exported from them
+
+    Returns:
+        Tuple of (__getattr__, __dir__)
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {
+        ...     "larapy.container.container": ["Container"],
+        ... })
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+    namespace = sys.modules[package]
+
+    for name, module_name in origins.items():
+        if name.islower() and _is_submodule(namespace, name):
+            importlib.import_module(f"{package}.{name}")
+            setattr(namespace, name, getattr(importlib.import_module(module_name), name))
+
+    def __getattr__(name: str) -> Any:
+        module_name = origins.get(name)
+
+        if module_name is None:
+            if name.startswith("_"):
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+            submodule = f"{package}.{name}"
+            try:
+                return importlib.import_module(submodule)
+            except ModuleNotFoundError as e:
+                if e.name != submodule:
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(namespace, name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(namespace)) | set(origins))
+
+    return __getattr__, __dir__
+
+
+def _is_submodule(package: Any, name: str) -> bool:
+    """Check if a package directory contains a module or subpackage called name."""
+    for directory in getattr(package, "__path__", ()):
+        if os.path.isfile(os.path.join(directory, f"{name}.py")) or os.path.isdir(
+            os.path.join(directory, name)
+        ):
+            return True
+    return False
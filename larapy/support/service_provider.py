@@ -136,7 +136,7 @@ class ServiceProvider(ABC):
         Returns:
             True if the provider is deferred, False otherwise
         """
-        return False
+        return isinstance(self, DeferrableProvider)
 
     def call_after_resolving(self, name: str, callback: Callable) -> None:
         """
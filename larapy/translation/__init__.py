@@ -1,9 +1,16 @@
-from larapy.translation.translator import Translator
-from larapy.translation.file_loader import FileLoader
-from larapy.translation.translation_service_provider import TranslationServiceProvider
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "Translator",
     "FileLoader",
     "TranslationServiceProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.translation.translator": ["Translator"],
+        "larapy.translation.file_loader": ["FileLoader"],
+        "larapy.translation.translation_service_provider": ["TranslationServiceProvider"],
+    },
+)
@@ -1,13 +1,4 @@
-from larapy.validation.message_bag import MessageBag
-from larapy.validation.validation_rule import ValidationRule
-from larapy.validation.validator import Validator
-from larapy.validation.factory import Factory
-from larapy.validation.form_request import FormRequest
-from larapy.validation.exceptions import (
-    AuthorizationException,
-    ValidationException422,
-    RedirectException,
-)
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "MessageBag",
@@ -19,3 +10,19 @@ __all__ = [
     "ValidationException422",
     "RedirectException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.validation.message_bag": ["MessageBag"],
+        "larapy.validation.validation_rule": ["ValidationRule"],
+        "larapy.validation.validator": ["Validator"],
+        "larapy.validation.factory": ["Factory"],
+        "larapy.validation.form_request": ["FormRequest"],
+        "larapy.validation.exceptions": [
+            "AuthorizationException",
+            "ValidationException422",
+            "RedirectException",
+        ],
+    },
+)
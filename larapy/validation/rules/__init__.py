@@ -1,79 +1,4 @@
-from larapy.validation.rules.required import RequiredRule
-from larapy.validation.rules.email import EmailRule
-from larapy.validation.rules.min import MinRule
-from larapy.validation.rules.max import MaxRule
-from larapy.validation.rules.numeric import NumericRule
-from larapy.validation.rules.string import StringRule
-from larapy.validation.rules.array import ArrayRule
-from larapy.validation.rules.boolean import BooleanRule
-from larapy.validation.rules.integer import IntegerRule
-from larapy.validation.rules.alpha import AlphaRule
-from larapy.validation.rules.alpha_num import AlphaNumRule
-from larapy.validation.rules.alpha_dash import AlphaDashRule
-from larapy.validation.rules.url import UrlRule
-from larapy.validation.rules.ip import IpRule
-from larapy.validation.rules.confirmed import ConfirmedRule
-from larapy.validation.rules.same import SameRule
-from larapy.validation.rules.different import DifferentRule
-from larapy.validation.rules.in_rule import InRule
-from larapy.validation.rules.not_in import NotInRule
-from larapy.validation.rules.nullable import NullableRule
-from larapy.validation.rules.regex import RegexRule
-from larapy.validation.rules.required_if import RequiredIfRule
-from larapy.validation.rules.required_unless import RequiredUnlessRule
-from larapy.validation.rules.required_with import RequiredWithRule
-from larapy.validation.rules.required_without import RequiredWithoutRule
-from larapy.validation.rules.size import SizeRule
-from larapy.validation.rules.between import BetweenRule
-from larapy.validation.rules.digits import DigitsRule
-from larapy.validation.rules.json_rule import JsonRule
-from larapy.validation.rules.date import DateRule
-from larapy.validation.rules.accepted import AcceptedRule
-from larapy.validation.rules.accepted_if import AcceptedIfRule
-from larapy.validation.rules.declined import DeclinedRule
-from larapy.validation.rules.declined_if import DeclinedIfRule
-from larapy.validation.rules.starts_with import StartsWithRule
-from larapy.validation.rules.ends_with import EndsWithRule
-from larapy.validation.rules.doesnt_start_with import DoesntStartWithRule
-from larapy.validation.rules.doesnt_end_with import DoesntEndWithRule
-from larapy.validation.rules.uppercase import UppercaseRule
-from larapy.validation.rules.lowercase import LowercaseRule
-from larapy.validation.rules.uuid import UuidRule
-from larapy.validation.rules.ulid import UlidRule
-from larapy.validation.rules.gt import GtRule
-from larapy.validation.rules.gte import GteRule
-from larapy.validation.rules.lt import LtRule
-from larapy.validation.rules.lte import LteRule
-from larapy.validation.rules.decimal import DecimalRule
-from larapy.validation.rules.max_digits import MaxDigitsRule
-from larapy.validation.rules.min_digits import MinDigitsRule
-from larapy.validation.rules.multiple_of import MultipleOfRule
-from larapy.validation.rules.after import AfterRule
-from larapy.validation.rules.after_or_equal import AfterOrEqualRule
-from larapy.validation.rules.before import BeforeRule
-from larapy.validation.rules.before_or_equal import BeforeOrEqualRule
-from larapy.validation.rules.date_equals import DateEqualsRule
-from larapy.validation.rules.date_format import DateFormatRule
-from larapy.validation.rules.timezone import TimezoneRule
-from larapy.validation.rules.distinct import DistinctRule
-from larapy.validation.rules.contains import ContainsRule
-from larapy.validation.rules.doesnt_contain import DoesntContainRule
-from larapy.validation.rules.in_array import InArrayRule
-from larapy.validation.rules.list import ListRule
-from larapy.validation.rules.present import PresentRule
-from larapy.validation.rules.filled import FilledRule
-from larapy.validation.rules.bail import BailRule
-from larapy.validation.rules.ascii import AsciiRule
-from larapy.validation.rules.hex_color import HexColorRule
-from larapy.validation.rules.mac_address import MacAddressRule
-from larapy.validation.rules.not_regex import NotRegexRule
-from larapy.validation.rules.active_url import ActiveUrlRule
-from larapy.validation.rules.digits_between import DigitsBetweenRule
-from larapy.validation.rules.required_if_accepted import RequiredIfAcceptedRule
-from larapy.validation.rules.required_if_declined import RequiredIfDeclinedRule
-from larapy.validation.rules.required_with_all import RequiredWithAllRule
-from larapy.validation.rules.required_without_all import RequiredWithoutAllRule
-from larapy.validation.rules.required_array_keys import RequiredArrayKeysRule
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "RequiredRule",
@@ -153,3 +78,85 @@ __all__ = [
     "RequiredWithoutAllRule",
     "RequiredArrayKeysRule",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.validation.rules.required": ["RequiredRule"],
+        "larapy.validation.rules.email": ["EmailRule"],
+        "larapy.validation.rules.min": ["MinRule"],
+        "larapy.validation.rules.max": ["MaxRule"],
+        "larapy.validation.rules.numeric": ["NumericRule"],
+        "larapy.validation.rules.string": ["StringRule"],
+        "larapy.validation.rules.array": ["ArrayRule"],
+        "larapy.validation.rules.boolean": ["BooleanRule"],
+        "larapy.validation.rules.integer": ["IntegerRule"],
+        "larapy.validation.rules.alpha": ["AlphaRule"],
+        "larapy.validation.rules.alpha_num": ["AlphaNumRule"],
+        "larapy.validation.rules.alpha_dash": ["AlphaDashRule"],
+        "larapy.validation.rules.url": ["UrlRule"],
+        "larapy.validation.rules.ip": ["IpRule"],
+        "larapy.validation.rules.confirmed": ["ConfirmedRule"],
+        "larapy.validation.rules.same": ["SameRule"],
+        "larapy.validation.rules.different": ["DifferentRule"],
+        "larapy.validation.rules.in_rule": ["InRule"],
+        "larapy.validation.rules.not_in": ["NotInRule"],
+        "larapy.validation.rules.nullable": ["NullableRule"],
+        "larapy.validation.rules.regex": ["RegexRule"],
+        "larapy.validation.rules.required_if": ["RequiredIfRule"],
+        "larapy.validation.rules.required_unless": ["RequiredUnlessRule"],
+        "larapy.validation.rules.required_with": ["RequiredWithRule"],
+        "larapy.validation.rules.required_without": ["RequiredWithoutRule"],
+        "larapy.validation.rules.size": ["SizeRule"],
+        "larapy.validation.rules.between": ["BetweenRule"],
+        "larapy.validation.rules.digits": ["DigitsRule"],
+        "larapy.validation.rules.json_rule": ["JsonRule"],
+        "larapy.validation.rules.date": ["DateRule"],
+        "larapy.validation.rules.accepted": ["AcceptedRule"],
+        "larapy.validation.rules.accepted_if": ["AcceptedIfRule"],
+        "larapy.validation.rules.declined": ["DeclinedRule"],
+        "larapy.validation.rules.declined_if": ["DeclinedIfRule"],
+        "larapy.validation.rules.starts_with": ["StartsWithRule"],
+        "larapy.validation.rules.ends_with": ["EndsWithRule"],
+        "larapy.validation.rules.doesnt_start_with": ["DoesntStartWithRule"],
+        "larapy.validation.rules.doesnt_end_with": ["DoesntEndWithRule"],
+        "larapy.validation.rules.uppercase": ["UppercaseRule"],
+        "larapy.validation.rules.lowercase": ["LowercaseRule"],
+        "larapy.validation.rules.uuid": ["UuidRule"],
+        "larapy.validation.rules.ulid": ["UlidRule"],
+        "larapy.validation.rules.gt": ["GtRule"],
+        "larapy.validation.rules.gte": ["GteRule"],
+        "larapy.validation.rules.lt": ["LtRule"],
+        "larapy.validation.rules.lte": ["LteRule"],
+        "larapy.validation.rules.decimal": ["DecimalRule"],
+        "larapy.validation.rules.max_digits": ["MaxDigitsRule"],
+        "larapy.validation.rules.min_digits": ["MinDigitsRule"],
+        "larapy.validation.rules.multiple_of": ["MultipleOfRule"],
+        "larapy.validation.rules.after": ["AfterRule"],
+        "larapy.validation.rules.after_or_equal": ["AfterOrEqualRule"],
+        "larapy.validation.rules.before": ["BeforeRule"],
+        "larapy.validation.rules.before_or_equal": ["BeforeOrEqualRule"],
+        "larapy.validation.rules.date_equals": ["DateEqualsRule"],
+        "larapy.validation.rules.date_format": ["DateFormatRule"],
+        "larapy.validation.rules.timezone": ["TimezoneRule"],
+        "larapy.validation.rules.distinct": ["DistinctRule"],
+        "larapy.validation.rules.contains": ["ContainsRule"],
+        "larapy.validation.rules.doesnt_contain": ["DoesntContainRule"],
+        "larapy.validation.rules.in_array": ["InArrayRule"],
+        "larapy.validation.rules.list": ["ListRule"],
+        "larapy.validation.rules.present": ["PresentRule"],
+        "larapy.validation.rules.filled": ["FilledRule"],
+        "larapy.validation.rules.bail": ["BailRule"],
+        "larapy.validation.rules.ascii": ["AsciiRule"],
+        "larapy.validation.rules.hex_color": ["HexColorRule"],
+        "larapy.validation.rules.mac_address": ["MacAddressRule"],
+        "larapy.validation.rules.not_regex": ["NotRegexRule"],
+        "larapy.validation.rules.active_url": ["ActiveUrlRule"],
+        "larapy.validation.rules.digits_between": ["DigitsBetweenRule"],
+        "larapy.validation.rules.required_if_accepted": ["RequiredIfAcceptedRule"],
+        "larapy.validation.rules.required_if_declined": ["RequiredIfDeclinedRule"],
+        "larapy.validation.rules.required_with_all": ["RequiredWithAllRule"],
+        "larapy.validation.rules.required_without_all": ["RequiredWithoutAllRule"],
+        "larapy.validation.rules.required_array_keys": ["RequiredArrayKeysRule"],
+    },
+)
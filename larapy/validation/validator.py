@@ -1,10 +1,39 @@
 from larapy.validation.message_bag import MessageBag
 from larapy.validation.validation_rule import ValidationRule
-from larapy.validation.rules import *
+from larapy.validation import rules as rule_classes
 from typing import Dict, List, Any, Union, Callable, Optional
 import re
 
 
+# Rules that take no parameters, by name; classes are imported on first use
+SIMPLE_RULES = {
+    "required": "RequiredRule",
+    "email": "EmailRule",
+    "numeric": "NumericRule",
+    "string": "StringRule",
+    "array": "ArrayRule",
+    "boolean": "BooleanRule",
+    "integer": "IntegerRule",
+    "alpha": "AlphaRule",
+    "alpha_num": "AlphaNumRule",
+    "alpha_dash": "AlphaDashRule",
+    "url": "UrlRule",
+    "ip": "IpRule",
+    "confirmed": "ConfirmedRule",
+    "nullable": "NullableRule",
+    "json": "JsonRule",
+    "accepted": "AcceptedRule",
+    "declined": "DeclinedRule",
+    "uppercase": "UppercaseRule",
+    "lowercase": "LowercaseRule",
+    "present": "PresentRule",
+    "filled": "FilledRule",
+    "bail": "BailRule",
+    "ascii": "AsciiRule",
+    "active_url": "ActiveUrlRule",
+}
+
+
 class Validator:
     def __init__(
         self,
@@ -252,144 +281,117 @@ class Validator:
         return True
 
     def _getRuleInstance(self, rule_name: str, params: List[str]) -> Optional[ValidationRule]:
-        rule_map = {
-            "required": RequiredRule,
-            "email": EmailRule,
-            "numeric": NumericRule,
-            "string": StringRule,
-            "array": ArrayRule,
-            "boolean": BooleanRule,
-            "integer": IntegerRule,
-            "alpha": AlphaRule,
-            "alpha_num": AlphaNumRule,
-            "alpha_dash": AlphaDashRule,
-            "url": UrlRule,
-            "ip": IpRule,
-            "confirmed": ConfirmedRule,
-            "nullable": NullableRule,
-            "json": JsonRule,
-            "accepted": AcceptedRule,
-            "declined": DeclinedRule,
-            "uppercase": UppercaseRule,
-            "lowercase": LowercaseRule,
-            "present": PresentRule,
-            "filled": FilledRule,
-            "bail": BailRule,
-            "ascii": AsciiRule,
-            "active_url": ActiveUrlRule,
-        }
-
-        if rule_name in rule_map:
-            return rule_map[rule_name]()
+        if rule_name in SIMPLE_RULES:
+            return getattr(rule_classes, SIMPLE_RULES[rule_name])()
 
         if rule_name == "min" and params:
-            return MinRule(float(params[0]))
+            return rule_classes.MinRule(float(params[0]))
         elif rule_name == "max" and params:
-            return MaxRule(float(params[0]))
+            return rule_classes.MaxRule(float(params[0]))
         elif rule_name == "same" and params:
-            return SameRule(params[0])
+            return rule_classes.SameRule(params[0])
         elif rule_name == "different" and params:
-            return DifferentRule(params[0])
+            return rule_classes.DifferentRule(params[0])
         elif rule_name == "in" and params:
-            return InRule(params)
+            return rule_classes.InRule(params)
         elif rule_name == "not_in" and params:
-            return NotInRule(params)
+            return rule_classes.NotInRule(params)
         elif rule_name == "regex" and params:
-            return RegexRule(params[0])
+            return rule_classes.RegexRule(params[0])
         elif rule_name == "not_regex" and params:
-            return NotRegexRule(params[0])
+            return rule_classes.NotRegexRule(params[0])
         elif rule_name == "required_if" and len(params) >= 2:
-            return RequiredIfRule(params[0], params[1])
+            return rule_classes.RequiredIfRule(params[0], params[1])
         elif rule_name == "required_unless" and len(params) >= 2:
-            return RequiredUnlessRule(params[0], params[1])
+            return rule_classes.RequiredUnlessRule(params[0], params[1])
         elif rule_name == "required_with" and params:
-            return RequiredWithRule(params)
+            return rule_classes.RequiredWithRule(params)
         elif rule_name == "required_without" and params:
-            return RequiredWithoutRule(params)
+            return rule_classes.RequiredWithoutRule(params)
         elif rule_name == "required_with_all" and params:
-            return RequiredWithAllRule(*params)
+            return rule_classes.RequiredWithAllRule(*params)
         elif rule_name == "required_without_all" and params:
-            return RequiredWithoutAllRule(*params)
+            return rule_classes.RequiredWithoutAllRule(*params)
         elif rule_name == "required_if_accepted" and params:
-            return RequiredIfAcceptedRule(params[0])
+            return rule_classes.RequiredIfAcceptedRule(params[0])
         elif rule_name == "required_if_declined" and params:
-            return RequiredIfDeclinedRule(params[0])
+            return rule_classes.RequiredIfDeclinedRule(params[0])
         elif rule_name == "required_array_keys" and params:
-            return RequiredArrayKeysRule(*params)
+            return rule_classes.RequiredArrayKeysRule(*params)
         elif rule_name == "size" and params:
-            return SizeRule(int(params[0]))
+            return rule_classes.SizeRule(int(params[0]))
         elif rule_name == "between" and len(params) >= 2:
-            return BetweenRule(int(params[0]), int(params[1]))
+            return rule_classes.BetweenRule(int(params[0]), int(params[1]))
         elif rule_name == "digits" and params:
-            return DigitsRule(int(params[0]))
+            return rule_classes.DigitsRule(int(params[0]))
         elif rule_name == "digits_between" and len(params) >= 2:
-            return DigitsBetweenRule(int(params[0]), int(params[1]))
+            return rule_classes.DigitsBetweenRule(int(params[0]), int(params[1]))
         elif rule_name == "date" and params:
-            return DateRule(params[0])
+            return rule_classes.DateRule(params[0])
         elif rule_name == "date_format" and params:
-            return DateFormatRule(*params)
+            return rule_classes.DateFormatRule(*params)
         elif rule_name == "date_equals" and params:
-            return DateEqualsRule(params[0])
+            return rule_classes.DateEqualsRule(params[0])
         elif rule_name == "after" and params:
-            return AfterRule(params[0])
+            return rule_classes.AfterRule(params[0])
         elif rule_name == "after_or_equal" and params:
-            return AfterOrEqualRule(params[0])
+            return rule_classes.AfterOrEqualRule(params[0])
         elif rule_name == "before" and params:
-            return BeforeRule(params[0])
+            return rule_classes.BeforeRule(params[0])
         elif rule_name == "before_or_equal" and params:
-            return BeforeOrEqualRule(params[0])
+            return rule_classes.BeforeOrEqualRule(params[0])
         elif rule_name == "timezone" and params:
-            return TimezoneRule(params[0] if params else "all")
+            return rule_classes.TimezoneRule(params[0] if params else "all")
         elif rule_name == "accepted_if" and len(params) >= 2:
-            return AcceptedIfRule(params[0], params[1])
+            return rule_classes.AcceptedIfRule(params[0], params[1])
         elif rule_name == "declined_if" and len(params) >= 2:
-            return DeclinedIfRule(params[0], params[1])
+            return rule_classes.DeclinedIfRule(params[0], params[1])
         elif rule_name == "starts_with" and params:
-            return StartsWithRule(*params)
+            return rule_classes.StartsWithRule(*params)
         elif rule_name == "ends_with" and params:
-            return EndsWithRule(*params)
+            return rule_classes.EndsWithRule(*params)
         elif rule_name == "doesnt_start_with" and params:
-            return DoesntStartWithRule(*params)
+            return rule_classes.DoesntStartWithRule(*params)
         elif rule_name == "doesnt_end_with" and params:
-            return DoesntEndWithRule(*params)
+            return rule_classes.DoesntEndWithRule(*params)
         elif rule_name == "uuid" and params:
-            return UuidRule(int(params[0]) if params[0].isdigit() else None)
+            return rule_classes.UuidRule(int(params[0]) if params[0].isdigit() else None)
         elif rule_name == "ulid":
-            return UlidRule()
+            return rule_classes.UlidRule()
         elif rule_name == "gt" and params:
-            return GtRule(params[0])
+            return rule_classes.GtRule(params[0])
         elif rule_name == "gte" and params:
-            return GteRule(params[0])
+            return rule_classes.GteRule(params[0])
         elif rule_name == "lt" and params:
-            return LtRule(params[0])
+            return rule_classes.LtRule(params[0])
         elif rule_name == "lte" and params:
-            return LteRule(params[0])
+            return rule_classes.LteRule(params[0])
         elif rule_name == "decimal" and params:
             if len(params) >= 2:
-                return DecimalRule(params[0], params[1])
-            return DecimalRule(params[0])
+                return rule_classes.DecimalRule(params[0], params[1])
+            return rule_classes.DecimalRule(params[0])
         elif rule_name == "max_digits" and params:
-            return MaxDigitsRule(params[0])
+            return rule_classes.MaxDigitsRule(params[0])
         elif rule_name == "min_digits" and params:
-            return MinDigitsRule(params[0])
+            return rule_classes.MinDigitsRule(params[0])
         elif rule_name == "multiple_of" and params:
-            return MultipleOfRule(params[0])
+            return rule_classes.MultipleOfRule(params[0])
         elif rule_name == "distinct":
             strict = "strict" in params
             ignore_case = "ignore_case" in params
-            return DistinctRule(strict, ignore_case)
+            return rule_classes.DistinctRule(strict, ignore_case)
         elif rule_name == "contains" and params:
-            return ContainsRule(*params)
+            return rule_classes.ContainsRule(*params)
         elif rule_name == "doesnt_contain" and params:
-            return DoesntContainRule(*params)
+            return rule_classes.DoesntContainRule(*params)
         elif rule_name == "in_array" and params:
-            return InArrayRule(params[0])
+            return rule_classes.InArrayRule(params[0])
         elif rule_name == "list":
-            return ListRule()
+            return rule_classes.ListRule()
         elif rule_name == "hex_color":
-            return HexColorRule()
+            return rule_classes.HexColorRule()
         elif rule_name == "mac_address":
-            return MacAddressRule()
+            return rule_classes.MacAddressRule()
 
         return None
 
@@ -4,12 +4,19 @@ Views & Templating System
 Blade-like templating engine for generating HTML responses.
 """
 
-from .view import View
-from .engine import Engine
-from .compiler import Compiler
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = [
     "View",
     "Engine",
     "Compiler",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.views.view": ["View"],
+        "larapy.views.engine": ["Engine"],
+        "larapy.views.compiler": ["Compiler"],
+    },
+)
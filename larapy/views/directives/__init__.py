@@ -1,3 +1,14 @@
-from larapy.views.directives.authorization import can_directive, cannot_directive, canany_directive
+from larapy.support.lazy_loader import lazy_exports
 
 __all__ = ["can_directive", "cannot_directive", "canany_directive"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "larapy.views.directives.authorization": [
+            "can_directive",
+            "cannot_directive",
+            "canany_directive",
+        ],
+    },
+)
@@ -8,7 +8,7 @@ from pathlib import Path
 
 import pytest
 
-from larapy.container import Container
+from larapy.container import Container, ContainerCompilationException
 from larapy.foundation import Application
 from larapy.support import ServiceProvider
 
@@ -305,6 +305,49 @@ class TestBootingProviders:
         assert len(booted) == 1
 
 
+class TestBootCompilation:
+    """Test compiling the container during boot."""
+
+    def test_production_boot_compiles_container(self, app, monkeypatch):
+        """Test that booting in production compiles the container."""
+        monkeypatch.setenv("APP_ENV", "production")
+
+        class CacheProvider(ServiceProvider):
+            def register(self):
+                self.app.singleton("cache", CacheService)
+
+        app.register(CacheProvider)
+        app.boot()
+
+        assert app.is_compiled()
+        assert isinstance(app.make("cache"), CacheService)
+
+    def test_misconfigured_binding_fails_at_boot(self, app, monkeypatch):
+        """Test that an unresolvable binding fails boot in production."""
+        monkeypatch.setenv("APP_ENV", "production")
+
+        class Mailer:
+            def __init__(self, host: str):
+                self.host = host
+
+        class MailProvider(ServiceProvider):
+            def register(self):
+                self.app.bind("mailer", Mailer)
+
+        app.register(MailProvider)
+
+        with pytest.raises(ContainerCompilationException, match="mailer"):
+            app.boot()
+
+    def test_local_boot_does_not_compile(self, app, monkeypatch):
+        """Test that the container is left uncompiled outside production."""
+        monkeypatch.setenv("APP_ENV", "local")
+
+        app.boot()
+
+        assert not app.is_compiled()
+
+
 class TestProviderCallbacks:
     """Test provider booting and booted callbacks."""
 
@@ -8,6 +8,7 @@ from larapy.container import (
     BindingResolutionException,
     CircularDependencyException,
     Container,
+    ContainerCompilationException,
 )
 
 
@@ -487,3 +488,237 @@ class TestComplexScenarios:
         assert isinstance(simple, SimpleDependency)
         assert isinstance(cache, RedisCache)
         assert resolved_another is another
+
+
+class TestResolutionPlans:
+    """Test cached resolution plans."""
+
+    def test_repeated_make_reuses_plans(self, container):
+        """Test that a second make() compiles nothing new."""
+        container.make(ComplexDependency)
+        misses = container.resolution_plan_stats()["misses"]
+
+        container.make(ComplexDependency)
+        stats = container.resolution_plan_stats()
+
+        assert stats["misses"] == misses
+        assert stats["hits"] > 0
+        assert stats["build_plans"] == 3
+
+    def test_rebinding_invalidates_concrete(self, container):
+        """Test that a new binding takes effect after a cached resolve."""
+        container.bind(CacheInterface, RedisCache)
+        assert isinstance(container.make(CacheInterface), RedisCache)
+
+        container.bind(CacheInterface, FileCache)
+        assert isinstance(container.make(CacheInterface), FileCache)
+
+    def test_instance_after_resolve(self, container):
+        """Test that registering an instance replaces a cached binding."""
+        container.bind("cache", RedisCache)
+        container.make("cache")
+
+        cache = FileCache()
+        container.instance("cache", cache)
+
+        assert container.make("cache") is cache
+
+    def test_alias_after_resolve(self, container):
+        """Test that a new alias is honoured after a cached resolve."""
+        container.bind("redis", RedisCache)
+        container.bind("file", FileCache)
+        container.alias("redis", "cache")
+        assert isinstance(container.make("cache"), RedisCache)
+
+        container.alias("file", "cache")
+        assert isinstance(container.make("cache"), FileCache)
+
+    def test_contextual_binding_invalidates_plan(self, container):
+        """Test that contextual bindings apply to already compiled classes."""
+
+        class Consumer:
+            def __init__(self, cache: CacheInterface):
+                self.cache = cache
+
+        container.bind(CacheInterface, RedisCache)
+        assert isinstance(container.make(Consumer).cache, RedisCache)
+
+        container.add_contextual_binding(Consumer, CacheInterface, FileCache)
+
+        assert isinstance(container.make(Consumer).cache, FileCache)
+        assert isinstance(container.make(CacheInterface), RedisCache)
+
+    def test_bound_methods_share_a_plan(self, container):
+        """Test that call() caches bound methods by their function."""
+
+        class Controller:
+            def show(self, simple: SimpleDependency, page: int = 1):
+                return (self, simple, page)
+
+        first, second = Controller(), Controller()
+        container.call(first.show)
+        misses = container.resolution_plan_stats()["misses"]
+
+        result = container.call(second.show, {"page": 2})
+
+        assert result[0] is second
+        assert isinstance(result[1], SimpleDependency)
+        assert result[2] == 2
+        assert container.resolution_plan_stats()["misses"] == misses
+
+    def test_errors_are_raised_from_cached_plans(self, container):
+        """Test that unresolvable parameters fail the same way every time."""
+
+        class NeedsName:
+            def __init__(self, name: str):
+                self.name = name
+
+        for _ in range(2):
+            with pytest.raises(BindingResolutionException, match="Cannot auto-wire builtin type 'str'"):
+                container.make(NeedsName)
+
+        assert container.make(NeedsName, {"name": "ok"}).name == "ok"
+
+    def test_call_plan_cache_is_bounded(self, container, monkeypatch):
+        """Test that the call() plan cache does not grow without limit."""
+        monkeypatch.setattr("larapy.container.container.MAX_CALL_PLANS", 4)
+
+        for i in range(10):
+            container.call(lambda simple: simple, {"simple": i})
+
+        assert container.resolution_plan_stats()["call_plans"] <= 4
+
+    def test_flush_forgets_plans(self, container):
+        """Test that flush() clears every cached plan."""
+        container.make(ComplexDependency)
+        container.call(lambda simple: simple, {"simple": 1})
+
+        container.flush()
+        stats = container.resolution_plan_stats()
+
+        assert stats["concretes"] == stats["build_plans"] == stats["call_plans"] == 0
+
+
+class TestCompile:
+    """Test compiling and validating the container."""
+
+    def test_compile_warms_plans(self, container):
+        """Test that compile() builds plans without instantiating services."""
+        built = []
+
+        class Service:
+            def __init__(self, dependency: ComplexDependency):
+                built.append(self)
+
+        container.singleton("service", Service)
+        container.bind(RedisCache)
+        container.tag([RedisCache], ["caches"])
+
+        container.compile()
+
+        assert built == []
+        assert container.is_compiled()
+        assert container.resolution_plan_stats()["build_plans"] == 5
+
+        misses = container.resolution_plan_stats()["misses"]
+        container.make("service")
+        assert container.resolution_plan_stats()["misses"] == misses
+
+    def test_unsatisfiable_dependency_fails(self, container):
+        """Test that a missing dependency is reported for the service."""
+
+        class NeedsName:
+            def __init__(self, simple: SimpleDependency, name: str):
+                self.name = name
+
+        container.bind("needs_name", NeedsName)
+        container.bind("ok", OptionalDependency)
+
+        with pytest.raises(ContainerCompilationException) as info:
+            container.compile()
+
+        assert list(info.value.errors) == ["needs_name"]
+        assert isinstance(info.value.errors["needs_name"], BindingResolutionException)
+        assert not container.is_compiled()
+
+    def test_nested_unsatisfiable_dependency_fails(self, container):
+        """Test that failures deep in the graph surface at compile time."""
+
+        class Interface:
+            pass
+
+        class Leaf:
+            def __init__(self, interface: Interface, name: str):
+                pass
+
+        class Root:
+            def __init__(self, leaf: Leaf):
+                pass
+
+        container.bind("root", Root)
+
+        with pytest.raises(ContainerCompilationException, match="leaf"):
+            container.compile()
+
+    def test_cycle_fails(self, container):
+        """Test that circular dependencies are detected without building."""
+        container.bind("circular", CircularA)
+
+        with pytest.raises(ContainerCompilationException) as info:
+            container.compile()
+
+        assert isinstance(info.value.errors["circular"], CircularDependencyException)
+
+    def test_tagged_unbound_key_fails(self, container):
+        """Test that tags must point at resolvable services."""
+        container.tag(["missing"], ["caches"])
+
+        with pytest.raises(ContainerCompilationException, match="missing"):
+            container.compile()
+
+    def test_alias_cycle_fails(self, container):
+        """Test that bindings pointing at each other are detected."""
+        container.bind("a", "b")
+        container.bind("b", "a")
+
+        with pytest.raises(ContainerCompilationException):
+            container.compile()
+
+    def test_optional_unresolvable_dependency_is_allowed(self, container):
+        """Test that a default covers an unresolvable dependency."""
+
+        class Interface:
+            def __init__(self, name: str):
+                pass
+
+        class Service:
+            def __init__(self, interface: Interface = None):
+                self.interface = interface
+
+        container.bind("service", Service)
+        container.compile()
+
+        assert container.make("service").interface is None
+
+    def test_factories_and_instances_are_accepted(self, container):
+        """Test that closures and instances need no validation."""
+        container.bind("factory", lambda c: "made")
+        container.instance("config", {"debug": False})
+        container.bind(CacheInterface, RedisCache)
+        container.alias("factory", "made")
+
+        container.compile()
+
+        assert container.make("made") == "made"
+
+    def test_binding_after_compile_uncompiles(self, container):
+        """Test that registering after compile() still works."""
+        container.bind(CacheInterface, RedisCache)
+        container.compile()
+
+        container.bind(CacheInterface, FileCache)
+        container.tag([CacheInterface], ["caches"])
+
+        assert not container.is_compiled()
+        assert isinstance(container.make(CacheInterface), FileCache)
+        assert len(container.tagged("caches")) == 1
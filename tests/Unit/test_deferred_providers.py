@@ -0,0 +1,303 @@
+"""
+Unit tests for deferred service providers and the provider manifest
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+from larapy.container import BindingResolutionException
+from larapy.foundation import Application
+from larapy.foundation.provider_repository import ProviderRepository, provider_name
+from larapy.support import DeferrableProvider, ServiceProvider
+
+events = []
+
+
+class Mailer:
+    """Mock mailer service."""
+
+
+class EagerProvider(ServiceProvider):
+    """Provider registered on every boot."""
+
+    def register(self):
+        events.append("eager.register")
+        self.app.singleton("config.loaded", lambda app: True)
+
+
+class MailProvider(ServiceProvider, DeferrableProvider):
+    """Provider loaded on first use of the mailer."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        events.append("mail.construct")
+
+    def register(self):
+        events.append("mail.register")
+        self.app.singleton("mailer", lambda app: Mailer())
+        self.app.alias("mailer", "mail")
+        self.app.singleton(Mailer, lambda app: app.make("mailer"))
+
+    def boot(self):
+        events.append("mail.boot")
+
+    def provides(self):
+        return ["mailer", Mailer]
+
+
+class QueueProvider(ServiceProvider, DeferrableProvider):
+    """Provider loaded when an event is dispatched."""
+
+    def register(self):
+        events.append("queue.register")
+        self.app.singleton("queue", lambda app: "queue")
+
+    def provides(self):
+        return ["queue"]
+
+    def when(self):
+        return ["job.pushed"]
+
+
+class BrokenProvider(ServiceProvider, DeferrableProvider):
+    """Provider whose registration fails."""
+
+    def register(self):
+        events.append("broken.register")
+        raise RuntimeError("broken provider")
+
+    def provides(self):
+        return ["broken"]
+
+
+class SlowProvider(ServiceProvider, DeferrableProvider):
+    """Provider that registers only once released."""
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def register(self):
+        events.append("slow.register")
+        self.started.set()
+        self.release.wait(5)
+        self.app.singleton("slow", lambda app: object())
+
+    def provides(self):
+        return ["slow"]
+
+
+@pytest.fixture(autouse=True)
+def reset_events():
+    events.clear()
+    yield
+    events.clear()
+
+
+@pytest.fixture
+def app(tmp_path):
+    return Application(str(tmp_path))
+
+
+def write_providers(app, providers):
+    path = app.bootstrap_path("providers.py")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    names = ", ".join(repr(provider_name(provider)) for provider in providers)
+    with open(path, "w") as handle:
+        handle.write(f"providers = [{names}]\n")
+
+
+class TestDeferrableProvider:
+    """Test the deferred provider interface."""
+
+    def test_deferrable_provider_is_deferred(self, app):
+        assert MailProvider(app).is_deferred()
+        assert not EagerProvider(app).is_deferred()
+
+
+class TestProviderManifest:
+    """Test compiling and reading the manifest."""
+
+    def test_first_load_writes_manifest(self, app):
+        repository = ProviderRepository(app, app.get_cached_services_path())
+
+        repository.load([EagerProvider, MailProvider])
+
+        with open(app.get_cached_services_path()) as handle:
+            manifest = json.load(handle)
+
+        assert manifest["eager"] == [provider_name(EagerProvider)]
+        assert manifest["deferred"] == {
+            "mailer": provider_name(MailProvider),
+            app._get_abstract_key(Mailer): provider_name(MailProvider),
+        }
+        assert events == ["mail.construct", "eager.register"]
+        assert app.provider_is_loaded("EagerProvider")
+        assert not app.provider_is_loaded("MailProvider")
+
+    def test_cached_manifest_skips_deferred_providers(self, app):
+        ProviderRepository(app, app.get_cached_services_path()).load([EagerProvider, MailProvider])
+        events.clear()
+
+        fresh = Application(app.base_path())
+        ProviderRepository(fresh, fresh.get_cached_services_path()).load(
+            [EagerProvider, MailProvider]
+        )
+
+        assert events == ["eager.register"]
+        assert fresh.is_deferred_service("mailer")
+
+    def test_manifest_is_recompiled_when_providers_change(self, app):
+        path = app.get_cached_services_path()
+        ProviderRepository(app, path).load([EagerProvider])
+
+        ProviderRepository(Application(app.base_path()), path).load([EagerProvider, QueueProvider])
+
+        with open(path) as handle:
+            assert json.load(handle)["deferred"] == {"queue": provider_name(QueueProvider)}
+
+    def test_deferred_provider_module_is_not_imported(self, tmp_path, monkeypatch):
+        package = tmp_path / "deferredpkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "heavy.py").write_text(
+            "from larapy.support import DeferrableProvider, ServiceProvider\n"
+            "class HeavyProvider(ServiceProvider, DeferrableProvider):\n"
+            "    def register(self):\n"
+            "        self.app.singleton('heavy', lambda app: 'heavy')\n"
+            "    def provides(self):\n"
+            "        return ['heavy']\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        (tmp_path / "bootstrap").mkdir()
+        (tmp_path / "bootstrap" / "providers.py").write_text(
+            "providers = ['deferredpkg.heavy.HeavyProvider']\n"
+        )
+
+        Application(str(tmp_path)).register_configured_providers()
+        sys.modules.pop("deferredpkg.heavy")
+
+        app = Application(str(tmp_path))
+        app.register_configured_providers()
+
+        assert "deferredpkg.heavy" not in sys.modules
+        assert app.make("heavy") == "heavy"
+        assert "deferredpkg.heavy" in sys.modules
+        monkeypatch.delitem(sys.modules, "deferredpkg.heavy")
+
+
+class TestDeferredResolution:
+    """Test loading deferred providers on first resolve."""
+
+    def test_resolving_service_registers_and_boots_provider(self, app):
+        write_providers(app, [EagerProvider, MailProvider])
+        app.register_configured_providers()
+        app.boot()
+        events.clear()
+
+        mailer = app.make("mailer")
+
+        assert isinstance(mailer, Mailer)
+        assert events == ["mail.construct", "mail.register", "mail.boot"]
+        assert app.make(Mailer) is mailer
+        assert app.make("mail") is mailer
+        assert app.get_deferred_services() == {}
+        assert events.count("mail.register") == 1
+
+    def test_resolving_by_type_loads_provider(self, app):
+        app.add_deferred_services({app._get_abstract_key(Mailer): provider_name(MailProvider)})
+
+        assert isinstance(app.make(Mailer), Mailer)
+
+    def test_provider_loaded_before_boot_is_booted_with_the_rest(self, app):
+        app.add_deferred_services({"mailer": provider_name(MailProvider)})
+
+        app.make("mailer")
+        assert "mail.boot" not in events
+
+        app.boot()
+        assert events.count("mail.boot") == 1
+
+    def test_deferred_services_are_bound(self, app):
+        app.add_deferred_services({"mailer": provider_name(MailProvider)})
+
+        assert app.bound("mailer")
+        assert not app.provider_is_loaded("MailProvider")
+
+    def test_resolve_before_manifest_does_not_stick(self, app):
+        with pytest.raises(BindingResolutionException):
+            app.make("mailer")
+
+        app.add_deferred_services({"mailer": provider_name(MailProvider)})
+
+        assert isinstance(app.make("mailer"), Mailer)
+
+    def test_compile_does_not_load_deferred_providers(self, app, monkeypatch):
+        monkeypatch.setenv("APP_ENV", "production")
+
+        class Newsletter:
+            def __init__(self, mailer: Mailer):
+                self.mailer = mailer
+
+        app.add_deferred_services({app._get_abstract_key(Mailer): provider_name(MailProvider)})
+        app.bind("newsletter", Newsletter)
+        app.boot()
+
+        assert app.is_compiled()
+        assert "mail.register" not in events
+        assert isinstance(app.make("newsletter").mailer, Mailer)
+
+    def test_load_deferred_providers(self, app):
+        app.add_deferred_services(
+            {"mailer": provider_name(MailProvider), "queue": provider_name(QueueProvider)}
+        )
+
+        app.load_deferred_providers()
+
+        assert app.provider_is_loaded("MailProvider")
+        assert app.provider_is_loaded("QueueProvider")
+
+    def test_when_event_loads_provider(self, app):
+        from larapy.events.event_service_provider import EventServiceProvider
+
+        app.register(EventServiceProvider)
+        ProviderRepository(app, app.get_cached_services_path()).load([QueueProvider])
+        assert not app.provider_is_loaded("QueueProvider")
+
+        app.make("events").dispatch("job.pushed")
+
+        assert app.provider_is_loaded("QueueProvider")
+
+    def test_failed_registration_keeps_services_deferred(self, app):
+        app.add_deferred_services({"broken": provider_name(BrokenProvider)})
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="broken provider"):
+                app.make("broken")
+
+        assert app.is_deferred_service("broken")
+        assert events == ["broken.register", "broken.register"]
+
+    def test_concurrent_resolves_wait_for_the_registration(self, app):
+        app.add_deferred_services({"slow": provider_name(SlowProvider)})
+        resolved = []
+
+        def resolve():
+            resolved.append(app.make("slow"))
+
+        first = threading.Thread(target=resolve)
+        first.start()
+        assert SlowProvider.started.wait(5)
+
+        second = threading.Thread(target=resolve)
+        second.start()
+        second.join(0.05)
+        SlowProvider.release.set()
+        first.join(5)
+        second.join(5)
+
+        assert len(resolved) == 2 and resolved[0] is resolved[1]
+        assert events == ["slow.register"]
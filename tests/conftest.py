@@ -0,0 +1,41 @@
+"""Fixtures shared by the ORM tests."""
+
+import pytest
+
+from larapy.database.connection import Connection
+from larapy.database.orm.morph_map import MorphMap
+from tests.orm_models import MODELS, MORPH_MAP, SCHEMA
+
+
+@pytest.fixture
+def orm_connection():
+    """An in-memory database with the tests.orm_models schema, bound to its models."""
+    connection = Connection({"driver": "sqlite", "database": ":memory:"})
+    connection.connect()
+    for schema in SCHEMA:
+        connection.statement(f"CREATE TABLE {schema}")
+
+    MorphMap.set(MORPH_MAP)
+    for model in MODELS:
+        model._connection = connection
+
+    yield connection
+
+    MorphMap._map.clear()
+    MorphMap._reverse_map.clear()
+    for model in MODELS:
+        model._connection = None
+
+
+@pytest.fixture
+def queries(connection, monkeypatch):
+    """Record every SELECT run on the test module's connection."""
+    executed = []
+    select_rows = connection.select_rows
+
+    def counting_select_rows(query, bindings=None, use_read_pdo=True):
+        executed.append(query)
+        return select_rows(query, bindings, use_read_pdo)
+
+    monkeypatch.setattr(connection, "select_rows", counting_select_rows)
+    return executed
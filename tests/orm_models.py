@@ -0,0 +1,136 @@
+"""
+Model graph shared by the ORM relation tests.
+
+Covers every relationship type, including same-table and polymorphic ones;
+the orm_connection fixture in conftest.py creates the schema, and each test
+module seeds the rows its assertions count on.
+"""
+
+from larapy.database.orm.model import Model
+
+
+class Country(Model):
+    _table = "countries"
+    _timestamps = False
+
+    def users(self):
+        return self.has_many(User, "country_id")
+
+    def posts(self):
+        return self.has_many_through(Post, User, "country_id", "user_id", "id", "id")
+
+    def profile(self):
+        return self.has_one_through(Profile, User, "country_id", "user_id", "id", "id")
+
+
+class User(Model):
+    _table = "users"
+    _timestamps = False
+
+    def country(self):
+        return self.belongs_to(Country, "country_id")
+
+    def manager(self):
+        return self.belongs_to(User, "manager_id")
+
+    def reports(self):
+        return self.has_many(User, "manager_id")
+
+    def profile(self):
+        return self.has_one(Profile, "user_id")
+
+    def posts(self):
+        return self.has_many(Post, "user_id")
+
+    def roles(self):
+        return self.belongs_to_many(Role, "role_user", "user_id", "role_id")
+
+    def avatar(self):
+        return self.morph_one(Image, "imageable")
+
+    def images(self):
+        return self.morph_many(Image, "imageable")
+
+
+class Profile(Model):
+    _table = "profiles"
+    _timestamps = False
+
+    def user(self):
+        return self.belongs_to(User, "user_id")
+
+
+class Role(Model):
+    _table = "roles"
+    _timestamps = False
+
+    def users(self):
+        return self.belongs_to_many(User, "role_user", "role_id", "user_id")
+
+
+class Post(Model):
+    _table = "posts"
+    _timestamps = False
+
+    def user(self):
+        return self.belongs_to(User, "user_id")
+
+    def comments(self):
+        return self.has_many(Comment, "post_id")
+
+    def approved_comments(self):
+        return self.has_many(Comment, "post_id").where("approved", 1)
+
+    def images(self):
+        return self.morph_many(Image, "imageable")
+
+    def tags(self):
+        return self.morph_to_many(Tag, "taggable")
+
+
+class Comment(Model):
+    _table = "comments"
+    _timestamps = False
+
+    def post(self):
+        return self.belongs_to(Post, "post_id")
+
+    def author(self):
+        return self.belongs_to(User, "user_id")
+
+
+class Image(Model):
+    _table = "images"
+    _timestamps = False
+
+    def imageable(self):
+        return self.morph_to("imageable")
+
+
+class Tag(Model):
+    _table = "tags"
+    _timestamps = False
+
+    def posts(self):
+        return self.morphed_by_many(Post, "taggable")
+
+
+MODELS = [Country, User, Profile, Role, Post, Comment, Image, Tag]
+
+SCHEMA = [
+    "countries (id INTEGER PRIMARY KEY, name TEXT)",
+    "users (id INTEGER PRIMARY KEY, name TEXT, country_id INTEGER, manager_id INTEGER)",
+    "profiles (id INTEGER PRIMARY KEY, bio TEXT, user_id INTEGER)",
+    "roles (id INTEGER PRIMARY KEY, name TEXT)",
+    "role_user (role_id INTEGER, user_id INTEGER)",
+    "posts (id INTEGER PRIMARY KEY, title TEXT, user_id INTEGER)",
+    "comments (id INTEGER PRIMARY KEY, body TEXT, votes INTEGER, approved INTEGER, post_id INTEGER, user_id INTEGER)",
+    "images (id INTEGER PRIMARY KEY, url TEXT, imageable_type TEXT, imageable_id INTEGER)",
+    "tags (id INTEGER PRIMARY KEY, name TEXT)",
+    "taggables (tag_id INTEGER, taggable_id INTEGER, taggable_type TEXT)",
+]
+
+MORPH_MAP = {
+    "user": f"{User.__module__}.{User.__name__}",
+    "post": f"{Post.__module__}.{Post.__name__}",
+}
@@ -0,0 +1,469 @@
+"""
+Tests for the ASGI application adapter.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from larapy.container.container import Container
+from larapy.foundation.application import Application
+from larapy.foundation.http.asgi import AsgiApplication
+from larapy.http.exceptions import HttpException
+from larapy.http.kernel import Kernel
+from larapy.http.response import BinaryFileResponse, Response, StreamedResponse
+from larapy.routing.router import Router
+
+
+class AsgiClient:
+    """Minimal in-process ASGI client."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method, path, body=b'', headers=None, chunks=None, extensions=None,
+                      disconnect_after=None):
+        query = b''
+        if '?' in path:
+            path, query = path.split('?', 1)
+            query = query.encode()
+
+        scope = {
+            'type': 'http',
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'query_string': query,
+            'headers': [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+            'client': ('127.0.0.1', 5000),
+            'server': ('testserver', 80),
+            'extensions': extensions or {},
+        }
+        parts = list(chunks) if chunks is not None else [body]
+        self.received = 0
+        messages = []
+        disconnected = asyncio.Event()
+
+        async def receive():
+            if parts:
+                self.received += 1
+                chunk = parts.pop(0)
+                return {'type': 'http.request', 'body': chunk, 'more_body': bool(parts)}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+            bodies = [m for m in messages if m['type'] == 'http.response.body']
+            if disconnect_after is not None and len(bodies) >= disconnect_after:
+                disconnected.set()
+
+        await self.app(scope, receive, send)
+
+        start = messages[0]
+        return {
+            'status': start['status'],
+            'headers': {k.decode(): v.decode() for k, v in start['headers']},
+            'header_list': [(k.decode(), v.decode()) for k, v in start['headers']],
+            'messages': messages[1:],
+            'body': b''.join(m.get('body', b'') for m in messages[1:]),
+        }
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def router():
+    return Router()
+
+
+@pytest.fixture
+def client(router):
+    app = AsgiApplication(router, max_workers=4, chunk_size=4)
+    yield AsgiClient(app)
+    app.shutdown()
+
+
+class TestAsgiRequests:
+    def test_sync_route(self, router, client):
+        router.get('/hello/{name}', lambda request: f"hello {request.route('name')}")
+
+        response = run(client.request('GET', '/hello/taylor'))
+
+        assert response['status'] == 200
+        assert response['body'] == b'hello taylor'
+        assert response['headers']['content-length'] == '12'
+
+    def test_async_route_runs_on_event_loop(self, router, client):
+        async def show(request):
+            await asyncio.sleep(0)
+            return {'thread': threading.current_thread().name}
+
+        router.get('/async', show)
+
+        response = run(client.request('GET', '/async'))
+
+        assert json.loads(response['body']) == {'thread': threading.current_thread().name}
+        assert response['headers']['content-type'] == 'application/json'
+
+    def test_sync_route_runs_on_thread_pool(self, router, client):
+        router.get('/sync', lambda request: threading.current_thread().name)
+
+        response = run(client.request('GET', '/sync'))
+
+        assert response['body'].startswith(b'larapy-asgi')
+
+    def test_request_is_built_from_scope(self, router, client):
+        def show(request):
+            return {
+                'method': request.method(),
+                'path': request.path(),
+                'page': request.query('page'),
+                'tags': request.query('tags'),
+                'ip': request.ip(),
+                'host': request.host(),
+                'cookie': request.cookie('session'),
+                'agent': request.header('User-Agent'),
+            }
+
+        router.get('/users', show)
+
+        response = run(client.request(
+            'GET', '/users?page=2&tags[]=a&tags[]=b',
+            headers={'Host': 'example.com', 'Cookie': 'session=abc; theme=dark', 'User-Agent': 'test'},
+        ))
+
+        assert json.loads(response['body']) == {
+            'method': 'GET', 'path': 'users', 'page': '2', 'tags': ['a', 'b'],
+            'ip': '127.0.0.1', 'host': 'example.com', 'cookie': 'abc', 'agent': 'test',
+        }
+
+    def test_json_and_form_bodies_are_parsed(self, router, client):
+        router.post('/json', lambda request: request.input('name'))
+        router.post('/form', lambda request: request.input('name'))
+
+        json_response = run(client.request(
+            'POST', '/json', chunks=[b'{"name":', b' "ada"}'],
+            headers={'Content-Type': 'application/json'},
+        ))
+        form_response = run(client.request(
+            'POST', '/form', body=b'name=grace', headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        ))
+
+        assert json_response['body'] == b'ada'
+        assert form_response['body'] == b'grace'
+
+    def test_oversized_form_body_is_rejected(self, router):
+        router.post('/form', lambda request: 'ok')
+        app = AsgiApplication(router, max_buffered_body=8)
+
+        response = run(AsgiClient(app).request(
+            'POST', '/form', body=b'name=' + b'x' * 20,
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        ))
+        app.shutdown()
+
+        assert response['status'] == 413
+
+    def test_other_bodies_are_streamed_to_sync_routes(self, router, client):
+        seen = {}
+
+        def upload(request):
+            seen['before'] = client.received
+            chunks = list(request.stream())
+            seen['after'] = client.received
+            return b''.join(chunks)
+
+        router.post('/upload', upload)
+
+        response = run(client.request('POST', '/upload', chunks=[b'ab', b'cd', b'ef']))
+
+        assert response['body'] == b'abcdef'
+        assert seen == {'before': 0, 'after': 3}
+
+    def test_other_bodies_are_streamed_to_async_routes(self, router, client):
+        async def upload(request):
+            size = 0
+            async for chunk in request.stream():
+                size += len(chunk)
+            return str(size)
+
+        router.post('/upload', upload)
+
+        response = run(client.request('POST', '/upload', chunks=[b'a' * 10, b'b' * 5]))
+
+        assert response['body'] == b'15'
+
+    def test_head_request_has_no_body(self, router, client):
+        router.get('/page', lambda request: 'content')
+
+        response = run(client.request('HEAD', '/page'))
+
+        assert response['headers']['content-length'] == '7'
+        assert response['body'] == b''
+
+    def test_not_found(self, client):
+        response = run(client.request('GET', '/missing'))
+
+        assert response['status'] == 404
+
+    def test_http_exception_is_rendered(self, router, client):
+        def forbidden(request):
+            raise HttpException(403, headers={'X-Reason': 'policy'})
+
+        router.get('/admin', forbidden)
+
+        response = run(client.request('GET', '/admin'))
+
+        assert response['status'] == 403
+        assert response['body'] == b'Forbidden'
+        assert response['headers']['x-reason'] == 'policy'
+
+    def test_unhandled_exception_returns_server_error(self, router, client):
+        async def broken(request):
+            raise ValueError('boom')
+
+        router.get('/broken', broken)
+
+        response = run(client.request('GET', '/broken'))
+
+        assert response['status'] == 500
+
+    def test_cookies_are_sent(self, router, client):
+        router.get('/login', lambda request: Response('ok').cookie('token', 'abc', minutes=1))
+
+        response = run(client.request('GET', '/login'))
+
+        assert ('set-cookie', 'token=abc; Path=/; Max-Age=60; HttpOnly') in response['header_list']
+
+
+class TestAsgiMiddleware:
+    def make_app(self, router, middleware, max_workers=4):
+        container = Container()
+        kernel = Kernel(container)
+        for m in middleware:
+            kernel.append(m)
+        return AsgiApplication(router, kernel, max_workers=max_workers)
+
+    def test_sync_and_async_middleware_interleave(self, router):
+        order = []
+
+        async def first(request, next_handler):
+            order.append('first')
+            response = await next_handler(request)
+            order.append('first-after')
+            return response
+
+        def second(request, next_handler):
+            order.append('second')
+            return next_handler(request)
+
+        async def third(request, next_handler):
+            order.append('third')
+            return await next_handler(request)
+
+        class Fourth:
+            def handle(self, request, next_handler):
+                order.append('fourth')
+                response = next_handler(request)
+                response.header('X-Fourth', 'yes')
+                return response
+
+        async def action(request):
+            order.append('action')
+            return Response('done')
+
+        router.get('/chain', action)
+        app = self.make_app(router, [first, second, third, Fourth()])
+
+        response = run(AsgiClient(app).request('GET', '/chain'))
+        app.shutdown()
+
+        assert response['body'] == b'done'
+        assert response['headers']['x-fourth'] == 'yes'
+        assert order == ['first', 'second', 'third', 'fourth', 'action', 'first-after']
+
+    def test_route_middleware_and_terminate(self, router):
+        terminated = []
+
+        class Authenticate:
+            async def handle(self, request, next_handler):
+                if request.header('Authorization') != 'secret':
+                    return Response('Unauthorized', 401)
+                return await next_handler(request)
+
+            def terminate(self, request, response):
+                terminated.append(response.status())
+
+        router.get('/private', lambda request: 'private').middleware('auth')
+        router.get('/public', lambda request: 'public')
+
+        app = self.make_app(router, [])
+        app.kernel.aliasMiddleware('auth', Authenticate)
+        client = AsgiClient(app)
+
+        assert run(client.request('GET', '/public'))['status'] == 200
+        assert run(client.request('GET', '/private'))['status'] == 401
+        assert run(client.request('GET', '/private', headers={'Authorization': 'secret'}))['body'] == b'private'
+        app.shutdown()
+
+        assert terminated == [401, 200]
+
+    def test_mixed_chains_do_not_exhaust_the_pool(self, router):
+        def sync_middleware(request, next_handler):
+            return next_handler(request)
+
+        async def async_middleware(request, next_handler):
+            await asyncio.sleep(0.01)
+            return await next_handler(request)
+
+        def action(request):
+            time.sleep(0.01)
+            return 'ok'
+
+        router.get('/mixed', action)
+        app = self.make_app(router, [sync_middleware, async_middleware, sync_middleware], max_workers=2)
+        client = AsgiClient(app)
+
+        async def main():
+            return await asyncio.wait_for(
+                asyncio.gather(*(client.request('GET', '/mixed') for _ in range(20))), timeout=10
+            )
+
+        responses = run(main())
+        app.shutdown()
+
+        assert [r['body'] for r in responses] == [b'ok'] * 20
+
+
+class TestAsgiStreaming:
+    def test_streamed_generator_is_sent_in_chunks(self, router, client):
+        router.get('/stream', lambda request: StreamedResponse((f'line {i}\n' for i in range(3))))
+
+        response = run(client.request('GET', '/stream'))
+
+        bodies = [m['body'] for m in response['messages']]
+        assert bodies == [b'line 0\n', b'line 1\n', b'line 2\n', b'']
+        assert 'content-length' not in response['headers']
+        assert response['headers']['x-accel-buffering'] == 'no'
+
+    def test_streamed_async_generator(self, router, client):
+        async def events():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield f'data: {i}\n\n'
+
+        router.get('/events', lambda request: StreamedResponse(events))
+
+        response = run(client.request('GET', '/events'))
+
+        assert response['body'] == b'data: 0\n\ndata: 1\n\ndata: 2\n\n'
+
+    def test_stream_stops_when_client_disconnects(self, router, client):
+        produced = []
+
+        async def events():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    await asyncio.sleep(0.001)
+                    yield f'{i}\n'
+            finally:
+                produced.append('closed')
+
+        router.get('/events', lambda request: StreamedResponse(events()))
+
+        run(client.request('GET', '/events', disconnect_after=3))
+
+        assert len(produced) < 50
+        assert produced[-1] == 'closed'
+
+    def test_binary_file_response_is_sent_in_chunks(self, router, client, tmp_path):
+        path = tmp_path / 'report.txt'
+        path.write_bytes(b'0123456789')
+        router.get('/download', lambda request: BinaryFileResponse(str(path), disposition='attachment'))
+
+        response = run(client.request('GET', '/download'))
+
+        assert [m['body'] for m in response['messages']] == [b'0123', b'4567', b'89', b'']
+        assert response['headers']['content-length'] == '10'
+        assert response['headers']['content-type'] == 'text/plain'
+        assert response['headers']['content-disposition'] == 'attachment; filename="report.txt"'
+
+    def test_binary_file_response_uses_pathsend(self, router, client, tmp_path):
+        path = tmp_path / 'image.png'
+        path.write_bytes(b'png')
+        router.get('/image', lambda request: BinaryFileResponse(str(path)))
+
+        response = run(client.request('GET', '/image', extensions={'http.response.pathsend': {}}))
+
+        assert response['messages'] == [{'type': 'http.response.pathsend', 'path': str(path)}]
+
+    def test_binary_file_range(self, router, client, tmp_path):
+        path = tmp_path / 'data.bin'
+        path.write_bytes(b'0123456789')
+        router.get('/data', lambda request: BinaryFileResponse(str(path)))
+
+        response = run(client.request('GET', '/data', headers={'Range': 'bytes=3-8'},
+                                      extensions={'http.response.pathsend': {}}))
+
+        assert response['status'] == 206
+        assert response['headers']['content-range'] == 'bytes 3-8/10'
+        assert response['body'] == b'345678'
+
+
+class TestAsgiConcurrency:
+    def test_slow_async_clients_share_one_thread(self, router):
+        async def slow(request):
+            await asyncio.sleep(0.2)
+            return 'ok'
+
+        router.get('/slow', slow)
+        app = AsgiApplication(router, max_workers=2)
+        client = AsgiClient(app)
+
+        async def main():
+            return await asyncio.gather(*(client.request('GET', '/slow') for _ in range(500)))
+
+        started = time.perf_counter()
+        responses = run(main())
+        elapsed = time.perf_counter() - started
+        app.shutdown()
+
+        assert all(r['body'] == b'ok' for r in responses)
+        assert elapsed < 2
+
+
+class TestAsgiApplicationFactory:
+    def test_from_application(self, tmp_path):
+        app = Application(str(tmp_path))
+        router = Router(app)
+        router.get('/', lambda request: 'home')
+        app.instance('router', router)
+
+        asgi = AsgiApplication.from_application(app)
+
+        assert asgi.router is router
+        assert run(AsgiClient(asgi).request('GET', '/'))['body'] == b'home'
+        asgi.shutdown()
+
+    def test_lifespan(self, router):
+        app = AsgiApplication(router)
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message['type'])
+
+        run(app({'type': 'lifespan'}, receive, send))
+
+        assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+
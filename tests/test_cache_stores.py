@@ -0,0 +1,152 @@
+"""
+Tests for Cache Stores
+
+Tests the interchangeable cache backends:
+- ArrayStore LRU eviction and TTL
+- FileStore persistence across instances
+- RedisStore serialization
+- make_store() configuration
+"""
+
+import time
+
+import pytest
+from larapy.cache import ArrayStore, FileStore, RedisStore, make_store
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis-py client API the store uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip('*')
+        return [key for key in self.data if key.startswith(prefix)]
+
+
+class TestArrayStore:
+    """Test the in-memory LRU store."""
+
+    def test_put_and_get(self):
+        store = ArrayStore()
+        store.put('key', [{'id': 1}])
+
+        assert store.get('key') == [{'id': 1}]
+        assert store.get('missing') is None
+
+    def test_evicts_least_recently_used(self):
+        store = ArrayStore(max_items=2)
+        store.put('a', 1)
+        store.put('b', 2)
+        store.get('a')
+        store.put('c', 3)
+
+        assert store.get('a') == 1
+        assert store.get('b') is None
+        assert store.get('c') == 3
+        assert store.size() == 2
+
+    def test_ttl_expiration(self):
+        store = ArrayStore()
+        store.put('key', 'value', ttl=0.05)
+
+        time.sleep(0.1)
+
+        assert store.get('key') is None
+
+    def test_forget_and_flush(self):
+        store = ArrayStore()
+        store.put('a', 1)
+        store.put('b', 2)
+
+        assert store.forget('a') is True
+        assert store.forget('a') is False
+
+        store.flush()
+
+        assert store.size() == 0
+
+
+class TestFileStore:
+    """Test the file-backed store."""
+
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        FileStore(str(tmp_path)).put('key', [{'id': 1, 'name': 'John'}])
+
+        assert FileStore(str(tmp_path)).get('key') == [{'id': 1, 'name': 'John'}]
+
+    def test_ttl_expiration(self, tmp_path):
+        store = FileStore(str(tmp_path))
+        store.put('key', 'value', ttl=0.05)
+
+        time.sleep(0.1)
+
+        assert store.get('key') is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_forget_and_flush(self, tmp_path):
+        store = FileStore(str(tmp_path))
+        store.put('a', 1)
+        store.put('b', 2)
+
+        assert store.forget('a') is True
+        assert store.get('a') is None
+
+        store.flush()
+
+        assert store.get('b') is None
+
+
+class TestRedisStore:
+    """Test the Redis store against a fake client."""
+
+    def test_values_round_trip(self):
+        store = RedisStore(FakeRedis())
+        store.put('rows', [{'id': 1}], ttl=60)
+        store.put('version', 7)
+
+        assert store.get('rows') == [{'id': 1}]
+        assert store.get('version') == 7
+        assert store.get('missing') is None
+
+    def test_keys_are_prefixed_and_flush_only_touches_the_prefix(self):
+        redis = FakeRedis()
+        redis.set('other', b'1')
+        store = RedisStore(redis, prefix='app:')
+        store.put('key', 'value')
+
+        assert 'app:key' in redis.data
+
+        store.flush()
+
+        assert list(redis.data) == ['other']
+
+
+class TestMakeStore:
+    """Test building stores from configuration."""
+
+    def test_builds_each_driver(self, tmp_path):
+        assert isinstance(make_store({'driver': 'array', 'max_items': 5}), ArrayStore)
+        assert isinstance(make_store({'driver': 'file', 'path': str(tmp_path)}), FileStore)
+        assert isinstance(make_store({'driver': 'redis'}, FakeRedis()), RedisStore)
+
+    def test_redis_requires_a_client(self):
+        with pytest.raises(ValueError):
+            make_store({'driver': 'redis'})
+
+    def test_unknown_driver(self):
+        with pytest.raises(ValueError):
+            make_store({'driver': 'memcached'})
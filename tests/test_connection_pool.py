@@ -2,11 +2,13 @@
 Tests for Connection Pool Implementation
 """
 
+import asyncio
 import pytest
 import time
 import threading
 from unittest.mock import Mock, MagicMock
 from larapy.database.connection_pool import (
+    AsyncConnectionPool,
     ConnectionPool,
     PooledConnection,
     set_global_pool,
@@ -320,6 +322,202 @@ class TestConnectionPool:
         pool.close()
 
 
+class TestConnectionPoolWaiting:
+    """Test condition-variable waiting and hand-off"""
+
+    def _wait_for_waiters(self, pool, count):
+        deadline = time.monotonic() + 2
+        while pool.stats()['waiting'] < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_waiters_are_served_in_fifo_order(self):
+        pool = ConnectionPool(create_mock_connection, min_size=1, max_size=1, enable_cleanup=False)
+        held = pool.get_connection()
+        order = []
+
+        def worker(index):
+            conn = pool.get_connection(timeout=2.0)
+            order.append(index)
+            pool.return_connection(conn)
+
+        threads = []
+        for index in range(4):
+            thread = threading.Thread(target=worker, args=(index,))
+            thread.start()
+            self._wait_for_waiters(pool, index + 1)
+            threads.append(thread)
+
+        pool.return_connection(held)
+        for thread in threads:
+            thread.join()
+
+        assert order == [0, 1, 2, 3]
+        assert pool.size() == 1
+        pool.close()
+
+    def test_returned_connection_is_handed_off_immediately(self):
+        pool = ConnectionPool(create_mock_connection, min_size=1, max_size=1, enable_cleanup=False)
+        held = pool.get_connection()
+        acquired = []
+
+        def worker():
+            conn = pool.get_connection(timeout=2.0)
+            acquired.append((time.monotonic(), conn))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self._wait_for_waiters(pool, 1)
+
+        released_at = time.monotonic()
+        pool.return_connection(held)
+        thread.join()
+
+        assert acquired[0][1] is held
+        assert acquired[0][0] - released_at < 0.05
+        pool.close()
+
+    def test_timed_out_waiter_leaves_the_queue(self):
+        pool = ConnectionPool(create_mock_connection, min_size=1, max_size=1, enable_cleanup=False)
+        held = pool.get_connection()
+
+        with pytest.raises(TimeoutError):
+            pool.get_connection(timeout=0.05)
+
+        pool.return_connection(held)
+
+        assert pool.get_connection(timeout=0.05) is held
+        assert pool.stats()['waiting'] == 0
+        pool.close()
+
+    def test_discarded_connection_frees_room_for_a_waiter(self):
+        healthy = [True]
+        pool = ConnectionPool(
+            create_mock_connection,
+            min_size=0,
+            max_size=1,
+            enable_cleanup=False,
+            validator=lambda conn: healthy[0],
+        )
+        held = pool.get_connection()
+        healthy[0] = False
+        pool.return_connection(held)
+
+        conn = pool.get_connection(timeout=0.5)
+
+        assert conn is not held
+        assert held.connection.closed is True
+        pool.close()
+
+    def test_connections_past_max_lifetime_are_replaced(self):
+        pool = ConnectionPool(create_mock_connection, min_size=1, max_size=1, max_lifetime=0.05, enable_cleanup=False)
+        first = pool.get_connection()
+        pool.return_connection(first)
+
+        time.sleep(0.1)
+        second = pool.get_connection()
+
+        assert second is not first
+        assert first.connection.closed is True
+        pool.close()
+
+    def test_overflow_connections_are_closed_on_return(self):
+        pool = ConnectionPool(create_mock_connection, min_size=0, max_size=1, max_overflow=1, enable_cleanup=False)
+        first = pool.get_connection()
+        second = pool.get_connection()
+
+        with pytest.raises(TimeoutError):
+            pool.get_connection(timeout=0.05)
+
+        pool.return_connection(first)
+        pool.return_connection(second)
+
+        assert pool.size() == 1
+        assert second.connection.closed is True
+        pool.close()
+
+    def test_close_wakes_waiters(self):
+        pool = ConnectionPool(create_mock_connection, min_size=1, max_size=1, enable_cleanup=False)
+        pool.get_connection()
+        errors = []
+
+        def worker():
+            try:
+                pool.get_connection(timeout=5.0)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self._wait_for_waiters(pool, 1)
+        pool.close()
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+
+class TestAsyncConnectionPool:
+    """Test the asyncio connection pool"""
+
+    async def test_get_and_return(self):
+        pool = AsyncConnectionPool(create_mock_connection, max_size=2)
+
+        async with pool.connection() as conn:
+            assert conn.execute("SELECT 1") == "Result: SELECT 1"
+            assert pool.in_use() == 1
+
+        assert pool.in_use() == 0
+        assert pool.available() == 1
+        await pool.close()
+
+    async def test_async_factory_and_fifo_hand_off(self):
+        async def factory():
+            return MockConnection()
+
+        pool = AsyncConnectionPool(factory, max_size=1)
+        held = await pool.get_connection()
+        order = []
+
+        async def worker(index):
+            async with pool.connection(timeout=1.0):
+                order.append(index)
+
+        tasks = [asyncio.ensure_future(worker(index)) for index in range(3)]
+        await asyncio.sleep(0)
+        assert pool.stats()['waiting'] == 3
+
+        pool.return_connection(held)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2]
+        assert pool.size() == 1
+        await pool.close()
+
+    async def test_timeout_leaves_the_queue(self):
+        pool = AsyncConnectionPool(create_mock_connection, max_size=1)
+        held = await pool.get_connection()
+
+        with pytest.raises(TimeoutError):
+            await pool.get_connection(timeout=0.05)
+
+        pool.return_connection(held)
+
+        assert await pool.get_connection(timeout=0.05) is held
+        await pool.close()
+
+    async def test_unhealthy_connection_is_replaced(self):
+        pool = AsyncConnectionPool(create_mock_connection, max_size=1, validator=lambda conn: not conn.closed)
+        first = await pool.get_connection()
+        pool.return_connection(first)
+        first.connection.closed = True
+
+        second = await pool.get_connection()
+
+        assert second is not first
+        assert pool.size() == 1
+        await pool.close()
+
+
 class TestGlobalPool:
     """Test global pool functions"""
     
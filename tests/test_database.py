@@ -1,10 +1,17 @@
 """Tests for the database query builder and schema builder."""
 import os
+import threading
+import tracemalloc
 import pytest
-from larapy.database.connection import Connection
+from unittest.mock import Mock
+from larapy.container.container import Container
+from larapy.database.connection import Connection, ExpandingList
 from larapy.database.database_manager import DatabaseManager
 from larapy.database.query.builder import QueryBuilder
 from larapy.database.schema.schema import Schema, Blueprint
+from larapy.http.kernel import Kernel
+from larapy.http.middleware import ForgetRecordsModification
+from larapy.queue.worker import Worker
 
 
 # Test configuration
@@ -116,14 +123,349 @@ class TestConnection:
         results = connection.select('SELECT * FROM users')
         assert len(results) == 0
     
+    def test_after_commit_runs_immediately_outside_a_transaction(self, connection):
+        calls = []
+        connection.after_commit(lambda: calls.append('ran'))
+
+        assert calls == ['ran']
+
+    def test_after_commit_waits_for_the_outermost_commit(self, connection):
+        calls = []
+        connection.begin_transaction()
+        connection.after_commit(lambda: calls.append('outer'))
+        connection.begin_transaction()
+        connection.after_commit(lambda: calls.append('inner'))
+        connection.commit()
+
+        assert calls == []
+
+        connection.commit()
+
+        assert calls == ['outer', 'inner']
+
+    def test_after_commit_discards_rolled_back_callbacks(self, connection):
+        calls = []
+        connection.begin_transaction()
+        connection.after_commit(lambda: calls.append('outer'))
+        connection.begin_transaction()
+        connection.after_commit(lambda: calls.append('savepoint'))
+        connection.rollback()
+        connection.commit()
+
+        assert calls == ['outer']
+
     def test_gets_table_query_builder(self, connection, schema, users_table):
         builder = connection.table('users')
         
         assert isinstance(builder, QueryBuilder)
         assert builder._table == 'users'
 
+    def test_reuses_compiled_statements(self, connection, schema, users_table):
+        connection.flush_statement_cache()
+
+        for name in ['John Doe', 'Jane Doe', 'Bob Smith']:
+            connection.select('SELECT * FROM users WHERE name = ?', [name])
+
+        stats = connection.statement_cache_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 2
+        assert stats['size'] == 1
+
+    def test_statement_cache_evicts_least_recently_used(self, schema, users_table):
+        conn = Connection({'driver': 'sqlite', 'database': ':memory:', 'statement_cache_size': 2})
+        conn.connect()
+
+        conn.select('SELECT 1 WHERE 1 = ?', [1])
+        conn.select('SELECT 2 WHERE 1 = ?', [1])
+        conn.select('SELECT 1 WHERE 1 = ?', [1])
+        conn.select('SELECT 3 WHERE 1 = ?', [1])
+
+        keys = [key[0] for key in conn._statements]
+        assert keys == ['SELECT 1 WHERE 1 = ?', 'SELECT 3 WHERE 1 = ?']
+        conn.disconnect()
+
+    def test_expanding_list_binding_expands(self, connection, schema, users_table):
+        connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['John Doe', 'john@example.com'])
+        connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['Jane Doe', 'jane@example.com'])
+
+        results = connection.select(
+            'SELECT * FROM users WHERE name IN ? AND email != ?', [ExpandingList(['John Doe', 'Jane Doe']), 'x']
+        )
+
+        assert len(results) == 2
+        assert connection.select('SELECT * FROM users WHERE name IN ?', [ExpandingList()]) == []
+
+    def test_plain_list_binding_is_one_value(self, connection):
+        statement, params = connection._compile_statement('UPDATE posts SET tags = ?', [['a', 'b']])
+
+        assert str(statement) == 'UPDATE posts SET tags = :param_0'
+        assert params == {'param_0': ['a', 'b']}
+
+
+@pytest.fixture
+def pooled_connection(tmp_path):
+    """Create a pooled connection to a file-backed SQLite database."""
+    conn = Connection({'driver': 'sqlite', 'database': str(tmp_path / 'pooled.db'), 'pool_size': 2})
+    conn.connect()
+    conn.statement('CREATE TABLE users (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT)')
+    yield conn
+    conn.disconnect()
+
+
+class TestConnectionPooling:
+    def test_statements_return_connections_to_pool(self, pooled_connection):
+        pooled_connection.insert('INSERT INTO users (name) VALUES (?)', ['John Doe'])
+        pooled_connection.select('SELECT * FROM users')
+
+        stats = pooled_connection.pool_stats()
+        assert stats['checked_out'] == 0
+        assert stats['total'] == 1
+        assert stats['wait_count'] == 3
+
+    def test_transaction_pins_one_connection(self, pooled_connection):
+        seen_by_other_thread = []
+
+        def work():
+            pooled_connection.insert('INSERT INTO users (name) VALUES (?)', ['John Doe'])
+            assert pooled_connection.pool_stats()['checked_out'] == 1
+            assert len(pooled_connection.select('SELECT * FROM users')) == 1
+
+            reader = threading.Thread(
+                target=lambda: seen_by_other_thread.extend(pooled_connection.select('SELECT * FROM users'))
+            )
+            reader.start()
+            reader.join()
+
+        pooled_connection.transaction(work)
+
+        assert seen_by_other_thread == []
+        assert pooled_connection.pool_stats()['checked_out'] == 0
+        assert len(pooled_connection.select('SELECT * FROM users')) == 1
+
+    def test_threads_pin_separate_connections(self, pooled_connection):
+        barrier = threading.Barrier(2)
+        pinned = []
+
+        def work():
+            pooled_connection.begin_transaction()
+            pinned.append(pooled_connection.get_connection())
+            barrier.wait()
+            pooled_connection.rollback()
+
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pinned[0] is not pinned[1]
+        assert not pooled_connection.in_transaction()
+
+    def test_nested_transaction_uses_savepoint(self, pooled_connection):
+        def inner():
+            pooled_connection.insert('INSERT INTO users (name) VALUES (?)', ['Jane Doe'])
+            raise ValueError('inner')
+
+        def outer():
+            pooled_connection.insert('INSERT INTO users (name) VALUES (?)', ['John Doe'])
+            with pytest.raises(ValueError):
+                pooled_connection.transaction(inner)
+
+        pooled_connection.transaction(outer)
+
+        assert [row['name'] for row in pooled_connection.select('SELECT name FROM users')] == ['John Doe']
+
+    def test_cursor_holds_connection_until_exhausted(self, pooled_connection):
+        pooled_connection.insert('INSERT INTO users (name) VALUES (?)', ['John Doe'])
+        rows = pooled_connection.cursor('SELECT * FROM users')
+
+        next(rows)
+        assert pooled_connection.pool_stats()['checked_out'] == 1
+
+        assert list(rows) == []
+        assert pooled_connection.pool_stats()['checked_out'] == 0
+
+    def test_pre_ping_replaces_dead_connections(self, tmp_path):
+        conn = Connection({'driver': 'sqlite', 'database': str(tmp_path / 'ping.db'), 'pool_pre_ping': True})
+        conn.connect()
+        conn.select('SELECT 1')
+        conn._pool._idle[0].connection.close()
+
+        assert conn.select('SELECT 1 AS one') == [{'one': 1}]
+        assert conn.pool_stats()['total'] == 1
+        conn.disconnect()
+
+    def test_memory_database_is_not_pooled(self, connection):
+        assert connection.is_pooled() is False
+        assert connection.pool_stats() is None
+
+    def test_manager_reports_pool_stats(self, tmp_path):
+        manager = DatabaseManager({
+            'default': 'main',
+            'connections': {
+                'main': {'driver': 'sqlite', 'database': str(tmp_path / 'main.db')},
+                'memory': {'driver': 'sqlite', 'database': ':memory:'},
+            },
+        })
+        manager.select('SELECT 1')
+        manager.select('SELECT 1', connection_name='memory')
+
+        stats = manager.pool_stats()
+
+        assert list(stats) == ['main']
+        assert stats['main']['checked_out'] == 0
+        manager.disconnect()
+
+
+def seed_users_database(database, name):
+    seed = Connection({'driver': 'sqlite', 'database': database})
+    seed.statement('CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))')
+    seed.insert('INSERT INTO users (name) VALUES (?)', [name])
+    seed.disconnect()
+
+
+@pytest.fixture
+def split_config(tmp_path):
+    """Config writing to one SQLite file and reading from another."""
+    primary, replica = str(tmp_path / 'primary.db'), str(tmp_path / 'replica.db')
+    seed_users_database(primary, 'primary')
+    seed_users_database(replica, 'replica')
+
+    return {
+        'driver': 'sqlite',
+        'read': {'database': replica},
+        'write': {'database': primary},
+    }
+
+
+@pytest.fixture
+def split_connection(split_config):
+    conn = Connection(split_config)
+    conn.connect()
+    yield conn
+    conn.disconnect()
+
+
+class TestReadWriteSplitting:
+    def test_selects_read_from_the_replica(self, split_connection):
+        assert split_connection.select('SELECT name FROM users') == [{'name': 'replica'}]
+        assert split_connection.table('users').pluck('name') == ['replica']
+
+    def test_writes_go_to_the_primary(self, split_connection):
+        split_connection.table('users').insert({'name': 'new'})
+
+        names = split_connection.select('SELECT name FROM users', use_read_pdo=False)
+
+        assert [row['name'] for row in names] == ['primary', 'new']
+
+    def test_reads_stick_to_the_primary_after_a_write(self, split_connection):
+        split_connection.update('UPDATE users SET name = ? WHERE id = 1', ['changed'])
+
+        assert split_connection.has_modified_records() is True
+        assert split_connection.table('users').pluck('name') == ['changed']
+
+        split_connection.forget_records_modification()
+
+        assert split_connection.table('users').pluck('name') == ['replica']
+
+    def test_sticky_can_be_turned_off(self, split_config):
+        conn = Connection({**split_config, 'sticky': False})
+        conn.update('UPDATE users SET name = ? WHERE id = 1', ['changed'])
+
+        assert conn.table('users').pluck('name') == ['replica']
+        conn.disconnect()
+
+    def test_stickiness_is_scoped_to_the_thread(self, split_connection):
+        split_connection.update('UPDATE users SET name = ? WHERE id = 1', ['changed'])
+        names = []
+
+        thread = threading.Thread(
+            target=lambda: names.extend(split_connection.table('users').pluck('name'))
+        )
+        thread.start()
+        thread.join()
+
+        assert names == ['replica']
+
+    def test_use_write_pdo_forces_the_primary(self, split_connection):
+        assert split_connection.table('users').use_write_pdo().pluck('name') == ['primary']
+        assert [row['name'] for row in split_connection.table('users').use_write_pdo().cursor()] == ['primary']
+
+    def test_transactions_read_from_the_primary(self, split_connection):
+        split_connection.begin_transaction()
+        try:
+            assert split_connection.table('users').pluck('name') == ['primary']
+        finally:
+            split_connection.rollback()
+
+    def test_reads_are_spread_over_the_least_loaded_replica(self, tmp_path):
+        replicas = [str(tmp_path / f'replica{index}.db') for index in range(2)]
+
+        conn = Connection({
+            'driver': 'sqlite',
+            'database': str(tmp_path / 'primary.db'),
+            'read': {'database': replicas},
+        })
+        busy = conn.get_read_connection()
+        held = busy._get_pool().get_connection()
+
+        try:
+            for _ in range(5):
+                assert conn.get_read_connection() is not busy
+        finally:
+            busy._get_pool().return_connection(held)
+            conn.disconnect()
+
+    def test_manager_forgets_records_modification(self, split_config):
+        manager = DatabaseManager({'default': 'main', 'connections': {'main': split_config}})
+        manager.update('UPDATE users SET name = ? WHERE id = 1', ['changed'])
+
+        assert manager.select('SELECT name FROM users') == [{'name': 'changed'}]
+
+        manager.forget_records_modification()
+
+        assert manager.select('SELECT name FROM users') == [{'name': 'replica'}]
+        manager.disconnect()
+
+    def test_queue_jobs_do_not_inherit_stickiness(self, split_config):
+        manager = DatabaseManager({'default': 'main', 'connections': {'main': split_config}})
+        container = Container()
+        container.instance('db', manager)
+        worker = Worker(Mock(), container=container)
+        names = []
+
+        def job(action):
+            return Mock(fire=action, timeout=Mock(return_value=None))
+
+        worker.process(job(lambda: manager.update('UPDATE users SET name = ? WHERE id = 1', ['changed'])), 'sync', {})
+        worker.process(job(lambda: names.extend(manager.table('users').pluck('name'))), 'sync', {})
+
+        assert names == ['replica']
+        manager.disconnect()
+
+    def test_terminable_middleware_forgets_records_modification(self, split_config):
+        manager = DatabaseManager({'default': 'main', 'connections': {'main': split_config}})
+        container = Container()
+        container.instance(DatabaseManager, manager)
+        kernel = Kernel(container).append(ForgetRecordsModification)
+
+        kernel.handle(Mock(_route_middleware=[]), lambda request: manager.update('UPDATE users SET name = ?', ['changed']))
+        kernel.terminate(Mock(_route_middleware=[]), None)
+
+        assert manager.select('SELECT name FROM users') == [{'name': 'replica'}]
+        manager.disconnect()
+
 
 class TestQueryBuilder:
+    def test_select_rows_returns_tuples_with_shared_columns(self, connection, schema, users_table):
+        connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['John Doe', 'john@example.com'])
+
+        columns, rows = connection.select_rows('SELECT id, name FROM users')
+
+        assert columns == ['id', 'name']
+        assert [tuple(row) for row in rows] == [(1, 'John Doe')]
+        assert connection.table('users').select('id', 'name').get_rows()[0] == ['id', 'name']
+
     def test_selects_all_records(self, connection, schema, users_table):
         connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['John Doe', 'john@example.com'])
         connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['Jane Doe', 'jane@example.com'])
@@ -179,6 +521,24 @@ class TestQueryBuilder:
         
         assert len(results) == 1
         assert results[0]['name'] == 'Bob Smith'
+
+    def test_where_in_sql_is_independent_of_list_size(self, connection, schema, users_table):
+        small = connection.table('users').where_in('id', [1, 2])
+        large = connection.table('users').where_in('id', list(range(5000)))
+
+        assert small.to_sql() == large.to_sql()
+        assert large._bindings == [list(range(5000))]
+
+    def test_where_in_with_large_list(self, connection, schema, users_table):
+        for i in range(3):
+            connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', [f'User {i}', f'user{i}@example.com'])
+        connection.flush_statement_cache()
+
+        ids = list(range(1, 10001))
+        assert connection.table('users').where_in('id', ids).count() == 3
+        assert connection.table('users').where_in('id', ids[:2]).where_not_null('age').count() == 0
+        assert connection.table('users').where_in('id', ids[:2]).count() == 2
+        assert connection.statement_cache_stats()['hits'] >= 1
     
     def test_where_null_clause(self, connection, schema, users_table):
         connection.insert('INSERT INTO users (name, email, age) VALUES (?, ?, ?)', ['John Doe', 'john@example.com', None])
@@ -220,6 +580,29 @@ class TestQueryBuilder:
         
         assert len(results) == 2
     
+    def test_or_where_nested_clauses(self, connection, schema, users_table):
+        connection.insert('INSERT INTO users (name, email, age) VALUES (?, ?, ?)', ['John Doe', 'john@example.com', 25])
+        connection.insert('INSERT INTO users (name, email, age) VALUES (?, ?, ?)', ['Jane Doe', 'jane@example.com', 30])
+        connection.insert('INSERT INTO users (name, email, age) VALUES (?, ?, ?)', ['Bob Smith', 'bob@example.com', 35])
+
+        query = connection.table('users') \
+            .where('age', '>', 30) \
+            .or_where(lambda q: q.where('age', '=', 30).where('name', '=', 'Jane Doe'))
+
+        assert query.to_sql() == 'SELECT * FROM users WHERE age > ? OR (age = ? AND name = ?)'
+        assert sorted(row['name'] for row in query.get()) == ['Bob Smith', 'Jane Doe']
+
+    def test_for_page_after_id(self, connection, schema, users_table):
+        connection.table('users').insert([
+            {'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(5)
+        ])
+        query = connection.table('users').order_by('id', 'desc')
+
+        page = query.clone().for_page_after_id(2, 2)
+
+        assert [row['id'] for row in page.get()] == [3, 4]
+        assert query.to_sql() == 'SELECT * FROM users ORDER BY id DESC'
+
     def test_order_by(self, connection, schema, users_table):
         connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['John Doe', 'john@example.com'])
         connection.insert('INSERT INTO users (name, email) VALUES (?, ?)', ['Jane Doe', 'jane@example.com'])
@@ -354,7 +737,134 @@ class TestQueryBuilder:
         count = connection.table('users').count()
         
         assert count == 2
+
+    def test_bulk_insert_is_chunked_to_parameter_limit(self, connection, schema, users_table, monkeypatch):
+        monkeypatch.setitem(connection._config, 'max_bindings', 10)
+        statements = []
+        original = connection.insert
+        monkeypatch.setattr(connection, 'insert', lambda query, bindings=None: statements.append(query) or original(query, bindings))
+
+        connection.table('users').insert([
+            {'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(12)
+        ])
+
+        assert len(statements) == 3
+        assert statements[0].count('(?, ?)') == 5
+        assert connection.table('users').count() == 12
+
+    def test_bulk_insert_respects_chunk_size(self, connection, schema, users_table):
+        statements = connection.table('users')._compile_insert_chunks(
+            [{'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(7)], chunk_size=3
+        )
+
+        assert [len(bindings) for _, bindings in statements] == [6, 6, 2]
+
+    def test_bulk_insert_groups_rows_by_columns(self, connection, schema, users_table):
+        connection.table('users').insert([
+            {'name': 'John Doe', 'email': 'john@example.com'},
+            {'name': 'Jane Doe', 'email': 'jane@example.com', 'age': 30},
+        ])
+
+        assert connection.table('users').where('name', 'Jane Doe').value('age') == 30
+        assert connection.table('users').where('name', 'John Doe').value('age') is None
+
+    def test_bulk_insert_rolls_back_all_chunks(self, connection, schema, users_table):
+        rows = [{'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(4)]
+        rows.append({'name': 'Duplicate', 'email': 'user0@example.com'})
+
+        with pytest.raises(Exception):
+            connection.table('users').insert(rows, chunk_size=2)
+
+        assert connection.table('users').count() == 0
+
+    def test_insert_many(self, connection, schema, users_table):
+        inserted = connection.table('users').insert_many([
+            {'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(5)
+        ])
+
+        assert inserted == 5
+        assert connection.table('users').count() == 5
+
+    def test_insert_get_ids(self, connection, schema, users_table):
+        ids = connection.table('users').insert_get_ids([
+            {'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(5)
+        ], chunk_size=2)
+
+        assert len(ids) == 5
+        assert connection.table('users').find(ids[3])['name'] == 'User 3'
     
+    def test_insert_or_ignore_skips_duplicates(self, connection, schema, users_table):
+        connection.table('users').insert({'name': 'John Doe', 'email': 'john@example.com'})
+
+        inserted = connection.table('users').insert_or_ignore([
+            {'name': 'Johnny', 'email': 'john@example.com'},
+            {'name': 'Jane Doe', 'email': 'jane@example.com'},
+        ])
+
+        assert inserted == 1
+        assert connection.table('users').count() == 2
+        assert connection.table('users').where('email', 'john@example.com').value('name') == 'John Doe'
+
+    def test_upsert_inserts_and_updates(self, connection, schema, users_table):
+        connection.table('users').insert({'name': 'John Doe', 'email': 'john@example.com', 'age': 30})
+
+        connection.table('users').upsert([
+            {'name': 'John Updated', 'email': 'john@example.com', 'age': 31},
+            {'name': 'Jane Doe', 'email': 'jane@example.com', 'age': 25},
+        ], 'email', ['age'])
+
+        john = connection.table('users').where('email', 'john@example.com').first()
+        assert john['age'] == 31
+        assert john['name'] == 'John Doe'
+        assert connection.table('users').count() == 2
+
+    def test_upsert_updates_every_other_column_by_default(self, connection, schema, users_table):
+        connection.table('users').insert({'name': 'John Doe', 'email': 'john@example.com', 'age': 30})
+
+        connection.table('users').upsert({'name': 'John Updated', 'email': 'john@example.com', 'age': 31}, ['email'])
+
+        john = connection.table('users').where('email', 'john@example.com').first()
+        assert john['name'] == 'John Updated'
+        assert john['age'] == 31
+
+    def test_upsert_compiles_on_duplicate_key_for_mysql(self, connection, monkeypatch):
+        monkeypatch.setitem(connection._config, 'driver', 'mysql')
+
+        clause = connection.table('users')._compile_upsert(['email'], ['name', 'age'])
+
+        assert clause == ' ON DUPLICATE KEY UPDATE name = VALUES(name), age = VALUES(age)'
+
+    def test_cursor_yields_rows_lazily(self, connection, schema, users_table):
+        connection.table('users').insert([
+            {'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(5)
+        ])
+
+        rows = connection.table('users').where('id', '>', 2).order_by('id').cursor(chunk_size=2)
+
+        assert not isinstance(rows, list)
+        assert [row['name'] for row in rows] == ['User 2', 'User 3', 'User 4']
+
+    def test_cursor_memory_stays_flat_on_large_table(self, tmp_path):
+        conn = Connection({'driver': 'sqlite', 'database': str(tmp_path / 'large.db')})
+        conn.connect()
+        conn.statement('CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT)')
+        conn.table('events').insert([{'payload': 'x' * 200} for _ in range(50000)])
+
+        def peak(consume):
+            tracemalloc.start()
+            try:
+                consume()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        streamed = peak(lambda: sum(1 for _ in conn.table('events').cursor(chunk_size=500)))
+        fetched = peak(lambda: len(conn.table('events').get()))
+        conn.disconnect()
+
+        assert streamed < 2 * 1024 * 1024
+        assert streamed * 10 < fetched
+
     def test_insert_get_id(self, connection, schema, users_table):
         last_id = connection.table('users').insert_get_id({
             'name': 'John Doe',
@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime
 from larapy.database.connection import Connection
 from larapy.database.orm import Model, Collection
+from larapy.pagination.cursor import Cursor
 
 
 class User(Model):
@@ -105,6 +106,49 @@ def test_model_find(connection):
     assert found_user.email == 'jane@example.com'
 
 
+def test_hydrated_models_track_changes_against_the_row(connection):
+    User._connection = connection
+    User.create({'name': 'Jane Doe', 'email': 'jane@example.com', 'age': 25})
+
+    user = User.query().first()
+
+    assert user._exists is True
+    assert user.is_dirty() is False
+    assert user.get_original('name') == 'Jane Doe'
+
+    user._attributes['age'] = 26
+    user.name = 'Janet'
+
+    assert user.get_dirty() == {'age': 26, 'name': 'Janet'}
+    assert user.get_original() == {**user.get_attributes(), 'age': 25, 'name': 'Jane Doe'}
+
+    user.save()
+
+    assert user.is_dirty() is False
+    assert User.find(user.get_key()).age == 26
+
+
+class CountingUser(User):
+    instances = 0
+
+    def __init__(self, attributes=None, connection=None):
+        super().__init__(attributes, connection)
+        CountingUser.instances += 1
+
+
+def test_models_overriding_init_are_constructed_normally(connection):
+    CountingUser._connection = connection
+    User._connection = connection
+    User.create({'name': 'Jane Doe', 'email': 'jane@example.com', 'age': 25})
+    CountingUser.instances = 0
+
+    user = CountingUser.query().first()
+
+    assert CountingUser.instances >= 1
+    assert user.name == 'Jane Doe'
+    assert user.is_dirty() is False
+
+
 def test_model_update(connection):
     User._connection = connection
     
@@ -314,6 +358,138 @@ def test_model_paginate(connection):
     assert len(paginated['data']) == 10
 
 
+def test_model_simple_paginate_skips_count(connection):
+    User._connection = connection
+
+    for i in range(25):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    statements = []
+    original = connection.select_rows
+    connection.select_rows = lambda query, *args: statements.append(query) or original(query, *args)
+
+    page = User.query().simple_paginate(per_page=10, page=3, path='/users')
+
+    assert len(page.items()) == 5
+    assert page.has_more_pages() is False
+    assert page.previous_page_url() == '/users?page=2'
+    assert page.next_page_url() is None
+    assert not any('COUNT' in query for query in statements)
+
+
+def test_model_chunk_by_id(connection):
+    User._connection = connection
+
+    for i in range(25):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    chunks = []
+    User.query().where('age', '>=', 22).chunk_by_id(10, lambda users: chunks.append([u.name for u in users]))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 3]
+    assert chunks[0][0] == 'User 3'
+    assert chunks[2][-1] == 'User 25'
+
+
+def test_model_chunk_by_id_tolerates_deletes_between_chunks(connection):
+    User._connection = connection
+
+    for i in range(10):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    seen = []
+
+    def process(users):
+        seen.extend(user.get_key() for user in users)
+        for user in users:
+            user.delete()
+
+    User.query().chunk_by_id(3, process)
+
+    assert seen == list(range(1, 11))
+
+
+def test_model_each_by_id_and_lazy_by_id(connection):
+    User._connection = connection
+
+    for i in range(7):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    names = []
+    completed = User.query().each_by_id(lambda user: names.append(user.name) if len(names) < 4 else False, count=3)
+
+    assert completed is False
+    assert names == ['User 1', 'User 2', 'User 3', 'User 4']
+    assert [user.get_key() for user in User.query().lazy_by_id(3)] == list(range(1, 8))
+
+
+def test_model_cursor_paginate(connection):
+    User._connection = connection
+
+    for i in range(25):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    first = User.query().cursor_paginate(per_page=10, path='/users')
+    second = User.query().cursor_paginate(per_page=10, cursor=first.next_cursor().encode())
+    third = User.query().cursor_paginate(per_page=10, cursor=second.next_cursor())
+    back = User.query().cursor_paginate(per_page=10, cursor=third.previous_cursor())
+
+    assert [user.get_key() for user in first.items()] == list(range(1, 11))
+    assert first.previous_cursor() is None
+    assert first.next_page_url().startswith('/users?cursor=')
+    assert [user.get_key() for user in second.items()] == list(range(11, 21))
+    assert [user.get_key() for user in third.items()] == list(range(21, 26))
+    assert third.next_cursor() is None
+    assert [user.get_key() for user in back.items()] == list(range(11, 21))
+    assert back.next_cursor().parameters() == {'id': 20}
+
+
+def test_model_cursor_paginate_with_multiple_orders(connection):
+    User._connection = connection
+
+    for i, age in enumerate([30, 20, 30, 20, 25]):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': age})
+
+    first = User.query().order_by('age', 'desc').order_by('id').cursor_paginate(per_page=2)
+    second = User.query().order_by('age', 'desc').order_by('id').cursor_paginate(per_page=2, cursor=first.next_cursor())
+    third = User.query().order_by('age', 'desc').order_by('id').cursor_paginate(per_page=2, cursor=second.next_cursor())
+
+    assert [user.get_key() for user in first.items()] == [1, 3]
+    assert [user.get_key() for user in second.items()] == [5, 2]
+    assert [user.get_key() for user in third.items()] == [4]
+
+
+def test_model_keyset_pagination_with_table_qualified_columns(connection):
+    User._connection = connection
+
+    for i in range(5):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    chunks = []
+    User.query().chunk_by_id(2, lambda users: chunks.append([u.get_key() for u in users]), 'users.id')
+
+    assert chunks == [[1, 2], [3, 4], [5]]
+    assert [user.get_key() for user in User.query().lazy_by_id(2, 'users.id')] == [1, 2, 3, 4, 5]
+
+    first = User.query().order_by('users.id').cursor_paginate(per_page=2)
+    second = User.query().order_by('users.id').cursor_paginate(per_page=2, cursor=first.next_cursor())
+
+    assert first.next_cursor().parameters() == {'users.id': 2}
+    assert [user.get_key() for user in second.items()] == [3, 4]
+
+
+def test_model_cursor_paginate_restarts_on_a_cursor_without_the_order_columns(connection):
+    User._connection = connection
+
+    for i in range(3):
+        User.create({'name': f'User {i+1}', 'email': f'user{i+1}@example.com', 'age': 20 + i})
+
+    forged = Cursor({'age': 21}).encode()
+    page = User.query().cursor_paginate(per_page=2, cursor=forged)
+
+    assert [user.get_key() for user in page.items()] == [1, 2]
+
+
 def test_model_exists_and_doesnt_exist(connection):
     User._connection = connection
     
@@ -384,3 +560,37 @@ def test_nested_relationships(connection):
     
     assert post_comments.count() == 2
     assert all(comment.post_id == post.get_key() for comment in post_comments)
+
+
+def test_model_upsert_fills_timestamps(connection):
+    User._connection = connection
+    connection.statement('CREATE UNIQUE INDEX users_email_unique ON users (email)')
+
+    User.create({'name': 'John Doe', 'email': 'john@example.com', 'age': 30})
+    connection.table('users').update({'created_at': '2020-01-01 00:00:00', 'updated_at': '2020-01-01 00:00:00'})
+
+    User.upsert([
+        {'name': 'John Doe', 'email': 'john@example.com', 'age': 31},
+        {'name': 'Jane Doe', 'email': 'jane@example.com', 'age': 25},
+    ], 'email', ['age'])
+
+    john = User.where('email', 'john@example.com').first()
+    jane = User.where('email', 'jane@example.com').first()
+
+    assert john.age == 31
+    assert john.created_at == '2020-01-01 00:00:00'
+    assert john.updated_at != '2020-01-01 00:00:00'
+    assert jane.created_at is not None
+    assert jane.updated_at is not None
+
+
+def test_model_cursor_hydrates_lazily(connection):
+    User._connection = connection
+
+    for i in range(3):
+        User.create({'name': f'User {i}', 'email': f'user{i}@example.com', 'age': 20 + i})
+
+    users = User.query().order_by('id').cursor()
+
+    assert [user.name for user in users.take(2)] == ['User 0', 'User 1']
+    assert all(user._exists for user in users)
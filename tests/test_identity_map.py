@@ -0,0 +1,205 @@
+"""
+Tests for the ORM identity map.
+
+Inside a unit of work a row is loaded into one model instance, whether it
+is found by key, reached through a belongs-to or morph-to relation or bound
+from a route, and repeated lookups of the key do not query.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from larapy.database.connection import Connection
+from larapy.database.orm.identity_map import current_identity_map, unit_of_work
+from larapy.database.orm.model import Model
+from larapy.database.orm.morph_map import MorphMap
+from larapy.http.middleware import UseIdentityMap
+from larapy.queue.worker import Worker
+from larapy.routing.model_binder import ModelBinder
+
+
+class User(Model):
+    _table = "users"
+    _timestamps = False
+
+
+class Post(Model):
+    _table = "posts"
+    _timestamps = False
+
+    def author(self):
+        return self.belongs_to(User, "user_id")
+
+
+class Image(Model):
+    _table = "images"
+    _timestamps = False
+
+    def imageable(self):
+        return self.morph_to("imageable")
+
+
+MODELS = [User, Post, Image]
+
+
+@pytest.fixture
+def connection():
+    connection = Connection({"driver": "sqlite", "database": ":memory:"})
+    connection.connect()
+    connection.statement("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.statement("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT, user_id INTEGER)")
+    connection.statement(
+        "CREATE TABLE images (id INTEGER PRIMARY KEY, imageable_type TEXT, imageable_id INTEGER)"
+    )
+
+    for user_id in range(1, 4):
+        connection.insert("INSERT INTO users (id, name) VALUES (?, ?)", [user_id, f"u{user_id}"])
+    for post_id in range(1, 5):
+        connection.insert(
+            "INSERT INTO posts (id, title, user_id) VALUES (?, ?, ?)",
+            [post_id, f"p{post_id}", post_id % 2 + 1],
+        )
+        connection.insert(
+            "INSERT INTO images (imageable_type, imageable_id) VALUES (?, ?)", ["user", post_id % 3 + 1]
+        )
+
+    MorphMap.set({"user": f"{User.__module__}.{User.__name__}"})
+    for model in MODELS:
+        model._connection = connection
+
+    yield connection
+
+    MorphMap._map.clear()
+    MorphMap._reverse_map.clear()
+    for model in MODELS:
+        model._connection = None
+
+
+def test_without_a_unit_of_work_every_find_queries(queries):
+    assert current_identity_map() is None
+    assert User.find(1) is not User.find(1)
+    assert len(queries) == 2
+
+
+def test_find_returns_the_mapped_instance(queries):
+    with unit_of_work() as identity_map:
+        user = User.find(1)
+
+        assert User.find(1) is user
+        assert User.find("1") is user
+        assert User.query().where("name", "u2").first() is not user
+        assert User.query().get()[0] is user
+        assert len(queries) == 3
+        assert len(identity_map) == 3
+
+    assert current_identity_map() is None
+    assert len(identity_map) == 0
+
+
+def test_constrained_and_partial_queries_bypass_the_map(queries):
+    with unit_of_work() as identity_map:
+        user = User.find(1)
+
+        assert User.query().where("name", "u9").find(1) is None
+        assert User.query().select("id").find(1) is not user
+
+        User.query().select("id").get()
+        assert len(identity_map) == 1
+        assert User.find(2).name == "u2"
+
+
+def test_belongs_to_uses_mapped_owners(queries):
+    with unit_of_work():
+        post = Post.find(1)
+        author = User.find(2)
+        del queries[:]
+
+        assert post.author().get_results() is author
+        assert queries == []
+
+        # Eager loading only queries owners that are not mapped yet
+        posts = Post.query().with_("author").get()
+        assert len(queries) == 2
+        assert posts[0].author is author
+        assert posts[1].author is User.find(1)
+        assert len(queries) == 2
+
+        del queries[:]
+        Post.query().with_("author").get()
+        assert len(queries) == 1
+
+
+def test_morph_to_uses_mapped_models(queries):
+    with unit_of_work():
+        user = User.find(2)
+        del queries[:]
+
+        assert Image.find(1).imageable().get_results() is user
+        assert len(queries) == 1
+
+        images = Image.query().with_("imageable").get()
+        assert [image.imageable.id for image in images] == [2, 3, 1, 2]
+        assert images[0].imageable is user
+        assert images[3].imageable is user
+        assert len(queries) == 3
+
+
+def test_writes_drop_mapped_models(connection, queries):
+    with unit_of_work() as identity_map:
+        user = User.find(1)
+        connection.update("UPDATE users SET name = ? WHERE id = ?", ["renamed", 1])
+
+        assert User.find(1).name == "u1"
+        fresh = user.fresh()
+        assert fresh is not user and fresh.name == "renamed"
+
+        User.query().where("id", 1).update({"name": "again"})
+        assert User.find(1) is not user
+        assert User.find(1).name == "again"
+
+        User.find(3).delete()
+        assert User.find(3) is None
+        assert len(identity_map) == 1
+
+
+def test_route_model_binding_uses_the_map(queries):
+    binder = ModelBinder()
+
+    with unit_of_work():
+        user = User.find(2)
+        del queries[:]
+
+        assert binder.resolveImplicit(User, "2") is user
+        assert queries == []
+
+        bound = binder.resolveImplicit(User, "3")
+        assert User.find(3) is bound
+        assert len(queries) == 1
+
+
+def test_middleware_scopes_the_map_to_the_request():
+    seen = []
+
+    def next_handler(request):
+        seen.append(current_identity_map())
+        return "response"
+
+    assert UseIdentityMap().handle(Mock(), next_handler) == "response"
+    assert seen[0] is not None
+    assert current_identity_map() is None
+
+
+def test_queue_worker_runs_jobs_without_the_map_by_default(monkeypatch):
+    worker = Worker(Mock())
+    seen = []
+    monkeypatch.setattr(worker, "run_job", lambda job, connection, options: seen.append(current_identity_map()))
+
+    with unit_of_work() as request_map:
+        worker.process(Mock(), "sync", {})
+        worker.process(Mock(), "sync", {"identity_map": True})
+
+        assert current_identity_map() is request_map
+
+    assert seen[0] is None
+    assert seen[1] is not None and seen[1] is not request_map
@@ -0,0 +1,133 @@
+"""
+Tests that importing larapy packages stays cheap.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = [
+    "larapy",
+    "larapy.auth",
+    "larapy.broadcasting",
+    "larapy.cache",
+    "larapy.config",
+    "larapy.console",
+    "larapy.container",
+    "larapy.database",
+    "larapy.encryption",
+    "larapy.events",
+    "larapy.exceptions",
+    "larapy.filesystem",
+    "larapy.foundation",
+    "larapy.hashing",
+    "larapy.http",
+    "larapy.logging",
+    "larapy.mail",
+    "larapy.notifications",
+    "larapy.queue",
+    "larapy.routing",
+    "larapy.session",
+    "larapy.support",
+    "larapy.translation",
+    "larapy.validation",
+    "larapy.views",
+]
+
+HEAVY_MODULES = ["sqlalchemy", "cryptography", "bcrypt", "argon2", "requests"]
+
+# Cumulative milliseconds for importing every package above
+IMPORT_BUDGET_MS = 150
+
+
+def run_python(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def top_level_import_ms(stderr):
+    """Sum the cumulative -X importtime of top-level larapy imports."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if name.startswith(" larapy") and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1000
+
+
+class TestImportTime:
+    def test_packages_do_not_import_heavy_dependencies(self):
+        code = (
+            "import json, sys\n"
+            + "".join(f"import {package}\n" for package in PACKAGES)
+            + f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+            + "print(json.dumps([m for m in sys.modules if m.startswith('larapy.validation.rules.')]))"
+        )
+
+        heavy, rules = (json.loads(line) for line in run_python(code).stdout.splitlines())
+
+        assert heavy == []
+        assert rules == []
+
+    def test_import_time_budget(self):
+        code = "".join(f"import {package}\n" for package in PACKAGES)
+
+        elapsed = top_level_import_ms(run_python(code, "-X", "importtime").stderr)
+
+        assert 0 < elapsed < IMPORT_BUDGET_MS
+
+    def test_validation_loads_only_the_rules_it_uses(self):
+        code = (
+            "import sys\n"
+            "from larapy.validation import Validator\n"
+            "assert Validator({'name': 'ada'}, {'name': 'required|min:2'}).passes()\n"
+            "print(sorted(m for m in sys.modules if m.startswith('larapy.validation.rules.')))"
+        )
+
+        assert run_python(code).stdout.strip() == (
+            "['larapy.validation.rules.min', 'larapy.validation.rules.required']"
+        )
+
+
+class TestLazyExports:
+    def test_public_names_are_unchanged(self):
+        import larapy.database as database
+        from larapy.database.connection import Connection
+
+        assert database.Connection is Connection
+        assert "Connection" in dir(database)
+        assert set(database.__all__) <= set(dir(database))
+
+    def test_names_shadowed_by_submodules_are_exported(self):
+        import larapy.events as events
+        import larapy.http as http
+        from larapy.events.helpers import event
+        from larapy.http.response import response
+
+        assert events.event is event
+        assert http.response is response
+
+    def test_submodules_are_reachable_as_attributes(self):
+        import larapy.database as database
+
+        assert database.schema.__name__ == "larapy.database.schema"
+
+    def test_unknown_name_raises_attribute_error(self):
+        import larapy.database as database
+
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            database.Missing
+
+    def test_star_import_exports_all_names(self):
+        namespace = {}
+        exec("from larapy.validation.rules import *", namespace)
+
+        assert "RequiredRule" in namespace
+        assert "MacAddressRule" in namespace
@@ -0,0 +1,196 @@
+"""
+Tests for the lazy loading guards.
+
+Model.prevent_lazy_loading() turns a lazy load on a model loaded together
+with others into an exception; automatic eager loading turns it into one
+query for the whole result set.
+"""
+
+import pytest
+
+from larapy.database.connection import Connection
+from larapy.database.orm.model import Model
+from larapy.exceptions import LazyLoadingViolationException
+
+
+class User(Model):
+    _table = "users"
+    _timestamps = False
+
+    def posts(self):
+        return self.has_many(Post, "user_id")
+
+
+def written_by(post):
+    return post.belongs_to(User, "user_id")
+
+
+class Post(Model):
+    _table = "posts"
+    _timestamps = False
+
+    def author(self):
+        return self.belongs_to(User, "user_id")
+
+    def writer(self):
+        return written_by(self)
+
+    def comments(self):
+        return self.has_many(Comment, "post_id")
+
+
+class Comment(Model):
+    _table = "comments"
+    _timestamps = False
+
+
+@pytest.fixture
+def connection():
+    connection = Connection({"driver": "sqlite", "database": ":memory:"})
+    connection.connect()
+    connection.statement("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    connection.statement("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT, user_id INTEGER)")
+    connection.statement(
+        "CREATE TABLE comments (id INTEGER PRIMARY KEY, body TEXT, approved INTEGER, post_id INTEGER)"
+    )
+
+    for user_id in range(1, 4):
+        connection.insert("INSERT INTO users (id, name) VALUES (?, ?)", [user_id, f"u{user_id}"])
+    for post_id in range(1, 7):
+        connection.insert(
+            "INSERT INTO posts (id, title, user_id) VALUES (?, ?, ?)",
+            [post_id, f"p{post_id}", post_id % 3 + 1],
+        )
+        for approved in (0, 1):
+            connection.insert(
+                "INSERT INTO comments (body, approved, post_id) VALUES (?, ?, ?)",
+                [f"c{post_id}", approved, post_id],
+            )
+
+    for model in (User, Post, Comment):
+        model._connection = connection
+
+    yield connection
+
+    for model in (User, Post, Comment):
+        model._connection = None
+    Model.prevent_lazy_loading(False)
+    Model.automatically_eager_load_relationships(False)
+
+
+class TestPreventLazyLoading:
+    def test_lazy_loading_a_model_from_a_multi_row_result_raises(self, connection):
+        Model.prevent_lazy_loading()
+        posts = Post.query().get()
+
+        with pytest.raises(LazyLoadingViolationException) as error:
+            posts[0].author().get_results()
+
+        assert error.value.model == "Post"
+        assert error.value.relation_name == "author"
+
+    def test_relations_built_by_helpers_are_named_by_their_method(self, connection):
+        Model.prevent_lazy_loading()
+        posts = Post.query().get()
+
+        with pytest.raises(LazyLoadingViolationException) as error:
+            posts[0].writer().get_results()
+
+        assert error.value.relation_name == "writer"
+
+    def test_single_models_and_eager_loads_are_allowed(self, connection):
+        Model.prevent_lazy_loading()
+
+        assert Post.query().first().author().get_results().id == 2
+        assert Post.find(1).comments().get_results().count() == 2
+
+        posts = Post.query().with_("author.posts").get()
+        assert posts[0].author.posts.count() == 2
+
+    def test_lazy_loads_on_eager_loaded_models_are_guarded(self, connection):
+        Model.prevent_lazy_loading()
+        users = User.query().with_("posts").get()
+
+        with pytest.raises(LazyLoadingViolationException):
+            users[0].posts[0].comments().get_results()
+
+    def test_guard_can_be_limited_to_one_model_class(self, connection):
+        Post.prevent_lazy_loading()
+        try:
+            assert User.query().get()[0].posts().get_results().count() == 2
+
+            with pytest.raises(LazyLoadingViolationException):
+                Post.query().get()[0].author().get_results()
+        finally:
+            del Post._prevents_lazy_loading
+
+    def test_result_sets_are_only_tracked_while_a_guard_is_on(self, connection):
+        posts = Post.query().get()
+
+        assert all(post._result_set is None for post in posts)
+        assert posts[0].author().get_results().id == 2
+
+        Model.prevent_lazy_loading()
+        posts = Post.query().get()
+
+        assert posts[0]._result_set is posts[1]._result_set
+        assert len(posts[0]._result_set) == 6
+
+
+class TestAutomaticEagerLoading:
+    def test_first_lazy_load_loads_the_relation_for_all_siblings(self, queries):
+        Model.automatically_eager_load_relationships()
+        posts = Post.query().get()
+
+        authors = [post.author().get_results() for post in posts]
+
+        assert [author.id for author in authors] == [post.user_id for post in posts]
+        assert len(queries) == 2
+
+        # The relation methods stay callable and are served from memory
+        assert not posts[1].relation_loaded("author")
+        assert posts[1].author().get_results() is authors[1]
+        assert len(queries) == 2
+
+    def test_relations_built_by_helpers_are_batched(self, queries):
+        Model.automatically_eager_load_relationships()
+        posts = Post.query().get()
+
+        writers = [post.writer().get_results() for post in posts]
+
+        assert [writer.id for writer in writers] == [post.user_id for post in posts]
+        assert len(queries) == 2
+
+    def test_nested_lazy_loads_are_batched_per_level(self, queries):
+        Model.automatically_eager_load_relationships()
+        users = User.query().get()
+
+        comments = [
+            comment
+            for user in users
+            for post in user.posts().get_results()
+            for comment in post.comments().get_results()
+        ]
+
+        assert len(comments) == 12
+        assert len(queries) == 3
+
+    def test_constrained_relations_query_only_their_model(self, queries):
+        Model.automatically_eager_load_relationships()
+        posts = Post.query().get()
+
+        approved = posts[0].comments().where("approved", 1).get_results()
+
+        assert [comment.approved for comment in approved] == [1]
+        assert "_autoloaded_relations" not in posts[1].__dict__
+        assert len(queries) == 2
+
+    def test_takes_precedence_over_prevent_lazy_loading(self, queries):
+        Model.prevent_lazy_loading()
+        Model.automatically_eager_load_relationships()
+        posts = Post.query().get()
+
+        assert posts[0].comments().get_results().count() == 2
+
+        with pytest.raises(LazyLoadingViolationException):
+            posts[1].comments().where("approved", 1).get_results()
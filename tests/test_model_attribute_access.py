@@ -0,0 +1,135 @@
+"""
+Tests for model attribute access.
+
+Columns are read through accessors installed on the model class on first
+use, loaded relations are served under their method's name and built-in
+casts are kept per model until the attribute is written again.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from larapy.database.connection import Connection
+from larapy.database.orm.model import Model
+
+
+class User(Model):
+    _table = "users"
+    _timestamps = False
+    _casts = {"age": "int", "joined_at": "datetime", "settings": "json"}
+
+    def posts(self):
+        return self.has_many(Post, "user_id")
+
+    def cast_attribute(self, key, value):
+        self.casts.append(key)
+        if self._casts.get(key) == "json":
+            return {"raw": value}
+        return super().cast_attribute(key, value)
+
+    @property
+    def casts(self):
+        return self.__dict__.setdefault("_casts_run", [])
+
+
+class Admin(User):
+    pass
+
+
+class Post(Model):
+    _table = "posts"
+    _timestamps = False
+
+    def author(self):
+        return self.belongs_to(User, "user_id")
+
+
+@pytest.fixture
+def connection():
+    connection = Connection({"driver": "sqlite", "database": ":memory:"})
+    connection.connect()
+    connection.statement(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, age TEXT, joined_at TEXT, settings TEXT)"
+    )
+    connection.statement("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT, user_id INTEGER)")
+    connection.insert(
+        "INSERT INTO users (id, name, age, joined_at, settings) VALUES (?, ?, ?, ?, ?)",
+        [1, "u1", "41", "2024-01-02 03:04:05", "{}"],
+    )
+    for post_id in range(1, 3):
+        connection.insert("INSERT INTO posts (id, title, user_id) VALUES (?, ?, ?)", [post_id, f"p{post_id}", 1])
+
+    for model in (User, Post):
+        model._connection = connection
+
+    yield connection
+
+    for model in (User, Post):
+        model._connection = None
+
+
+def test_columns_are_read_through_class_accessors(connection):
+    post = Post.find(1)
+
+    assert post.title == "p1"
+    assert "title" in Post.__dict__
+    assert Post.find(2).title == "p2"
+    assert post.missing is None
+    assert "missing" not in Post.__dict__
+
+    post.title = "changed"
+    assert post.title == "changed"
+    assert post.get_attribute("title") == "changed"
+    assert "title" not in post.__dict__
+    assert Post(attributes={}).title is None
+
+
+def test_loaded_relations_shadow_their_methods(connection):
+    user = User.find(1)
+
+    assert callable(user.posts)
+    assert user.posts().get_results().count() == 2
+
+    user = User.query().with_("posts").get()[0]
+    assert [post.title for post in user.posts] == ["p1", "p2"]
+    assert callable(User.posts)
+    assert User.find(1).posts().get_results().count() == 2
+
+    admin = Admin.find(1).set_relation("posts", "loaded")
+    assert admin.posts == "loaded"
+    assert callable(Admin.find(1).posts)
+
+
+def test_relations_set_under_a_column_name_shadow_the_column(connection):
+    post = Post.find(1)
+    assert post.user_id == 1
+
+    post.set_relation("user_id", "relation")
+    assert post.user_id == "relation"
+    assert Post.find(2).user_id == 1
+
+
+def test_built_in_casts_are_cached_until_the_attribute_changes(connection):
+    user = User.find(1)
+
+    assert user.joined_at == datetime(2024, 1, 2, 3, 4, 5)
+    assert user.joined_at is user.joined_at
+    assert user.age == 41
+    assert user.age == 41
+    assert user.casts == ["joined_at", "age"]
+
+    user.age = "42"
+    assert user.age == 42
+    assert user.casts == ["joined_at", "age", "age"]
+
+    user._attributes = dict(user._attributes, joined_at="2025-01-01 00:00:00")
+    assert user.joined_at == datetime(2025, 1, 1)
+
+
+def test_other_casts_run_on_every_read(connection):
+    user = User.find(1)
+
+    assert user.settings == {"raw": "{}"}
+    assert user.settings is not user.settings
+    assert user.casts == ["settings"] * 3
@@ -0,0 +1,177 @@
+"""
+Tests for nested eager loading.
+
+Every level of a dotted path such as "posts.comments.author" must be loaded
+with one query for all models at that level, whatever the relationship type
+and however many parents there are.
+"""
+
+import pytest
+
+from larapy.database.orm.collection import Collection
+from larapy.database.orm.relationships.relation import Relation
+from tests.orm_models import Comment, Country, Image, Post, Tag, User
+
+
+@pytest.fixture
+def connection(orm_connection):
+    connection = orm_connection
+
+    users, posts = 20, 60
+    for country_id in range(1, 5):
+        connection.insert("INSERT INTO countries (id, name) VALUES (?, ?)", [country_id, f"c{country_id}"])
+    for role_id in range(1, 4):
+        connection.insert("INSERT INTO roles (id, name) VALUES (?, ?)", [role_id, f"r{role_id}"])
+    for tag_id in range(1, 6):
+        connection.insert("INSERT INTO tags (id, name) VALUES (?, ?)", [tag_id, f"t{tag_id}"])
+
+    for user_id in range(1, users + 1):
+        connection.insert(
+            "INSERT INTO users (id, name, country_id) VALUES (?, ?, ?)",
+            [user_id, f"u{user_id}", user_id % 4 + 1],
+        )
+        connection.insert(
+            "INSERT INTO profiles (bio, user_id) VALUES (?, ?)", [f"bio{user_id}", user_id]
+        )
+        connection.insert(
+            "INSERT INTO role_user (role_id, user_id) VALUES (?, ?)", [user_id % 3 + 1, user_id]
+        )
+        connection.insert(
+            "INSERT INTO images (url, imageable_type, imageable_id) VALUES (?, ?, ?)",
+            [f"avatar{user_id}", "user", user_id],
+        )
+
+    for post_id in range(1, posts + 1):
+        connection.insert(
+            "INSERT INTO posts (id, title, user_id) VALUES (?, ?, ?)",
+            [post_id, f"p{post_id}", post_id % users + 1],
+        )
+        connection.insert(
+            "INSERT INTO images (url, imageable_type, imageable_id) VALUES (?, ?, ?)",
+            [f"cover{post_id}", "post", post_id],
+        )
+        connection.insert(
+            "INSERT INTO taggables (tag_id, taggable_id, taggable_type) VALUES (?, ?, ?)",
+            [post_id % 5 + 1, post_id, "post"],
+        )
+        for offset in range(2):
+            connection.insert(
+                "INSERT INTO comments (body, approved, post_id, user_id) VALUES (?, ?, ?, ?)",
+                [f"comment{post_id}-{offset}", offset, post_id, (post_id + offset) % users + 1],
+            )
+
+    return connection
+
+
+def collect(models, path):
+    """Walk a loaded relation path, failing if any level was not loaded."""
+    for name in path.split("."):
+        related = []
+        for model in models:
+            assert model.relation_loaded(name), f"{name} not loaded on {model!r}"
+            value = model.get_relation(name)
+            if isinstance(value, Collection):
+                related.extend(value.all())
+            elif value is not None:
+                related.append(value)
+        models = related
+    return models
+
+
+@pytest.mark.parametrize(
+    "model, path, expected_queries",
+    [
+        (User, "posts.comments.author", 4),  # has many
+        (Comment, "post.user.country", 4),  # belongs to
+        (User, "profile.user.posts", 4),  # has one
+        (User, "roles.users.profile", 4),  # belongs to many
+        (Country, "posts.comments.author", 4),  # has many through
+        (Country, "profile.user.posts", 4),  # has one through
+        (User, "avatar.imageable.posts", 4),  # morph one
+        (Post, "images.imageable.comments", 4),  # morph many
+        (Image, "imageable.images.imageable", 7),  # morph to, one query per type
+        (Post, "tags.posts.user", 4),  # morph to many
+        (Tag, "posts.comments.author", 4),  # morphed by many
+    ],
+)
+def test_three_level_eager_load_runs_one_query_per_level(queries, model, path, expected_queries):
+    models = model.query().with_(path).get()
+
+    assert len(queries) == expected_queries
+    assert collect(models.all(), path)
+
+    # Everything along the path is already loaded
+    del queries[:]
+    collect(models.all(), path)
+    assert queries == []
+
+
+def test_nested_eager_load_matches_lazy_loading(connection):
+    users = User.query().with_("posts.comments.author").get()
+
+    for user in users:
+        assert [post.id for post in user.get_relation("posts")] == [
+            post.id for post in User.posts(user).get_results()
+        ]
+        for post in user.get_relation("posts"):
+            for comment in post.get_relation("comments"):
+                assert comment.post_id == post.id
+                assert comment.get_relation("author").id == comment.user_id
+
+
+def test_shared_prefixes_are_loaded_once(queries):
+    User.query().with_("posts", "posts.comments", "posts.comments.author").get()
+
+    assert len(queries) == 4
+
+
+def test_collection_and_model_load_are_batched(connection, queries):
+    users = User.query().get()
+    users.load("posts.comments.author")
+
+    assert len(queries) == 4
+    assert collect(users.all(), "posts.comments.author")
+
+    del queries[:]
+    post = Post.query().first()
+    post.load("comments.author.country")
+
+    assert len(queries) == 4
+    assert collect([post], "comments.author.country")
+
+
+def test_constraint_callbacks_apply_to_their_own_level(queries):
+    users = User.query().with_({"posts.comments": lambda query: query.where("approved", 1)}).get()
+
+    posts = collect(users.all(), "posts")
+    comments = collect(users.all(), "posts.comments")
+
+    assert len(posts) == 60
+    assert len(comments) == 60
+    assert all(comment.approved == 1 for comment in comments)
+    assert len(queries) == 3
+
+
+def test_large_key_lists_are_chunked(queries, monkeypatch):
+    unchunked = collect(User.query().with_("posts.comments.author").get().all(), "posts.comments.author")
+    del queries[:]
+
+    monkeypatch.setattr(Relation, "EAGER_CHUNK_SIZE", 7)
+    users = User.query().with_("posts.comments.author").get()
+    chunked = collect(users.all(), "posts.comments.author")
+
+    # 20 users, 60 posts and 20 authors in chunks of at most 7 keys
+    assert len(queries) == 1 + 3 + 9 + 3
+    assert [author.id for author in chunked] == [author.id for author in unchunked]
+
+
+def test_models_without_keys_skip_the_query(queries):
+    comments = Comment.query().where("id", 0).get()
+    assert comments.is_empty()
+
+    comment = Comment()
+    comment._exists = True
+    Collection([comment]).load("post.user")
+
+    assert comment.get_relation("post") is None
+    assert len(queries) == 1
@@ -0,0 +1,54 @@
+import pytest
+from larapy.pagination import Cursor, CursorPaginator, Paginator
+
+
+class TestCursor:
+    def test_encode_round_trip(self):
+        cursor = Cursor({'id': 15, 'created_at': '2025-01-01 00:00:00'}, points_to_next_items=False)
+
+        decoded = Cursor.from_encoded(cursor.encode())
+
+        assert decoded == cursor
+        assert decoded.parameter('id') == 15
+        assert decoded.points_to_previous_items() is True
+
+    def test_encoded_cursor_is_url_safe(self):
+        encoded = Cursor({'name': '??>>~~'}).encode()
+
+        assert all(ch.isalnum() or ch in '-_' for ch in encoded)
+
+    @pytest.mark.parametrize('encoded', [None, '', 'not a cursor', 'W10'])
+    def test_malformed_cursor_decodes_to_none(self, encoded):
+        assert Cursor.from_encoded(encoded) is None
+
+    def test_missing_parameter_raises(self):
+        with pytest.raises(KeyError):
+            Cursor({'id': 1}).parameter('name')
+
+
+class TestPaginator:
+    def test_urls(self):
+        paginator = Paginator(['a', 'b'], per_page=2, current_page=2, has_more=True, path='/items?sort=name')
+
+        assert paginator.previous_page_url() == '/items?sort=name&page=1'
+        assert paginator.next_page_url() == '/items?sort=name&page=3'
+        assert paginator.first_item() == 3
+        assert paginator.last_item() == 4
+
+
+class TestCursorPaginator:
+    def test_first_page_without_more_items_has_no_cursors(self):
+        paginator = CursorPaginator([{'id': 1}], per_page=10, columns=['id'])
+
+        assert paginator.next_cursor() is None
+        assert paginator.previous_cursor() is None
+
+    def test_cursors_point_at_page_edges(self):
+        items = [{'id': 11}, {'id': 12}]
+        paginator = CursorPaginator(items, per_page=2, columns=['id'], cursor=Cursor({'id': 10}), has_more=True)
+
+        assert paginator.next_cursor().parameters() == {'id': 12}
+        assert paginator.next_cursor().points_to_next_items() is True
+        assert paginator.previous_cursor().parameters() == {'id': 11}
+        assert paginator.previous_cursor().points_to_previous_items() is True
+        assert paginator.to_dict()['next_cursor'] == paginator.next_cursor().encode()
@@ -149,3 +149,44 @@ class TestPaginatedResourceResponse:
         
         assert data['meta']['per_page'] == 25
         assert len(data['data']) == 25
+
+
+class TestCursorPaginatedResourceResponse:
+    def test_cursor_links_and_meta(self):
+        from larapy.pagination import Cursor, CursorPaginator
+
+        users = [User(i, f'User {i}') for i in range(11, 21)]
+        paginator = CursorPaginator(
+            [{'id': user.id, 'name': user.name} for user in users],
+            per_page=10,
+            columns=['id'],
+            cursor=Cursor({'id': 10}),
+            has_more=True,
+            path='/users',
+        )
+
+        data = PaginatedResourceResponse(paginator, JsonResource).to_response()
+
+        assert data['links']['first'] is None
+        assert data['links']['last'] is None
+        assert data['links']['next'] == f"/users?cursor={Cursor({'id': 20}).encode()}"
+        assert data['links']['prev'] == f"/users?cursor={Cursor({'id': 11}, False).encode()}"
+        assert data['meta'] == {
+            'path': '/users',
+            'per_page': 10,
+            'next_cursor': Cursor({'id': 20}).encode(),
+            'prev_cursor': Cursor({'id': 11}, False).encode(),
+        }
+
+    def test_simple_paginator_has_no_last_link(self):
+        from larapy.pagination import Paginator
+
+        users = [User(i, f'User {i}') for i in range(1, 16)]
+        paginator = Paginator(users, per_page=15, current_page=1, has_more=True, path='/users')
+
+        data = PaginatedResourceResponse(paginator, UserResource).to_response()
+
+        assert data['links']['last'] is None
+        assert data['links']['next'] == '/users?page=2'
+        assert data['meta']['path'] == '/users'
+        assert 'total' not in data['meta']
@@ -563,3 +563,108 @@ class TestKernelMiddlewarePriority:
         kernel.handle(request, handler)
         
         assert execution_order == ['first', 'second', 'third', 'handler']
+
+
+class TestCompiledPipeline:
+    """Test pipelines compiled once and run per request."""
+
+    def test_compiled_pipeline_runs_with_different_destinations(self):
+        def add_one(value, next_handler):
+            return next_handler(value + 1)
+
+        compiled = Pipeline().through([add_one, add_one]).compile()
+
+        assert compiled.then(1, lambda value: value) == 3
+        assert compiled.then(1, lambda value: value * 10) == 30
+
+    def test_compiled_pipeline_instantiates_classes_once(self):
+        instances = []
+
+        class CountingMiddleware:
+            def __init__(self):
+                instances.append(self)
+
+            def handle(self, request, next_handler):
+                return next_handler(request)
+
+        compiled = Pipeline().through([CountingMiddleware]).compile()
+        compiled.then('a', lambda value: value)
+        compiled.then('b', lambda value: value)
+
+        assert len(instances) == 1
+
+    def test_compiled_pipeline_exception_handler(self):
+        def failing(value, next_handler):
+            raise ValueError('boom')
+
+        compiled = (
+            Pipeline()
+            .through([failing])
+            .on_exception(lambda passable, e: f'handled {e}')
+            .compile()
+        )
+
+        assert compiled.then('x', lambda value: value) == 'handled boom'
+
+    def test_nested_runs_use_their_own_destination(self):
+        compiled = Pipeline().through([lambda value, next_handler: next_handler(value)]).compile()
+
+        def outer(value):
+            inner = compiled.then(value, lambda v: f'inner {v}')
+            return f'outer {inner}'
+
+        assert compiled.then('x', outer) == 'outer inner x'
+
+
+class TestKernelPipelineCache:
+    """Test the kernel's per-route compiled middleware stacks."""
+
+    def test_pipeline_is_reused_for_same_route_middleware(self):
+        kernel = Kernel()
+        kernel.use([lambda request, next_handler: next_handler(request)])
+
+        first = Request('/')
+        first._route_middleware = ['auth']
+        second = Request('/other')
+        second._route_middleware = ['auth']
+
+        assert kernel.pipeline(first) is kernel.pipeline(second)
+
+    def test_pipeline_is_rebuilt_after_configuration_change(self):
+        kernel = Kernel()
+        request = Request('/')
+        pipeline = kernel.pipeline(request)
+
+        kernel.append(lambda request, next_handler: next_handler(request))
+
+        assert kernel.pipeline(request) is not pipeline
+
+    def test_string_middleware_resolved_once(self):
+        from larapy.container.container import Container
+
+        made = []
+
+        class TrackingMiddleware:
+            def __init__(self):
+                made.append(self)
+
+            def handle(self, request, next_handler, *parameters):
+                request._parameters = parameters
+                return next_handler(request)
+
+            def terminate(self, request, response):
+                request._terminated_by = self
+
+        container = Container()
+        container.bind('tracking', TrackingMiddleware)
+        kernel = Kernel(container)
+        kernel.append('tracking:a,b')
+
+        for _ in range(3):
+            request = Request('/')
+            response = kernel.handle(request, lambda r: Response('OK'))
+            kernel.terminate(request, response)
+
+        assert len(made) == 1
+        assert request._parameters == ('a', 'b')
+        assert request._terminated_by is made[0]
@@ -365,10 +365,6 @@ def test_mixed_polymorphic_eager_loading(setup_database):
 
 def test_nested_eager_loading_with_polymorphic(setup_database):
     """Test nested eager loading with polymorphic relationships."""
-    # Note: Nested eager loading with MorphTo is complex and requires additional work
-    # This is a known limitation that can be addressed in future iterations
-    pytest.skip("Nested eager loading with MorphTo requires additional implementation")
-    
     # Create post with image
     post1 = Post.create({"title": "Post 1", "body": "Content 1"})
     image1 = Image.create({"url": "http://post1.jpg", "imageable_type": "post", "imageable_id": post1.id})
@@ -12,8 +12,20 @@ Tests the query result caching functionality including:
 import pytest
 import time
 from unittest.mock import Mock, MagicMock, call
+from larapy.database.connection import Connection
+from larapy.database.orm import Model
 from larapy.database.query.builder import QueryBuilder
-from larapy.cache import cache, reset_cache
+from larapy.cache import (
+    ArrayStore,
+    FileStore,
+    cache,
+    query_cache,
+    reset_cache,
+    set_query_cache_store,
+)
+from larapy.config.repository import Repository
+from larapy.container.container import Container
+from larapy.database.database_service_provider import DatabaseServiceProvider
 
 
 class TestQueryBuilderCaching:
@@ -345,3 +357,162 @@ class TestQueryBuilderCaching:
         
         # Should execute twice (cache was cleared)
         assert self.mock_connection.select.call_count == 2
+
+
+class Account(Model):
+    _table = 'accounts'
+    _fillable = ['name', 'balance']
+    _timestamps = False
+
+
+class TestQueryCacheInvalidation:
+    """Test that writes invalidate remembered results for the tables they touch."""
+
+    def setup_method(self):
+        reset_cache()
+        set_query_cache_store(None)
+
+        self.connection = Connection({'driver': 'sqlite', 'database': ':memory:'})
+        self.connection.connect()
+        self.connection.statement('CREATE TABLE accounts (id INTEGER PRIMARY KEY, name TEXT, balance INTEGER)')
+        self.connection.statement('CREATE TABLE notes (id INTEGER PRIMARY KEY, account_id INTEGER, body TEXT)')
+        self.connection.table('accounts').insert({'name': 'alpha', 'balance': 10})
+
+        self.selects = []
+        original = self.connection.select
+        self.connection.select = lambda query, *args: self.selects.append(query) or original(query, *args)
+
+    def teardown_method(self):
+        self.connection.disconnect()
+        set_query_cache_store(None)
+        reset_cache()
+
+    def names(self):
+        return [row['name'] for row in self.connection.table('accounts').remember().get()]
+
+    def balances(self):
+        return self.connection.table('accounts').remember().pluck('balance')
+
+    def note_bodies(self):
+        return (
+            self.connection.table('accounts')
+            .join('notes', 'notes.account_id', '=', 'accounts.id')
+            .select('notes.body')
+            .remember()
+            .get()
+        )
+
+    def test_repeated_reads_hit_the_cache(self):
+        assert self.names() == ['alpha']
+        assert self.names() == ['alpha']
+        assert len(self.selects) == 1
+
+    def test_insert_invalidates(self):
+        self.names()
+        self.connection.table('accounts').insert({'name': 'beta', 'balance': 5})
+
+        assert self.names() == ['alpha', 'beta']
+
+    def test_update_increment_and_delete_invalidate(self):
+        assert self.balances() == [10]
+        self.connection.table('accounts').where('id', 1).update({'balance': 20})
+        assert self.balances() == [20]
+        self.connection.table('accounts').where('id', 1).increment('balance', 5)
+        assert self.balances() == [25]
+        self.connection.table('accounts').where('id', 1).delete()
+        assert self.balances() == []
+
+    def test_bulk_writes_invalidate(self):
+        self.names()
+        self.connection.table('accounts').upsert(
+            [{'id': 1, 'name': 'renamed', 'balance': 0}, {'id': 2, 'name': 'beta', 'balance': 0}], 'id'
+        )
+
+        assert self.names() == ['renamed', 'beta']
+
+    def test_writes_to_other_tables_keep_the_cache(self):
+        self.names()
+        self.connection.table('notes').insert({'account_id': 1, 'body': 'hi'})
+
+        assert self.names() == ['alpha']
+        assert len(self.selects) == 1
+
+    def test_joined_tables_invalidate(self):
+        assert self.note_bodies() == []
+        self.connection.table('notes').insert({'account_id': 1, 'body': 'hi'})
+
+        assert self.note_bodies() == [{'body': 'hi'}]
+
+    def test_model_save_and_delete_invalidate(self):
+        Account._connection = self.connection
+        self.names()
+
+        account = Account.create({'name': 'beta', 'balance': 0})
+        assert self.names() == ['alpha', 'beta']
+
+        account.delete()
+        assert self.names() == ['alpha']
+
+    def test_writes_in_a_transaction_invalidate_on_commit(self):
+        self.names()
+        self.connection.begin_transaction()
+        self.connection.table('accounts').insert({'name': 'beta', 'balance': 0})
+        self.connection.commit()
+
+        assert self.names() == ['alpha', 'beta']
+
+    def test_rolled_back_writes_keep_the_cache(self):
+        self.names()
+        self.connection.begin_transaction()
+        self.connection.table('accounts').insert({'name': 'beta', 'balance': 0})
+        self.connection.rollback()
+
+        assert self.names() == ['alpha']
+        assert len(self.selects) == 1
+
+    def test_pluggable_store(self):
+        store = ArrayStore(max_items=100)
+        set_query_cache_store(store)
+        global_size = cache().size()
+
+        self.names()
+
+        assert store.size() == 2  # the result and the accounts version
+        assert cache().size() == global_size
+        assert self.names() == ['alpha']
+        assert len(self.selects) == 1
+
+    def test_evicted_version_never_serves_stale_results(self):
+        set_query_cache_store(ArrayStore(max_items=2))
+        self.names()
+        self.connection.table('accounts').insert({'name': 'beta', 'balance': 0})
+
+        # Fill the store so the accounts version is evicted
+        self.connection.table('notes').remember().get()
+
+        assert self.names() == ['alpha', 'beta']
+
+
+class TestQueryCacheConfiguration:
+    """Test configuring the query cache store through the service provider."""
+
+    def teardown_method(self):
+        set_query_cache_store(None)
+
+    def test_provider_configures_the_store(self, tmp_path):
+        app = Container()
+        app.instance('config', Repository({
+            'database': {'query_cache': {'driver': 'file', 'path': str(tmp_path)}},
+        }))
+
+        DatabaseServiceProvider(app).boot()
+
+        assert isinstance(query_cache().store, FileStore)
+
+    def test_global_cache_is_used_without_configuration(self):
+        app = Container()
+        app.instance('config', Repository({'database': {}}))
+
+        DatabaseServiceProvider(app).boot()
+
+        assert query_cache().store is cache()
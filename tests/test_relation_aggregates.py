@@ -0,0 +1,189 @@
+"""
+Tests for relationship aggregates.
+
+with_count() and friends select each aggregate as a correlated subquery of
+the parent query, so models and aggregates load with one query whatever
+the relationship type; Collection.load_count() adds them to loaded models
+with one more query per EAGER_CHUNK_SIZE keys.
+"""
+
+import pytest
+
+from larapy.database.orm.relationships.relation import Relation
+from larapy.exceptions import InvalidRelationException, RelationNotFoundException
+from tests.orm_models import Country, Image, Post, Tag, User
+
+
+@pytest.fixture
+def connection(orm_connection):
+    connection = orm_connection
+
+    # Country 3 has no users; users 1 and 2 manage the others
+    for country_id in range(1, 4):
+        connection.insert("INSERT INTO countries (id, name) VALUES (?, ?)", [country_id, f"c{country_id}"])
+    for role_id in range(1, 3):
+        connection.insert("INSERT INTO roles (id, name) VALUES (?, ?)", [role_id, f"r{role_id}"])
+    for tag_id in range(1, 4):
+        connection.insert("INSERT INTO tags (id, name) VALUES (?, ?)", [tag_id, f"t{tag_id}"])
+
+    for user_id in range(1, 5):
+        connection.insert(
+            "INSERT INTO users (id, name, country_id, manager_id) VALUES (?, ?, ?, ?)",
+            [user_id, f"u{user_id}", 1 if user_id < 4 else 2, None if user_id < 3 else user_id - 2],
+        )
+        connection.insert("INSERT INTO profiles (bio, user_id) VALUES (?, ?)", [f"bio{user_id}", user_id])
+        for role_id in range(1, user_id % 3 + 1):
+            connection.insert("INSERT INTO role_user (role_id, user_id) VALUES (?, ?)", [role_id, user_id])
+    connection.insert(
+        "INSERT INTO images (url, imageable_type, imageable_id) VALUES (?, ?, ?)", ["avatar", "user", 1]
+    )
+
+    # Posts 1-3 belong to user 1, post 4 to user 4; post n has n - 1 comments
+    for post_id in range(1, 5):
+        connection.insert(
+            "INSERT INTO posts (id, title, user_id) VALUES (?, ?, ?)",
+            [post_id, f"p{post_id}", 1 if post_id < 4 else 4],
+        )
+        for number in range(1, post_id):
+            connection.insert(
+                "INSERT INTO comments (votes, approved, post_id) VALUES (?, ?, ?)",
+                [number * 10, number % 2, post_id],
+            )
+        for tag_id in range(1, post_id % 3 + 1):
+            connection.insert(
+                "INSERT INTO taggables (tag_id, taggable_id, taggable_type) VALUES (?, ?, ?)",
+                [tag_id, post_id, "post"],
+            )
+    connection.insert(
+        "INSERT INTO images (url, imageable_type, imageable_id) VALUES (?, ?, ?)", ["cover", "post", 2]
+    )
+
+    return connection
+
+
+def counts(models, attribute):
+    return {model.id: model.get_attribute(attribute) for model in models}
+
+
+@pytest.mark.parametrize(
+    "model, relation, expected",
+    [
+        (User, "posts", {1: 3, 2: 0, 3: 0, 4: 1}),  # has many
+        (User, "profile", {1: 1, 2: 1, 3: 1, 4: 1}),  # has one
+        (User, "country", {1: 1, 2: 1, 3: 1, 4: 1}),  # belongs to
+        (User, "roles", {1: 1, 2: 2, 3: 0, 4: 1}),  # belongs to many
+        (Country, "posts", {1: 3, 2: 1, 3: 0}),  # has many through
+        (Country, "profile", {1: 3, 2: 1, 3: 0}),  # has one through
+        (User, "avatar", {1: 1, 2: 0, 3: 0, 4: 0}),  # morph one
+        (Post, "images", {1: 0, 2: 1, 3: 0, 4: 0}),  # morph many
+        (Post, "tags", {1: 1, 2: 2, 3: 0, 4: 1}),  # morph to many
+        (Tag, "posts", {1: 3, 2: 1, 3: 0}),  # morphed by many
+        (User, "reports", {1: 1, 2: 1, 3: 0, 4: 0}),  # same table
+        (User, "manager", {1: 0, 2: 0, 3: 1, 4: 1}),  # same table
+    ],
+)
+def test_with_count_runs_one_query_for_every_relation_type(queries, model, relation, expected):
+    models = model.query().with_count(relation).get()
+
+    assert counts(models, f"{relation}_count") == expected
+    assert len(queries) == 1
+
+
+def test_sum_avg_max_and_min_name_the_column(connection):
+    post = (
+        Post.query()
+        .with_sum("comments", "votes")
+        .with_avg("comments", "votes")
+        .with_max("comments", "votes")
+        .with_min("comments", "comments.votes")
+        .find(4)
+    )
+
+    assert post.comments_sum_votes == 60
+    assert post.comments_avg_votes == 20
+    assert post.comments_max_votes == 30
+    assert post.comments_min_votes == 10
+    assert Post.query().with_sum("comments", "votes").find(1).comments_sum_votes is None
+
+
+def test_with_exists_casts_to_booleans(connection):
+    posts = Post.query().with_exists("comments", "images").get()
+
+    assert counts(posts, "comments_exists") == {1: False, 2: True, 3: True, 4: True}
+    assert counts(posts, "images_exists") == {1: False, 2: True, 3: False, 4: False}
+    assert not any(post.is_dirty() for post in posts)
+
+
+def test_callbacks_aliases_and_definition_constraints(connection):
+    posts = (
+        Post.query()
+        .with_count(
+            "comments",
+            "comments as all_comments",
+            {"comments as approved_count": lambda query: query.where("approved", 1)},
+            "approved_comments",
+        )
+        .get()
+    )
+
+    assert counts(posts, "comments_count") == {1: 0, 2: 1, 3: 2, 4: 3}
+    assert counts(posts, "all_comments") == counts(posts, "comments_count")
+    assert counts(posts, "approved_count") == {1: 0, 2: 1, 3: 1, 4: 2}
+    assert counts(posts, "approved_comments_count") == counts(posts, "approved_count")
+
+
+def test_subquery_bindings_precede_where_bindings(connection):
+    posts = (
+        Post.query()
+        .where("user_id", 1)
+        .with_count({"comments": lambda query: query.where("votes", ">", 10)})
+        .where("title", "!=", "p1")
+        .order_by("id")
+        .get()
+    )
+
+    assert counts(posts, "comments_count") == {2: 0, 3: 1}
+
+
+def test_aggregate_queries_still_count_and_paginate(connection):
+    def query():
+        return Post.query().with_count({"comments": lambda q: q.where("approved", 1)}).where("user_id", 1)
+
+    assert query().count() == 3
+    page = query().paginate(per_page=2, page=2)
+    assert page["total"] == 3
+    assert [post.comments_count for post in page["data"]] == [1]
+
+
+def test_collection_load_count_uses_one_query(connection, queries):
+    posts = Post.query().get()
+    del queries[:]
+
+    posts.load_count("comments", {"tags": lambda query: query.where("tags.id", 1)})
+
+    assert len(queries) == 1
+    assert counts(posts, "comments_count") == {1: 0, 2: 1, 3: 2, 4: 3}
+    assert counts(posts, "tags_count") == {1: 1, 2: 1, 3: 0, 4: 1}
+    assert not any(post.is_dirty() for post in posts)
+
+    post = Post.find(3).load_count("images")
+    assert post.images_count == 0
+
+
+def test_collection_load_count_chunks_the_keys(connection, queries, monkeypatch):
+    monkeypatch.setattr(Relation, "EAGER_CHUNK_SIZE", 3)
+    posts = Post.query().get()
+    del queries[:]
+
+    posts.load_count("comments")
+
+    assert len(queries) == 2
+    assert counts(posts, "comments_count") == {1: 0, 2: 1, 3: 2, 4: 3}
+
+
+def test_unknown_and_morph_to_relations_are_rejected(connection):
+    with pytest.raises(RelationNotFoundException):
+        Post.query().with_count("likes")
+
+    with pytest.raises(InvalidRelationException):
+        Image.query().with_count("imageable")
@@ -0,0 +1,153 @@
+"""
+Tests for the route cache and route:cache / route:clear commands.
+"""
+
+import pytest
+from larapy.console.commands.route_cache import RouteCacheCommand
+from larapy.console.commands.route_clear import RouteClearCommand
+from larapy.foundation.application import Application
+from larapy.routing.route_cache import RouteCache, RouteCacheException
+from larapy.routing.router import Router
+
+
+class RouteCacheController:
+    def show(self, id: int):
+        return {'id': id}
+
+
+class AuthMiddleware:
+    pass
+
+
+def find_team(value):
+    return {'team': value}
+
+
+def register_routes(router):
+    router.pattern('id', r'\d+')
+    router.aliasMiddleware('auth', 'App.Http.Middleware.Authenticate')
+    router.middlewareGroup('api', ['throttle', 'auth'])
+    router.bind('team', find_team)
+
+    def api_routes(r):
+        r.get('/users/{id}', 'UsersController@show').name('users.show')
+        r.get('/teams/{team}', 'TeamsController@show').middleware(AuthMiddleware)
+        r.get('/posts/{post:slug}', 'PostsController@show').withTrashed()
+        r.get('/files/{path}', 'FilesController@show').where('path', '.*')
+
+    router.group({'prefix': 'api', 'middleware': ['api'], 'name': 'api.'}, api_routes)
+
+
+class TestRouteCache:
+    def test_round_trip_preserves_route_table(self, tmp_path):
+        router = Router()
+        register_routes(router)
+        cache = RouteCache(str(tmp_path / 'routes.json'))
+
+        assert cache.write(router) == 4
+
+        cached = Router()
+        assert cached.loadCachedRoutes(cache.path) == 4
+
+        for original, hydrated in zip(router.getRoutes(), cached.getRoutes()):
+            assert hydrated.getUri() == original.getUri()
+            assert hydrated.getMethods() == original.getMethods()
+            assert hydrated.getName() == original.getName()
+            assert hydrated.getAction() == original.getAction()
+            assert hydrated.getMiddleware() == original.getMiddleware()
+            assert hydrated.getBindings() == original.getBindings()
+            assert hydrated.shouldIncludeTrashed() == original.shouldIncludeTrashed()
+            assert hydrated._where == original._where
+
+        assert cached.routes.getByName('api.users.show') is not None
+        assert cached._patterns == {'id': r'\d+'}
+        assert cached._middleware_groups['api'] == ['throttle', 'auth']
+        assert cached.getBindings()['team'] is find_team
+
+    def test_hydrated_routes_match_like_originals(self, tmp_path):
+        router = Router()
+        register_routes(router)
+        cache = RouteCache(str(tmp_path / 'routes.json'))
+        cache.write(router)
+
+        cached = Router()
+        cached.loadCachedRoutes(cache.path)
+
+        for uri in ['/api/users/5', '/api/users/abc', '/api/files/a/b.txt', '/api/teams/x']:
+            expected = router.routes.match(uri, 'GET')
+            actual = cached.routes.match(uri, 'GET')
+            if expected is None:
+                assert actual is None
+            else:
+                assert actual.route.getUri() == expected.route.getUri()
+                assert actual.parameters() == expected.parameters()
+
+    def test_hydrated_routes_compile_regex_lazily(self, tmp_path):
+        router = Router()
+        router.get('/users/{id}', 'UsersController@show')
+        cache = RouteCache(str(tmp_path / 'routes.json'))
+        cache.write(router)
+
+        cached = Router()
+        cached.loadCachedRoutes(cache.path)
+        route = cached.getRoutes().getRoutes()[0]
+
+        assert route._compiled_pattern is None
+        assert route.matches('/users/3', 'GET') is True
+        assert route._compiled_pattern is not None
+
+    def test_closure_routes_are_rejected(self, tmp_path):
+        router = Router()
+        router.get('/ping', lambda request: 'pong')
+        cache = RouteCache(str(tmp_path / 'routes.json'))
+
+        with pytest.raises(RouteCacheException, match=r'Unable to prepare route \[/ping\]'):
+            cache.write(router)
+        assert not cache.exists()
+
+    def test_incompatible_cache_version_is_rejected(self, tmp_path):
+        path = tmp_path / 'routes.json'
+        path.write_text('{"version": 0, "routes": []}')
+
+        with pytest.raises(RouteCacheException):
+            RouteCache(str(path)).load(Router())
+
+    def test_load_routes_from_file(self, tmp_path):
+        routes_file = tmp_path / 'web.py'
+        routes_file.write_text("router.get('/home', 'HomeController@index').name('home')\n")
+
+        router = Router().loadRoutesFrom(str(routes_file))
+
+        assert router.routes.getByName('home').getUri() == '/home'
+
+
+class TestRouteCacheCommands:
+    @pytest.fixture
+    def app(self, tmp_path):
+        app = Application(str(tmp_path))
+        router = Router(app)
+        router.get('/users/{id}', 'UsersController@show')
+        app.instance('router', router)
+        return app
+
+    def test_route_cache_command_writes_cache(self, app):
+        assert RouteCacheCommand(app).handle() == 0
+        assert app.routes_are_cached()
+
+        router = Router()
+        router.loadCachedRoutes(app.get_cached_routes_path())
+        assert router.routes.match('/users/1', 'GET') is not None
+
+    def test_route_cache_command_reports_closures(self, app):
+        app.make('router').get('/ping', lambda request: 'pong')
+
+        command = RouteCacheCommand(app)
+        assert command.handle() == 1
+        assert any('Uses Closure' in line for line in command._output)
+        assert not app.routes_are_cached()
+
+    def test_route_clear_command_removes_cache(self, app):
+        RouteCacheCommand(app).handle()
+
+        assert RouteClearCommand(app).handle() == 0
+        assert not app.routes_are_cached()
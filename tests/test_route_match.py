@@ -0,0 +1,110 @@
+"""
+Tests for stateless route matching.
+"""
+
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from larapy.http.middleware.substitute_bindings import SubstituteBindings
+from larapy.http.request import Request
+from larapy.routing.model_binder import ModelBinder
+from larapy.routing.route import Route
+from larapy.routing.route_match import RouteMatch
+from larapy.routing.router import Router
+
+
+class TestRouteMatch:
+    def test_match_is_immutable(self):
+        route = Route(['GET'], '/users/{id}', lambda: 'response')
+        match = RouteMatch(route, {'id': '1'}, 'users.show')
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            match.name = 'other'
+        with pytest.raises(TypeError):
+            match.params['id'] = '2'
+
+    def test_parameters_returns_copy(self):
+        route = Route(['GET'], '/users/{id}', lambda: 'response')
+        match = RouteMatch(route, {'id': '1'})
+
+        match.parameters()['id'] = '2'
+        assert match.parameter('id') == '1'
+
+    def test_with_parameters_creates_new_match(self):
+        route = Route(['GET'], '/users/{id}', lambda: 'response')
+        match = RouteMatch(route, {'id': '1'}, 'users.show')
+        updated = match.withParameters({'id': 'model'})
+
+        assert updated is not match
+        assert updated.route is route
+        assert updated.name == 'users.show'
+        assert updated.parameter('id') == 'model'
+        assert match.parameter('id') == '1'
+
+    def test_route_match_does_not_store_parameters(self):
+        route = Route(['GET'], '/users/{id}', lambda: 'response')
+        match = route.match('/users/5', 'GET')
+
+        assert match.parameters() == {'id': '5'}
+        assert route.parameters() == {}
+        assert route.match('/users/5', 'POST') is None
+
+    def test_run_uses_match_parameters(self):
+        route = Route(['GET'], '/users/{id}', lambda id: f'user {id}')
+        assert RouteMatch(route, {'id': '9'}).run() == 'user 9'
+
+
+class TestRouterDispatch:
+    def test_dispatch_sets_route_match_on_request(self):
+        router = Router()
+        route = router.get('/users/{id}', lambda request: request.route('id')).name('users.show')
+
+        request = Request(uri='/users/7', method='GET')
+        assert router.dispatch(request) == '7'
+
+        match = request.getRouteMatch()
+        assert match.route is route
+        assert match.name == 'users.show'
+        assert request.route('_route_name') == 'users.show'
+        assert route.parameters() == {}
+
+    def test_concurrent_dispatch_keeps_parameters_separate(self):
+        router = Router()
+        barrier = threading.Barrier(8)
+
+        def show(request):
+            barrier.wait()
+            return request.getRouteMatch().parameter('id')
+
+        router.get('/users/{id}', show)
+
+        def handle(i):
+            return router.dispatch(Request(uri=f'/users/{i}', method='GET'))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(handle, range(8)))
+
+        assert results == [str(i) for i in range(8)]
+
+
+class TestSubstituteBindingsWithMatch:
+    def test_bindings_are_applied_to_a_new_match(self):
+        router = Router()
+        route = router.get('/users/{user}', lambda request: None)
+        binder = ModelBinder()
+        binder.bind('user', lambda value: {'id': int(value)})
+
+        request = Request(uri='/users/3', method='GET')
+        match = router.findRoute(request)
+        request.setRouteMatch(match)
+        request.setRouteParameters(match.parameters())
+
+        middleware = SubstituteBindings(binder)
+        result = middleware.handle(request, lambda req: req.getRouteMatch())
+
+        assert result.parameter('user') == {'id': 3}
+        assert request.route('user') == {'id': 3}
+        assert match.parameter('user') == '3'
+        assert route.parameters() == {}
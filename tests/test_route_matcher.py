@@ -0,0 +1,157 @@
+"""
+Tests for the compiled route matcher.
+"""
+
+import pytest
+from larapy.routing.route import Route
+from larapy.routing.route_collection import RouteCollection
+from larapy.routing.route_matcher import CompiledRouteMatcher, is_segment_constraint
+from larapy.routing.router import Router
+
+
+def linear_match(routes, uri):
+    for route in routes:
+        if route.matches(uri, 'GET'):
+            return route, dict(route.parameters())
+    return None
+
+
+class TestSegmentConstraint:
+    @pytest.mark.parametrize('constraint', [
+        '[^/]+', r'\d+', '[a-zA-Z]+', '[a-zA-Z0-9]+', 'draft|published', r'\w+',
+        '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    ])
+    def test_single_segment_constraints(self, constraint):
+        assert is_segment_constraint(constraint) is True
+
+    @pytest.mark.parametrize('constraint', ['.*', '.+', r'\D+', '[^a]+', '[!-z]+', 'a/b'])
+    def test_constraints_that_may_span_segments(self, constraint):
+        assert is_segment_constraint(constraint) is False
+
+
+class TestCompiledRouteMatcher:
+    def test_static_route(self):
+        route = Route(['GET'], '/users', lambda: 'response')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/users') == (route, {})
+        assert matcher.match('/users/') == (route, {})
+        assert matcher.match('/posts') is None
+
+    def test_root_route(self):
+        route = Route(['GET'], '/', lambda: 'response')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/') == (route, {})
+        assert matcher.match('/users') is None
+
+    def test_parameters_are_captured(self):
+        route = Route(['GET'], '/users/{user}/posts/{post}', lambda: 'response')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/users/42/posts/99') == (route, {'user': '42', 'post': '99'})
+
+    def test_optional_parameter(self):
+        route = Route(['GET'], '/users/{id?}', lambda: 'response')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/users') == (route, {})
+        assert matcher.match('/users/5') == (route, {'id': '5'})
+
+    def test_optional_parameters_prefer_leftmost(self):
+        route = Route(['GET'], '/archive/{year?}/{month?}', lambda: 'response')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/archive/2024') == (route, {'year': '2024'})
+
+    def test_where_constraints(self):
+        numeric = Route(['GET'], '/users/{id}', lambda: 'numeric').whereNumber('id')
+        named = Route(['GET'], '/users/{name}', lambda: 'named').whereAlpha('name')
+        matcher = CompiledRouteMatcher([numeric, named])
+        assert matcher.match('/users/12') == (numeric, {'id': '12'})
+        assert matcher.match('/users/john') == (named, {'name': 'john'})
+        assert matcher.match('/users/john12') is None
+
+    def test_first_registered_route_wins(self):
+        wildcard = Route(['GET'], '/users/{id}', lambda: 'wildcard')
+        static = Route(['GET'], '/users/create', lambda: 'static')
+        matcher = CompiledRouteMatcher([wildcard, static])
+        assert matcher.match('/users/create') == (wildcard, {'id': 'create'})
+
+    def test_catch_all_parameter(self):
+        route = Route(['GET'], '/files/{path}', lambda: 'response').where('path', '.*')
+        matcher = CompiledRouteMatcher([route])
+        assert matcher.match('/files/a/b/c.txt') == (route, {'path': 'a/b/c.txt'})
+        assert matcher.match('/files') is None
+
+    def test_static_routes_are_tried_before_catch_all(self):
+        catch_all = Route(['GET'], '/{any}', lambda: 'spa').where('any', '.*')
+        api = Route(['GET'], '/api/status', lambda: 'status')
+        matcher = CompiledRouteMatcher([api, catch_all])
+        assert matcher.match('/api/status') == (api, {})
+        assert matcher.match('/dashboard/settings') == (catch_all, {'any': 'dashboard/settings'})
+
+    @pytest.mark.parametrize('combined_regex', [True, False])
+    def test_regex_only_routes_fall_back(self, combined_regex):
+        mixed = Route(['GET'], '/download/{name}.pdf', lambda: 'mixed')
+        dotted = Route(['GET'], '/sitemap.xml', lambda: 'dotted')
+        param = Route(['GET'], '/download/{name}', lambda: 'param')
+        matcher = CompiledRouteMatcher([mixed, dotted, param], combined_regex)
+        assert matcher.match('/download/report.pdf') == (mixed, {'name': 'report'})
+        assert matcher.match('/sitemap.xml') == (dotted, {})
+        assert matcher.match('/download/report') == (param, {'name': 'report'})
+
+    def test_fallback_respects_registration_order(self):
+        param = Route(['GET'], '/download/{name}', lambda: 'param')
+        mixed = Route(['GET'], '/download/{name}.pdf', lambda: 'mixed')
+        matcher = CompiledRouteMatcher([param, mixed])
+        assert matcher.match('/download/report.pdf') == (param, {'name': 'report.pdf'})
+
+    def test_matches_linear_scan(self):
+        routes = [
+            Route(['GET'], '/', lambda: None),
+            Route(['GET'], '/users/{id}', lambda: None).whereNumber('id'),
+            Route(['GET'], '/users/{user}/posts/{post?}', lambda: None),
+            Route(['GET'], '/users/create', lambda: None),
+            Route(['GET'], '/posts/{slug}', lambda: None).whereIn('slug', ['draft', 'live']),
+            Route(['GET'], '/{page}', lambda: None).whereAlpha('page'),
+            Route(['GET'], '/assets/{path}', lambda: None).where('path', '.+'),
+            Route(['GET'], '/report.{format}', lambda: None),
+        ]
+        matcher = CompiledRouteMatcher(routes)
+        uris = [
+            '/', '/users/5', '/users/create', '/users/abc/posts', '/users/abc/posts/9',
+            '/posts/draft', '/posts/other', '/about', '/about1', '/assets/css/app.css',
+            '/report.json', '/reportxjson', '/missing/route/here',
+        ]
+        for uri in uris:
+            assert matcher.match(uri) == linear_match(routes, uri), uri
+
+
+class TestRouteCollectionMatcher:
+    def test_matcher_is_rebuilt_after_add(self):
+        collection = RouteCollection()
+        collection.add(Route(['GET'], '/users', lambda: 'users'))
+        assert collection.match('/posts', 'GET') is None
+
+        posts = collection.add(Route(['GET'], '/posts', lambda: 'posts'))
+        assert collection.match('/posts', 'GET').route is posts
+
+    def test_matcher_is_rebuilt_after_where(self):
+        router = Router()
+        route = router.get('/users/{id}', lambda request: 'user')
+        assert router.routes.match('/users/abc', 'GET').route is route
+
+        route.whereNumber('id')
+        assert router.routes.match('/users/abc', 'GET') is None
+        assert router.routes.match('/users/7', 'GET').route is route
+
+    def test_refresh_invalidates_matchers(self):
+        collection = RouteCollection()
+        collection.add(Route(['GET'], '/users', lambda: 'users'))
+        matcher = collection.getMatcher('GET')
+
+        collection.refresh()
+        assert collection.getMatcher('GET') is not matcher
+
+    def test_match_returns_parameters(self):
+        collection = RouteCollection()
+        route = collection.add(Route(['GET'], '/users/{id}', lambda: 'user'))
+        match = collection.match('/users/3', 'get')
+        assert match.route is route
+        assert match.parameters() == {'id': '3'}
@@ -159,7 +159,7 @@ class TestRouteCollection:
         route = Route(['GET'], '/users', lambda: 'response')
         collection.add(route)
         matched = collection.match('/users', 'GET')
-        assert matched == route
+        assert matched.route == route
 
     def test_match_route_not_found(self):
         collection = RouteCollection()
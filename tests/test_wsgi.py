@@ -0,0 +1,368 @@
+"""
+Tests for the WSGI application adapter and file response preparation.
+"""
+
+import io
+import json
+import os
+import tracemalloc
+from contextvars import ContextVar
+from email.utils import formatdate
+from wsgiref.util import FileWrapper, setup_testing_defaults
+
+import pytest
+from larapy.container.container import Container
+from larapy.foundation.http.wsgi import WsgiApplication
+from larapy.http.kernel import Kernel
+from larapy.http.request import Request
+from larapy.http.response import BinaryFileResponse, StreamedResponse
+from larapy.routing.router import Router
+
+
+def call(app, method='GET', path='/', body=b'', headers=None, file_wrapper=True, query=''):
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'wsgi.input': io.BytesIO(body),
+        'CONTENT_LENGTH': str(len(body)) if body else '',
+    }
+    for name, value in (headers or {}).items():
+        key = name.upper().replace('-', '_')
+        environ[key if key in ('CONTENT_TYPE',) else f'HTTP_{key}'] = value
+    setup_testing_defaults(environ)
+    if file_wrapper:
+        environ['wsgi.file_wrapper'] = FileWrapper
+    else:
+        environ.pop('wsgi.file_wrapper', None)
+
+    started = {}
+
+    def start_response(status, response_headers, exc_info=None):
+        started['status'] = status
+        started['headers'] = response_headers
+
+    iterable = app(environ, start_response)
+    return started, iterable
+
+
+def consume(iterable):
+    try:
+        return b''.join(iterable)
+    finally:
+        if hasattr(iterable, 'close'):
+            iterable.close()
+
+
+@pytest.fixture
+def router():
+    return Router()
+
+
+@pytest.fixture
+def app(router):
+    return WsgiApplication(router, chunk_size=4)
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / 'data.txt'
+    path.write_bytes(b'0123456789')
+    return str(path)
+
+
+class TestWsgiRequests:
+    def test_plain_response(self, router, app):
+        router.get('/hello/{name}', lambda request: f"hello {request.route('name')}")
+
+        started, iterable = call(app, path='/hello/ada')
+
+        assert started['status'] == '200 OK'
+        assert ('Content-Length', '9') in started['headers']
+        assert consume(iterable) == b'hello ada'
+
+    def test_request_is_built_from_environ(self, router, app):
+        def show(request):
+            return {
+                'path': request.path(),
+                'page': request.query('page'),
+                'agent': request.header('User-Agent'),
+                'cookie': request.cookie('session'),
+                'ip': request.ip(),
+            }
+
+        router.get('/users', show)
+
+        started, iterable = call(
+            app, path='/users', query='page=3',
+            headers={'User-Agent': 'test', 'Cookie': 'session=xyz'},
+        )
+
+        assert json.loads(consume(iterable)) == {
+            'path': 'users', 'page': '3', 'agent': 'test', 'cookie': 'xyz', 'ip': '127.0.0.1',
+        }
+
+    def test_form_body_is_parsed(self, router, app):
+        router.post('/form', lambda request: request.input('name'))
+
+        _, iterable = call(
+            app, 'POST', '/form', body=b'name=grace',
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        )
+
+        assert consume(iterable) == b'grace'
+
+    def test_other_bodies_are_streamed(self, router, app):
+        router.post('/upload', lambda request: str([len(chunk) for chunk in request.stream()]))
+
+        _, iterable = call(app, 'POST', '/upload', body=b'x' * 10)
+
+        assert consume(iterable) == b'[4, 4, 2]'
+
+    def test_async_route(self, router, app):
+        async def show(request):
+            return 'async'
+
+        router.get('/async', show)
+
+        _, iterable = call(app, path='/async')
+
+        assert consume(iterable) == b'async'
+
+    def test_context_variables_do_not_leak_between_requests(self, router, app):
+        seen = ContextVar('seen', default=None)
+
+        def show(request):
+            previous = seen.get()
+            seen.set('set')
+            return str(previous)
+
+        router.get('/context', show)
+
+        assert consume(call(app, path='/context')[1]) == b'None'
+        assert consume(call(app, path='/context')[1]) == b'None'
+
+    def test_not_found(self, app):
+        started, iterable = call(app, path='/missing')
+
+        assert started['status'] == '404 Not Found'
+        consume(iterable)
+
+    def test_head_request_has_no_body(self, router, app):
+        router.get('/page', lambda request: 'content')
+
+        started, iterable = call(app, 'HEAD', '/page')
+
+        assert ('Content-Length', '7') in started['headers']
+        assert consume(iterable) == b''
+
+    def test_middleware_and_terminate_after_close(self, router):
+        events = []
+
+        class Tracking:
+            def handle(self, request, next_handler):
+                events.append('handle')
+                return next_handler(request)
+
+            def terminate(self, request, response):
+                events.append('terminate')
+
+        kernel = Kernel(Container())
+        kernel.append(Tracking)
+        router.get('/', lambda request: 'ok')
+        app = WsgiApplication(router, kernel)
+
+        _, iterable = call(app)
+        assert events == ['handle']
+
+        consume(iterable)
+        assert events == ['handle', 'terminate']
+
+
+class TestWsgiStreaming:
+    def test_streamed_response_is_lazy(self, router, app):
+        produced = []
+
+        def lines():
+            for i in range(3):
+                produced.append(i)
+                yield f'line {i}\n'
+
+        router.get('/stream', lambda request: StreamedResponse(lines()))
+
+        started, iterable = call(app, path='/stream')
+        assert produced == []
+
+        iterator = iter(iterable)
+        assert next(iterator) == b'line 0\n'
+        assert produced == [0]
+        assert b''.join(iterator) == b'line 1\nline 2\n'
+        iterable.close()
+
+        assert not any(name == 'Content-Length' for name, _ in started['headers'])
+
+    def test_streamed_callable_returning_iterable(self, router, app):
+        router.get('/stream', lambda request: StreamedResponse(lambda: [b'a', 'b']))
+
+        _, iterable = call(app, path='/stream')
+
+        assert consume(iterable) == b'ab'
+
+    def test_closing_stops_generator(self, router, app):
+        state = {}
+
+        def lines():
+            try:
+                while True:
+                    yield 'x'
+            finally:
+                state['closed'] = True
+
+        router.get('/stream', lambda request: StreamedResponse(lines()))
+
+        _, iterable = call(app, path='/stream')
+        next(iter(iterable))
+        iterable.close()
+
+        assert state == {'closed': True}
+
+
+class TestWsgiFiles:
+    def test_whole_file_uses_file_wrapper(self, router, app, file_path):
+        router.get('/file', lambda request: BinaryFileResponse(file_path))
+
+        started, iterable = call(app, path='/file')
+        headers = dict(started['headers'])
+
+        assert isinstance(iterable, FileWrapper)
+        assert iterable.filelike.fileno() > 0
+        assert started['status'] == '200 OK'
+        assert headers['Content-Length'] == '10'
+        assert headers['Accept-Ranges'] == 'bytes'
+        assert headers['Content-Type'] == 'text/plain'
+        assert consume(iterable) == b'0123456789'
+
+    def test_whole_file_without_file_wrapper(self, router, app, file_path):
+        router.get('/file', lambda request: BinaryFileResponse(file_path))
+
+        _, iterable = call(app, path='/file', file_wrapper=False)
+
+        assert consume(iterable) == b'0123456789'
+
+    def test_range_request(self, router, app, file_path):
+        router.get('/file', lambda request: BinaryFileResponse(file_path))
+
+        started, iterable = call(app, path='/file', headers={'Range': 'bytes=2-5'})
+        headers = dict(started['headers'])
+
+        assert started['status'] == '206 Partial Content'
+        assert headers['Content-Range'] == 'bytes 2-5/10'
+        assert headers['Content-Length'] == '4'
+        assert consume(iterable) == b'2345'
+
+    def test_unsatisfiable_range(self, router, app, file_path):
+        router.get('/file', lambda request: BinaryFileResponse(file_path))
+
+        started, iterable = call(app, path='/file', headers={'Range': 'bytes=20-'})
+
+        assert started['status'] == '416 Requested Range Not Satisfiable'
+        assert dict(started['headers'])['Content-Range'] == 'bytes */10'
+        assert consume(iterable) == b''
+
+    def test_not_modified(self, router, app, file_path):
+        router.get('/file', lambda request: BinaryFileResponse(file_path))
+
+        started, iterable = call(app, path='/file')
+        etag = dict(started['headers'])['ETag']
+        consume(iterable)
+
+        started, iterable = call(app, path='/file', headers={'If-None-Match': etag})
+
+        assert started['status'] == '304 Not Modified'
+        assert consume(iterable) == b''
+
+    def test_large_file_is_not_read_into_memory(self, router, tmp_path):
+        path = tmp_path / 'large.bin'
+        with open(path, 'wb') as handle:
+            handle.truncate(32 * 1024 * 1024)
+        router.get('/large', lambda request: BinaryFileResponse(str(path)))
+        app = WsgiApplication(router)
+
+        tracemalloc.start()
+        try:
+            _, iterable = call(app, path='/large', headers={'Range': 'bytes=1024-'}, file_wrapper=False)
+            total = sum(len(chunk) for chunk in iterable)
+            iterable.close()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total == 32 * 1024 * 1024 - 1024
+        assert peak < 4 * 1024 * 1024
+
+
+class TestBinaryFileResponsePrepare:
+    def prepare(self, file_path, **headers):
+        request = Request('/file', 'GET', headers=headers)
+        return BinaryFileResponse(file_path).prepare(request)
+
+    def test_headers(self, file_path):
+        response = BinaryFileResponse(file_path, disposition='attachment').prepare()
+        headers = response.getHeaders()
+
+        assert headers['Content-Disposition'] == 'attachment; filename="data.txt"'
+        assert headers['Last-Modified'] == formatdate(os.stat(file_path).st_mtime, usegmt=True)
+        assert headers['ETag'].startswith('"')
+        assert response.getRange() == (0, 10)
+
+    def test_suffix_range(self, file_path):
+        response = self.prepare(file_path, Range='bytes=-3')
+
+        assert response.status() == 206
+        assert response.getRange() == (7, 3)
+        assert response.getHeaders()['Content-Range'] == 'bytes 7-9/10'
+
+    def test_open_range_is_clamped(self, file_path):
+        response = self.prepare(file_path, Range='bytes=8-100')
+
+        assert response.getRange() == (8, 2)
+
+    def test_multiple_ranges_return_whole_file(self, file_path):
+        response = self.prepare(file_path, Range='bytes=0-1,4-5')
+
+        assert response.status() == 200
+        assert response.getRange() == (0, 10)
+
+    def test_if_range_with_matching_etag(self, file_path):
+        etag = BinaryFileResponse(file_path).prepare().getHeaders()['ETag']
+
+        response = self.prepare(file_path, Range='bytes=0-1', **{'If-Range': etag})
+
+        assert response.status() == 206
+
+    def test_if_range_with_stale_validator_returns_whole_file(self, file_path):
+        response = self.prepare(file_path, Range='bytes=0-1', **{'If-Range': '"stale"'})
+
+        assert response.status() == 200
+        assert response.getRange() == (0, 10)
+
+    def test_if_range_with_date(self, file_path):
+        last_modified = formatdate(os.stat(file_path).st_mtime, usegmt=True)
+
+        response = self.prepare(file_path, Range='bytes=0-1', **{'If-Range': last_modified})
+
+        assert response.status() == 206
+
+    def test_if_modified_since(self, file_path):
+        last_modified = formatdate(os.stat(file_path).st_mtime, usegmt=True)
+
+        response = self.prepare(file_path, **{'If-Modified-Since': last_modified})
+
+        assert response.status() == 304
+
+    def test_weak_if_none_match(self, file_path):
+        etag = BinaryFileResponse(file_path).prepare().getHeaders()['ETag']
+
+        response = self.prepare(file_path, **{'If-None-Match': f'"other", W/{etag}'})
+
+        assert response.status() == 304